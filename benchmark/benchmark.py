@@ -21,12 +21,15 @@
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
-from bip_utils import Bip39SeedGenerator
+from bip_utils import Bip39SeedGenerator, EllipticCurveBackends, EllipticCurveTypes
 from tests import (
-    BenchmarkTestsBase, Ed25519Blake2bTests, Ed25519KholawTests, Ed25519Tests, MoneroTests, Nist256p1Tests,
-    Secp256k1Tests, SubstrateTests
+    BenchmarkTestsBase, Bip39MnemonicBulkTests, Bip39MnemonicLoopTests, Bip39Seeds1WorkerTests, Bip39Seeds4WorkersTests,
+    Bip39Seeds16WorkersTests, Bip39SeedLoopTests, Bip44GapScanTests, Ed25519Blake2bTests, Ed25519ChildKeysRangeTests,
+    Ed25519KholawChildKeysRangeTests, Ed25519KholawTests, Ed25519Tests, MoneroSubaddressesBatchTests,
+    MoneroSubaddressLoopTests, MoneroTests, Nist256p1Tests, Secp256k1ChildKeyLoopTests, Secp256k1ChildKeysRangeTests,
+    Secp256k1PublicChildKeysRangeTests, Secp256k1Tests, SubstrateTests
 )
 
 
@@ -40,6 +43,20 @@ class TestTypes(Enum):
     ED25519_KHOLAW = auto()
     SUBSTRATE = auto()
     MONERO = auto()
+    SECP256K1_CHILD_KEY_LOOP = auto()
+    SECP256K1_CHILD_KEYS_RANGE = auto()
+    SECP256K1_PUBLIC_CHILD_KEYS_RANGE = auto()
+    ED25519_CHILD_KEYS_RANGE = auto()
+    ED25519_KHOLAW_CHILD_KEYS_RANGE = auto()
+    BIP44_GAP_SCAN = auto()
+    MONERO_SUBADDRESS_LOOP = auto()
+    MONERO_SUBADDRESSES = auto()
+    BIP39_MNEMONIC_LOOP = auto()
+    BIP39_MNEMONIC_BULK = auto()
+    BIP39_SEED_LOOP = auto()
+    BIP39_SEEDS_1_WORKER = auto()
+    BIP39_SEEDS_4_WORKERS = auto()
+    BIP39_SEEDS_16_WORKERS = auto()
 
 
 # Tests constants
@@ -53,6 +70,20 @@ class TestsConsts:
         TestTypes.ED25519_KHOLAW: Ed25519KholawTests,
         TestTypes.SUBSTRATE: SubstrateTests,
         TestTypes.MONERO: MoneroTests,
+        TestTypes.SECP256K1_CHILD_KEY_LOOP: Secp256k1ChildKeyLoopTests,
+        TestTypes.SECP256K1_CHILD_KEYS_RANGE: Secp256k1ChildKeysRangeTests,
+        TestTypes.SECP256K1_PUBLIC_CHILD_KEYS_RANGE: Secp256k1PublicChildKeysRangeTests,
+        TestTypes.ED25519_CHILD_KEYS_RANGE: Ed25519ChildKeysRangeTests,
+        TestTypes.ED25519_KHOLAW_CHILD_KEYS_RANGE: Ed25519KholawChildKeysRangeTests,
+        TestTypes.BIP44_GAP_SCAN: Bip44GapScanTests,
+        TestTypes.MONERO_SUBADDRESS_LOOP: MoneroSubaddressLoopTests,
+        TestTypes.MONERO_SUBADDRESSES: MoneroSubaddressesBatchTests,
+        TestTypes.BIP39_MNEMONIC_LOOP: Bip39MnemonicLoopTests,
+        TestTypes.BIP39_MNEMONIC_BULK: Bip39MnemonicBulkTests,
+        TestTypes.BIP39_SEED_LOOP: Bip39SeedLoopTests,
+        TestTypes.BIP39_SEEDS_1_WORKER: Bip39Seeds1WorkerTests,
+        TestTypes.BIP39_SEEDS_4_WORKERS: Bip39Seeds4WorkersTests,
+        TestTypes.BIP39_SEEDS_16_WORKERS: Bip39Seeds16WorkersTests,
     }
 
 
@@ -62,14 +93,21 @@ class TestsConf:
     TEST_ITR_NUM: int = 3000
     TEST_CACHE_NUM: int = 50
     TEST_TYPE: TestTypes = TestTypes.SECP256K1
+    # Backend for secp256k1 curve (coincurve, python or ecdsa), None for the default one
+    SECP256K1_BACKEND: Optional[str] = None
 
 
 # Main function
 def main() -> None:
+    # Set backend
+    if TestsConf.SECP256K1_BACKEND is not None:
+        EllipticCurveBackends.SetBackend(EllipticCurveTypes.SECP256K1, TestsConf.SECP256K1_BACKEND)
+
     # Print info
     print("\nBenchmark started!")
     print("Configuration:")
     print(f"  - Test type: {TestsConf.TEST_TYPE}")
+    print(f"  - Secp256k1 backend: {EllipticCurveBackends.ActiveName(EllipticCurveTypes.SECP256K1)}")
     print(f"  - Number of tests: {TestsConf.TEST_NUM}")
     print(f"  - Number of iterations for each test: {TestsConf.TEST_ITR_NUM}")
     print(f"  - Number of iterations for caching: {TestsConf.TEST_CACHE_NUM}\n")
@@ -90,7 +128,8 @@ def main() -> None:
 
     # Print average time
     print("\nBenchmark completed.")
-    print(f"Average time: {tests.GetAverageTime():.0f}ms\n")
+    print(f"Average time: {tests.GetAverageTime():.0f}ms")
+    print(f"Average time for each iteration: {tests.GetAverageTime() / TestsConf.TEST_ITR_NUM:.3f}ms\n")
 
 
 # Execute main
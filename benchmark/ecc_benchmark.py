@@ -0,0 +1,178 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import hashlib
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from bip_utils import EllipticCurveBackends, EllipticCurveGetter, EllipticCurveTypes
+from bip_utils._version import __version__
+from bip_utils.ecc.common.dummy_point import DummyPoint
+
+
+# ECC tests configuration
+class EccTestsConf:
+    TEST_NUM: int = 5
+    TEST_ITR_NUM: int = 200
+    # Curves to test
+    CURVE_TYPES: List[EllipticCurveTypes] = list(EllipticCurveTypes)
+    # Backends to test, None for all the available ones
+    BACKENDS: Optional[List[str]] = None
+    # Path of the JSON results file, None for not writing it
+    JSON_FILE_PATH: Optional[str] = "ecc_benchmark.json"
+
+
+# Number of different inputs used in turn by each test
+INPUT_NUM: int = 16
+
+
+# Get private keys bytes for testing (the ones not valid for the curve are skipped)
+def get_priv_keys_bytes(priv_key_cls: Any) -> List[bytes]:
+    priv_keys_bytes = []
+    i = 0
+    while len(priv_keys_bytes) < INPUT_NUM:
+        key_bytes = hashlib.sha512(i.to_bytes(4, "big")).digest()[:priv_key_cls.Length()]
+        try:
+            priv_key_cls.FromBytes(key_bytes).PublicKey()
+            priv_keys_bytes.append(key_bytes)
+        except ValueError:
+            pass
+        i += 1
+    return priv_keys_bytes
+
+
+# Get the tests of a backend, each one taking the input index
+def get_tests(curve_type: EllipticCurveTypes,
+              backend_name: str) -> Dict[str, Callable[[int], Any]]:
+    backend = EllipticCurveBackends.Backend(curve_type, backend_name)
+    priv_key_cls = backend.PrivateKeyClass()
+    pub_key_cls = backend.PublicKeyClass()
+    point_cls = backend.PointClass()
+    generator = backend.Generator()
+
+    priv_keys_bytes = get_priv_keys_bytes(priv_key_cls)
+    priv_keys = [priv_key_cls.FromBytes(key_bytes) for key_bytes in priv_keys_bytes]
+    pub_keys = [priv_key.PublicKey() for priv_key in priv_keys]
+    pub_keys_compr = [pub_key.RawCompressed().ToBytes() for pub_key in pub_keys]
+    pub_keys_uncompr = [pub_key.RawUncompressed().ToBytes() for pub_key in pub_keys]
+
+    tests: Dict[str, Callable[[int], Any]] = {
+        "priv_key_from_bytes": lambda i: priv_key_cls.FromBytes(priv_keys_bytes[i]),
+        # Some libraries compute the public key when constructing the private one, so they are timed together
+        "pub_key_from_priv_key": lambda i: priv_key_cls.FromBytes(priv_keys_bytes[i]).PublicKey(),
+        "pub_key_from_compressed": lambda i: pub_key_cls.FromBytes(pub_keys_compr[i]),
+        "pub_key_from_uncompressed": lambda i: pub_key_cls.FromBytes(pub_keys_uncompr[i]),
+        "pub_key_to_compressed": lambda i: pub_keys[i].RawCompressed(),
+        "pub_key_to_uncompressed": lambda i: pub_keys[i].RawUncompressed(),
+    }
+
+    # Point operations are meaningless for dummy points
+    if not issubclass(point_cls, DummyPoint):
+        order = EllipticCurveGetter.FromType(curve_type).Order()
+        points = [pub_key.Point() for pub_key in pub_keys]
+        points_enc = [point.RawEncoded().ToBytes() for point in points]
+        scalars = [int.from_bytes(hashlib.sha256(key_bytes).digest(), "big") % order for key_bytes in priv_keys_bytes]
+
+        tests.update({
+            "point_from_bytes": lambda i: point_cls.FromBytes(points_enc[i]),
+            "point_to_bytes": lambda i: points[i].RawEncoded(),
+            "point_add": lambda i: points[i] + points[(i + 1) % INPUT_NUM],
+            "point_scalar_mul_g": lambda i: generator * scalars[i],
+            "point_scalar_mul": lambda i: points[i] * scalars[i],
+        })
+    return tests
+
+
+# Run a test, returning the operations per second of each round
+def run_test(test_fct: Callable[[int], Any]) -> List[float]:
+    input_idxs = [i % INPUT_NUM for i in range(EccTestsConf.TEST_ITR_NUM)]
+    # Warm up, so that one-time initializations (e.g. precomputed tables) are not counted
+    for i in range(INPUT_NUM):
+        test_fct(i)
+
+    ops_per_sec = []
+    for _ in range(EccTestsConf.TEST_NUM):
+        start = time.perf_counter()
+        for i in input_idxs:
+            test_fct(i)
+        ops_per_sec.append(EccTestsConf.TEST_ITR_NUM / (time.perf_counter() - start))
+    return ops_per_sec
+
+
+# Main function
+def main() -> None:
+    # Print info
+    print("\nECC benchmark started!")
+    print("Configuration:")
+    print(f"  - Curves: {', '.join(curve_type.name for curve_type in EccTestsConf.CURVE_TYPES)}")
+    print(f"  - Backends: {'all available' if EccTestsConf.BACKENDS is None else ', '.join(EccTestsConf.BACKENDS)}")
+    print(f"  - Number of tests: {EccTestsConf.TEST_NUM}")
+    print(f"  - Number of iterations for each test: {EccTestsConf.TEST_ITR_NUM}\n")
+
+    results = []
+    print(f"{'Curve':<16}{'Backend':<17}{'Test':<27}{'Ops/sec':>12}{'Stdev':>10}")
+    for curve_type in EccTestsConf.CURVE_TYPES:
+        for backend_name in EllipticCurveBackends.AvailableNames(curve_type):
+            if EccTestsConf.BACKENDS is not None and backend_name not in EccTestsConf.BACKENDS:
+                continue
+
+            for test_name, test_fct in get_tests(curve_type, backend_name).items():
+                ops_per_sec = run_test(test_fct)
+                ops_mean = statistics.mean(ops_per_sec)
+                ops_stdev = statistics.stdev(ops_per_sec) if len(ops_per_sec) > 1 else 0.0
+                results.append({
+                    "curve": curve_type.name,
+                    "backend": backend_name,
+                    "test": test_name,
+                    "ops_per_sec_mean": ops_mean,
+                    "ops_per_sec_stdev": ops_stdev,
+                    "ops_per_sec": ops_per_sec,
+                })
+                print(f"{curve_type.name:<16}{backend_name:<17}{test_name:<27}{ops_mean:>12.0f}"
+                      f"{100 * ops_stdev / ops_mean:>9.1f}%")
+
+    # Write JSON results
+    if EccTestsConf.JSON_FILE_PATH is not None:
+        with open(EccTestsConf.JSON_FILE_PATH, "w", encoding="utf-8") as fout:
+            json.dump(
+                {
+                    "bip_utils_version": __version__,
+                    "python_version": platform.python_version(),
+                    "python_implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "test_num": EccTestsConf.TEST_NUM,
+                    "test_itr_num": EccTestsConf.TEST_ITR_NUM,
+                    "results": results,
+                },
+                fout,
+                indent=2
+            )
+
+    print("\nECC benchmark completed.")
+    if EccTestsConf.JSON_FILE_PATH is not None:
+        print(f"Results written to {EccTestsConf.JSON_FILE_PATH}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import gc
+import tracemalloc
+from typing import List
+
+from bip_utils import Bip32Slip10Secp256k1, Bip39SeedGenerator
+from bip_utils.bip.bip32 import Bip32Base
+
+
+# Memory tests configuration
+class MemoryTestsConf:
+    NODE_NUM: int = 10000
+    PUBLIC_ONLY: bool = True
+
+
+# Derive nodes
+def derive_nodes(bip32_ctx: Bip32Base,
+                 node_num: int) -> List[Bip32Base]:
+    # Derive the nodes and force the computation of the public keys, so that they are actually kept in memory
+    nodes = bip32_ctx.ChildKeysRange(0, node_num)
+    for node in nodes:
+        node.PublicKey().KeyObject()
+    return nodes
+
+
+# Main function
+def main() -> None:
+    # Print info
+    print("\nMemory benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of nodes: {MemoryTestsConf.NODE_NUM}")
+    print(f"  - Public-only nodes: {MemoryTestsConf.PUBLIC_ONLY}\n")
+
+    # Generate a seed
+    mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "\
+               "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon art"
+    seed_bytes = Bip39SeedGenerator(mnemonic).Generate()
+
+    # Account-level key to derive from (like a watch-only wallet)
+    bip32_ctx = Bip32Slip10Secp256k1.FromSeed(seed_bytes).DerivePath("m/44'/0'/0'/0")
+    if MemoryTestsConf.PUBLIC_ONLY:
+        bip32_ctx.ConvertToPublic()
+    # Warm up, so that one-time allocations are not counted
+    derive_nodes(bip32_ctx, 1)
+
+    gc.collect()
+    tracemalloc.start()
+    mem_start, _ = tracemalloc.get_traced_memory()
+    nodes = derive_nodes(bip32_ctx, MemoryTestsConf.NODE_NUM)
+    gc.collect()
+    mem_end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Print memory usage
+    print("Memory benchmark completed.")
+    print(f"Total memory: {(mem_end - mem_start) / 1024:.0f}KB")
+    print(f"Memory for each node: {(mem_end - mem_start) / len(nodes):.0f} bytes\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 from tests.benchmark_tests_base import BenchmarkTestsBase
+from tests.bip32_child_keys_tests import (
+    Ed25519ChildKeysRangeTests, Ed25519KholawChildKeysRangeTests, Secp256k1ChildKeyLoopTests,
+    Secp256k1ChildKeysRangeTests, Secp256k1PublicChildKeysRangeTests
+)
+from tests.bip39_mnemonic_tests import Bip39MnemonicBulkTests, Bip39MnemonicLoopTests
+from tests.bip39_seed_tests import (
+    Bip39Seeds1WorkerTests, Bip39Seeds4WorkersTests, Bip39Seeds16WorkersTests, Bip39SeedLoopTests
+)
+from tests.bip44_gap_scan_tests import Bip44GapScanTests
 from tests.ed25519_blake2b_tests import Ed25519Blake2bTests
 from tests.ed25519_kholaw_tests import Ed25519KholawTests
 from tests.ed25519_tests import Ed25519Tests
-from tests.monero_tests import MoneroTests
+from tests.monero_tests import MoneroSubaddressesBatchTests, MoneroSubaddressLoopTests, MoneroTests
 from tests.nist256p1_tests import Nist256p1Tests
 from tests.secp256k1_tests import Secp256k1Tests
 from tests.substrate_tests import SubstrateTests
@@ -0,0 +1,137 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+# Imports
+from typing import Type
+
+from bip_utils import Bip32KholawEd25519, Bip32Slip10Ed25519, Bip32Slip10Secp256k1
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Bip32 child keys tests class
+class Bip32ChildKeysTests(BenchmarkTestsBase):
+
+    m_bip32_cls: Type[Bip32Base]
+    m_use_batch: bool
+    m_public_only: bool
+
+    # Constructor
+    def __init__(self,
+                 bip32_cls: Type[Bip32Base],
+                 use_batch: bool,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int,
+                 public_only: bool = False) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num)
+        self.m_bip32_cls = bip32_cls
+        self.m_use_batch = use_batch
+        self.m_public_only = public_only
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        bip32_ctx = self.m_bip32_cls.FromSeed(seed_bytes)
+        if self.m_public_only:
+            bip32_ctx.ConvertToPublic()
+
+        # Use hardened indexes if public derivation is not supported
+        start_idx = Bip32KeyIndex.HardenIndex(0) if not bip32_ctx.IsPublicDerivationSupported() else 0
+
+        # Derive one child key for each iteration
+        if self.m_use_batch:
+            bip32_ctx.ChildKeysRange(start_idx, self.m_test_itr_num)
+        else:
+            for i in range(start_idx, start_idx + self.m_test_itr_num):
+                bip32_ctx.ChildKey(i)
+
+
+# Secp256k1 child keys tests class (ChildKey loop)
+class Secp256k1ChildKeyLoopTests(Bip32ChildKeysTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(Bip32Slip10Secp256k1,
+                         False,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# Secp256k1 child keys tests class (ChildKeysRange)
+class Secp256k1ChildKeysRangeTests(Bip32ChildKeysTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(Bip32Slip10Secp256k1,
+                         True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# Secp256k1 public child keys tests class (ChildKeysRange)
+class Secp256k1PublicChildKeysRangeTests(Bip32ChildKeysTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(Bip32Slip10Secp256k1,
+                         True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num,
+                         public_only=True)
+
+
+# Ed25519 child keys tests class (ChildKeysRange)
+class Ed25519ChildKeysRangeTests(Bip32ChildKeysTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(Bip32Slip10Ed25519,
+                         True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# Ed25519-Kholaw child keys tests class (ChildKeysRange)
+class Ed25519KholawChildKeysRangeTests(Bip32ChildKeysTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(Bip32KholawEd25519,
+                         True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from typing import List
+
+from bip_utils import Bip39Languages, Bip39MnemonicBulkValidator, Bip39MnemonicEncoder, Bip39MnemonicValidator
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# BIP39 mnemonic tests class
+class Bip39MnemonicTests(BenchmarkTestsBase):
+
+    m_use_bulk: bool
+
+    # Constructor
+    def __init__(self,
+                 use_bulk: bool,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num)
+        self.m_use_bulk = use_bulk
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        encoder = Bip39MnemonicEncoder()
+
+        # Encode and validate one 24-word mnemonic for each iteration
+        entropies = self.__GetEntropies(seed_bytes)
+        if self.m_use_bulk:
+            bulk_validator = Bip39MnemonicBulkValidator(Bip39Languages.ENGLISH)
+            for _ in bulk_validator.Validate(encoder.Encode(entropy).ToStr() for entropy in entropies):
+                pass
+        else:
+            validator = Bip39MnemonicValidator()
+            for entropy in entropies:
+                validator.IsValid(encoder.Encode(entropy))
+
+    # Get entropies
+    def __GetEntropies(self,
+                       seed_bytes: bytes) -> List[bytes]:
+        return [seed_bytes[:28] + i.to_bytes(4, "big") for i in range(self.m_test_itr_num)]
+
+
+# BIP39 mnemonic tests class (IsValid loop)
+class Bip39MnemonicLoopTests(Bip39MnemonicTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(False,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# BIP39 mnemonic tests class (Bip39MnemonicBulkValidator)
+class Bip39MnemonicBulkTests(Bip39MnemonicTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
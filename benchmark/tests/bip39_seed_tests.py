@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from typing import List, Optional
+
+from bip_utils import Bip39MnemonicEncoder, Bip39SeedGenerator
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# BIP39 seeds tests class
+class Bip39SeedsTests(BenchmarkTestsBase):
+
+    m_worker_num: Optional[int]
+    m_mnemonics: List[str]
+
+    # Constructor
+    def __init__(self,
+                 worker_num: Optional[int],
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num)
+        self.m_worker_num = worker_num
+        # Encode the mnemonics only once, so that only the seeds generation is timed
+        self.m_mnemonics = self.__GetMnemonics()
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        # Generate one seed for each iteration
+        if self.m_worker_num is not None:
+            Bip39SeedGenerator.GenerateMany(self.m_mnemonics, worker_num=self.m_worker_num)
+        else:
+            for mnemonic in self.m_mnemonics:
+                Bip39SeedGenerator(mnemonic).Generate()
+
+    # Get mnemonics
+    def __GetMnemonics(self) -> List[str]:
+        encoder = Bip39MnemonicEncoder()
+        return [encoder.Encode(bytes(28) + i.to_bytes(4, "big")).ToStr() for i in range(self.m_test_itr_num)]
+
+
+# BIP39 seeds tests class (Generate loop)
+class Bip39SeedLoopTests(Bip39SeedsTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(None,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# BIP39 seeds tests class (GenerateMany, 1 worker)
+class Bip39Seeds1WorkerTests(Bip39SeedsTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(1,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# BIP39 seeds tests class (GenerateMany, 4 workers)
+class Bip39Seeds4WorkersTests(Bip39SeedsTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(4,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# BIP39 seeds tests class (GenerateMany, 16 workers)
+class Bip39Seeds16WorkersTests(Bip39SeedsTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(16,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
@@ -41,3 +41,56 @@ class MoneroTests(BenchmarkTestsBase):
                 monero_ctx.PrivateSpendKey().Raw().ToHex()
                 monero_ctx.PrivateViewKey().Raw().ToHex()
                 monero_ctx.Subaddress(i)
+
+
+# Monero subaddresses tests class
+class MoneroSubaddressesTests(BenchmarkTestsBase):
+
+    m_use_batch: bool
+
+    # Constructor
+    def __init__(self,
+                 use_batch: bool,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(test_num, test_itr_num, test_cache_num)
+        self.m_use_batch = use_batch
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        monero_ctx = Monero.FromSeed(seed_bytes)
+
+        # Compute one subaddress for each iteration
+        if self.m_use_batch:
+            monero_ctx.Subaddresses(range(1, self.m_test_itr_num + 1))
+        else:
+            for i in range(1, self.m_test_itr_num + 1):
+                monero_ctx.Subaddress(i)
+
+
+# Monero subaddresses tests class (Subaddress loop)
+class MoneroSubaddressLoopTests(MoneroSubaddressesTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(False,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
+
+
+# Monero subaddresses tests class (Subaddresses)
+class MoneroSubaddressesBatchTests(MoneroSubaddressesTests):
+    # Constructor
+    def __init__(self,
+                 test_num: int,
+                 test_itr_num: int,
+                 test_cache_num: int) -> None:
+        super().__init__(True,
+                         test_num,
+                         test_itr_num,
+                         test_cache_num)
@@ -180,11 +180,15 @@ from bip_utils.bech32 import (
 from bip_utils.bip.bip32 import (
     Bip32ChainCode,
     Bip32Depth,
+    Bip32DerivationCache,
     Bip32DeserializedKey,
     Bip32Ed25519Blake2bSlip,
     Bip32Ed25519Kholaw,
     Bip32Ed25519Slip,
+    Bip32ExKeyCache,
     Bip32FingerPrint,
+    Bip32KeyBinaryDeserializer,
+    Bip32KeyBinarySerializer,
     Bip32KeyData,
     Bip32KeyDeserializer,
     Bip32KeyError,
@@ -195,6 +199,7 @@ from bip_utils.bip.bip32 import (
     Bip32Path,
     Bip32PathError,
     Bip32PathParser,
+    Bip32PathTemplate,
     Bip32PrivateKey,
     Bip32PrivateKeySerializer,
     Bip32PublicKey,
@@ -216,6 +221,7 @@ from bip_utils.bip.bip39 import (
     Bip39EntropyGenerator,
     Bip39Languages,
     Bip39Mnemonic,
+    Bip39MnemonicBulkValidator,
     Bip39MnemonicDecoder,
     Bip39MnemonicEncoder,
     Bip39MnemonicGenerator,
@@ -226,7 +232,18 @@ from bip_utils.bip.bip39 import (
 from bip_utils.bip.bip44 import Bip44
 
 # BIP44/49/84
-from bip_utils.bip.bip44_base import Bip44Changes, Bip44DepthError, Bip44Levels, Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base import (
+    Bip44AddrIndex,
+    Bip44AddrIndexWriter,
+    Bip44Changes,
+    Bip44DepthError,
+    Bip44GapScanner,
+    Bip44GapScanResult,
+    Bip44Levels,
+    Bip44ParallelDeriver,
+    Bip44PrivateKey,
+    Bip44PublicKey,
+)
 from bip_utils.bip.bip49 import Bip49
 from bip_utils.bip.bip84 import Bip84
 from bip_utils.bip.bip86 import Bip86
@@ -253,6 +270,8 @@ from bip_utils.coin_conf import CoinsConf
 
 # ECC
 from bip_utils.ecc import (
+    EccInterningCache,
+    EccInterningCacheStats,
     Ed25519,
     Ed25519Blake2b,
     Ed25519Blake2bPoint,
@@ -269,6 +288,8 @@ from bip_utils.ecc import (
     Ed25519Point,
     Ed25519PrivateKey,
     Ed25519PublicKey,
+    EllipticCurveBackend,
+    EllipticCurveBackends,
     EllipticCurveGetter,
     EllipticCurveTypes,
     IPoint,
@@ -309,6 +330,7 @@ from bip_utils.electrum.mnemonic_v2 import (
     ElectrumV2EntropyGenerator,
     ElectrumV2Languages,
     ElectrumV2Mnemonic,
+    ElectrumV2MnemonicBulkValidator,
     ElectrumV2MnemonicDecoder,
     ElectrumV2MnemonicEncoder,
     ElectrumV2MnemonicGenerator,
@@ -319,7 +341,15 @@ from bip_utils.electrum.mnemonic_v2 import (
 )
 
 # Monero
-from bip_utils.monero import Monero, MoneroKeyError, MoneroPrivateKey, MoneroPublicKey, MoneroSubaddress
+from bip_utils.monero import (
+    Monero,
+    MoneroKeyError,
+    MoneroPrivateKey,
+    MoneroPublicKey,
+    MoneroSubaddress,
+    MoneroSubaddressTable,
+    MoneroSubaddressTableWriter,
+)
 
 # Monero configuration
 from bip_utils.monero.conf import MoneroCoins, MoneroConf
@@ -330,6 +360,7 @@ from bip_utils.monero.mnemonic import (
     MoneroEntropyGenerator,
     MoneroLanguages,
     MoneroMnemonic,
+    MoneroMnemonicBulkValidator,
     MoneroMnemonicDecoder,
     MoneroMnemonicEncoder,
     MoneroMnemonicGenerator,
@@ -416,9 +447,11 @@ from bip_utils.utils.misc import (
     BytesUtils,
     DataBytes,
     IntegerUtils,
+    LruCache,
+    LruCacheStats,
     StringUtils,
 )
-from bip_utils.utils.mnemonic import MnemonicChecksumError
+from bip_utils.utils.mnemonic import MnemonicBulkValidatorResult, MnemonicChecksumError
 
 # WIF
 from bip_utils.wif import WifDecoder, WifEncoder, WifPubKeyModes
@@ -163,5 +163,8 @@ class AddrKeyValidator:
             curve = EllipticCurveGetter.FromType(pub_key_cls.CurveType())
             raise TypeError(f"A {curve.Name()} public key is required"
                             f"(expected: {pub_key_cls}, got: {type(pub_key)}")
+        else:
+            # The key may have been created with a different backend of the curve
+            pub_key = pub_key_cls.FromPublicKey(pub_key)
 
         return pub_key
@@ -1,16 +1,24 @@
-from bip_utils.bip.bip32.base import Bip32Base, IBip32KeyDerivator, IBip32MstKeyGenerator
+from bip_utils.bip.bip32.base import (
+    Bip32Base,
+    Bip32DerivationCache,
+    Bip32ExKeyCache,
+    IBip32KeyDerivator,
+    IBip32MstKeyGenerator,
+)
 from bip_utils.bip.bip32.bip32_const import Bip32Const
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError, Bip32PathError
 from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
 from bip_utils.bip.bip32.bip32_key_ser import (
     Bip32DeserializedKey,
+    Bip32KeyBinaryDeserializer,
+    Bip32KeyBinarySerializer,
     Bip32KeyDeserializer,
     Bip32PrivateKeySerializer,
     Bip32PublicKeySerializer,
 )
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
-from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
+from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser, Bip32PathTemplate
 from bip_utils.bip.bip32.bip32_utils import Bip32Utils
 from bip_utils.bip.bip32.kholaw import (
     Bip32Ed25519Kholaw,
@@ -24,19 +24,39 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Type, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
+from bip_utils.bip.bip32.base.bip32_derivation_cache import Bip32DerivationCache
+from bip_utils.bip.bip32.base.bip32_ex_key_cache import Bip32ExKeyCache
 from bip_utils.bip.bip32.base.ibip32_key_derivator import IBip32KeyDerivator
 from bip_utils.bip.bip32.base.ibip32_mst_key_generator import IBip32MstKeyGenerator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
-from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_data import (
+    Bip32ChainCode,
+    Bip32Depth,
+    Bip32FingerPrint,
+    Bip32KeyData,
+    Bip32KeyDataConst,
+    Bip32KeyIndex,
+)
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
-from bip_utils.bip.bip32.bip32_key_ser import Bip32KeyDeserializer
+from bip_utils.bip.bip32.bip32_key_ser import (
+    Bip32KeyBinaryDeserializer,
+    Bip32KeyBinarySerializer,
+    Bip32KeyDeserializer,
+)
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
 from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
 from bip_utils.ecc import EllipticCurve, EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey
 
 
+class Bip32BaseConst:
+    """Class container for BIP32 base constants."""
+
+    # Number of child keys derived at a time when iterating over children
+    ITER_CHILDREN_CHUNK_SIZE: int = 256
+
+
 class Bip32Base(ABC):
     """
     BIP32 base class.
@@ -44,6 +64,8 @@ class Bip32Base(ABC):
     It shall be derived to implement derivation for a specific elliptic curve.
     """
 
+    __slots__ = ("m_priv_key", "m_pub_key")
+
     m_priv_key: Optional[Bip32PrivateKey]
     m_pub_key: Bip32PublicKey
 
@@ -83,7 +105,8 @@ class Bip32Base(ABC):
     def FromSeedAndPath(cls,
                         seed_bytes: bytes,
                         path: Union[str, Bip32Path],
-                        key_net_ver: Optional[Bip32KeyNetVersions] = None) -> Bip32Base:
+                        key_net_ver: Optional[Bip32KeyNetVersions] = None,
+                        cache: Optional[Bip32DerivationCache] = None) -> Bip32Base:
         """
         Create a Bip32 object from the specified seed (e.g. BIP39 seed) and path.
 
@@ -92,6 +115,7 @@ class Bip32Base(ABC):
             path (str or Bip32Path object)                    : Path
             key_net_ver (Bip32KeyNetVersions object, optional): Bip32KeyNetVersions object
                                                                 (default: specific class key net version)
+            cache (Bip32DerivationCache object, optional)     : Derivation cache (default: None)
 
         Returns:
             Bip32Base object: Bip32Base object
@@ -102,19 +126,23 @@ class Bip32Base(ABC):
             Bip32KeyError: If the seed is not suitable for master key generation
         """
         key_net_ver = key_net_ver or cls._DefaultKeyNetVersion()
-        return cls.FromSeed(seed_bytes, key_net_ver).DerivePath(path)
+        return cls.FromSeed(seed_bytes, key_net_ver).DerivePath(path, cache)
 
     @classmethod
     def FromExtendedKey(cls,
                         ex_key_str: str,
-                        key_net_ver: Optional[Bip32KeyNetVersions] = None) -> Bip32Base:
+                        key_net_ver: Optional[Bip32KeyNetVersions] = None,
+                        cache: Optional[Bip32ExKeyCache] = None) -> Bip32Base:
         """
         Create a Bip32 object from the specified extended key.
+        If an extended keys cache is specified, the object is taken from the cache if the same extended key
+        was already decoded. In this case, public-only objects are shared with the cache.
 
         Args:
             ex_key_str (str)                                  : Extended key string
             key_net_ver (Bip32KeyNetVersions object, optional): Bip32KeyNetVersions object
                                                                 (default: specific class key net version)
+            cache (Bip32ExKeyCache object, optional)          : Extended keys cache (default: None)
 
         Returns:
             Bip32Base object: Bip32Base object
@@ -123,20 +151,59 @@ class Bip32Base(ABC):
             Bip32KeyError: If the key is not valid
         """
         key_net_ver = key_net_ver or cls._DefaultKeyNetVersion()
+        if cache is not None:
+            return cache.FromExtendedKey(cls, ex_key_str, key_net_ver)
 
         # De-serialize key
         deser_key = Bip32KeyDeserializer.DeserializeKey(ex_key_str, key_net_ver)
         # Get key parts
         key_bytes, key_data, is_public = deser_key.KeyBytes(), deser_key.KeyData(), deser_key.IsPublic()
 
-        # If depth is zero, fingerprint shall be the master one and child index shall be zero
-        if key_data.Depth() == 0:
-            if not key_data.ParentFingerPrint().IsMasterKey():
-                raise Bip32KeyError(
-                    f"Invalid extended master key (wrong fingerprint: {key_data.ParentFingerPrint().ToHex()})"
-                )
-            if key_data.Index() != 0:
-                raise Bip32KeyError(f"Invalid extended master key (wrong child index: {key_data.Index().ToInt()})")
+        cls.__ValidateMasterKeyData(key_data)
+
+        return cls(
+            priv_key=key_bytes if not is_public else None,
+            pub_key=key_bytes if is_public else None,
+            key_data=key_data,
+            key_net_ver=key_net_ver
+        )
+
+    @classmethod
+    def FromBinary(cls,
+                   ser_key_bytes: bytes,
+                   trusted: bool = False) -> Bip32Base:
+        """
+        Create a Bip32 object from the specified binary key (i.e. serialized with ToBinary).
+        If the key is trusted (e.g. serialized by the same application), the key data is not validated and
+        the public key is decoded only when needed for the first time.
+
+        Args:
+            ser_key_bytes (bytes)   : Binary key bytes
+            trusted (bool, optional): True if the key is trusted, false otherwise (default)
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the key is not valid
+        """
+
+        # De-serialize key
+        deser_key, key_net_ver = Bip32KeyBinaryDeserializer.DeserializeKey(ser_key_bytes, cls.CurveType())
+        # Get key parts
+        key_bytes, key_data, is_public = deser_key.KeyBytes(), deser_key.KeyData(), deser_key.IsPublic()
+
+        if not trusted:
+            cls.__ValidateMasterKeyData(key_data)
+        # Trusted public key, skip the point decoding
+        elif is_public:
+            bip32_obj = cls.__new__(cls)
+            bip32_obj.m_priv_key = None
+            bip32_obj.m_pub_key = Bip32PublicKey.FromTrustedBytes(key_bytes,
+                                                                  key_data,
+                                                                  key_net_ver,
+                                                                  cls.CurveType())
+            return bip32_obj
 
         return cls(
             priv_key=key_bytes if not is_public else None,
@@ -232,6 +299,9 @@ class Bip32Base(ABC):
             # Check that key type matches the Bip curve
             if not isinstance(priv_key, bytes) and not isinstance(priv_key, curve.PrivateKeyClass()):
                 raise Bip32KeyError(f"Invalid private key class, a {curve.Name()} key is required")
+            # The key may have been created with a different backend of the curve
+            if not isinstance(priv_key, bytes):
+                priv_key = curve.PrivateKeyClass().FromPrivateKey(priv_key)
 
             self.m_priv_key = Bip32PrivateKey.FromBytesOrKeyObject(priv_key,
                                                                    key_data,
@@ -245,6 +315,10 @@ class Bip32Base(ABC):
                     and not isinstance(pub_key, curve.PointClass())
                     and not isinstance(pub_key, curve.PublicKeyClass())):
                 raise Bip32KeyError(f"Invalid public key class, a {curve.Name()} key or point is required")
+            # The key may have been created with a different backend of the curve (points are converted
+            # by their coordinates, so they're already accepted)
+            if isinstance(pub_key, IPublicKey):
+                pub_key = curve.PublicKeyClass().FromPublicKey(pub_key)
 
             self.m_priv_key = None
             self.m_pub_key = Bip32PublicKey.FromBytesOrKeyObject(pub_key,
@@ -270,13 +344,127 @@ class Bip32Base(ABC):
         index = self.__GetIndex(index)
         return self.__ValidateAndCkdPriv(index) if not self.IsPublicOnly() else self.__ValidateAndCkdPub(index)
 
+    def ChildKeys(self,
+                  indexes: Iterable[Union[int, Bip32KeyIndex]]) -> List[Bip32Base]:
+        """
+        Create and return the child keys of the current one with the specified indexes.
+        The result is the same of calling ChildKey for each index, but the parent data (e.g. public key,
+        chain code, fingerprint) is computed only once, so it's faster when deriving many sibling keys.
+
+        Args:
+            indexes (iterable[int or Bip32KeyIndex object]): Indexes
+
+        Returns:
+            list[Bip32Base object]: Bip32Base objects, in the same order of the indexes
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+            ValueError: If one of the indexes is not valid
+        """
+        index_objs = [self.__GetIndex(index) for index in indexes]
+        return (self.__ValidateAndCkdPrivBatch(index_objs)
+                if not self.IsPublicOnly()
+                else self.__ValidateAndCkdPubBatch(index_objs))
+
+    def ChildKeysRange(self,
+                       start: Union[int, Bip32KeyIndex],
+                       count: int) -> List[Bip32Base]:
+        """
+        Create and return the child keys of the current one with consecutive indexes.
+        The start index shall be hardened using HardenIndex method to use the private derivation algorithm.
+
+        Args:
+            start (int or Bip32KeyIndex object): Start index
+            count (int)                        : Number of child keys
+
+        Returns:
+            list[Bip32Base object]: Bip32Base objects, from index start to start + count - 1
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+            ValueError: If the start index or the count is not valid
+        """
+        start = self.__GetIndex(start).ToInt()
+        if count < 0:
+            raise ValueError(f"Invalid child keys count ({count})")
+        if count > 0 and Bip32KeyIndex.IsHardenedIndex(start) != Bip32KeyIndex.IsHardenedIndex(start + count - 1):
+            raise ValueError("Child keys range cannot contain both hardened and not-hardened indexes")
+
+        return self.ChildKeys(range(start, start + count))
+
+    def IterChildKeys(self,
+                      start: Union[int, Bip32KeyIndex],
+                      stop: int) -> Iterator[Bip32Base]:
+        """
+        Iterate over the child keys of the current one with indexes from start to stop (excluded).
+        Child keys are derived in small batches, so the memory usage doesn't depend on the number of indexes.
+        The start index shall be hardened using HardenIndex method to use the private derivation algorithm.
+
+        Args:
+            start (int or Bip32KeyIndex object): Start index
+            stop (int)                         : Stop index (excluded)
+
+        Returns:
+            Iterator[Bip32Base object]: Iterator over Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+            ValueError: If the start or stop index is not valid
+        """
+        start = self.__GetIndex(start).ToInt()
+        if stop < start or stop > Bip32KeyDataConst.KEY_INDEX_MAX_VAL + 1:
+            raise ValueError(f"Invalid child keys stop index ({stop})")
+        if stop > start and Bip32KeyIndex.IsHardenedIndex(start) != Bip32KeyIndex.IsHardenedIndex(stop - 1):
+            raise ValueError("Child keys range cannot contain both hardened and not-hardened indexes")
+
+        for chunk_start in range(start, stop, Bip32BaseConst.ITER_CHILDREN_CHUNK_SIZE):
+            yield from self.ChildKeysRange(chunk_start,
+                                           min(Bip32BaseConst.ITER_CHILDREN_CHUNK_SIZE, stop - chunk_start))
+
+    def IterChildren(self,
+                     start: Union[int, Bip32KeyIndex],
+                     stop: int,
+                     public_only: bool = True) -> Iterator[Tuple[int, bytes, Optional[bytes]]]:
+        """
+        Iterate over the children of the current key with indexes from start to stop (excluded).
+        Like IterChildKeys, but only the raw keys are returned instead of Bip32Base objects.
+
+        Args:
+            start (int or Bip32KeyIndex object): Start index
+            stop (int)                         : Stop index (excluded)
+            public_only (bool, optional)       : True to return only public keys, false to also return private keys
+                                                 (default: True)
+
+        Returns:
+            Iterator[tuple[int, bytes, bytes or None]]: Iterator over index, compressed public key bytes and
+                                                        private key bytes (None if public only)
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key or private keys are requested
+                           for a public-only key
+            ValueError: If the start or stop index is not valid
+        """
+        if not public_only and self.IsPublicOnly():
+            raise Bip32KeyError("Public-only deterministic keys have no private half")
+
+        for child_key in self.IterChildKeys(start, stop):
+            yield (
+                child_key.Index().ToInt(),
+                child_key.PublicKey().RawCompressed().ToBytes(),
+                None if public_only else child_key.PrivateKey().Raw().ToBytes(),
+            )
+
     def DerivePath(self,
-                   path: Union[str, Bip32Path]) -> Bip32Base:
+                   path: Union[str, Bip32Path],
+                   cache: Optional[Bip32DerivationCache] = None) -> Bip32Base:
         """
         Derive children keys from the specified path.
+        If a derivation cache is specified, the intermediate keys are stored in it and the derivation starts
+        from the longest path prefix already cached (e.g. when deriving many addresses of the same account).
 
         Args:
-            path (str or Bip32Path object): Path
+            path (str or Bip32Path object)               : Path
+            cache (Bip32DerivationCache object, optional): Derivation cache (default: None)
 
         Returns:
             Bip32Base object: Bip32Base object
@@ -290,6 +478,9 @@ class Bip32Base(ABC):
         if self.Depth() > 0 and path.IsAbsolute():
             raise ValueError("Absolute paths can only be derived from a master key, not child ones")
 
+        if cache is not None:
+            return cache.DerivePath(self, path)
+
         bip32_obj = self
         # Derive children keys
         for path_elem in path:
@@ -299,6 +490,9 @@ class Bip32Base(ABC):
 
     def ConvertToPublic(self) -> None:
         """Convert the object into a public one."""
+        # Resolve the lazy public key and parent fingerprint, so that no private key is referenced anymore
+        self.m_pub_key.KeyObject()
+        self.m_pub_key.Data().ParentFingerPrint()
         self.m_priv_key = None
 
     def IsPublicOnly(self) -> bool:
@@ -389,6 +583,34 @@ class Bip32Base(ABC):
         """
         return self.m_pub_key.Data().ParentFingerPrint()
 
+    def ToBinary(self) -> bytes:
+        """
+        Return the key in compact binary format.
+        It's faster to serialize/deserialize than the extended key, so it's suitable for storing keys or
+        sending them between processes.
+
+        Returns:
+            bytes: Key in binary format
+        """
+        is_public = self.IsPublicOnly()
+        return Bip32KeyBinarySerializer.Serialize(
+            self.m_pub_key.RawCompressed().ToBytes() if is_public else self.PrivateKey().Raw().ToBytes(),
+            self.m_pub_key.Data(),
+            self.m_pub_key.KeyNetVersions(),
+            self.CurveType(),
+            is_public
+        )
+
+    def __reduce__(self) -> Tuple[Callable[[bytes, bool], Bip32Base], Tuple[bytes, bool]]:
+        """
+        Get the object state for pickling.
+        The object is pickled in binary format and loaded back as trusted.
+
+        Returns:
+            tuple: Function to recreate the object (index 0) and its arguments (index 1)
+        """
+        return self.__class__.FromBinary, (self.ToBinary(), True)
+
     @classmethod
     def Curve(cls) -> EllipticCurve:
         """
@@ -450,6 +672,106 @@ class Bip32Base(ABC):
 
         return self.__CkdPub(index)
 
+    def __ValidateAndCkdPrivBatch(self,
+                                  indexes: List[Bip32KeyIndex]) -> List[Bip32Base]:
+        """
+        Check the key indexes validity and create the child keys with the specified indexes using private derivation.
+
+        Args:
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[Bip32Base object]: Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        assert self.m_priv_key is not None
+
+        child_keys = self._KeyDerivator().CkdPrivBatch(self.m_priv_key,
+                                                       self.m_pub_key,
+                                                       indexes)
+        key_net_ver = self.KeyNetVersions()
+        return [
+            self.__class__(
+                priv_key=priv_key_bytes,
+                pub_key=None,
+                key_data=key_data,
+                key_net_ver=key_net_ver
+            )
+            for (priv_key_bytes, _), key_data in zip(child_keys, self.__ChildrenKeyData(indexes, child_keys))
+        ]
+
+    def __ValidateAndCkdPubBatch(self,
+                                 indexes: List[Bip32KeyIndex]) -> List[Bip32Base]:
+        """
+        Check the key indexes validity and create the child keys with the specified indexes using public derivation.
+
+        Args:
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[Bip32Base object]: Bip32Base objects
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+
+        # Hardened index is not supported for public derivation
+        if any(index.IsHardened() for index in indexes):
+            raise Bip32KeyError("Public child derivation cannot be used to create a hardened child key")
+
+        child_keys = self._KeyDerivator().CkdPubBatch(self.m_pub_key,
+                                                      indexes)
+        key_net_ver = self.KeyNetVersions()
+        return [
+            self.__class__(
+                priv_key=None,
+                pub_key=pub_key,
+                key_data=key_data,
+                key_net_ver=key_net_ver
+            )
+            for (pub_key, _), key_data in zip(child_keys, self.__ChildrenKeyData(indexes, child_keys))
+        ]
+
+    def __ChildrenKeyData(self,
+                          indexes: List[Bip32KeyIndex],
+                          child_keys: Sequence[Tuple[Union[bytes, IPoint], bytes]]) -> List[Bip32KeyData]:
+        """
+        Get the key data of the children derived from the current key.
+        Depth and parent fingerprint are computed only once and shared among all the children.
+
+        Args:
+            indexes (list[Bip32KeyIndex object]): Key indexes
+            child_keys (list[tuple])            : Derived key (index 0) and chain code bytes (index 1) for each index
+
+        Returns:
+            list[Bip32KeyData object]: Bip32KeyData objects
+        """
+        depth = self.Depth().Increase()
+        parent_fprint = self.__ParentFingerPrintForChildren()
+
+        return [
+            Bip32KeyData(
+                chain_code=chain_code_bytes,
+                depth=depth,
+                index=index,
+                parent_fprint=parent_fprint
+            )
+            for index, (_, chain_code_bytes) in zip(indexes, child_keys)
+        ]
+
+    def __ParentFingerPrintForChildren(self) -> Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]:
+        """
+        Get the parent fingerprint to be used for the children of the current key.
+        If the public key is not computed yet, the fingerprint is returned lazily so that the public key is not
+        computed unless the children's parent fingerprint is actually needed.
+
+        Returns:
+            Bip32FingerPrint object or function: Fingerprint, or function returning it
+        """
+        return self.m_pub_key.FingerPrintGetter()
+
     def __CkdPriv(self,
                   index: Bip32KeyIndex) -> Bip32Base:
         """
@@ -476,7 +798,7 @@ class Bip32Base(ABC):
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.__ParentFingerPrintForChildren()
             ),
             key_net_ver=self.KeyNetVersions()
         )
@@ -504,11 +826,31 @@ class Bip32Base(ABC):
                 chain_code=chain_code_bytes,
                 depth=self.Depth().Increase(),
                 index=index,
-                parent_fprint=self.FingerPrint()
+                parent_fprint=self.__ParentFingerPrintForChildren()
             ),
             key_net_ver=self.KeyNetVersions()
         )
 
+    @staticmethod
+    def __ValidateMasterKeyData(key_data: Bip32KeyData) -> None:
+        """
+        Validate key data of a master key.
+        If depth is zero, fingerprint shall be the master one and child index shall be zero.
+
+        Args:
+            key_data (Bip32KeyData object): Key data
+
+        Raises:
+            Bip32KeyError: If the key data is not valid
+        """
+        if key_data.Depth() == 0:
+            if not key_data.ParentFingerPrint().IsMasterKey():
+                raise Bip32KeyError(
+                    f"Invalid extended master key (wrong fingerprint: {key_data.ParentFingerPrint().ToHex()})"
+                )
+            if key_data.Index() != 0:
+                raise Bip32KeyError(f"Invalid extended master key (wrong child index: {key_data.Index().ToInt()})")
+
     @staticmethod
     def __GetIndex(index: Union[int, Bip32KeyIndex]) -> Bip32KeyIndex:
         """
@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 derivation cache."""
+
+# Imports
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Hashable
+
+from bip_utils.ecc import EllipticCurveBackends
+from bip_utils.utils.misc import LruCache
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+    from bip_utils.bip.bip32.bip32_path import Bip32Path
+
+
+class Bip32DerivationCacheConst:
+    """Class container for BIP32 derivation cache constants."""
+
+    # Default maximum number of cached nodes
+    DEFAULT_MAX_SIZE: int = 1024
+
+
+class Bip32DerivationCache(LruCache):
+    """
+    BIP32 derivation cache class.
+    It keeps the intermediate nodes computed by path derivation, so that paths sharing the same prefix
+    (e.g. all the addresses of an account) are derived only from the longest cached prefix.
+    Nodes are identified by the key and chain code of the node the derivation starts from (i.e. not only by its
+    fingerprint, which can collide), the BIP32 class (i.e. the curve) and the path prefix.
+    A hit is a derivation that started from a cached node, a miss one that didn't find any.
+    The least recently used nodes are evicted when the maximum size is reached.
+    The cache is thread-safe and can be shared by different objects.
+    All the caches are cleared when the elliptic curve backend is switched, since nodes keep the old one.
+    """
+
+    m_instances: weakref.WeakSet = weakref.WeakSet()
+
+    def __init__(self,
+                 max_size: int = Bip32DerivationCacheConst.DEFAULT_MAX_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached nodes (default: 1024)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        super().__init__(max_size)
+        Bip32DerivationCache.m_instances.add(self)
+
+    @classmethod
+    def ClearAll(cls) -> None:
+        """Clear all the existing caches."""
+        for cache in list(Bip32DerivationCache.m_instances):
+            cache.Clear()
+
+    def DerivePath(self,
+                   bip32_obj: Bip32Base,
+                   path: Bip32Path) -> Bip32Base:
+        """
+        Derive the specified path from the BIP32 object, starting from the longest cached prefix.
+        All the intermediate nodes are cached, while the last one is always derived, so the returned object
+        is never shared with the cache.
+        It shall be called by Bip32Base.DerivePath, which validates the path.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object to start the derivation from
+            path (Bip32Path object)     : Path
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the index results in an invalid key
+        """
+        path_elems = path.ToList()
+        if len(path_elems) == 0:
+            return bip32_obj
+
+        origin_key = self.__OriginKey(bip32_obj)
+
+        # Look for the longest cached prefix, excluding the last element
+        prefix_lens = range(len(path_elems) - 1, 0, -1)
+        found_idx, cached_obj = self._GetFirst([(origin_key, tuple(path_elems[:prefix_len]))
+                                                for prefix_len in prefix_lens])
+        curr_obj = cached_obj or bip32_obj
+        start_idx = prefix_lens[found_idx] if cached_obj is not None else 0
+
+        # Derive the remaining intermediate nodes and cache them
+        for i in range(start_idx, len(path_elems) - 1):
+            curr_obj = self._Put((origin_key, tuple(path_elems[:i + 1])),
+                                 curr_obj.ChildKey(path_elems[i]))
+
+        # Derive the last node
+        return curr_obj.ChildKey(path_elems[-1])
+
+    @staticmethod
+    def __OriginKey(bip32_obj: Bip32Base) -> Hashable:
+        """
+        Get the key identifying the node the derivation starts from.
+        The key bytes are used instead of the fingerprint to avoid collisions and, for private nodes,
+        the private key is used so that no public key computation is needed.
+        The parent fingerprint is not used, since it may require computing the parent public key and
+        the derived nodes don't depend on it.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object
+
+        Returns:
+            hashable: Origin key
+        """
+        key_bytes = (bip32_obj.PublicKey().RawCompressed().ToBytes()
+                     if bip32_obj.IsPublicOnly()
+                     else bip32_obj.PrivateKey().Raw().ToBytes())
+        key_net_ver = bip32_obj.KeyNetVersions()
+
+        return (
+            bip32_obj.__class__,
+            bip32_obj.IsPublicOnly(),
+            key_bytes,
+            bip32_obj.ChainCode().ToBytes(),
+            bip32_obj.Depth().ToInt(),
+            bip32_obj.Index().ToInt(),
+            key_net_ver.Public() + key_net_ver.Private(),
+        )
+
+
+# Cached nodes keep the elliptic curve backend they were created with
+EllipticCurveBackends.AddSwitchListener(lambda _: Bip32DerivationCache.ClearAll())
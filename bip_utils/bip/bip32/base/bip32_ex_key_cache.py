@@ -0,0 +1,145 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP32 extended keys cache."""
+
+# Imports
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Type
+
+from bip_utils.ecc import EllipticCurveBackends
+from bip_utils.utils.misc import LruCache
+
+
+if TYPE_CHECKING:
+    from bip_utils.bip.bip32.base.bip32_base import Bip32Base
+    from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
+
+
+class Bip32ExKeyCacheConst:
+    """Class container for BIP32 extended keys cache constants."""
+
+    # Default maximum number of cached nodes
+    DEFAULT_MAX_SIZE: int = 4096
+
+
+class Bip32ExKeyCache(LruCache):
+    """
+    BIP32 extended keys cache class.
+    It keeps the nodes constructed from extended keys, so that the same extended key is decoded (i.e. Base58
+    check-decoding and point decompression) only once.
+    Nodes are identified by the extended key string, the key net versions and the BIP32 class (i.e. the curve).
+    Public nodes are immutable, so they are directly shared by all the callers.
+    Private nodes are not cached by default and, if enabled, a new object sharing the same keys is returned
+    each time, so that converting it to public doesn't affect the cached node.
+    The least recently used nodes are evicted when the maximum size is reached.
+    The cache is thread-safe and can be shared by different objects.
+    All the caches are cleared when the elliptic curve backend is switched, since nodes keep the old one.
+    """
+
+    m_instances: weakref.WeakSet = weakref.WeakSet()
+
+    m_cache_priv: bool
+
+    def __init__(self,
+                 max_size: int = Bip32ExKeyCacheConst.DEFAULT_MAX_SIZE,
+                 cache_priv: bool = False) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int, optional)   : Maximum number of cached nodes (default: 4096)
+            cache_priv (bool, optional): True for caching also private extended keys, false otherwise (default)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        super().__init__(max_size)
+        Bip32ExKeyCache.m_instances.add(self)
+        self.m_cache_priv = cache_priv
+
+    @classmethod
+    def ClearAll(cls) -> None:
+        """Clear all the existing caches."""
+        for cache in list(Bip32ExKeyCache.m_instances):
+            cache.Clear()
+
+    def IsPrivateCached(self) -> bool:
+        """
+        Get if private extended keys are cached.
+
+        Returns:
+            bool: True if private extended keys are cached, false otherwise
+        """
+        return self.m_cache_priv
+
+    def FromExtendedKey(self,
+                        bip32_cls: Type[Bip32Base],
+                        ex_key_str: str,
+                        key_net_ver: Bip32KeyNetVersions) -> Bip32Base:
+        """
+        Get the node of the specified extended key, constructing and caching it if not already cached.
+        It shall be called by Bip32Base.FromExtendedKey.
+
+        Args:
+            bip32_cls (Bip32Base class)             : Bip32Base class
+            ex_key_str (str)                        : Extended key string
+            key_net_ver (Bip32KeyNetVersions object): Bip32KeyNetVersions object
+
+        Returns:
+            Bip32Base object: Bip32Base object
+
+        Raises:
+            Bip32KeyError: If the key is not valid
+        """
+        node_key = (bip32_cls, ex_key_str, key_net_ver.Public(), key_net_ver.Private())
+
+        node = self._Get(node_key)
+        if node is None:
+            # Construct the node outside the lock, invalid keys are never cached
+            node = bip32_cls.FromExtendedKey(ex_key_str, key_net_ver)
+            # Private nodes are not shared if they are not cached
+            if not node.IsPublicOnly() and not self.m_cache_priv:
+                return node
+            node = self._Put(node_key, node)
+
+        return node if node.IsPublicOnly() else self.__CopyPrivateNode(node)
+
+    @staticmethod
+    def __CopyPrivateNode(bip32_obj: Bip32Base) -> Bip32Base:
+        """
+        Copy a private node, sharing the same private key object.
+
+        Args:
+            bip32_obj (Bip32Base object): Bip32Base object
+
+        Returns:
+            Bip32Base object: Bip32Base object
+        """
+        priv_key = bip32_obj.PrivateKey()
+        return bip32_obj.FromPrivateKey(priv_key.KeyObject(),
+                                        priv_key.Data(),
+                                        priv_key.KeyNetVersions())
+
+
+# Cached nodes keep the elliptic curve backend they were created with
+EllipticCurveBackends.AddSwitchListener(lambda _: Bip32ExKeyCache.ClearAll())
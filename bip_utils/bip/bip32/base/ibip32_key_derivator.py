@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
@@ -81,3 +81,46 @@ class IBip32KeyDerivator(ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
+
+    @classmethod
+    def CkdPrivBatch(cls,
+                     priv_key: Bip32PrivateKey,
+                     pub_key: Bip32PublicKey,
+                     indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[bytes, bytes]]:
+        """
+        Derive the child keys with the specified indexes using private derivation.
+        By default, it calls CkdPriv for each index. Derivators can override it to compute the parent data only once.
+
+        Args:
+            priv_key (Bip32PrivateKey object)   : Bip32PrivateKey object
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes, bytes]]: Private key bytes (index 0) and chain code bytes (index 1) for each index
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        return [cls.CkdPriv(priv_key, pub_key, index) for index in indexes]
+
+    @classmethod
+    def CkdPubBatch(cls,
+                    pub_key: Bip32PublicKey,
+                    indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[Union[bytes, IPoint], bytes]]:
+        """
+        Derive the child keys with the specified indexes using public derivation.
+        By default, it calls CkdPub for each index. Derivators can override it to compute the parent data only once.
+
+        Args:
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes or IPoint, bytes]]: Public key bytes or point (index 0) and chain code bytes (index 1)
+                                                 for each index
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        return [cls.CkdPub(pub_key, index) for index in indexes]
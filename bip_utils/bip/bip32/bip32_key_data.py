@@ -23,8 +23,9 @@
 # Imports
 from __future__ import annotations
 
-from typing import Union
+from typing import Callable, Optional, Tuple, Type, Union
 
+from bip_utils.utils.crypto import HmacSha512
 from bip_utils.utils.misc import BitUtils, BytesUtils, DataBytes, IntegerUtils
 from bip_utils.utils.typing import Literal
 
@@ -54,6 +55,10 @@ class Bip32ChainCode(DataBytes):
     It represents a BIP32 chaincode.
     """
 
+    __slots__ = ("m_hmac",)
+
+    m_hmac: Optional[HmacSha512]
+
     def __init__(self,
                  chaincode: bytes = b"\x00" * Bip32KeyDataConst.CHAINCODE_BYTE_LEN) -> None:
         """
@@ -68,6 +73,16 @@ class Bip32ChainCode(DataBytes):
         if len(chaincode) != self.FixedLength():
             raise ValueError(f"Invalid chaincode length ({len(chaincode)})")
         super().__init__(chaincode)
+        self.m_hmac = None
+
+    def __reduce__(self) -> Tuple[Type[Bip32ChainCode], Tuple[bytes]]:
+        """
+        Get the object state for pickling, i.e. only the chaincode bytes.
+
+        Returns:
+            tuple: Class and constructor arguments
+        """
+        return self.__class__, (self.ToBytes(),)
 
     @staticmethod
     def FixedLength() -> int:
@@ -79,6 +94,19 @@ class Bip32ChainCode(DataBytes):
         """
         return Bip32KeyDataConst.CHAINCODE_BYTE_LEN
 
+    def Hmac(self) -> HmacSha512:
+        """
+        Get the HMAC-SHA512 object keyed with the chaincode, used for deriving child keys.
+        It's created the first time and kept, so that children derivation doesn't process the key every time.
+        The returned object shall be copied before being updated.
+
+        Returns:
+            HmacSha512 object: HmacSha512 object
+        """
+        if self.m_hmac is None:
+            self.m_hmac = HmacSha512(self.ToBytes())
+        return self.m_hmac
+
 
 class Bip32FingerPrint(DataBytes):
     """
@@ -86,6 +114,8 @@ class Bip32FingerPrint(DataBytes):
     It represents a BIP32 fingerprint.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  fprint: bytes = Bip32KeyDataConst.FINGERPRINT_MASTER_KEY) -> None:
         """
@@ -127,6 +157,8 @@ class Bip32Depth:
     It represents a BIP32 depth.
     """
 
+    __slots__ = ("m_depth",)
+
     m_depth: int
 
     def __init__(self,
@@ -257,6 +289,8 @@ class Bip32KeyIndex:
     It represents a BIP32 key index.
     """
 
+    __slots__ = ("m_idx",)
+
     m_idx: int
 
     @staticmethod
@@ -437,16 +471,20 @@ class Bip32KeyData:
     It contains all additional data related to a BIP32 key (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_depth", "m_index", "m_chain_code", "m_parent_fprint")
+
     m_depth: Bip32Depth
     m_index: Bip32KeyIndex
     m_chain_code: Bip32ChainCode
-    m_parent_fprint: Bip32FingerPrint
+    m_parent_fprint: Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]
 
     def __init__(self,
                  depth: Union[int, Bip32Depth] = Bip32Depth(0),
                  index: Union[int, Bip32KeyIndex] = Bip32KeyIndex(0),
                  chain_code: Union[bytes, Bip32ChainCode] = Bip32ChainCode(),
-                 parent_fprint: Union[bytes, Bip32FingerPrint] = Bip32FingerPrint()) -> None:
+                 parent_fprint: Union[bytes,
+                                      Bip32FingerPrint,
+                                      Callable[[], Bip32FingerPrint]] = Bip32FingerPrint()) -> None:
         """
         Construct class.
 
@@ -455,12 +493,14 @@ class Bip32KeyData:
             index (Bip32KeyIndex object)            : Key index
             chain_code (Bip32ChainCode object)      : Key chain code
             parent_fprint (Bip32FingerPrint object) : Key parent fingerprint
+                                                      It can also be a function returning it, that will be called
+                                                      only the first time the fingerprint is needed
         """
         self.m_depth = depth if isinstance(depth, Bip32Depth) else Bip32Depth(depth)
         self.m_index = index if isinstance(index, Bip32KeyIndex) else Bip32KeyIndex(index)
         self.m_chain_code = chain_code if isinstance(chain_code, Bip32ChainCode) else Bip32ChainCode(chain_code)
         self.m_parent_fprint = (parent_fprint
-                                if isinstance(parent_fprint, Bip32FingerPrint)
+                                if isinstance(parent_fprint, Bip32FingerPrint) or callable(parent_fprint)
                                 else Bip32FingerPrint(parent_fprint))
 
     def Depth(self) -> Bip32Depth:
@@ -497,4 +537,6 @@ class Bip32KeyData:
         Returns:
             Bip32FingerPrint object: Parent fingerprint
         """
+        if not isinstance(self.m_parent_fprint, Bip32FingerPrint):
+            self.m_parent_fprint = self.m_parent_fprint()
         return self.m_parent_fprint
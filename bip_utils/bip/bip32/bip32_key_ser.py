@@ -21,14 +21,14 @@
 """Module for BIP32 extended key serialization/deserialization."""
 
 # Imports
-from typing import Tuple
+from typing import Dict, Tuple
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.bip.bip32.bip32_const import Bip32Const
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
-from bip_utils.ecc import IPrivateKey, IPublicKey
+from bip_utils.ecc import EllipticCurveGetter, EllipticCurveTypes, IPrivateKey, IPublicKey
 from bip_utils.utils.misc import BytesUtils
 
 
@@ -40,6 +40,22 @@ class Bip32KeySerConst:
     # Serialized private key length in bytes
     SERIALIZED_PRIV_KEY_BYTE_LEN: Tuple[int, int] = (78, 110)
 
+    # Binary curve tags (explicit values, so that they are stable across versions)
+    BINARY_CURVE_TAGS: Dict[EllipticCurveTypes, int] = {
+        EllipticCurveTypes.ED25519: 0,
+        EllipticCurveTypes.ED25519_BLAKE2B: 1,
+        EllipticCurveTypes.ED25519_KHOLAW: 2,
+        EllipticCurveTypes.ED25519_MONERO: 3,
+        EllipticCurveTypes.NIST256P1: 4,
+        EllipticCurveTypes.SECP256K1: 5,
+        EllipticCurveTypes.SR25519: 6,
+    }
+    # Binary flag for private keys
+    BINARY_PRIV_KEY_FLAG: int = 0x01
+    # Binary header length in bytes (curve tag, flags, public and private net versions, depth,
+    # parent fingerprint, index, chain code)
+    BINARY_HEADER_BYTE_LEN: int = 51
+
 
 class _Bip32KeySerializer:
     """
@@ -125,6 +141,44 @@ class Bip32PublicKeySerializer:
                                              key_net_ver.Public())
 
 
+class Bip32KeyBinarySerializer:
+    """
+    BIP32 key binary serializer class.
+    It serializes private/public keys in a compact binary format, which is faster to serialize/deserialize
+    than the extended key format (no Base58 encoding and no checksum).
+    Format: curve tag (1-byte) || flags (1-byte) || public net version (4-byte) || private net version (4-byte)
+    || depth (1-byte) || parent fingerprint (4-byte) || index (4-byte) || chain code (32-byte) || key bytes,
+    where the key bytes are the raw private key or the compressed public key.
+    """
+
+    @staticmethod
+    def Serialize(key_bytes: bytes,
+                  key_data: Bip32KeyData,
+                  key_net_ver: Bip32KeyNetVersions,
+                  curve_type: EllipticCurveTypes,
+                  is_public: bool) -> bytes:
+        """
+        Serialize the specified key bytes.
+
+        Args:
+            key_bytes (bytes)                       : Key bytes (raw private key or compressed public key)
+            key_data (BipKeyData object)            : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            curve_type (EllipticCurveTypes)         : Elliptic curve type
+            is_public (bool)                        : True if the key is public, false otherwise
+
+        Returns:
+            bytes: Serialized key
+        """
+        flags = 0 if is_public else Bip32KeySerConst.BINARY_PRIV_KEY_FLAG
+        return (
+            bytes([Bip32KeySerConst.BINARY_CURVE_TAGS[curve_type], flags])
+            + key_net_ver.Public() + key_net_ver.Private()
+            + bytes(key_data.Depth()) + bytes(key_data.ParentFingerPrint()) + bytes(key_data.Index())
+            + bytes(key_data.ChainCode()) + key_bytes
+        )
+
+
 class Bip32DeserializedKey:
     """
     BIP32 deserialized key class.
@@ -292,3 +346,119 @@ class Bip32KeyDeserializer:
             key_bytes = key_bytes[1:]
 
         return key_bytes, key_data
+
+
+class Bip32KeyBinaryDeserializer:
+    """
+    BIP32 key binary deserializer class.
+    It deserializes a key serialized with the Bip32KeyBinarySerializer.
+    """
+
+    @classmethod
+    def DeserializeKey(cls,
+                       ser_key_bytes: bytes,
+                       curve_type: EllipticCurveTypes) -> Tuple[Bip32DeserializedKey, Bip32KeyNetVersions]:
+        """
+        Deserialize a key.
+
+        Args:
+            ser_key_bytes (bytes)          : Serialized key bytes
+            curve_type (EllipticCurveTypes): Expected elliptic curve type
+
+        Returns:
+            tuple[Bip32DeserializedKey, Bip32KeyNetVersions]: Deserialized key (index 0) and
+                                                              key net versions (index 1)
+
+        Raises:
+            Bip32KeyError: If the key is not valid
+        """
+        if len(ser_key_bytes) < Bip32KeySerConst.BINARY_HEADER_BYTE_LEN:
+            raise Bip32KeyError(f"Invalid binary key (wrong length: {len(ser_key_bytes)})")
+
+        # Validate curve tag
+        curve_tag = Bip32KeySerConst.BINARY_CURVE_TAGS[curve_type]
+        if ser_key_bytes[0] != curve_tag:
+            raise Bip32KeyError(f"Invalid binary key (wrong curve tag: {ser_key_bytes[0]})")
+
+        # Validate flags
+        flags = ser_key_bytes[1]
+        if flags & ~Bip32KeySerConst.BINARY_PRIV_KEY_FLAG:
+            raise Bip32KeyError(f"Invalid binary key (wrong flags: {flags})")
+        is_public = not flags & Bip32KeySerConst.BINARY_PRIV_KEY_FLAG
+
+        # Validate length
+        curve = EllipticCurveGetter.FromType(curve_type)
+        key_len = (curve.PublicKeyClass().CompressedLength()
+                   if is_public
+                   else curve.PrivateKeyClass().Length())
+        if len(ser_key_bytes) != Bip32KeySerConst.BINARY_HEADER_BYTE_LEN + key_len:
+            raise Bip32KeyError(f"Invalid binary key (wrong length: {len(ser_key_bytes)})")
+
+        key_net_ver, key_bytes, key_data = cls.__GetPartsFromBytes(ser_key_bytes)
+
+        return Bip32DeserializedKey(key_bytes, key_data, is_public), key_net_ver
+
+    @classmethod
+    def ToExtendedKey(cls,
+                      ser_key_bytes: bytes) -> str:
+        """
+        Convert a binary key to an extended key string.
+        The elliptic curve is taken from the binary key curve tag.
+
+        Args:
+            ser_key_bytes (bytes): Serialized key bytes
+
+        Returns:
+            str: Extended key string
+
+        Raises:
+            Bip32KeyError: If the key is not valid
+        """
+        if len(ser_key_bytes) < Bip32KeySerConst.BINARY_HEADER_BYTE_LEN:
+            raise Bip32KeyError(f"Invalid binary key (wrong length: {len(ser_key_bytes)})")
+
+        curve_types = [curve_type for curve_type, curve_tag in Bip32KeySerConst.BINARY_CURVE_TAGS.items()
+                       if curve_tag == ser_key_bytes[0]]
+        if not curve_types:
+            raise Bip32KeyError(f"Invalid binary key (wrong curve tag: {ser_key_bytes[0]})")
+
+        deser_key, key_net_ver = cls.DeserializeKey(ser_key_bytes, curve_types[0])
+        if deser_key.IsPublic():
+            return _Bip32KeySerializer.Serialize(deser_key.KeyBytes(),
+                                                 deser_key.KeyData(),
+                                                 key_net_ver.Public())
+        return _Bip32KeySerializer.Serialize(b"\x00" + deser_key.KeyBytes(),
+                                             deser_key.KeyData(),
+                                             key_net_ver.Private())
+
+    @staticmethod
+    def __GetPartsFromBytes(ser_key_bytes: bytes) -> Tuple[Bip32KeyNetVersions, bytes, Bip32KeyData]:
+        """
+        Get back key parts from serialized key bytes.
+
+        Args:
+            ser_key_bytes (bytes): Serialized key bytes
+
+        Returns:
+            tuple[Bip32KeyNetVersions, bytes, Bip32KeyData]: key net versions (index 0), key bytes (index 1)
+                                                             and key data (index 2)
+        """
+
+        # Compute indexes
+        pub_net_ver_idx = 2
+        priv_net_ver_idx = pub_net_ver_idx + Bip32KeyNetVersions.Length()
+        depth_idx = priv_net_ver_idx + Bip32KeyNetVersions.Length()
+        fprint_idx = depth_idx + Bip32Depth.FixedLength()
+        key_index_idx = fprint_idx + Bip32FingerPrint.FixedLength()
+        chain_code_idx = key_index_idx + Bip32KeyIndex.FixedLength()
+        key_idx = chain_code_idx + Bip32ChainCode.FixedLength()
+
+        # Get parts
+        key_net_ver = Bip32KeyNetVersions(ser_key_bytes[pub_net_ver_idx:priv_net_ver_idx],
+                                          ser_key_bytes[priv_net_ver_idx:depth_idx])
+        key_data = Bip32KeyData(Bip32Depth(ser_key_bytes[depth_idx]),
+                                Bip32KeyIndex.FromBytes(ser_key_bytes[key_index_idx:chain_code_idx]),
+                                Bip32ChainCode(ser_key_bytes[chain_code_idx:key_idx]),
+                                Bip32FingerPrint(ser_key_bytes[fprint_idx:key_index_idx]))
+
+        return key_net_ver, ser_key_bytes[key_idx:], key_data
@@ -25,7 +25,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import lru_cache
-from typing import Union
+from typing import Callable, Optional, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32ChainCode, Bip32FingerPrint, Bip32KeyData
@@ -39,6 +39,8 @@ from bip_utils.utils.misc import DataBytes
 class _Bip32KeyBase(ABC):
     """Base class for a generic BIP32 key."""
 
+    __slots__ = ("m_curve", "m_curve_type", "m_key_data", "m_key_net_ver")
+
     m_curve: EllipticCurve
     m_curve_type: EllipticCurveTypes
     m_key_data: Bip32KeyData
@@ -122,6 +124,8 @@ class Bip32PublicKey(_Bip32KeyBase):
     It represents a public key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_pub_key",)
+
     m_pub_key: IPublicKey
 
     @classmethod
@@ -193,6 +197,31 @@ class Bip32PublicKey(_Bip32KeyBase):
                    key_data,
                    key_net_ver)
 
+    @classmethod
+    def FromTrustedBytes(cls,
+                         key_bytes: bytes,
+                         key_data: Bip32KeyData,
+                         key_net_ver: Bip32KeyNetVersions,
+                         curve_type: EllipticCurveTypes) -> Bip32PublicKey:
+        """
+        Create from trusted bytes (e.g. previously serialized by the library itself).
+        The key bytes are not validated and they are decoded only when the key object is needed for the first
+        time, so invalid key bytes will only result in an error at that time.
+
+        Args:
+            key_bytes (bytes)                       : Key bytes
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            curve_type (EllipticCurveTypes)         : Elliptic curve type
+
+        Returns:
+            Bip32PublicKey object: Bip32PublicKey object
+        """
+        return _Bip32LazyPublicKey(lambda: cls.__KeyFromBytes(key_bytes, curve_type),
+                                   key_data,
+                                   key_net_ver,
+                                   curve_type)
+
     def __init__(self,
                  pub_key: IPublicKey,
                  key_data: Bip32KeyData,
@@ -225,7 +254,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawCompressed()
+        return self.KeyObject().RawCompressed()
 
     @lru_cache()
     def RawUncompressed(self) -> DataBytes:
@@ -235,7 +264,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             DataBytes object: DataBytes object
         """
-        return self.m_pub_key.RawUncompressed()
+        return self.KeyObject().RawUncompressed()
 
     def Point(self) -> IPoint:
         """
@@ -244,7 +273,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             IPoint object: IPoint object
         """
-        return self.m_pub_key.Point()
+        return self.KeyObject().Point()
 
     @lru_cache()
     def FingerPrint(self) -> Bip32FingerPrint:
@@ -256,6 +285,16 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return Bip32FingerPrint(self.KeyIdentifier())
 
+    def FingerPrintGetter(self) -> Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]:
+        """
+        Get key fingerprint, or a function returning it if the key is not computed yet.
+        The function can be given to children keys, so that the fingerprint is computed only if needed.
+
+        Returns:
+            Bip32FingerPrint object or function: Key fingerprint, or function returning it
+        """
+        return self.FingerPrint()
+
     @lru_cache()
     def KeyIdentifier(self) -> bytes:
         """
@@ -264,7 +303,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             bytes: Key identifier bytes
         """
-        return Hash160.QuickDigest(self.m_pub_key.RawCompressed().ToBytes())
+        return Hash160.QuickDigest(self.KeyObject().RawCompressed().ToBytes())
 
     @lru_cache()
     def ToExtended(self) -> str:
@@ -274,7 +313,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             str: Key in serialized extended format
         """
-        return Bip32PublicKeySerializer.Serialize(self.m_pub_key,
+        return Bip32PublicKeySerializer.Serialize(self.KeyObject(),
                                                   self.m_key_data,
                                                   self.m_key_net_ver)
 
@@ -321,12 +360,82 @@ class Bip32PublicKey(_Bip32KeyBase):
             raise Bip32KeyError("Invalid public key point") from ex
 
 
+class _Bip32LazyPublicKey(Bip32PublicKey):
+    """
+    BIP32 lazy public key class.
+    It represents a public key which is computed only when it's needed for the first time (e.g. from the
+    private key, or by decoding trusted key bytes). In this way, the point multiplication/decompression is
+    avoided for keys whose public key is never used (e.g. intermediate keys of a hardened derivation path).
+    """
+
+    __slots__ = ("m_key_fct",)
+
+    m_key_fct: Optional[Callable[[], IPublicKey]]
+
+    def __init__(self,
+                 key_fct: Callable[[], IPublicKey],
+                 key_data: Bip32KeyData,
+                 key_net_ver: Bip32KeyNetVersions,
+                 curve_type: EllipticCurveTypes) -> None:
+        """
+        Construct class.
+
+        Args:
+            key_fct (function)                      : Function returning the public key object
+            key_data (Bip32KeyData object)          : Key data
+            key_net_ver (Bip32KeyNetVersions object): Key net versions
+            curve_type (EllipticCurveTypes)         : Elliptic curve type
+        """
+        _Bip32KeyBase.__init__(self, key_data, key_net_ver, curve_type)
+        self.m_key_fct = key_fct
+
+    def KeyObject(self) -> IPublicKey:
+        """
+        Return the key object, computing it the first time.
+        The function reference (and so the private key, if any) is released as soon as the public key is computed.
+
+        Returns:
+            IPublicKey object: Key object
+        """
+        if self.m_key_fct is not None:
+            self.m_pub_key = self.m_key_fct()
+            self.m_key_fct = None
+        return self.m_pub_key
+
+    def FingerPrintGetter(self) -> Union[Bip32FingerPrint, Callable[[], Bip32FingerPrint]]:
+        """
+        Get key fingerprint, or a function returning it if the key is not computed yet.
+        The function computes the key through this object, so the key is computed only once even if both
+        the fingerprint and the key are used. The object is released as soon as the fingerprint is computed.
+
+        Returns:
+            Bip32FingerPrint object or function: Key fingerprint, or function returning it
+        """
+        if self.m_key_fct is None:
+            return self.FingerPrint()
+
+        pub_key: Optional[_Bip32LazyPublicKey] = self
+        fprint: Optional[Bip32FingerPrint] = None
+
+        def fprint_fct() -> Bip32FingerPrint:
+            nonlocal pub_key, fprint
+            if fprint is None:
+                assert pub_key is not None
+                fprint = Bip32FingerPrint(Hash160.QuickDigest(pub_key.KeyObject().RawCompressed().ToBytes()))
+                pub_key = None
+            return fprint
+
+        return fprint_fct
+
+
 class Bip32PrivateKey(_Bip32KeyBase):
     """
     BIP32 private key class.
     It represents a private key used by BIP32 with all the related data (e.g. depth, chain code, etc...).
     """
 
+    __slots__ = ("m_priv_key",)
+
     m_priv_key: IPrivateKey
 
     @classmethod
@@ -418,9 +527,10 @@ class Bip32PrivateKey(_Bip32KeyBase):
         Returns:
             Bip32PublicKey object: Bip32PublicKey object
         """
-        return Bip32PublicKey(self.m_priv_key.PublicKey(),
-                              self.m_key_data,
-                              self.m_key_net_ver)
+        return _Bip32LazyPublicKey(self.m_priv_key.PublicKey,
+                                   self.m_key_data,
+                                   self.m_key_net_ver,
+                                   self.m_curve_type)
 
     @lru_cache()
     def ToExtended(self) -> str:
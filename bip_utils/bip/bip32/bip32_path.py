@@ -245,3 +245,190 @@ class Bip32PathParser:
             raise Bip32PathError(f"Invalid path element ({path_elem})")
 
         return int(path_elem) if not is_hardened else Bip32KeyIndex.HardenIndex(int(path_elem))
+
+
+class Bip32PathTemplate:
+    """
+    BIP32 path template class.
+    It represents a BIP-0032 path whose elements can be placeholders (e.g. "m/44'/60'/{account}'/0/{index}").
+    The template is parsed only once, then paths are built by specifying the placeholder values, without any
+    string parsing.
+    """
+
+    m_elems: List[Union[Bip32KeyIndex, Tuple[str, bool]]]
+    m_is_absolute: bool
+    m_prefix_len: int
+    m_slot_names: List[str]
+
+    def __init__(self,
+                 template: str) -> None:
+        """
+        Construct class.
+        Placeholders are specified by a name between curly brackets, optionally followed by a hardened character.
+
+        Args:
+            template (str): Path template
+
+        Raises:
+            Bip32PathError: If the path template is not valid
+        """
+        # Remove trailing "/" if any
+        if template.endswith("/"):
+            template = template[:-1]
+
+        path_elems = [path_elem.strip() for path_elem in filter(None, template.split("/"))]
+
+        # Remove the initial "m" character if any
+        if len(path_elems) > 0 and path_elems[0] == Bip32PathConst.MASTER_CHAR:
+            path_elems = path_elems[1:]
+            self.m_is_absolute = True
+        else:
+            self.m_is_absolute = False
+
+        self.m_elems = list(map(self.__ParseElem, path_elems))
+        self.m_slot_names = [elem[0] for elem in self.m_elems if isinstance(elem, tuple)]
+        if len(set(self.m_slot_names)) != len(self.m_slot_names):
+            raise Bip32PathError(f"Duplicated placeholders in path template ({template})")
+
+        # Number of constant elements at the beginning of the path
+        self.m_prefix_len = len(self.m_elems)
+        for i, elem in enumerate(self.m_elems):
+            if isinstance(elem, tuple):
+                self.m_prefix_len = i
+                break
+
+    def IsAbsolute(self) -> bool:
+        """
+        Get if absolute path.
+
+        Returns:
+            bool: True if absolute path, false otherwise
+        """
+        return self.m_is_absolute
+
+    def SlotNames(self) -> List[str]:
+        """
+        Get the placeholder names, in the same order of the path.
+
+        Returns:
+            list[str]: Placeholder names
+        """
+        return list(self.m_slot_names)
+
+    def Prefix(self) -> Bip32Path:
+        """
+        Get the constant prefix of the path, i.e. the elements before the first placeholder.
+
+        Returns:
+            Bip32Path object: Bip32Path object
+        """
+        return Bip32Path(self.m_elems[:self.m_prefix_len], self.m_is_absolute)   # type: ignore [arg-type]
+
+    def Path(self,
+             **slot_values: int) -> Bip32Path:
+        """
+        Build the path by replacing the placeholders with the specified values.
+        Values of hardened placeholders shall not be already hardened.
+
+        Args:
+            **slot_values (int): Placeholder values, by name
+
+        Returns:
+            Bip32Path object: Bip32Path object
+
+        Raises:
+            Bip32PathError: If some placeholder values are missing, unknown or not valid
+        """
+        if len(slot_values) != len(self.m_slot_names) or any(name not in slot_values for name in self.m_slot_names):
+            raise Bip32PathError(
+                f"Invalid placeholder values ({', '.join(slot_values)}), "
+                f"expected: {', '.join(self.m_slot_names)}"
+            )
+
+        try:
+            elems = [
+                elem if isinstance(elem, Bip32KeyIndex) else self.__SlotIndex(slot_values[elem[0]], elem[1])
+                for elem in self.m_elems
+            ]
+        except ValueError as ex:
+            raise Bip32PathError("The placeholder values contain some invalid key indexes") from ex
+
+        return Bip32Path(elems, self.m_is_absolute)
+
+    def ToStr(self) -> str:
+        """
+        Get the path template as a string.
+
+        Returns:
+            str: Path template as a string
+        """
+        path_elems = [Bip32PathConst.MASTER_CHAR] if self.m_is_absolute else []
+        for elem in self.m_elems:
+            if isinstance(elem, Bip32KeyIndex):
+                path_elems.append(Bip32Path([elem], False).ToStr())
+            else:
+                path_elems.append(f"{{{elem[0]}}}'" if elem[1] else f"{{{elem[0]}}}")
+        return "/".join(path_elems)
+
+    def __str__(self) -> str:
+        """
+        Get the path template as a string.
+
+        Returns:
+            str: Path template as a string
+        """
+        return self.ToStr()
+
+    @staticmethod
+    def __SlotIndex(value: int,
+                    is_hardened: bool) -> Bip32KeyIndex:
+        """
+        Get the key index of a placeholder value.
+
+        Args:
+            value (int)       : Placeholder value
+            is_hardened (bool): True if the placeholder is hardened, false otherwise
+
+        Returns:
+            Bip32KeyIndex object: Bip32KeyIndex object
+
+        Raises:
+            ValueError: If the value is not valid
+        """
+        if is_hardened:
+            if Bip32KeyIndex.IsHardenedIndex(value):
+                raise ValueError(f"Hardened placeholder value shall not be already hardened ({value})")
+            value = Bip32KeyIndex.HardenIndex(value)
+        return Bip32KeyIndex(value)
+
+    @staticmethod
+    def __ParseElem(path_elem: str) -> Union[Bip32KeyIndex, Tuple[str, bool]]:
+        """
+        Parse path template element.
+
+        Args:
+            path_elem (str): Path template element
+
+        Returns:
+            Bip32KeyIndex object or tuple[str, bool]: Key index for constant elements, placeholder name (index 0)
+                                                      and if hardened (index 1) for placeholders
+
+        Raises:
+            Bip32PathError: If the element is not valid
+        """
+        if not path_elem.startswith("{"):
+            path = Bip32PathParser.Parse(path_elem)
+            if path.IsAbsolute() or path.Length() != 1:
+                raise Bip32PathError(f"Invalid path template element ({path_elem})")
+            return path[0]
+
+        # Get if hardened
+        is_hardened = path_elem.endswith(Bip32PathConst.HARDENED_CHARS)
+        if is_hardened:
+            path_elem = path_elem[:-1]
+
+        # The placeholder name shall be a valid identifier
+        name = path_elem[1:-1]
+        if not path_elem.endswith("}") or not name.isidentifier():
+            raise Bip32PathError(f"Invalid path template element ({path_elem})")
+        return name, is_hardened
@@ -25,7 +25,7 @@ Reference: https://github.com/LedgerHQ/orakolo/blob/master/papers/Ed25519_BIP%20
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.base import IBip32KeyDerivator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
@@ -71,34 +71,61 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
+        return cls.CkdPrivBatch(priv_key, pub_key, [index])[0]
 
-        # Get index and key bytes
-        index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = priv_key.ChainCode().ToBytes()
-        priv_key_bytes = priv_key.Raw().ToBytes()
-        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
+    @classmethod
+    def CkdPrivBatch(cls,
+                     priv_key: Bip32PrivateKey,
+                     pub_key: Bip32PublicKey,
+                     indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[bytes, bytes]]:
+        """
+        Derive the child keys with the specified indexes using private derivation.
+        The parent key data is computed only once for all the indexes.
+
+        Args:
+            priv_key (Bip32PrivateKey object)   : Bip32PrivateKey object
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes, bytes]]: Private key bytes (index 0) and chain code bytes (index 1) for each index
 
-        # Compute Z and chain code
-        if index.IsHardened():
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x00" + priv_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x01" + priv_key_bytes + index_bytes)[1]
-        else:
-            z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x02" + pub_key_bytes + index_bytes)
-            chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x03" + pub_key_bytes + index_bytes)[1]
-
-        # Compute the left and right part of the new private key
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+
+        # Get key bytes
+        curve = pub_key.Curve()
+        chain_code_hmac = priv_key.ChainCode().Hmac()
+        priv_key_bytes = priv_key.Raw().ToBytes()
         hmac_half_len = HmacSha512.DigestSize() // 2
-        kl_bytes = cls._NewPrivateKeyLeftPart(z_bytes[:hmac_half_len],
-                                              priv_key_bytes[:hmac_half_len],
-                                              pub_key.Curve())
-        kr_bytes = cls._NewPrivateKeyRightPart(z_bytes[hmac_half_len:],
-                                               priv_key_bytes[hmac_half_len:])
 
-        return kl_bytes + kr_bytes, chain_code_bytes
+        child_keys = []
+        for index in indexes:
+            index_bytes = cls._SerializeIndex(index)
+
+            # Compute Z and chain code
+            if index.IsHardened():
+                z_bytes = cls.__HmacDigest(chain_code_hmac,
+                                           b"\x00" + priv_key_bytes + index_bytes)
+                new_chain_code_bytes = cls.__HmacDigest(chain_code_hmac,
+                                                        b"\x01" + priv_key_bytes + index_bytes)[hmac_half_len:]
+            else:
+                pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
+                z_bytes = cls.__HmacDigest(chain_code_hmac,
+                                           b"\x02" + pub_key_bytes + index_bytes)
+                new_chain_code_bytes = cls.__HmacDigest(chain_code_hmac,
+                                                        b"\x03" + pub_key_bytes + index_bytes)[hmac_half_len:]
+
+            # Compute the left and right part of the new private key
+            kl_bytes = cls._NewPrivateKeyLeftPart(z_bytes[:hmac_half_len],
+                                                  priv_key_bytes[:hmac_half_len],
+                                                  curve)
+            kr_bytes = cls._NewPrivateKeyRightPart(z_bytes[hmac_half_len:],
+                                                   priv_key_bytes[hmac_half_len:])
+            child_keys.append((kl_bytes + kr_bytes, new_chain_code_bytes))
+
+        return child_keys
 
     @classmethod
     def CkdPub(cls,
@@ -117,27 +144,74 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
+        return cls.CkdPubBatch(pub_key, [index])[0]
 
-        # Get index and key bytes
-        index_bytes = cls._SerializeIndex(index)
-        chain_code_bytes = pub_key.ChainCode().ToBytes()
-        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
+    @classmethod
+    def CkdPubBatch(cls,
+                    pub_key: Bip32PublicKey,
+                    indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[Union[bytes, IPoint], bytes]]:
+        """
+        Derive the child keys with the specified indexes using public derivation.
+        The parent key data is computed only once for all the indexes.
 
-        # Compute Z and chain code
-        z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                         b"\x02" + pub_key_bytes + index_bytes)
-        chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                        b"\x03" + pub_key_bytes + index_bytes)[1]
+        Args:
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes or IPoint, bytes]]: Public key bytes or point (index 0) and chain code bytes (index 1)
+                                                 for each index
 
-        # Compute the new public key point
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+
+        # Get key bytes
+        chain_code_hmac = pub_key.ChainCode().Hmac()
+        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
         hmac_half_len = HmacSha512.DigestSize() // 2
-        new_pub_key_point = cls._NewPublicKeyPoint(pub_key,
-                                                   z_bytes[:hmac_half_len])
-        # If the public key is the identity point (0, 1) discard the child
-        if new_pub_key_point.X() == 0 and new_pub_key_point.Y() == 1:
-            raise Bip32KeyError("Computed public child key is not valid, very unlucky index")
 
-        return new_pub_key_point, chain_code_bytes
+        child_keys: List[Tuple[Union[bytes, IPoint], bytes]] = []
+        for index in indexes:
+            index_bytes = cls._SerializeIndex(index)
+
+            # Compute Z and chain code
+            z_bytes = cls.__HmacDigest(chain_code_hmac,
+                                       b"\x02" + pub_key_bytes + index_bytes)
+            new_chain_code_bytes = cls.__HmacDigest(chain_code_hmac,
+                                                    b"\x03" + pub_key_bytes + index_bytes)[hmac_half_len:]
+
+            # Compute the new public key point
+            new_pub_key_point = cls._NewPublicKeyPoint(pub_key,
+                                                       z_bytes[:hmac_half_len])
+            # If the public key is the identity point (0, 1) discard the child
+            if new_pub_key_point.X() == 0 and new_pub_key_point.Y() == 1:
+                raise Bip32KeyError("Computed public child key is not valid, very unlucky index")
+
+            child_keys.append((new_pub_key_point, new_chain_code_bytes))
+
+        return child_keys
+
+    #
+    # Private methods
+    #
+
+    @staticmethod
+    def __HmacDigest(chain_code_hmac: HmacSha512,
+                     data_bytes: bytes) -> bytes:
+        """
+        Compute the HMAC digest of the specified data, starting from the HMAC object keyed with the chain code.
+
+        Args:
+            chain_code_hmac (HmacSha512 object): HmacSha512 object keyed with the chain code
+            data_bytes (bytes)                 : Data bytes
+
+        Returns:
+            bytes: Computed digest
+        """
+        hmac = chain_code_hmac.Copy()
+        hmac.Update(data_bytes)
+        return hmac.Digest()
 
     #
     # Abstract methods
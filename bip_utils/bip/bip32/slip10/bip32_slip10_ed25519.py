@@ -37,6 +37,8 @@ class Bip32Slip10Ed25519(Bip32Base):
     It allows master keys generation and keys derivation using ed25519 curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
@@ -31,6 +31,8 @@ class Bip32Slip10Ed25519Blake2b(Bip32Slip10Ed25519):
     It allows master keys generation and keys derivation using ed25519-blake2b curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
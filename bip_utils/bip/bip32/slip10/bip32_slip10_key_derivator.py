@@ -27,14 +27,13 @@ References:
 """
 
 # Imports
-from typing import Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.base import IBip32KeyDerivator
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
 from bip_utils.bip.bip32.bip32_keys import Bip32PrivateKey, Bip32PublicKey
 from bip_utils.ecc import IPoint
-from bip_utils.utils.crypto import HmacSha512
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
@@ -80,28 +79,57 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        curve = pub_key.Curve()
-        priv_key_bytes = priv_key.Raw().ToBytes()
+        return cls.CkdPrivBatch(priv_key, pub_key, [index])[0]
 
-        # Data for HMAC
-        if index.IsHardened():
-            data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
-                          + priv_key_bytes
-                          + index.ToBytes())
-        else:
-            data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
+    @classmethod
+    def CkdPrivBatch(cls,
+                     priv_key: Bip32PrivateKey,
+                     pub_key: Bip32PublicKey,
+                     indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[bytes, bytes]]:
+        """
+        Derive the child keys with the specified indexes using private derivation.
+        The parent key data is computed only once for all the indexes.
 
-        # Compute HMAC halves
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                                          data_bytes)
+        Args:
+            priv_key (Bip32PrivateKey object)   : Bip32PrivateKey object
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
 
-        # Construct new key secret from iL and current private key
-        il_int = BytesUtils.ToInteger(il_bytes)
+        Returns:
+            list[tuple[bytes, bytes]]: Private key bytes (index 0) and chain code bytes (index 1) for each index
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        curve = pub_key.Curve()
+        curve_order = curve.Order()
+        priv_key_len = curve.PrivateKeyClass().Length()
+        chain_code_hmac = priv_key.ChainCode().Hmac()
+        priv_key_bytes = priv_key.Raw().ToBytes()
         priv_key_int = BytesUtils.ToInteger(priv_key_bytes)
-        new_priv_key_bytes = IntegerUtils.ToBytes((il_int + priv_key_int) % curve.Order(),
-                                                  bytes_num=curve.PrivateKeyClass().Length())
 
-        return new_priv_key_bytes, ir_bytes
+        child_keys = []
+        for index in indexes:
+            # Data for HMAC
+            if index.IsHardened():
+                data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
+                              + priv_key_bytes
+                              + index.ToBytes())
+            else:
+                data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
+
+            # Compute HMAC halves
+            hmac = chain_code_hmac.Copy()
+            hmac.Update(data_bytes)
+            il_bytes, ir_bytes = hmac.DigestHalves()
+
+            # Construct new key secret from iL and current private key
+            il_int = BytesUtils.ToInteger(il_bytes)
+            new_priv_key_bytes = IntegerUtils.ToBytes((il_int + priv_key_int) % curve_order,
+                                                      bytes_num=priv_key_len)
+            child_keys.append((new_priv_key_bytes, ir_bytes))
+
+        return child_keys
 
     @classmethod
     def CkdPub(cls,
@@ -120,18 +148,48 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        # Data for HMAC, same of CkdPriv() for public child key
-        data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
+        return cls.CkdPubBatch(pub_key, [index])[0]
+
+    @classmethod
+    def CkdPubBatch(cls,
+                    pub_key: Bip32PublicKey,
+                    indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[Union[bytes, IPoint], bytes]]:
+        """
+        Derive the child keys with the specified indexes using public derivation.
+        The parent key data is computed only once for all the indexes.
+
+        Args:
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes or IPoint, bytes]]: Public key bytes or point (index 0) and chain code bytes (index 1)
+                                                 for each index
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        chain_code_hmac = pub_key.ChainCode().Hmac()
+        pub_key_bytes = pub_key.RawCompressed().ToBytes()
+        # The key may have been created with a different backend of the curve
+        pub_key_point = pub_key.Curve().PointClass().FromPoint(pub_key.Point())
+        generator = pub_key.Curve().Generator()
+
+        child_keys: List[Tuple[Union[bytes, IPoint], bytes]] = []
+        for index in indexes:
+            # Data for HMAC, same of CkdPriv() for public child key
+            data_bytes = pub_key_bytes + index.ToBytes()
 
-        # Get HMAC of data
-        il_bytes, ir_bytes = HmacSha512.QuickDigestHalves(pub_key.ChainCode().ToBytes(),
-                                                          data_bytes)
-        il_int = BytesUtils.ToInteger(il_bytes)
+            # Get HMAC of data
+            hmac = chain_code_hmac.Copy()
+            hmac.Update(data_bytes)
+            il_bytes, ir_bytes = hmac.DigestHalves()
+            il_int = BytesUtils.ToInteger(il_bytes)
 
-        # Get a new public key point: pub_key_point + G*iL
-        new_pub_key_point = pub_key.Point() + (pub_key.Curve().Generator() * il_int)
+            # Get a new public key point: pub_key_point + G*iL
+            child_keys.append((pub_key_point + (generator * il_int), ir_bytes))
 
-        return new_pub_key_point, ir_bytes
+        return child_keys
 
 
 class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
@@ -169,16 +227,42 @@ class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
         Raises:
             Bip32KeyError: If the index results in an invalid key
         """
-        if not index.IsHardened():
+        return cls.CkdPrivBatch(priv_key, pub_key, [index])[0]
+
+    @classmethod
+    def CkdPrivBatch(cls,
+                     priv_key: Bip32PrivateKey,
+                     pub_key: Bip32PublicKey,
+                     indexes: Sequence[Bip32KeyIndex]) -> List[Tuple[bytes, bytes]]:
+        """
+        Derive the child keys with the specified indexes using private derivation.
+        The parent key data is computed only once for all the indexes.
+
+        Args:
+            priv_key (Bip32PrivateKey object)   : Bip32PrivateKey object
+            pub_key (Bip32PublicKey object)     : Bip32PublicKey object
+            indexes (list[Bip32KeyIndex object]): Key indexes
+
+        Returns:
+            list[tuple[bytes, bytes]]: Private key bytes (index 0) and chain code bytes (index 1) for each index
+
+        Raises:
+            Bip32KeyError: If one of the indexes results in an invalid key
+        """
+        if not all(index.IsHardened() for index in indexes):
             raise Bip32KeyError("Private child derivation with not-hardened index is not supported")
 
-        # Data for HMAC
-        data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
-                      + priv_key.Raw().ToBytes()
-                      + index.ToBytes())
-        # Compute HMAC halves
-        return HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
-                                            data_bytes)
+        chain_code_hmac = priv_key.ChainCode().Hmac()
+        data_prefix_bytes = Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX + priv_key.Raw().ToBytes()
+
+        child_keys = []
+        for index in indexes:
+            # Compute HMAC halves
+            hmac = chain_code_hmac.Copy()
+            hmac.Update(data_prefix_bytes + index.ToBytes())
+            child_keys.append(hmac.DigestHalves())
+
+        return child_keys
 
     @classmethod
     def CkdPub(cls,
@@ -37,6 +37,8 @@ class Bip32Slip10Nist256p1(Bip32Base):
     It allows master keys generation and keys derivation using nist256p1 curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
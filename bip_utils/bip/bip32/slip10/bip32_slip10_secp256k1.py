@@ -37,6 +37,8 @@ class Bip32Slip10Secp256k1(Bip32Base):
     It allows master keys generation and keys derivation using secp256k1 curve.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
@@ -1,5 +1,6 @@
 from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyBitLen, Bip39EntropyGenerator
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39WordsNum
+from bip_utils.bip.bip39.bip39_mnemonic_bulk_validator import Bip39MnemonicBulkValidator
 from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
 from bip_utils.bip.bip39.bip39_mnemonic_encoder import Bip39MnemonicEncoder
 from bip_utils.bip.bip39.bip39_mnemonic_generator import Bip39MnemonicGenerator
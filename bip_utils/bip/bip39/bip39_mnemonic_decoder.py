@@ -24,13 +24,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
-from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
-from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
-from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicWordsList
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39MnemonicUtils, Bip39WordsListFinder, Bip39WordsListGetter
+from bip_utils.utils.misc import IntegerUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicUtils
 
 
 class Bip39MnemonicDecoder(MnemonicDecoderBase):
@@ -68,9 +67,10 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        mnemonic_int, mnemonic_bit_len = self.__DecodeAndVerifyInteger(mnemonic)
+        checksum_len = self.__GetChecksumLen(mnemonic_bit_len)
 
-        return self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
+        return IntegerUtils.ToBytes(mnemonic_int >> checksum_len, (mnemonic_bit_len - checksum_len) // 8)
 
     def DecodeWithChecksum(self,
                            mnemonic: Union[str, Mnemonic]) -> bytes:
@@ -87,26 +87,21 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        mnemonic_int, mnemonic_bit_len = self.__DecodeAndVerifyInteger(mnemonic)
 
-        # Compute pad bit length
-        mnemonic_bit_len = len(mnemonic_bin_str)
-        pad_bit_len = (mnemonic_bit_len
-                       if mnemonic_bit_len % 8 == 0
-                       else mnemonic_bit_len + (8 - mnemonic_bit_len % 8))
+        # Pad to a whole number of bytes
+        return IntegerUtils.ToBytes(mnemonic_int, (mnemonic_bit_len + 7) // 8)
 
-        return BytesUtils.FromBinaryStr(mnemonic_bin_str, pad_bit_len // 4)
-
-    def __DecodeAndVerifyBinaryStr(self,
-                                   mnemonic: Union[str, Mnemonic]) -> str:
+    def __DecodeAndVerifyInteger(self,
+                                 mnemonic: Union[str, Mnemonic]) -> Tuple[int, int]:
         """
-        Decode a mnemonic phrase to its mnemonic binary string by verifying the checksum.
+        Decode a mnemonic phrase to its packed integer (i.e. word indexes bits) by verifying the checksum.
 
         Args:
             mnemonic (str or Mnemonic object): Mnemonic
 
         Returns:
-            str: Mnemonic binary string
+            tuple[int, int]: Mnemonic integer (index 0), mnemonic bit length (index 1)
 
         Raises:
             MnemonicChecksumError: If checksum is not valid
@@ -121,94 +116,36 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
         # Detect language if it was not specified at construction
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
-        # Get back mnemonic binary string
-        mnemonic_bin_str = self.__MnemonicToBinaryStr(mnemonic_obj, words_list)
+        # Get back mnemonic integer
+        mnemonic_int = MnemonicUtils.WordIndexesToInteger(
+            map(words_list.GetWordIdx, mnemonic_obj.ToList()),
+            Bip39MnemonicConst.WORD_BIT_LEN
+        )
+        mnemonic_bit_len = mnemonic_obj.WordsCount() * Bip39MnemonicConst.WORD_BIT_LEN
 
         # Verify checksum
-        checksum_bin_str = mnemonic_bin_str[-self.__GetChecksumLen(mnemonic_bin_str):]
-        checksum_bin_str_got = self.__ComputeChecksumBinaryStr(mnemonic_bin_str)
+        checksum_len = self.__GetChecksumLen(mnemonic_bit_len)
+        checksum = mnemonic_int & ((1 << checksum_len) - 1)
+        checksum_got = Bip39MnemonicUtils.ComputeChecksum(
+            IntegerUtils.ToBytes(mnemonic_int >> checksum_len, (mnemonic_bit_len - checksum_len) // 8)
+        )
 
-        if checksum_bin_str != checksum_bin_str_got:
+        if checksum != checksum_got:
             raise MnemonicChecksumError(
-                f"Invalid checksum (expected {checksum_bin_str}, got {checksum_bin_str_got})"
+                f"Invalid checksum (expected {checksum:0{checksum_len}b}, got {checksum_got:0{checksum_len}b})"
             )
 
-        return mnemonic_bin_str
-
-    def __ComputeChecksumBinaryStr(self,
-                                   mnemonic_bin_str: str) -> str:
-        """
-        Compute checksum from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           str: Computed checksum binary string
-        """
-
-        # Get entropy bytes
-        entropy_bytes = self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
-        # Convert entropy hash to binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-
-        # Return checksum
-        return entropy_hash_bin_str[:self.__GetChecksumLen(mnemonic_bin_str)]
-
-    def __EntropyBytesFromBinaryStr(self,
-                                    mnemonic_bin_str: str) -> bytes:
-        """
-        Get entropy bytes from mnemonic binary string.
-
-        Args:
-            mnemonic_bin_str (str): Mnemonic binary string
-
-        Returns:
-           bytes: Entropy bytes
-        """
-
-        # Get checksum length
-        checksum_len = self.__GetChecksumLen(mnemonic_bin_str)
-        # Get back entropy binary string
-        entropy_bin_str = mnemonic_bin_str[:-checksum_len]
-
-        # Get entropy bytes from binary string
-        return BytesUtils.FromBinaryStr(entropy_bin_str, checksum_len * 8)
-
-    @staticmethod
-    def __MnemonicToBinaryStr(mnemonic: Mnemonic,
-                              words_list: MnemonicWordsList) -> str:
-        """
-        Get mnemonic binary string from mnemonic phrase.
-
-        Args:
-            mnemonic (Mnemonic object)           : Mnemonic object
-            words_list (MnemonicWordsList object): Words list object
-
-        Returns:
-           str: Mnemonic binary string
-
-        Raises:
-            ValueError: If the one of the mnemonic word is not valid
-        """
-
-        # Convert each word to its index in binary format
-        mnemonic_bin_str = map(lambda word: IntegerUtils.ToBinaryStr(words_list.GetWordIdx(word),
-                                                                     Bip39MnemonicConst.WORD_BIT_LEN),
-                               mnemonic.ToList())
-
-        return "".join(mnemonic_bin_str)
+        return mnemonic_int, mnemonic_bit_len
 
     @staticmethod
-    def __GetChecksumLen(mnemonic_bin_str: str) -> int:
+    def __GetChecksumLen(mnemonic_bit_len: int) -> int:
         """
-        Get checksum length from mnemonic binary string.
+        Get checksum length from mnemonic bit length.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonic_bit_len (int): Mnemonic bit length
 
         Returns:
            int: Checksum length
         """
-        return len(mnemonic_bin_str) // 33
+        return mnemonic_bit_len // 33
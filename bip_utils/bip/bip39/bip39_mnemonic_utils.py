@@ -25,6 +25,8 @@ import os
 from typing import Tuple
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst
+from bip_utils.utils.crypto import Sha256
+from bip_utils.utils.misc import BytesUtils
 from bip_utils.utils.mnemonic import (
     Mnemonic,
     MnemonicLanguages,
@@ -34,6 +36,24 @@ from bip_utils.utils.mnemonic import (
 )
 
 
+class Bip39MnemonicUtils:
+    """Class container for BIP39 mnemonic utility functions."""
+
+    @staticmethod
+    def ComputeChecksum(entropy_bytes: bytes) -> int:
+        """
+        Compute checksum, i.e. the first (entropy bit length / 32) bits of the entropy SHA256.
+
+        Args:
+            entropy_bytes (bytes): Entropy bytes
+
+        Returns:
+            int: Computed checksum
+        """
+        checksum_len = len(entropy_bytes) // 4
+        return BytesUtils.ToInteger(Sha256.QuickDigest(entropy_bytes)) >> (Sha256.DigestSize() * 8 - checksum_len)
+
+
 class Bip39WordsListGetter(MnemonicWordsListGetterBase):
     """
     BIP39 words list getter class.
@@ -60,19 +80,19 @@ class Bip39WordsListGetter(MnemonicWordsListGetterBase):
             raise TypeError("Language is not an enumerative of Bip39Languages")
 
         return self._LoadWordsList(lang,
-                                   self.__GetLanguageFile(lang),
+                                   self.GetLanguageFile(lang),
                                    Bip39MnemonicConst.WORDS_LIST_NUM)
 
-    @staticmethod
-    def __GetLanguageFile(lang: MnemonicLanguages) -> str:
+    def GetLanguageFile(self,
+                        lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the words list file of the specified language.
 
         Args:
             lang (MnemonicLanguages): Language
 
         Returns:
-            str: Language file name
+            str: File path
         """
         return os.path.join(os.path.dirname(__file__),
                             Bip39MnemonicConst.LANGUAGE_FILES[lang])
@@ -24,7 +24,10 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
@@ -80,10 +83,149 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
         Args:
             passphrase (str, optional): Passphrase, empty if not specified
 
+        Returns:
+            bytes: Generated seed
+        """
+        return self.__GenerateSeed(self.m_mnemonic.ToStr(), passphrase)
+
+    @classmethod
+    def GenerateMany(cls,
+                     mnemonics: Sequence[Union[str, Mnemonic]],
+                     passphrases: Union[str, Sequence[str]] = "",
+                     lang: Optional[Bip39Languages] = None,
+                     worker_num: Optional[int] = None) -> List[bytes]:
+        """
+        Generate the seeds of multiple mnemonics.
+        All the mnemonics are validated before generating any seed, then seeds are generated by a pool of threads
+        (PBKDF2 releases the GIL, so threads run in parallel). Seeds are returned in the same order of the mnemonics.
+
+        Args:
+            mnemonics (Sequence[str or Mnemonic object]): Mnemonics
+            passphrases (str or Sequence[str], optional): Passphrase for all the mnemonics, or one passphrase
+                                                          for each mnemonic (default: empty)
+            lang (Bip39Languages, optional)             : Language, None for automatic detection
+            worker_num (int, optional)                  : Number of worker threads (default: number of processors)
+
+        Returns:
+            list[bytes]: Generated seeds
+
+        Raises:
+            MnemonicChecksumError: If the checksum of any mnemonic is not valid
+            ValueError: If any mnemonic, the number of passphrases or the number of workers is not valid
+        """
+        mnemonic_strs, passphrases_list = cls.__PrepareMany(mnemonics, passphrases, lang, worker_num)
+
+        # No need to spawn threads for a single worker
+        if worker_num == 1:
+            return list(map(cls.__GenerateSeed, mnemonic_strs, passphrases_list))
+
+        with ThreadPoolExecutor(worker_num or os.cpu_count() or 1) as executor:
+            return list(executor.map(cls.__GenerateSeed, mnemonic_strs, passphrases_list))
+
+    @classmethod
+    async def GenerateManyAsync(cls,
+                                mnemonics: Sequence[Union[str, Mnemonic]],
+                                passphrases: Union[str, Sequence[str]] = "",
+                                lang: Optional[Bip39Languages] = None,
+                                worker_num: Optional[int] = None) -> List[bytes]:
+        """
+        Generate the seeds of multiple mnemonics without blocking the event loop.
+        Same as GenerateMany, but the mnemonics are validated in the default executor of the event loop and
+        the pool of threads is awaited. If cancelled, the seeds not started yet are not generated.
+
+        Args:
+            mnemonics (Sequence[str or Mnemonic object]): Mnemonics
+            passphrases (str or Sequence[str], optional): Passphrase for all the mnemonics, or one passphrase
+                                                          for each mnemonic (default: empty)
+            lang (Bip39Languages, optional)             : Language, None for automatic detection
+            worker_num (int, optional)                  : Number of worker threads (default: number of processors)
+
+        Returns:
+            list[bytes]: Generated seeds
+
+        Raises:
+            MnemonicChecksumError: If the checksum of any mnemonic is not valid
+            ValueError: If any mnemonic, the number of passphrases or the number of workers is not valid
+        """
+        # Validating many mnemonics takes time, so do not block the event loop
+        loop = asyncio.get_running_loop()
+        mnemonic_strs, passphrases_list = await loop.run_in_executor(
+            None, cls.__PrepareMany, mnemonics, passphrases, lang, worker_num
+        )
+
+        executor = ThreadPoolExecutor(worker_num or os.cpu_count() or 1)
+        futures = [
+            loop.run_in_executor(executor, cls.__GenerateSeed, mnemonic_str, passphrase)
+            for mnemonic_str, passphrase in zip(mnemonic_strs, passphrases_list)
+        ]
+        try:
+            return list(await asyncio.gather(*futures))
+        finally:
+            # If cancelled (or failed), drop the seeds not started yet and do not block the event loop
+            # waiting for the running ones
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def __PrepareMany(mnemonics: Sequence[Union[str, Mnemonic]],
+                      passphrases: Union[str, Sequence[str]],
+                      lang: Optional[Bip39Languages],
+                      worker_num: Optional[int]) -> Tuple[List[str], List[str]]:
+        """
+        Validate the parameters for generating the seeds of multiple mnemonics.
+
+        Args:
+            mnemonics (Sequence[str or Mnemonic object]): Mnemonics
+            passphrases (str or Sequence[str])          : Passphrase for all the mnemonics, or one passphrase
+                                                          for each mnemonic
+            lang (Bip39Languages, optional)             : Language, None for automatic detection
+            worker_num (int, optional)                  : Number of worker threads
+
+        Returns:
+            tuple[list[str], list[str]]: Mnemonic strings (index 0), passphrases (index 1)
+
+        Raises:
+            MnemonicChecksumError: If the checksum of any mnemonic is not valid
+            ValueError: If any mnemonic, the number of passphrases or the number of workers is not valid
+        """
+        if worker_num is not None and worker_num <= 0:
+            raise ValueError(f"Invalid number of workers ({worker_num})")
+
+        passphrases_list = ([passphrases] * len(mnemonics)
+                            if isinstance(passphrases, str)
+                            else list(passphrases))
+        if len(passphrases_list) != len(mnemonics):
+            raise ValueError(
+                f"Number of passphrases ({len(passphrases_list)}) is different from "
+                f"number of mnemonics ({len(mnemonics)})"
+            )
+
+        # Make sure that all the given mnemonics are valid, using the same validator
+        mnemonic_validator = Bip39MnemonicValidator(lang)
+        mnemonic_strs = []
+        for mnemonic in mnemonics:
+            mnemonic_validator.Validate(mnemonic)
+            mnemonic_strs.append(
+                Bip39Mnemonic.FromString(mnemonic).ToStr() if isinstance(mnemonic, str) else mnemonic.ToStr()
+            )
+
+        return mnemonic_strs, passphrases_list
+
+    @staticmethod
+    def __GenerateSeed(mnemonic_str: str,
+                       passphrase: str) -> bytes:
+        """
+        Generate the seed of a mnemonic using the specified passphrase.
+
+        Args:
+            mnemonic_str (str): Mnemonic string
+            passphrase (str)  : Passphrase
+
         Returns:
             bytes: Generated seed
         """
         salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
+        return Pbkdf2HmacSha512.DeriveKey(mnemonic_str,
                                           salt,
                                           Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
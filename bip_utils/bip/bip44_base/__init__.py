@@ -1,3 +1,6 @@
+from bip_utils.bip.bip44_base.bip44_addr_index import Bip44AddrIndex, Bip44AddrIndexWriter
 from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+from bip_utils.bip.bip44_base.bip44_gap_scanner import Bip44GapScanner, Bip44GapScanResult
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base.bip44_parallel_deriver import Bip44ParallelDeriver
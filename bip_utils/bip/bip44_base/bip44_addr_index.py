@@ -0,0 +1,576 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for indexing BIP44 addresses, to get back the derivation path of an address."""
+
+# Imports
+import heapq
+import mmap
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from bip_utils.addr.iaddr_decoder import IAddrDecoder
+from bip_utils.bip.bip32 import Bip32Base
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes
+from bip_utils.bip.bip44_base.bip44_keys import Bip44PublicKey
+from bip_utils.bip.conf.common import BipCoinConf
+
+
+class Bip44AddrIndexConst:
+    """Class container for BIP44 address index constants."""
+
+    # File magic
+    FILE_MAGIC: bytes = b"BUAI"
+    # File version
+    FILE_VERSION: int = 2
+    # File header: magic, version, key length, path length, reserved byte
+    FILE_HEADER: struct.Struct = struct.Struct(">4sBBBx")
+    # Segment directory entry: offset of the first record, number of records
+    SEGMENT_ENTRY: struct.Struct = struct.Struct(">QQ")
+    # File footer: segment directory offset, number of segments
+    FILE_FOOTER: struct.Struct = struct.Struct(">QQ")
+    # Default maximum number of pending addresses, before they are automatically flushed
+    DEFAULT_MAX_PENDING: int = 100000
+    # Default maximum number of segments, before they are automatically compacted
+    DEFAULT_MAX_SEGMENTS: int = 8
+    # Default path length (account, change, address index)
+    DEFAULT_PATH_LEN: int = 3
+    # Path element length in bytes
+    PATH_ELEM_BYTE_LEN: int = 4
+    # Maximum key and path lengths
+    MAX_KEY_LEN: int = 255
+    MAX_PATH_LEN: int = 255
+
+
+class _Bip44AddrIndexUtils:
+    """Class container for BIP44 address index utility functions."""
+
+    @staticmethod
+    def PathStruct(path_len: int) -> struct.Struct:
+        """
+        Get the structure for encoding a path.
+
+        Args:
+            path_len (int): Path length
+
+        Returns:
+            struct.Struct object: Path structure
+        """
+        return struct.Struct(f">{path_len}I")
+
+    @staticmethod
+    def ReadHeader(header_bytes: bytes) -> Tuple[int, int]:
+        """
+        Read the file header.
+
+        Args:
+            header_bytes (bytes): Header bytes
+
+        Returns:
+            tuple[int, int]: Key length (index 0) and path length (index 1)
+
+        Raises:
+            ValueError: If the header is not valid
+        """
+        if len(header_bytes) < Bip44AddrIndexConst.FILE_HEADER.size:
+            raise ValueError("Invalid address index file (header too short)")
+
+        magic, version, key_len, path_len = Bip44AddrIndexConst.FILE_HEADER.unpack_from(header_bytes)
+        if magic != Bip44AddrIndexConst.FILE_MAGIC:
+            raise ValueError("Invalid address index file (wrong magic)")
+        if version != Bip44AddrIndexConst.FILE_VERSION:
+            raise ValueError(f"Invalid address index file (unsupported version: {version})")
+        return key_len, path_len
+
+    @staticmethod
+    def ReadSegments(buff: mmap.mmap,
+                     rec_len: int) -> List[Tuple[int, int]]:
+        """
+        Read the segment directory from the end of the file, without reading the records.
+
+        Args:
+            buff (mmap object): Memory-mapped file
+            rec_len (int)     : Record length
+
+        Returns:
+            list[tuple[int, int]]: Offset of the first record (index 0) and number of records (index 1)
+                                   for each segment, in writing order
+
+        Raises:
+            ValueError: If the file is truncated
+        """
+        footer_offset = len(buff) - Bip44AddrIndexConst.FILE_FOOTER.size
+        if footer_offset < Bip44AddrIndexConst.FILE_HEADER.size:
+            raise ValueError("Invalid address index file (truncated footer)")
+
+        dir_offset, seg_num = Bip44AddrIndexConst.FILE_FOOTER.unpack_from(buff, footer_offset)
+        if (dir_offset < Bip44AddrIndexConst.FILE_HEADER.size
+                or dir_offset + seg_num * Bip44AddrIndexConst.SEGMENT_ENTRY.size != footer_offset):
+            raise ValueError("Invalid address index file (truncated segment directory)")
+
+        segments = list(Bip44AddrIndexConst.SEGMENT_ENTRY.iter_unpack(buff[dir_offset:footer_offset]))
+        if any(seg_offset < Bip44AddrIndexConst.FILE_HEADER.size or seg_offset + rec_num * rec_len > dir_offset
+               for seg_offset, rec_num in segments):
+            raise ValueError("Invalid address index file (truncated segment)")
+        return segments
+
+    @staticmethod
+    def WriteSegments(fout: BinaryIO,
+                      segments: List[Tuple[int, int]]) -> None:
+        """
+        Write the segment directory and the file footer at the current position.
+
+        Args:
+            fout (BinaryIO object)          : File
+            segments (list[tuple[int, int]]): Offset of the first record (index 0) and number of records (index 1)
+                                              for each segment, in writing order
+        """
+        dir_offset = fout.tell()
+        fout.write(b"".join(Bip44AddrIndexConst.SEGMENT_ENTRY.pack(*segment) for segment in segments))
+        fout.write(Bip44AddrIndexConst.FILE_FOOTER.pack(dir_offset, len(segments)))
+
+
+class Bip44AddrIndex:
+    """
+    BIP44 address index class.
+    It allows to get back the derivation path of an address from an index file written by Bip44AddrIndexWriter.
+    The file is memory-mapped and records are never parsed when opening it, only the header and the segment
+    directory at the end of the file are read.
+    Addresses are decoded with the specified address decoder and the resulting bytes (e.g. public key hash,
+    witness program) are looked for using binary search in each segment, starting from the most recent one.
+    """
+
+    m_addr_dec_cls: Type[IAddrDecoder]
+    m_addr_params: Dict[str, Any]
+    m_file: BinaryIO
+    m_buff: mmap.mmap
+    m_key_len: int
+    m_path_struct: struct.Struct
+    m_rec_len: int
+    m_segments: List[Tuple[int, int]]
+
+    def __init__(self,
+                 file_path: str,
+                 addr_dec_cls: Type[IAddrDecoder],
+                 **addr_params: Any) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str)                 : Index file path
+            addr_dec_cls (IAddrDecoder class): Address decoder class
+            **addr_params                   : Address decoder parameters
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        self.m_addr_dec_cls = addr_dec_cls
+        self.m_addr_params = addr_params
+        self.m_file = open(file_path, "rb")     # pylint: disable=consider-using-with
+        try:
+            self.m_buff = mmap.mmap(self.m_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.m_key_len, path_len = _Bip44AddrIndexUtils.ReadHeader(
+                self.m_buff[:Bip44AddrIndexConst.FILE_HEADER.size]
+            )
+            self.m_path_struct = _Bip44AddrIndexUtils.PathStruct(path_len)
+            self.m_rec_len = self.m_key_len + self.m_path_struct.size
+            # Most recent segments first
+            self.m_segments = _Bip44AddrIndexUtils.ReadSegments(self.m_buff, self.m_rec_len)[::-1]
+        except ValueError:
+            self.Close()
+            raise
+
+    def Close(self) -> None:
+        """Close the index file."""
+        if hasattr(self, "m_buff"):
+            self.m_buff.close()
+        self.m_file.close()
+
+    def KeyLength(self) -> int:
+        """
+        Get the length of the decoded address bytes.
+
+        Returns:
+            int: Key length
+        """
+        return self.m_key_len
+
+    def PathLength(self) -> int:
+        """
+        Get the number of elements of each path.
+
+        Returns:
+            int: Path length
+        """
+        return self.m_path_struct.size // Bip44AddrIndexConst.PATH_ELEM_BYTE_LEN
+
+    def SegmentsNum(self) -> int:
+        """
+        Get the number of segments.
+
+        Returns:
+            int: Number of segments
+        """
+        return len(self.m_segments)
+
+    def RecordsNum(self) -> int:
+        """
+        Get the total number of records (duplicated addresses in different segments are counted more times).
+
+        Returns:
+            int: Number of records
+        """
+        return sum(rec_num for _, rec_num in self.m_segments)
+
+    def Lookup(self,
+               addr: str) -> Optional[Tuple[int, ...]]:
+        """
+        Get the path of the specified address.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            tuple[int, ...]: Path elements, None if the address is not in the index
+
+        Raises:
+            ValueError: If the address is not valid for the address decoder
+        """
+        return self.LookupKey(self.m_addr_dec_cls.DecodeAddr(addr, **self.m_addr_params))
+
+    def LookupKey(self,
+                  key_bytes: bytes) -> Optional[Tuple[int, ...]]:
+        """
+        Get the path of the specified decoded address bytes.
+
+        Args:
+            key_bytes (bytes): Decoded address bytes
+
+        Returns:
+            tuple[int, ...]: Path elements, None if the address is not in the index
+        """
+        if len(key_bytes) != self.m_key_len:
+            return None
+
+        buff = self.m_buff
+        for seg_offset, rec_num in self.m_segments:
+            low, high = 0, rec_num
+            while low < high:
+                mid = (low + high) // 2
+                rec_offset = seg_offset + mid * self.m_rec_len
+                rec_key_bytes = buff[rec_offset:rec_offset + self.m_key_len]
+                if rec_key_bytes < key_bytes:
+                    low = mid + 1
+                elif rec_key_bytes > key_bytes:
+                    high = mid
+                else:
+                    return self.m_path_struct.unpack_from(buff, rec_offset + self.m_key_len)
+        return None
+
+
+class Bip44AddrIndexWriter:
+    """
+    BIP44 address index writer class.
+    It writes addresses and their derivation paths to an index file, that can be read by Bip44AddrIndex.
+    Addresses are decoded with the specified address decoder and stored in fixed-width records, together with
+    their path. Each flush appends a new sorted segment to the file, so the index can be extended incrementally
+    (the most recent path is returned for addresses written more times). Pending addresses are flushed
+    automatically when their number reaches the specified maximum, so that memory doesn't grow indefinitely.
+    Since lookups search each segment, segments are automatically merged into a single one (i.e. the file is
+    compacted) when their number exceeds the specified maximum, so lookups stay fast for large indexes.
+    The existing data is never overwritten when flushing (the new segment, segment directory and footer are
+    appended to the file), so an interrupted flush doesn't corrupt the previously written addresses.
+    """
+
+    m_file_path: str
+    m_addr_dec_cls: Type[IAddrDecoder]
+    m_addr_params: Dict[str, Any]
+    m_key_len: Optional[int]
+    m_path_struct: struct.Struct
+    m_max_pending: Optional[int]
+    m_max_segments: Optional[int]
+    m_pending: Dict[bytes, Tuple[int, ...]]
+
+    def __init__(self,
+                 file_path: str,
+                 addr_dec_cls: Type[IAddrDecoder],
+                 path_len: int = Bip44AddrIndexConst.DEFAULT_PATH_LEN,
+                 max_pending: Optional[int] = Bip44AddrIndexConst.DEFAULT_MAX_PENDING,
+                 max_segments: Optional[int] = Bip44AddrIndexConst.DEFAULT_MAX_SEGMENTS,
+                 **addr_params: Any) -> None:
+        """
+        Construct class.
+        If the file already exists, new records will be appended to it.
+
+        Args:
+            file_path (str)                 : Index file path
+            addr_dec_cls (IAddrDecoder class): Address decoder class
+            path_len (int, optional)        : Number of elements of each path (default: 3)
+            max_pending (int, optional)     : Maximum number of pending addresses before flushing them
+                                              (default: 100000, None: no limit)
+            max_segments (int, optional)    : Maximum number of segments before compacting the file
+                                              (default: 8, None: no limit)
+            **addr_params                   : Address decoder parameters
+
+        Raises:
+            ValueError: If the path length or the maximum number of pending addresses or segments is not valid,
+                        or the path length is not matching the existing file
+        """
+        if path_len <= 0 or path_len > Bip44AddrIndexConst.MAX_PATH_LEN:
+            raise ValueError(f"Invalid path length ({path_len})")
+        if max_pending is not None and max_pending <= 0:
+            raise ValueError(f"Invalid maximum number of pending addresses ({max_pending})")
+        if max_segments is not None and max_segments <= 0:
+            raise ValueError(f"Invalid maximum number of segments ({max_segments})")
+
+        self.m_file_path = file_path
+        self.m_addr_dec_cls = addr_dec_cls
+        self.m_addr_params = addr_params
+        self.m_key_len = None
+        self.m_path_struct = _Bip44AddrIndexUtils.PathStruct(path_len)
+        self.m_max_pending = max_pending
+        self.m_max_segments = max_segments
+        self.m_pending = {}
+
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            with open(file_path, "rb") as fin:
+                self.m_key_len, file_path_len = _Bip44AddrIndexUtils.ReadHeader(
+                    fin.read(Bip44AddrIndexConst.FILE_HEADER.size)
+                )
+            if file_path_len != path_len:
+                raise ValueError(f"Path length ({path_len}) not matching the existing file ({file_path_len})")
+
+    def PendingNum(self) -> int:
+        """
+        Get the number of addresses not flushed yet.
+
+        Returns:
+            int: Number of pending addresses
+        """
+        return len(self.m_pending)
+
+    def AddAddress(self,
+                   addr: str,
+                   path: Sequence[int]) -> None:
+        """
+        Add an address with its derivation path.
+        Pending addresses are flushed if their number reaches the maximum.
+
+        Args:
+            addr (str)           : Address string
+            path (sequence[int]) : Path elements
+
+        Raises:
+            ValueError: If the address or the path is not valid
+        """
+        if len(path) != self.PathLength():
+            raise ValueError(f"Invalid path length ({len(path)})")
+        if any(elem < 0 or elem > 0xFFFFFFFF for elem in path):
+            raise ValueError(f"Invalid path elements ({path})")
+
+        key_bytes = self.m_addr_dec_cls.DecodeAddr(addr, **self.m_addr_params)
+        if self.m_key_len is None:
+            if len(key_bytes) > Bip44AddrIndexConst.MAX_KEY_LEN:
+                raise ValueError(f"Invalid decoded address length ({len(key_bytes)})")
+            self.m_key_len = len(key_bytes)
+        elif len(key_bytes) != self.m_key_len:
+            raise ValueError(f"Invalid decoded address length ({len(key_bytes)})")
+
+        self.m_pending[key_bytes] = tuple(path)
+        if self.m_max_pending is not None and len(self.m_pending) >= self.m_max_pending:
+            self.Flush()
+
+    def AddBip44Addresses(self,
+                          bip_obj: Bip44Base,
+                          change_type: Bip44Changes,
+                          start: int,
+                          stop: int) -> None:
+        """
+        Add the addresses of the specified change type with indexes from start to stop (excluded).
+        Paths are (account, change, address index), so the path length shall be 3.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at account level
+            change_type (Bip44Changes): Change type, must be a Bip44Changes enum
+            start (int)               : Start address index
+            stop (int)                : Stop address index (excluded)
+
+        Raises:
+            TypeError: If change type is not a Bip44Changes enum
+            Bip44DepthError: If the Bip44Base object is not at account level
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the path length is not 3 or the indexes are not valid
+        """
+        if self.PathLength() != Bip44AddrIndexConst.DEFAULT_PATH_LEN:
+            raise ValueError(f"BIP44 addresses require a path length of {Bip44AddrIndexConst.DEFAULT_PATH_LEN}")
+
+        acc_idx = bip_obj.Bip32Object().Index().Unharden().ToInt()
+        for addr_idx, _, addr in bip_obj.IterAddresses(change_type, start, stop):
+            self.AddAddress(addr, (acc_idx, int(change_type), addr_idx))
+
+    def AddBip32Addresses(self,
+                          bip32_obj: Bip32Base,
+                          coin_conf: BipCoinConf,
+                          start: int,
+                          stop: int,
+                          path_prefix: Sequence[int] = ()) -> None:
+        """
+        Add the addresses of the child keys with indexes from start to stop (excluded).
+        Paths are the path prefix followed by the child index.
+
+        Args:
+            bip32_obj (Bip32Base object)         : Bip32Base object
+            coin_conf (BipCoinConf object)       : Coin configuration used to encode the addresses
+            start (int)                          : Start index
+            stop (int)                           : Stop index (excluded)
+            path_prefix (sequence[int], optional): Path prefix (default: empty)
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the path or the indexes are not valid
+        """
+        path_prefix = tuple(path_prefix)
+        for bip32_child_obj in bip32_obj.IterChildKeys(start, stop):
+            addr = Bip44PublicKey(bip32_child_obj.PublicKey(), coin_conf).ToAddress()
+            self.AddAddress(addr, path_prefix + (bip32_child_obj.Index().ToInt(),))
+
+    def Flush(self) -> None:
+        """
+        Write the pending addresses to the file as a new sorted segment.
+        The file is compacted if the number of segments exceeds the maximum.
+        """
+        if not self.m_pending:
+            return
+
+        with open(self.m_file_path, "r+b" if os.path.exists(self.m_file_path) else "wb") as fout:
+            file_size = fout.seek(0, os.SEEK_END)
+            if file_size == 0:
+                segments = []
+            else:
+                with mmap.mmap(fout.fileno(), 0, access=mmap.ACCESS_READ) as buff:
+                    segments = _Bip44AddrIndexUtils.ReadSegments(buff, self.__RecordLength())
+
+            # Append the new segment and directory after the old ones, which are kept valid until the new
+            # footer is written. The old directory becomes unused space, removed when compacting.
+            try:
+                if file_size == 0:
+                    fout.write(self.__Header())
+                segments.append((fout.tell(), len(self.m_pending)))
+                fout.write(
+                    b"".join(key_bytes + self.m_path_struct.pack(*path)
+                             for key_bytes, path in sorted(self.m_pending.items()))
+                )
+                _Bip44AddrIndexUtils.WriteSegments(fout, segments)
+            except BaseException:
+                fout.truncate(file_size)
+                raise
+        self.m_pending.clear()
+
+        if self.m_max_segments is not None and len(segments) > self.m_max_segments:
+            self.Compact()
+
+    def Compact(self) -> None:
+        """
+        Flush the pending addresses and merge all the segments into a single one.
+        For addresses written more times, only the most recent path is kept.
+        """
+        self.Flush()
+        if not os.path.exists(self.m_file_path):
+            return
+
+        tmp_file_path = self.m_file_path + ".tmp"
+        index = Bip44AddrIndex(self.m_file_path, self.m_addr_dec_cls, **self.m_addr_params)
+        try:
+            if index.SegmentsNum() <= 1:
+                return
+
+            with open(tmp_file_path, "wb") as fout:
+                fout.write(self.__Header())
+
+                rec_num = 0
+                last_key_bytes = None
+                for key_bytes, _, rec_bytes in heapq.merge(*self.__SegmentsRecords(index)):
+                    if key_bytes != last_key_bytes:
+                        fout.write(rec_bytes)
+                        rec_num += 1
+                        last_key_bytes = key_bytes
+
+                _Bip44AddrIndexUtils.WriteSegments(fout, [(Bip44AddrIndexConst.FILE_HEADER.size, rec_num)])
+        finally:
+            index.Close()
+
+        os.replace(tmp_file_path, self.m_file_path)
+
+    def PathLength(self) -> int:
+        """
+        Get the number of elements of each path.
+
+        Returns:
+            int: Path length
+        """
+        return self.m_path_struct.size // Bip44AddrIndexConst.PATH_ELEM_BYTE_LEN
+
+    def __RecordLength(self) -> int:
+        """
+        Get the record length.
+
+        Returns:
+            int: Record length
+        """
+        return (self.m_key_len or 0) + self.m_path_struct.size
+
+    def __Header(self) -> bytes:
+        """
+        Get the file header.
+
+        Returns:
+            bytes: File header
+        """
+        return Bip44AddrIndexConst.FILE_HEADER.pack(Bip44AddrIndexConst.FILE_MAGIC,
+                                                    Bip44AddrIndexConst.FILE_VERSION,
+                                                    self.m_key_len,
+                                                    self.PathLength())
+
+    @staticmethod
+    def __SegmentsRecords(index: Bip44AddrIndex) -> List[Iterator[Tuple[bytes, int, bytes]]]:
+        """
+        Get an iterator over the records of each segment.
+        Records are tuples of key bytes, segment priority (most recent first) and record bytes,
+        so that merging them results in the most recent record first for each key.
+
+        Args:
+            index (Bip44AddrIndex object): Bip44AddrIndex object
+
+        Returns:
+            list[Iterator[tuple[bytes, int, bytes]]]: Iterators over the records of each segment
+        """
+        def seg_records(seg_prio: int,
+                        seg_offset: int,
+                        rec_num: int) -> Iterator[Tuple[bytes, int, bytes]]:
+            for i in range(rec_num):
+                rec_offset = seg_offset + i * index.m_rec_len
+                yield (index.m_buff[rec_offset:rec_offset + index.m_key_len],
+                       seg_prio,
+                       index.m_buff[rec_offset:rec_offset + index.m_rec_len])
+
+        # Segments are already sorted from the most recent one
+        return [seg_records(seg_prio, seg_offset, rec_num)
+                for seg_prio, (seg_offset, rec_num) in enumerate(index.m_segments)]
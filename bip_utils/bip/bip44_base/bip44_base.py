@@ -27,9 +27,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
 from functools import lru_cache
-from typing import Union
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
-from bip_utils.bip.bip32 import Bip32Base, Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32 import Bip32Base, Bip32ExKeyCache, Bip32KeyBinaryDeserializer, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
@@ -96,13 +96,15 @@ class Bip44Base(ABC):
     @classmethod
     def _FromExtendedKey(cls,
                          ex_key_str: str,
-                         coin_conf: BipCoinConf) -> Bip44Base:
+                         coin_conf: BipCoinConf,
+                         cache: Optional[Bip32ExKeyCache]) -> Bip44Base:
         """
         Create a Bip44Base object from the specified extended key.
 
         Args:
-            ex_key_str (str)       : Extended key string
-            coin_conf (BipCoinConf): BipCoinConf object
+            ex_key_str (str)              : Extended key string
+            coin_conf (BipCoinConf)       : BipCoinConf object
+            cache (Bip32ExKeyCache object): Extended keys cache (None for no cache)
 
         Returns:
             Bip44Base object: Bip44Base object
@@ -111,7 +113,30 @@ class Bip44Base(ABC):
             Bip32KeyError: If the extended key is not valid
         """
         bip32_cls = coin_conf.Bip32Class()
-        return cls(bip32_cls.FromExtendedKey(ex_key_str, coin_conf.KeyNetVersions()),
+        return cls(bip32_cls.FromExtendedKey(ex_key_str, coin_conf.KeyNetVersions(), cache),
+                   coin_conf)
+
+    @classmethod
+    def _FromBinary(cls,
+                    ser_key_bytes: bytes,
+                    coin_conf: BipCoinConf,
+                    trusted: bool) -> Bip44Base:
+        """
+        Create a Bip44Base object from the specified binary key.
+
+        Args:
+            ser_key_bytes (bytes)  : Binary key bytes
+            coin_conf (BipCoinConf): BipCoinConf object
+            trusted (bool)         : True if the key is trusted, false otherwise
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            Bip32KeyError: If the binary key is not valid
+        """
+        bip32_cls = coin_conf.Bip32Class()
+        return cls(bip32_cls.FromBinary(ser_key_bytes, trusted),
                    coin_conf)
 
     @classmethod
@@ -258,6 +283,31 @@ class Bip44Base(ABC):
         """
         return self.m_bip32_obj.IsPublicOnly()
 
+    def ToBinary(self) -> bytes:
+        """
+        Return the key in compact binary format.
+
+        Returns:
+            bytes: Key in binary format
+        """
+        return self.m_bip32_obj.ToBinary()
+
+    def __reduce__(self) -> Tuple[Callable[..., Bip44Base], Tuple[Any, ...]]:
+        """
+        Get the object state for pickling.
+        The object is pickled in binary format together with its coin type, and loaded back as trusted.
+        If the coin configuration is not one of the supported coins (e.g. a custom one), the whole configuration
+        is pickled.
+
+        Returns:
+            tuple: Function to recreate the object (index 0) and its arguments (index 1)
+        """
+        coin_type = next((coin_type for coin_type, coin_conf in self._CoinConfs().items()
+                          if coin_conf is self.m_coin_conf), None)
+        if coin_type is not None:
+            return self.__class__.FromBinary, (self.ToBinary(), coin_type, True)
+        return self.__class__, (self.m_bip32_obj, self.m_coin_conf)
+
     def Level(self) -> Bip44Levels:
         """
         Return the current level.
@@ -303,6 +353,71 @@ class Bip44Base(ABC):
         return self.__class__(bip_obj.m_bip32_obj.DerivePath(bip_obj.m_coin_conf.DefaultPath()),
                               bip_obj.m_coin_conf)
 
+    def IterAddresses(self,
+                      change_type: Bip44Changes,
+                      start: int,
+                      stop: int) -> Iterator[Tuple[int, bytes, str]]:
+        """
+        Iterate over the addresses of the specified change type with indexes from start to stop (excluded).
+        It shall be called from the account level. Keys are derived in small batches and not kept,
+        so the memory usage doesn't depend on the number of addresses.
+
+        Args:
+            change_type (Bip44Changes): Change type, must a Bip44Changes enum
+            start (int)               : Start address index
+            stop (int)                : Stop address index (excluded)
+
+        Returns:
+            Iterator[tuple[int, bytes, str]]: Iterator over address index, compressed public key bytes and address
+
+        Raises:
+            TypeError: If change type is not a Bip44Changes enum
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the start or stop index is not valid
+        """
+        yield from self.Change(change_type).IterChangeAddresses(start, stop)
+
+    def IterChangeAddresses(self,
+                            start: int,
+                            stop: int) -> Iterator[Tuple[int, bytes, str]]:
+        """
+        Iterate over the addresses with indexes from start to stop (excluded).
+        Same as IterAddresses, but it shall be called from the change level. This allows iterating more ranges
+        of the same chain without deriving the change key again.
+
+        Args:
+            start (int): Start address index
+            stop (int) : Stop address index (excluded)
+
+        Returns:
+            Iterator[tuple[int, bytes, str]]: Iterator over address index, compressed public key bytes and address
+
+        Raises:
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the start or stop index is not valid
+        """
+        if not self.IsLevel(Bip44Levels.CHANGE):
+            raise Bip44DepthError(
+                f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving address"
+            )
+
+        bip32_chg_obj = self.m_bip32_obj
+
+        # Use hardened derivation if not-hardended is not supported
+        idx_offset = (Bip32KeyIndex.HardenIndex(0)
+                      if not bip32_chg_obj.IsPublicDerivationSupported()
+                      else 0)
+
+        for bip32_addr_obj in bip32_chg_obj.IterChildKeys(start + idx_offset, stop + idx_offset):
+            pub_key = Bip44PublicKey(bip32_addr_obj.PublicKey(), self.m_coin_conf)
+            yield (
+                bip32_addr_obj.Index().ToInt() - idx_offset,
+                pub_key.RawCompressed().ToBytes(),
+                pub_key.ToAddress(),
+            )
+
     #
     # Protected class methods
     #
@@ -470,13 +585,15 @@ class Bip44Base(ABC):
     @abstractmethod
     def FromExtendedKey(cls,
                         ex_key_str: str,
-                        coin_type: BipCoins) -> Bip44Base:
+                        coin_type: BipCoins,
+                        cache: Optional[Bip32ExKeyCache] = None) -> Bip44Base:
         """
         Create a Bip44Base object from the specified extended key.
 
         Args:
-            ex_key_str (str)    : Extended key string
-            coin_type (BipCoins): Coin type (the type depends on the specific child class)
+            ex_key_str (str)                        : Extended key string
+            coin_type (BipCoins)                    : Coin type (the type depends on the specific child class)
+            cache (Bip32ExKeyCache object, optional): Extended keys cache (default: None)
 
         Returns:
             Bip44Base object: Bip44Base object
@@ -486,6 +603,30 @@ class Bip44Base(ABC):
             Bip32KeyError: If the extended key is not valid
         """
 
+    @classmethod
+    def FromBinary(cls,
+                   ser_key_bytes: bytes,
+                   coin_type: BipCoins,
+                   trusted: bool = False) -> Bip44Base:
+        """
+        Create a Bip44Base object from the specified binary key.
+        The default implementation converts the binary key to an extended key and calls FromExtendedKey,
+        so the key is always validated. Child classes can override it to support trusted keys.
+
+        Args:
+            ser_key_bytes (bytes)   : Binary key bytes
+            coin_type (BipCoins)    : Coin type (the type depends on the specific child class)
+            trusted (bool, optional): True if the key is trusted, false otherwise (default)
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            TypeError: If coin type is not of the correct type
+            Bip32KeyError: If the binary key is not valid
+        """
+        return cls.FromExtendedKey(Bip32KeyBinaryDeserializer.ToExtendedKey(ser_key_bytes), coin_type)
+
     @classmethod
     @abstractmethod
     def FromPrivateKey(cls,
@@ -621,3 +762,14 @@ class Bip44Base(ABC):
         Returns:
             str: Specification name
         """
+
+    @staticmethod
+    def _CoinConfs() -> Dict[BipCoins, BipCoinConf]:
+        """
+        Get the configurations of the supported coins, used for pickling the coin type instead of its
+        configuration.
+
+        Returns:
+            dict: Coin configurations by coin type (empty if not available)
+        """
+        return {}
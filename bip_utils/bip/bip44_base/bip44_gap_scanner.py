@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for scanning BIP44 accounts up to the gap limit."""
+
+# Imports
+from typing import Callable, Container, Dict, List, Union
+
+from bip_utils.bip.bip32 import Bip32KeyIndex
+from bip_utils.bip.bip44_base.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
+
+
+class Bip44GapScannerConst:
+    """Class container for BIP44 gap scanner constants."""
+
+    # Default gap limit
+    DEFAULT_GAP_LIMIT: int = 20
+
+
+class Bip44GapScanResult:
+    """
+    BIP44 gap scan result class.
+    It contains the result of scanning a single chain.
+    """
+
+    m_used_indexes: List[int]
+    m_scanned_num: int
+
+    def __init__(self,
+                 used_indexes: List[int],
+                 scanned_num: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            used_indexes (list[int]): Used address indexes, in ascending order
+            scanned_num (int)       : Number of scanned addresses
+        """
+        self.m_used_indexes = used_indexes
+        self.m_scanned_num = scanned_num
+
+    def UsedIndexes(self) -> List[int]:
+        """
+        Get the used address indexes.
+
+        Returns:
+            list[int]: Used address indexes, in ascending order
+        """
+        return self.m_used_indexes
+
+    def NextFreeIndex(self) -> int:
+        """
+        Get the next free address index, i.e. the one following the last used address.
+
+        Returns:
+            int: Next free address index (0 if no address is used)
+        """
+        return self.m_used_indexes[-1] + 1 if self.m_used_indexes else 0
+
+    def ScannedNum(self) -> int:
+        """
+        Get the number of scanned addresses.
+
+        Returns:
+            int: Number of scanned addresses
+        """
+        return self.m_scanned_num
+
+
+class Bip44GapScanner:
+    """
+    BIP44 gap scanner class.
+    It scans the chains of an account, deriving addresses until a number of consecutive unused addresses
+    equal to the gap limit is found (e.g. for restoring a wallet).
+    Addresses are derived in windows using batched derivation, without keeping the keys in memory.
+    """
+
+    m_bip_obj: Bip44Base
+    m_is_used_fct: Callable[[str], bool]
+    m_gap_limit: int
+
+    def __init__(self,
+                 bip_obj: Bip44Base,
+                 is_used: Union[Container[str], Callable[[str], bool]],
+                 gap_limit: int = Bip44GapScannerConst.DEFAULT_GAP_LIMIT) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base object)     : Bip44Base object at account level
+            is_used (container or function): Container of used addresses (e.g. a set), or function returning
+                                             if the specified address is used
+            gap_limit (int, optional)      : Gap limit (default: 20)
+
+        Raises:
+            Bip44DepthError: If the Bip44Base object is not at account level
+            ValueError: If the gap limit is not valid
+        """
+        if not bip_obj.IsLevel(Bip44Levels.ACCOUNT):
+            raise Bip44DepthError(
+                f"Current depth ({bip_obj.Bip32Object().Depth().ToInt()}) is not suitable for scanning addresses"
+            )
+        if gap_limit <= 0:
+            raise ValueError(f"Invalid gap limit ({gap_limit})")
+
+        self.m_bip_obj = bip_obj
+        self.m_is_used_fct = is_used if callable(is_used) else is_used.__contains__
+        self.m_gap_limit = gap_limit
+
+    def GapLimit(self) -> int:
+        """
+        Get the gap limit.
+
+        Returns:
+            int: Gap limit
+        """
+        return self.m_gap_limit
+
+    def Scan(self,
+             change_type: Bip44Changes) -> Bip44GapScanResult:
+        """
+        Scan the chain of the specified change type.
+
+        Args:
+            change_type (Bip44Changes): Change type, must be a Bip44Changes enum
+
+        Returns:
+            Bip44GapScanResult object: Bip44GapScanResult object
+
+        Raises:
+            TypeError: If change type is not a Bip44Changes enum
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        # Derive the change key only once for all the windows
+        bip_chg_obj = self.m_bip_obj.Change(change_type)
+        max_stop = Bip32KeyIndex.HardenIndex(0)
+
+        used_indexes = []
+        start = 0
+        stop = min(self.m_gap_limit, max_stop)
+        # Each window ends after gap limit addresses from the last used one, which moves while scanning
+        while start < stop:
+            for addr_idx, _, addr in bip_chg_obj.IterChangeAddresses(start, stop):
+                if self.m_is_used_fct(addr):
+                    used_indexes.append(addr_idx)
+            start = stop
+            if used_indexes:
+                stop = min(used_indexes[-1] + 1 + self.m_gap_limit, max_stop)
+
+        return Bip44GapScanResult(used_indexes, start)
+
+    def ScanAll(self) -> Dict[Bip44Changes, Bip44GapScanResult]:
+        """
+        Scan all the chains (i.e. external and internal).
+
+        Returns:
+            dict[Bip44Changes, Bip44GapScanResult object]: Result for each change type
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        return {change_type: self.Scan(change_type) for change_type in Bip44Changes}
@@ -0,0 +1,159 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for deriving large ranges of BIP44 addresses using multiple processes."""
+
+# Imports
+from typing import Iterator, List, Optional, Tuple, Union
+
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex, Bip32PathError, Bip32PathTemplate
+from bip_utils.bip.bip44_base.bip44_keys import Bip44PublicKey
+from bip_utils.bip.conf.common import BipCoinConf
+from bip_utils.utils.misc import ProcessPoolUtils
+
+
+class Bip44ParallelDeriverConst:
+    """Class container for BIP44 parallel deriver constants."""
+
+    # Default number of indexes derived by each task
+    DEFAULT_CHUNK_SIZE: int = 1000
+    # Default path template
+    DEFAULT_PATH_TEMPLATE: str = "{index}"
+
+
+class Bip44ParallelDeriver:
+    """
+    BIP44 parallel deriver class.
+    It derives a range of indexes starting from an extended key and computes the related public keys and addresses.
+    The range is split in chunks that are derived by a pool of processes, results are returned in order.
+    """
+
+    m_ser_key_bytes: bytes
+    m_coin_conf: BipCoinConf
+    m_is_hardened: bool
+    m_chunk_size: int
+    m_worker_num: Optional[int]
+
+    def __init__(self,
+                 ex_key: str,
+                 coin_conf: BipCoinConf,
+                 path_template: Union[str, Bip32PathTemplate] = Bip44ParallelDeriverConst.DEFAULT_PATH_TEMPLATE,
+                 chunk_size: int = Bip44ParallelDeriverConst.DEFAULT_CHUNK_SIZE,
+                 worker_num: Optional[int] = None) -> None:
+        """
+        Construct class.
+        The path template is relative to the extended key and its last element shall be its only placeholder,
+        i.e. the index (e.g. "0/{index}", or "0'/{index}'" for hardened indexes).
+        The constant part of the path is derived only once.
+
+        Args:
+            ex_key (str)                                      : Extended key string
+            coin_conf (BipCoinConf object)                    : BipCoinConf object
+            path_template (str or Bip32PathTemplate, optional): Path template (default: "{index}")
+            chunk_size (int, optional)                        : Number of indexes derived by each task (default: 1000)
+            worker_num (int, optional)                        : Number of worker processes
+                                                                (default: number of processors)
+
+        Raises:
+            Bip32KeyError: If the extended key is not valid or the path derivation results in an invalid key
+            Bip32PathError: If the path template is not valid
+            ValueError: If the chunk size or the number of workers is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        ProcessPoolUtils.CheckWorkersNum(worker_num)
+
+        if isinstance(path_template, str):
+            path_template = Bip32PathTemplate(path_template)
+        slot_names = path_template.SlotNames()
+        if len(slot_names) != 1:
+            raise Bip32PathError(f"Invalid path template ({path_template})")
+        idx_path = path_template.Path(**{slot_names[0]: 0})
+        path_prefix = path_template.Prefix()
+        if path_prefix.Length() != idx_path.Length() - 1:
+            raise Bip32PathError(f"Invalid path template ({path_template})")
+
+        # Derive the constant part of the path once, the workers will start from the resulting key
+        bip32_obj = coin_conf.Bip32Class().FromExtendedKey(ex_key, coin_conf.KeyNetVersions())
+        bip32_obj = bip32_obj.DerivePath(path_prefix)
+
+        # Workers receive the key in binary format, which is faster to load than the extended key
+        self.m_ser_key_bytes = bip32_obj.ToBinary()
+        self.m_coin_conf = coin_conf
+        self.m_is_hardened = idx_path[-1].IsHardened()
+        self.m_chunk_size = chunk_size
+        self.m_worker_num = worker_num
+
+    def Derive(self,
+               start: int,
+               stop: int) -> Iterator[Tuple[int, bytes, str]]:
+        """
+        Derive the indexes in the range [start, stop).
+        Indexes are hardened automatically if the path template index is hardened.
+
+        Args:
+            start (int): Start index (included)
+            stop (int) : Stop index (excluded)
+
+        Returns:
+            Iterator[tuple[int, bytes, str]]: Iterator over index, compressed public key bytes and address
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the range is not valid or the address cannot be computed for the coin
+        """
+        if start < 0 or stop < start or stop > Bip32KeyIndex.HardenIndex(0):
+            raise ValueError(f"Invalid index range ({start}, {stop})")
+
+        chunks_args = ((self.m_ser_key_bytes, self.m_coin_conf, self.m_is_hardened,
+                        chunk_start, min(chunk_start + self.m_chunk_size, stop))
+                       for chunk_start in range(start, stop, self.m_chunk_size))
+
+        yield from ProcessPoolUtils.MapChunks(self._DeriveChunk, chunks_args, self.m_worker_num)
+
+    @staticmethod
+    def _DeriveChunk(ser_key_bytes: bytes,
+                     coin_conf: BipCoinConf,
+                     is_hardened: bool,
+                     start: int,
+                     stop: int) -> List[Tuple[int, bytes, str]]:
+        """
+        Derive the indexes in the range [start, stop).
+        It's executed by the worker processes, so it only depends on its arguments.
+
+        Args:
+            ser_key_bytes (bytes)         : Key in binary format
+            coin_conf (BipCoinConf object): BipCoinConf object
+            is_hardened (bool)            : True if indexes shall be hardened, false otherwise
+            start (int)                   : Start index (included)
+            stop (int)                    : Stop index (excluded)
+
+        Returns:
+            list[tuple[int, bytes, str]]: Index, compressed public key bytes and address for each index
+        """
+        bip32_obj = coin_conf.Bip32Class().FromBinary(ser_key_bytes, True)
+        idx_offset = Bip32KeyIndex.HardenIndex(0) if is_hardened else 0
+        child_objs: List[Bip32Base] = bip32_obj.ChildKeysRange(start + idx_offset, stop - start)
+
+        results = []
+        for idx, child_obj in enumerate(child_objs, start):
+            pub_key = Bip44PublicKey(child_obj.PublicKey(), coin_conf)
+            results.append((idx, pub_key.RawCompressed().ToBytes(), pub_key.ToAddress()))
+        return results
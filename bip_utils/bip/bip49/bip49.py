@@ -24,12 +24,13 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0049.mediawiki
 """
 
 # Imports
-from typing import Union
+from typing import Dict, Optional, Union
 
-from bip_utils.bip.bip32 import Bip32KeyData, Bip32KeyIndex
+from bip_utils.bip.bip32 import Bip32ExKeyCache, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.bip.conf.bip49 import Bip49ConfGetter
-from bip_utils.bip.conf.common import BipCoins
+from bip_utils.bip.conf.bip49.bip49_conf_getter import Bip49ConfGetterConst
+from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 from bip_utils.ecc import IPrivateKey, IPublicKey
 
 
@@ -79,13 +80,15 @@ class Bip49(Bip44Base):
     @classmethod
     def FromExtendedKey(cls,
                         ex_key_str: str,
-                        coin_type: BipCoins) -> Bip44Base:
+                        coin_type: BipCoins,
+                        cache: Optional[Bip32ExKeyCache] = None) -> Bip44Base:
         """
         Create a Bip44Base object from the specified extended key.
 
         Args:
-            ex_key_str (str)    : Extended key string
-            coin_type (BipCoins): Coin type, shall be a Bip49Coins enum
+            ex_key_str (str)                        : Extended key string
+            coin_type (BipCoins)                    : Coin type, shall be a Bip49Coins enum
+            cache (Bip32ExKeyCache object, optional): Extended keys cache (default: None)
 
         Returns:
             Bip44Base object: Bip44Base object
@@ -96,7 +99,31 @@ class Bip49(Bip44Base):
         """
 
         # Bip49ConfGetter already checks the enum type
-        return cls._FromExtendedKey(ex_key_str, Bip49ConfGetter.GetConfig(coin_type))
+        return cls._FromExtendedKey(ex_key_str, Bip49ConfGetter.GetConfig(coin_type), cache)
+
+    @classmethod
+    def FromBinary(cls,
+                   ser_key_bytes: bytes,
+                   coin_type: BipCoins,
+                   trusted: bool = False) -> Bip44Base:
+        """
+        Create a Bip44Base object from the specified binary key.
+
+        Args:
+            ser_key_bytes (bytes)   : Binary key bytes
+            coin_type (BipCoins)    : Coin type, shall be a Bip49Coins enum
+            trusted (bool, optional): True if the key is trusted, false otherwise (default)
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            TypeError: If coin type is not a Bip49Coins enum
+            Bip32KeyError: If the binary key is not valid
+        """
+
+        # Bip49ConfGetter already checks the enum type
+        return cls._FromBinary(ser_key_bytes, Bip49ConfGetter.GetConfig(coin_type), trusted)
 
     @classmethod
     def FromPrivateKey(cls,
@@ -245,3 +272,13 @@ class Bip49(Bip44Base):
             str: Specification name
         """
         return Bip49Const.SPEC_NAME
+
+    @staticmethod
+    def _CoinConfs() -> Dict[BipCoins, BipCoinConf]:
+        """
+        Get the configurations of the supported coins.
+
+        Returns:
+            dict: Coin configurations by coin type
+        """
+        return Bip49ConfGetterConst.COIN_TO_CONF
@@ -37,6 +37,8 @@ class CardanoByronLegacyBip32(Bip32Base):
     keys derivation.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
@@ -34,6 +34,8 @@ class CardanoIcarusBip32(Bip32KholawEd25519):
     Derivation based on BIP32 ed25519 Khovratovich/Law with a different algorithm for master key generation.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _MasterKeyGenerator() -> Type[IBip32MstKeyGenerator]:
         """
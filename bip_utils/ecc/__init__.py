@@ -1,9 +1,11 @@
 # Common
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.interning_cache import EccInterningCache, EccInterningCacheStats
 from bip_utils.ecc.common.ipoint import IPoint
 
 # Curve
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import EllipticCurveBackend, EllipticCurveBackends
 from bip_utils.ecc.curve.elliptic_curve_getter import EllipticCurveGetter
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 
@@ -29,9 +31,7 @@ from bip_utils.ecc.ed25519_monero.ed25519_monero_keys import Ed25519MoneroPrivat
 from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
 
 # nist256p1
-from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
-from bip_utils.ecc.nist256p1.nist256p1_keys import Nist256p1PrivateKey, Nist256p1PublicKey
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1, Nist256p1Point, Nist256p1PrivateKey, Nist256p1PublicKey
 
 # secp256k1
 from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
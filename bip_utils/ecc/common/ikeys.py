@@ -26,6 +26,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
+from bip_utils.ecc.common.interning_cache import EccInterningCache
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.utils.misc import DataBytes
@@ -37,6 +38,18 @@ class IPublicKey(ABC):
     Verify method is missing because not needed.
     """
 
+    def __init_subclass__(cls,
+                          **kwargs: Any) -> None:
+        """
+        Initialize subclass.
+        Public keys created from bytes are interned, if the interning cache is enabled for the curve.
+
+        Args:
+            **kwargs: Arbitrary arguments
+        """
+        super().__init_subclass__(**kwargs)
+        EccInterningCache.InternFromBytes(cls)
+
     @classmethod
     @abstractmethod
     def FromBytes(cls,
@@ -71,6 +84,26 @@ class IPublicKey(ABC):
             ValueError: If key point is not valid
         """
 
+    @classmethod
+    def FromPublicKey(cls,
+                      pub_key: IPublicKey) -> IPublicKey:
+        """
+        Construct class from a public key of the same curve, possibly implemented by another backend.
+        The key is returned as it is if it's already of this class.
+
+        Args:
+            pub_key (IPublicKey object): Public key
+
+        Returns:
+            IPublicKey: IPublicKey object
+
+        Raises:
+            ValueError: If the public key is not valid
+        """
+        if isinstance(pub_key, cls):
+            return pub_key
+        return cls.FromBytes(pub_key.RawCompressed().ToBytes())
+
     @staticmethod
     @abstractmethod
     def CurveType() -> EllipticCurveTypes:
@@ -197,6 +230,26 @@ class IPrivateKey(ABC):
             ValueError: If key bytes are not valid
         """
 
+    @classmethod
+    def FromPrivateKey(cls,
+                       priv_key: IPrivateKey) -> IPrivateKey:
+        """
+        Construct class from a private key of the same curve, possibly implemented by another backend.
+        The key is returned as it is if it's already of this class.
+
+        Args:
+            priv_key (IPrivateKey object): Private key
+
+        Returns:
+            IPrivateKey: IPrivateKey object
+
+        Raises:
+            ValueError: If the private key is not valid
+        """
+        if isinstance(priv_key, cls):
+            return priv_key
+        return cls.FromBytes(priv_key.Raw().ToBytes())
+
     @staticmethod
     @abstractmethod
     def CurveType() -> EllipticCurveTypes:
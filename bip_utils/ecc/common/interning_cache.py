@@ -0,0 +1,257 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for interning public keys and points created from bytes.
+It's useful when the same keys are validated repeatedly (e.g. addresses of a payout list), since validating and
+decompressing a public key is expensive compared to a dictionary lookup.
+"""
+
+# Imports
+import functools
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.utils.misc import LruCache, LruCacheStats
+
+
+class EccInterningCacheConst:
+    """Class container for interning cache constants."""
+
+    # Default maximum number of objects for each curve
+    DEFAULT_MAX_SIZE: int = 4096
+
+
+# Statistics of the interning cache of a curve, kept for compatibility
+EccInterningCacheStats = LruCacheStats
+
+
+class _EccInterningCacheData(LruCache):
+    """Interning cache of a single curve, objects are keyed by class and bytes."""
+
+    def Get(self,
+            key: Tuple[type, bytes]) -> Optional[Any]:
+        """
+        Get an object, updating statistics.
+
+        Args:
+            key (tuple): Class and bytes
+
+        Returns:
+            Any: Object (None if not present)
+        """
+        return self._Get(key)
+
+    def Put(self,
+            key: Tuple[type, bytes],
+            obj: Any) -> Any:
+        """
+        Put an object, evicting the least recently used one if full.
+        If another thread put the same key in the meantime, its object is kept.
+
+        Args:
+            key (tuple): Class and bytes
+            obj (Any)  : Object
+
+        Returns:
+            Any: Interned object
+        """
+        return self._Put(key, obj)
+
+
+class EccInterningCache:
+    """
+    Interning cache class.
+    When enabled for a curve, public keys and points created with FromBytes are kept (keyed by class and bytes)
+    and the same already-validated object is returned for the same bytes, instead of creating a new one.
+    Only valid bytes are cached, invalid ones are validated (and rejected) every time.
+    The cache is disabled by default, and it's bounded (least recently used objects are evicted).
+    """
+
+    m_caches: Dict[EllipticCurveTypes, _EccInterningCacheData] = {}
+    m_lock: threading.Lock = threading.Lock()
+    m_local: threading.local = threading.local()
+    m_interned_fcts: weakref.WeakSet = weakref.WeakSet()
+
+    @classmethod
+    def Enable(cls,
+               curve_type: EllipticCurveTypes,
+               max_size: int = EccInterningCacheConst.DEFAULT_MAX_SIZE) -> None:
+        """
+        Enable the cache for the specified curve.
+        If already enabled, it's cleared and the new maximum size is used.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+            max_size (int, optional)       : Maximum number of objects (default: 4096)
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If the maximum size is not valid
+        """
+        cls.__CheckCurveType(curve_type)
+        if max_size <= 0:
+            raise ValueError(f"Invalid maximum size ({max_size})")
+        with cls.m_lock:
+            cls.m_caches[curve_type] = _EccInterningCacheData(max_size)
+
+    @classmethod
+    def Disable(cls,
+                curve_type: EllipticCurveTypes) -> None:
+        """
+        Disable the cache for the specified curve, releasing its objects.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        with cls.m_lock:
+            cls.m_caches.pop(curve_type, None)
+
+    @classmethod
+    def IsEnabled(cls,
+                  curve_type: EllipticCurveTypes) -> bool:
+        """
+        Get if the cache is enabled for the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            bool: True if enabled, false otherwise
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        return curve_type in cls.m_caches
+
+    @classmethod
+    def Clear(cls,
+              curve_type: Optional[EllipticCurveTypes] = None) -> None:
+        """
+        Clear objects and statistics of the specified curve, or of all curves if not specified.
+        The cache remains enabled.
+
+        Args:
+            curve_type (EllipticCurveTypes, optional): Curve type (default: all curves)
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        if curve_type is not None:
+            cls.__CheckCurveType(curve_type)
+        with cls.m_lock:
+            caches = list(cls.m_caches.values()) if curve_type is None else [cls.m_caches.get(curve_type)]
+        for cache in caches:
+            if cache is not None:
+                cache.Clear()
+
+    @classmethod
+    def Stats(cls,
+              curve_type: EllipticCurveTypes) -> LruCacheStats:
+        """
+        Get the statistics of the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            LruCacheStats object: LruCacheStats object
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If the cache is not enabled for the curve
+        """
+        cls.__CheckCurveType(curve_type)
+        cache = cls.m_caches.get(curve_type)
+        if cache is None:
+            raise ValueError(f"Interning cache is not enabled for {curve_type}")
+        return cache.Stats()
+
+    @classmethod
+    def InternFromBytes(cls,
+                        obj_cls: type) -> None:
+        """
+        Wrap the FromBytes method defined by the specified class, so that it uses the cache of the curve of the
+        class when enabled.
+        Nothing is done if the class doesn't define its own FromBytes class method, or if it's already wrapped.
+
+        Args:
+            obj_cls (class): Class
+        """
+        from_bytes = obj_cls.__dict__.get("FromBytes")
+        if isinstance(from_bytes, classmethod) and from_bytes.__func__ not in cls.m_interned_fcts:
+            setattr(obj_cls, "FromBytes", cls.Interned(from_bytes.__func__))
+
+    @classmethod
+    def Interned(cls,
+                 from_bytes_fct: Callable[[Any, bytes], Any]) -> classmethod:
+        """
+        Wrap a FromBytes method, so that it uses the cache of the curve of the class when enabled.
+        The cache is only used by the outermost call, so a FromBytes calling the one of its parent class
+        (e.g. with super) is cached once.
+
+        Args:
+            from_bytes_fct (function): FromBytes function (i.e. not bound to the class)
+
+        Returns:
+            classmethod: Wrapped FromBytes method
+        """
+        @functools.wraps(from_bytes_fct)
+        def _from_bytes(obj_cls: Any,
+                        obj_bytes: bytes) -> Any:
+            cache = cls.m_caches.get(obj_cls.CurveType())
+            if (cache is None
+                    or not isinstance(obj_bytes, (bytes, bytearray))
+                    or getattr(cls.m_local, "in_call", False)):
+                return from_bytes_fct(obj_cls, obj_bytes)
+
+            key = (obj_cls, bytes(obj_bytes))
+            obj = cache.Get(key)
+            if obj is None:
+                cls.m_local.in_call = True
+                try:
+                    obj = cache.Put(key, from_bytes_fct(obj_cls, obj_bytes))
+                finally:
+                    cls.m_local.in_call = False
+            return obj
+
+        cls.m_interned_fcts.add(_from_bytes)
+        return classmethod(_from_bytes)
+
+    @staticmethod
+    def __CheckCurveType(curve_type: EllipticCurveTypes) -> None:
+        """
+        Check the curve type.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        if not isinstance(curve_type, EllipticCurveTypes):
+            raise TypeError("Curve type is not an enumerative of EllipticCurveTypes")
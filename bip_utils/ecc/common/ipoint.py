@@ -26,6 +26,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
+from bip_utils.ecc.common.interning_cache import EccInterningCache
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.utils.misc import DataBytes
 
@@ -33,6 +34,18 @@ from bip_utils.utils.misc import DataBytes
 class IPoint(ABC):
     """Interface for a generic elliptic curve point."""
 
+    def __init_subclass__(cls,
+                          **kwargs: Any) -> None:
+        """
+        Initialize subclass.
+        Points created from bytes are interned, if the interning cache is enabled for the curve.
+
+        Args:
+            **kwargs: Arbitrary arguments
+        """
+        super().__init_subclass__(**kwargs)
+        EccInterningCache.InternFromBytes(cls)
+
     @classmethod
     @abstractmethod
     def FromBytes(cls,
@@ -63,6 +76,26 @@ class IPoint(ABC):
             IPoint: IPoint object
         """
 
+    @classmethod
+    def FromPoint(cls,
+                  point: IPoint) -> IPoint:
+        """
+        Construct class from a point of the same curve, possibly implemented by another backend.
+        The point is returned as it is if it's already of this class.
+
+        Args:
+            point (IPoint object): Point
+
+        Returns:
+            IPoint: IPoint object
+
+        Raises:
+            ValueError: If the point is not valid
+        """
+        if isinstance(point, cls):
+            return point
+        return cls.FromBytes(point.RawEncoded().ToBytes())
+
     @staticmethod
     @abstractmethod
     def CurveType() -> EllipticCurveTypes:
@@ -24,5 +24,7 @@
 class EccConf:
     """ECC configuration class."""
 
-    # True for using coincurve for secp256k1, false for using ecdsa
+    # True for using coincurve for secp256k1 (if installed), false for using the pure Python implementation
     USE_COINCURVE: bool = True
+    # True for using cryptography for nist256p1 (if installed), false for using ecdsa
+    USE_CRYPTOGRAPHY: bool = True
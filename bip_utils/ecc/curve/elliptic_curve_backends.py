@@ -0,0 +1,755 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for managing the backends (i.e. libraries) used to implement elliptic curves."""
+
+# Imports
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.interning_cache import EccInterningCache
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+
+
+# Alias for backend loaders, returning point class, public key class, private key class and generator point
+EllipticCurveBackendLoader = Callable[[], Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]]
+# Alias for backend switch listeners, called with the curve type whose active backend changed
+EllipticCurveBackendSwitchListener = Callable[[EllipticCurveTypes], None]
+
+
+class EllipticCurveBackend:
+    """
+    Elliptic curve backend class.
+    It holds the point and keys classes implementing a curve with a specific library.
+    Classes are loaded only when required, so that backends whose library is not installed can be registered anyway.
+    """
+
+    m_name: str
+    m_priority: int
+    m_loader: EllipticCurveBackendLoader
+    m_loaded: Optional[Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]]
+
+    def __init__(self,
+                 name: str,
+                 loader: EllipticCurveBackendLoader,
+                 priority: int = 0) -> None:
+        """
+        Construct class.
+
+        Args:
+            name (str)                            : Backend name
+            loader (EllipticCurveBackendLoader)   : Function returning point class, public key class,
+                                                    private key class and generator point
+            priority (int, optional)              : Priority for automatic selection, higher first (default: 0)
+        """
+        self.m_name = name
+        self.m_priority = priority
+        self.m_loader = loader
+        self.m_loaded = None
+
+    def Name(self) -> str:
+        """
+        Get the backend name.
+
+        Returns:
+            str: Backend name
+        """
+        return self.m_name
+
+    def Priority(self) -> int:
+        """
+        Get the backend priority.
+
+        Returns:
+            int: Backend priority
+        """
+        return self.m_priority
+
+    def IsAvailable(self) -> bool:
+        """
+        Get if the backend is available (i.e. its library can be imported).
+
+        Returns:
+            bool: True if available, false otherwise
+        """
+        try:
+            self.__Load()
+        except ImportError:
+            return False
+        return True
+
+    def IsLoaded(self) -> bool:
+        """
+        Get if the backend classes are loaded (i.e. objects of the backend may exist).
+
+        Returns:
+            bool: True if loaded, false otherwise
+        """
+        return self.m_loaded is not None
+
+    def Generator(self) -> IPoint:
+        """
+        Get the curve generator point.
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ImportError: If the backend library is not installed
+        """
+        return self.__Load()[3]
+
+    def PointClass(self) -> Type[IPoint]:
+        """
+        Get the point class.
+
+        Returns:
+            IPoint class: Point class
+
+        Raises:
+            ImportError: If the backend library is not installed
+        """
+        return self.__Load()[0]
+
+    def PublicKeyClass(self) -> Type[IPublicKey]:
+        """
+        Get the public key class.
+
+        Returns:
+            IPublicKey class: Public key class
+
+        Raises:
+            ImportError: If the backend library is not installed
+        """
+        return self.__Load()[1]
+
+    def PrivateKeyClass(self) -> Type[IPrivateKey]:
+        """
+        Get the private key class.
+
+        Returns:
+            IPrivateKey class: Private key class
+
+        Raises:
+            ImportError: If the backend library is not installed
+        """
+        return self.__Load()[2]
+
+    def __Load(self) -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+        """
+        Load the backend classes, only the first time.
+
+        Returns:
+            tuple: Point class, public key class, private key class and generator point
+
+        Raises:
+            ImportError: If the backend library is not installed
+        """
+        if self.m_loaded is None:
+            self.m_loaded = self.m_loader()
+            # Classes of the loaded backends changed
+            EllipticCurveBackends._UpdateVersion()
+        return self.m_loaded
+
+
+class EllipticCurveBackends:
+    """
+    Elliptic curve backends class.
+    It keeps the registered backends of each curve and the active one.
+    If no backend is explicitly set, the available backend with the highest priority is selected when first used.
+    Key and point objects keep the backend they were created with, but they are still accepted after switching
+    (i.e. they are converted to the active backend when used together with new objects).
+    Switch listeners are notified when the active backend of a curve changes (e.g. for clearing caches).
+    """
+
+    m_backends: Dict[EllipticCurveTypes, Dict[str, EllipticCurveBackend]] = {}
+    m_active: Dict[EllipticCurveTypes, EllipticCurveBackend] = {}
+    m_listeners: List[EllipticCurveBackendSwitchListener] = []
+    m_version: int = 0
+    m_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def Version(cls) -> int:
+        """
+        Get the version of the backends state.
+        It changes every time a backend is registered, unregistered, activated or loaded, so it can be used
+        for caching data depending on it.
+
+        Returns:
+            int: Version
+        """
+        return cls.m_version
+
+    @classmethod
+    def AddSwitchListener(cls,
+                          listener: EllipticCurveBackendSwitchListener) -> None:
+        """
+        Add a function to be called with the curve type when the active backend of a curve changes.
+
+        Args:
+            listener (function): Listener function
+        """
+        with cls.m_lock:
+            if listener not in cls.m_listeners:
+                cls.m_listeners.append(listener)
+
+    @classmethod
+    def RemoveSwitchListener(cls,
+                             listener: EllipticCurveBackendSwitchListener) -> None:
+        """
+        Remove a switch listener.
+
+        Args:
+            listener (function): Listener function
+
+        Raises:
+            ValueError: If the listener was not added
+        """
+        with cls.m_lock:
+            cls.m_listeners.remove(listener)
+
+    @classmethod
+    def Register(cls,
+                 curve_type: EllipticCurveTypes,
+                 backend: EllipticCurveBackend) -> None:
+        """
+        Register a backend for the specified curve.
+        A backend registered with the same name is replaced.
+        The active backend is not changed, call SetBackend or AutoSelect to use the new one.
+
+        Args:
+            curve_type (EllipticCurveTypes)      : Curve type
+            backend (EllipticCurveBackend object): EllipticCurveBackend object
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        with cls.m_lock:
+            cls.m_backends.setdefault(curve_type, {})[backend.Name()] = backend
+            cls.m_version += 1
+
+    @classmethod
+    def Unregister(cls,
+                   curve_type: EllipticCurveTypes,
+                   name: str) -> None:
+        """
+        Unregister the backend with the specified name.
+        If it's the active backend, a new one will be automatically selected when first used.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+            name (str)                     : Backend name
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If the backend is not registered
+        """
+        backend = cls.Backend(curve_type, name)
+        with cls.m_lock:
+            del cls.m_backends[curve_type][name]
+            cls.m_version += 1
+            is_active = cls.m_active.get(curve_type) is backend
+            if is_active:
+                del cls.m_active[curve_type]
+        if is_active:
+            cls.__NotifySwitch(curve_type)
+
+    @classmethod
+    def Names(cls,
+              curve_type: EllipticCurveTypes) -> List[str]:
+        """
+        Get the names of the registered backends for the specified curve, from the highest priority.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            list[str]: Backend names
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        return [backend.Name() for backend in cls.__SortedBackends(curve_type)]
+
+    @classmethod
+    def AvailableNames(cls,
+                       curve_type: EllipticCurveTypes) -> List[str]:
+        """
+        Get the names of the available backends for the specified curve, from the highest priority.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            list[str]: Backend names
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        return [backend.Name() for backend in cls.__SortedBackends(curve_type) if backend.IsAvailable()]
+
+    @classmethod
+    def LoadedBackends(cls,
+                       curve_type: EllipticCurveTypes) -> List[EllipticCurveBackend]:
+        """
+        Get the registered backends for the specified curve whose classes are loaded, from the highest priority.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            list[EllipticCurveBackend]: Backends
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        cls.__CheckCurveType(curve_type)
+        return [backend for backend in cls.__SortedBackends(curve_type) if backend.IsLoaded()]
+
+    @classmethod
+    def Backend(cls,
+                curve_type: EllipticCurveTypes,
+                name: str) -> EllipticCurveBackend:
+        """
+        Get the backend with the specified name.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+            name (str)                     : Backend name
+
+        Returns:
+            EllipticCurveBackend object: EllipticCurveBackend object
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If the backend is not registered
+        """
+        cls.__CheckCurveType(curve_type)
+        try:
+            return cls.m_backends[curve_type][name]
+        except KeyError as ex:
+            raise ValueError(f"Backend {name} is not registered for {curve_type}") from ex
+
+    @classmethod
+    def ActiveBackend(cls,
+                      curve_type: EllipticCurveTypes) -> EllipticCurveBackend:
+        """
+        Get the active backend for the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            EllipticCurveBackend object: EllipticCurveBackend object
+
+        Raises:
+            ValueError: If no backend is available
+        """
+        backend = cls.m_active.get(curve_type)
+        if backend is None:
+            cls.AutoSelect(curve_type)
+            backend = cls.m_active[curve_type]
+        return backend
+
+    @classmethod
+    def ActiveName(cls,
+                   curve_type: EllipticCurveTypes) -> str:
+        """
+        Get the name of the active backend for the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            str: Backend name
+
+        Raises:
+            ValueError: If no backend is available
+        """
+        return cls.ActiveBackend(curve_type).Name()
+
+    @classmethod
+    def SetBackend(cls,
+                   curve_type: EllipticCurveTypes,
+                   name: str) -> None:
+        """
+        Set the active backend for the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+            name (str)                     : Backend name
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If the backend is not registered or not available
+        """
+        backend = cls.Backend(curve_type, name)
+        if not backend.IsAvailable():
+            raise ValueError(f"Backend {name} is not available for {curve_type}")
+        cls.__Activate(curve_type, backend)
+
+    @classmethod
+    def AutoSelect(cls,
+                   curve_type: EllipticCurveTypes,
+                   exclude: Sequence[str] = ()) -> str:
+        """
+        Set the available backend with the highest priority as active for the specified curve.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+            exclude (list[str], optional)  : Names of the backends to be excluded (default: none)
+
+        Returns:
+            str: Name of the selected backend
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+            ValueError: If no backend is available
+        """
+        cls.__CheckCurveType(curve_type)
+        for backend in cls.__SortedBackends(curve_type):
+            if backend.Name() not in exclude and backend.IsAvailable():
+                cls.__Activate(curve_type, backend)
+                return backend.Name()
+        raise ValueError(f"No backend available for {curve_type}")
+
+    @classmethod
+    def _UpdateVersion(cls) -> None:
+        """Update the version of the backends state (e.g. when a backend is loaded)."""
+        with cls.m_lock:
+            cls.m_version += 1
+
+    @classmethod
+    def __Activate(cls,
+                   curve_type: EllipticCurveTypes,
+                   backend: EllipticCurveBackend) -> None:
+        """
+        Set the active backend, notifying the listeners if it replaces a different one.
+
+        Args:
+            curve_type (EllipticCurveTypes)      : Curve type
+            backend (EllipticCurveBackend object): EllipticCurveBackend object
+        """
+        with cls.m_lock:
+            prev_backend = cls.m_active.get(curve_type)
+            cls.m_active[curve_type] = backend
+            cls.m_version += 1
+        if prev_backend is not None and prev_backend is not backend:
+            cls.__NotifySwitch(curve_type)
+
+    @classmethod
+    def __NotifySwitch(cls,
+                       curve_type: EllipticCurveTypes) -> None:
+        """
+        Notify the listeners that the active backend of the specified curve changed.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+        """
+        with cls.m_lock:
+            listeners = list(cls.m_listeners)
+        for listener in listeners:
+            listener(curve_type)
+
+    @classmethod
+    def __SortedBackends(cls,
+                         curve_type: EllipticCurveTypes) -> List[EllipticCurveBackend]:
+        """
+        Get the registered backends for the specified curve, from the highest priority.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Returns:
+            list[EllipticCurveBackend]: Backends
+        """
+        return sorted(cls.m_backends.get(curve_type, {}).values(),
+                      key=lambda backend: backend.Priority(),
+                      reverse=True)
+
+    @staticmethod
+    def __CheckCurveType(curve_type: EllipticCurveTypes) -> None:
+        """
+        Check the curve type.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+
+        Raises:
+            TypeError: If curve type is not a EllipticCurveTypes enum
+        """
+        if not isinstance(curve_type, EllipticCurveTypes):
+            raise TypeError("Curve type is not an enumerative of EllipticCurveTypes")
+
+
+class EllipticCurveBackendGenerator:
+    """
+    Elliptic curve backend generator class.
+    It's a descriptor returning the generator point of the active backend, so that it can be used as
+    a class constant that follows the backend switching.
+    """
+
+    m_curve_type: EllipticCurveTypes
+
+    def __init__(self,
+                 curve_type: EllipticCurveTypes) -> None:
+        """
+        Construct class.
+
+        Args:
+            curve_type (EllipticCurveTypes): Curve type
+        """
+        self.m_curve_type = curve_type
+
+    def __get__(self,
+                instance: Any,
+                owner: Any = None) -> IPoint:
+        """
+        Get the generator point of the active backend.
+
+        Args:
+            instance (Any): Instance the attribute is accessed through (None if accessed through the class)
+            owner (class) : Owner class
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If no backend is available
+        """
+        return EllipticCurveBackends.ActiveBackend(self.m_curve_type).Generator()
+
+
+class EllipticCurveBackendProxy(type):
+    """
+    Elliptic curve backend proxy metaclass.
+    Classes created with it forward attribute reads and construction to the correspondent class of the active
+    backend, so they can be used in place of the backend classes.
+    Type checks accept the classes of all the loaded backends, so objects created before switching backend
+    are still recognized.
+    Attributes shall be set (e.g. patched) directly on the class of the active backend.
+    """
+
+    m_curve_type: EllipticCurveTypes
+    m_cls_getter: Callable[[EllipticCurveBackend], type]
+    m_classes: Tuple[int, Tuple[type, ...]]
+
+    @classmethod
+    def Create(cls,
+               name: str,
+               curve_type: EllipticCurveTypes,
+               cls_getter: Callable[[EllipticCurveBackend], type],
+               module: str) -> Any:
+        """
+        Create a proxy class.
+
+        Args:
+            name (str)                     : Class name
+            curve_type (EllipticCurveTypes): Curve type
+            cls_getter (function)          : Function getting the class from the backend
+                                             (e.g. EllipticCurveBackend.PublicKeyClass)
+            module (str)                   : Name of the module defining the proxy class
+
+        Returns:
+            class: Proxy class
+        """
+        return cls(name, (), {"__module__": module,
+                              "__qualname__": name,
+                              "m_curve_type": curve_type,
+                              "m_cls_getter": staticmethod(cls_getter),
+                              "m_classes": (-1, ())})
+
+    def ActiveClass(cls) -> type:
+        """
+        Get the class of the active backend.
+
+        Returns:
+            class: Class of the active backend
+        """
+        return cls.__BackendClasses()[0]
+
+    def __getattr__(cls,
+                    name: str) -> Any:
+        """
+        Get an attribute of the class of the active backend.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            Any: Attribute value
+        """
+        return getattr(cls.ActiveClass(), name)
+
+    def __call__(cls,
+                 *args: Any,
+                 **kwargs: Any) -> Any:
+        """
+        Construct the class of the active backend.
+
+        Returns:
+            Any: Object of the class of the active backend
+        """
+        return cls.ActiveClass()(*args, **kwargs)
+
+    def __instancecheck__(cls,
+                          instance: Any) -> bool:
+        """
+        Check if the instance belongs to the class of the active backend or of any other loaded backend.
+
+        Args:
+            instance (Any): Instance
+
+        Returns:
+            bool: True if instance of the class of a loaded backend, false otherwise
+        """
+        return isinstance(instance, cls.__BackendClasses())
+
+    def __subclasscheck__(cls,
+                          subclass: type) -> bool:
+        """
+        Check if the class is a subclass of the class of the active backend or of any other loaded backend.
+
+        Args:
+            subclass (class): Class
+
+        Returns:
+            bool: True if subclass of the class of a loaded backend, false otherwise
+        """
+        return issubclass(subclass, cls.__BackendClasses())
+
+    def __BackendClasses(cls) -> Tuple[type, ...]:
+        """
+        Get the classes of the loaded backends, starting from the active one.
+        They are cached until the backends state changes, since they are used for every type check.
+
+        Returns:
+            tuple[class]: Classes of the loaded backends
+        """
+        version, classes = cls.m_classes
+        if version != EllipticCurveBackends.Version():
+            version = EllipticCurveBackends.Version()
+            active_cls = cls.m_cls_getter(EllipticCurveBackends.ActiveBackend(cls.m_curve_type))
+            classes = (active_cls,) + tuple(
+                backend_cls
+                for backend_cls in map(cls.m_cls_getter, EllipticCurveBackends.LoadedBackends(cls.m_curve_type))
+                if backend_cls is not active_cls
+            )
+            cls.m_classes = (version, classes)
+        return classes
+
+
+class EllipticCurveWithBackends(EllipticCurve):
+    """
+    Elliptic curve whose generator and classes are taken from the active backend of EllipticCurveBackends.
+    If classes are specified (e.g. proxy classes), they are returned in place of the backend ones.
+    """
+
+    m_curve_type: EllipticCurveTypes
+    m_use_backend_classes: bool
+
+    def __init__(self,
+                 name: str,
+                 order: int,
+                 curve_type: EllipticCurveTypes,
+                 *,
+                 point_cls: Optional[Type[IPoint]] = None,
+                 pub_key_cls: Optional[Type[IPublicKey]] = None,
+                 priv_key_cls: Optional[Type[IPrivateKey]] = None):
+        """
+        Construct class.
+        Classes shall be either all specified or all not specified.
+
+        Args:
+            name (str)                                : Curve name
+            order (int)                               : Curve order
+            curve_type (EllipticCurveTypes)           : Curve type
+            point_cls (IPoint class, optional)        : Point class (default: active backend one)
+            pub_key_cls (IPublicKey class, optional)  : Public key class (default: active backend one)
+            priv_key_cls (IPrivateKey class, optional): Private key class (default: active backend one)
+
+        Raises:
+            ValueError: If no backend is available or only some classes are specified
+        """
+        classes = (point_cls, pub_key_cls, priv_key_cls)
+        if any(cls is None for cls in classes) and any(cls is not None for cls in classes):
+            raise ValueError("Point and keys classes shall be either all specified or all not specified")
+
+        backend = EllipticCurveBackends.ActiveBackend(curve_type)
+        super().__init__(name,
+                         order,
+                         backend.Generator(),
+                         point_cls or backend.PointClass(),
+                         pub_key_cls or backend.PublicKeyClass(),
+                         priv_key_cls or backend.PrivateKeyClass())
+        self.m_curve_type = curve_type
+        self.m_use_backend_classes = point_cls is None
+
+    def Generator(self) -> IPoint:
+        """
+        Get the curve generator point.
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return EllipticCurveBackends.ActiveBackend(self.m_curve_type).Generator()
+
+    def PointClass(self) -> Type[IPoint]:
+        """
+        Return the point class.
+
+        Returns:
+            IPoint class: Point class
+        """
+        if self.m_use_backend_classes:
+            return EllipticCurveBackends.ActiveBackend(self.m_curve_type).PointClass()
+        return self.m_point_cls
+
+    def PublicKeyClass(self) -> Type[IPublicKey]:
+        """
+        Return the public key class.
+
+        Returns:
+            IPublicKey class: Public key class
+        """
+        if self.m_use_backend_classes:
+            return EllipticCurveBackends.ActiveBackend(self.m_curve_type).PublicKeyClass()
+        return self.m_pub_key_cls
+
+    def PrivateKeyClass(self) -> Type[IPrivateKey]:
+        """
+        Return the private key class.
+
+        Returns:
+            IPrivateKey class: Private key class
+        """
+        if self.m_use_backend_classes:
+            return EllipticCurveBackends.ActiveBackend(self.m_curve_type).PrivateKeyClass()
+        return self.m_priv_key_cls
+
+
+# Interned objects belong to the backend they were created with
+EllipticCurveBackends.AddSwitchListener(EccInterningCache.Clear)
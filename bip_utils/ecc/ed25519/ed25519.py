@@ -22,15 +22,28 @@
 
 # Imports
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ed25519.ed25519_const import Ed25519Const
 from bip_utils.ecc.ed25519.ed25519_keys import Ed25519PrivateKey, Ed25519PublicKey
 from bip_utils.ecc.ed25519.ed25519_point import Ed25519Point
 
 
+# Register the Ed25519 backend
+EllipticCurveBackends.Register(
+    EllipticCurveTypes.ED25519,
+    EllipticCurveBackend("nacl",
+                         lambda: (Ed25519Point,
+                                  Ed25519PublicKey,
+                                  Ed25519PrivateKey,
+                                  Ed25519Const.GENERATOR))
+)
+
 # Ed25519 curve definition
-Ed25519: EllipticCurve = EllipticCurve(Ed25519Const.NAME,
-                                       Ed25519Const.CURVE_ORDER,
-                                       Ed25519Const.GENERATOR,
-                                       Ed25519Point,
-                                       Ed25519PublicKey,
-                                       Ed25519PrivateKey)
+Ed25519: EllipticCurve = EllipticCurveWithBackends(Ed25519Const.NAME,
+                                                   Ed25519Const.CURVE_ORDER,
+                                                   EllipticCurveTypes.ED25519)
@@ -94,6 +94,11 @@ class Ed25519PublicKey(IPublicKey):
         Raises:
             ValueError: If key point is not valid
         """
+        # Avoid decoding the point again to check it, if it's already known to lie on the curve
+        if isinstance(key_point, Ed25519Point):
+            if not key_point.IsOnCurve():
+                raise ValueError("Invalid public key point")
+            return cls(signing.VerifyKey(key_point.RawEncoded().ToBytes()))
         return cls.FromBytes(key_point.RawEncoded().ToBytes())
 
     def __init__(self,
@@ -21,6 +21,8 @@
 """Module for ed25519 point."""
 
 # Imports
+from __future__ import annotations
+
 from typing import Any, Optional
 
 from bip_utils.ecc.common.ipoint import IPoint
@@ -39,8 +41,8 @@ class Ed25519PointConst:
 class Ed25519Point(IPoint):
     """Ed25519 point class."""
 
-    m_is_generator: bool
     m_enc_bytes: bytes
+    m_is_on_curve: Optional[bool]
     m_x: Optional[int]
     m_y: Optional[int]
 
@@ -56,13 +58,19 @@ class Ed25519Point(IPoint):
         Returns:
             IPoint: IPoint object
         """
-        if not ed25519_lib.point_is_on_curve(point_bytes):
+        if not ed25519_lib.point_is_valid_bytes(point_bytes):
+            raise ValueError("Invalid point bytes")
+
+        # Keep the decoded coordinates, so they don't need to be computed again
+        point_coord = ed25519_lib.point_bytes_to_coord(point_bytes)
+        if not ed25519_lib.point_is_on_curve(point_coord):
             raise ValueError("Invalid point bytes")
         if ed25519_lib.point_is_decoded_bytes(point_bytes):
-            point_bytes = ed25519_lib.point_encode(
-                ed25519_lib.point_bytes_to_coord(point_bytes)
-            )
-        return cls(point_bytes)
+            point_bytes = ed25519_lib.point_encode(point_coord)
+
+        point = cls.__FromValidBytes(point_bytes)
+        point.m_x, point.m_y = point_coord
+        return point
 
     @classmethod
     def FromCoordinates(cls,
@@ -82,6 +90,22 @@ class Ed25519Point(IPoint):
             ed25519_lib.point_coord_to_bytes((x, y))
         )
 
+    @classmethod
+    def __FromValidBytes(cls,
+                         point_bytes: bytes) -> Ed25519Point:
+        """
+        Construct class from point bytes that are already known to lie on the curve.
+
+        Args:
+            point_bytes (bytes): Point bytes
+
+        Returns:
+            Ed25519Point object: Ed25519Point object
+        """
+        point = cls(point_bytes)
+        point.m_is_on_curve = True
+        return point
+
     def __init__(self,
                  point_bytes: bytes) -> None:
         """
@@ -94,7 +118,7 @@ class Ed25519Point(IPoint):
             raise ValueError("Invalid point bytes")
 
         self.m_enc_bytes = point_bytes
-        self.m_is_generator = ed25519_lib.point_is_generator(point_bytes)
+        self.m_is_on_curve = None
         self.m_x, self.m_y = None, None
 
     @staticmethod
@@ -126,6 +150,19 @@ class Ed25519Point(IPoint):
         """
         return self.m_enc_bytes
 
+    def IsOnCurve(self) -> bool:
+        """
+        Get if the point lies on the curve.
+        It's computed only once and it's already known for points constructed from bytes or coordinates
+        and for points resulting from operations.
+
+        Returns:
+           bool: True if it lies on the curve, false otherwise
+        """
+        if self.m_is_on_curve is None:
+            self.m_is_on_curve = ed25519_lib.point_is_on_curve((self.X(), self.Y()))
+        return self.m_is_on_curve
+
     def X(self) -> int:
         """
         Get point X coordinate.
@@ -186,7 +223,8 @@ class Ed25519Point(IPoint):
         Returns:
             IPoint object: IPoint object
         """
-        return self.__class__(
+        # Results of libsodium operations always lie on the curve
+        return self.__FromValidBytes(
             ed25519_lib.point_add(self.m_enc_bytes, point.UnderlyingObject())
         )
 
@@ -214,12 +252,13 @@ class Ed25519Point(IPoint):
         Returns:
             IPoint object: IPoint object
         """
-        if self.m_is_generator:
-            return self.__class__(
+        point_bytes = self.m_enc_bytes
+        if ed25519_lib.point_is_generator(point_bytes):
+            return self.__FromValidBytes(
                 ed25519_lib.point_scalar_mul_base(scalar)
             )
-        return self.__class__(
-            ed25519_lib.point_scalar_mul(scalar, self.m_enc_bytes)
+        return self.__FromValidBytes(
+            ed25519_lib.point_scalar_mul(scalar, point_bytes)
         )
 
     def __rmul__(self,
@@ -25,6 +25,7 @@ Encode/Decode operations copied from: https://github.com/warner/python-pure25519
 import binascii
 from typing import Tuple, Union
 
+from ecdsa.numbertheory import inverse_mod
 from nacl import bindings
 
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
@@ -41,7 +42,7 @@ _COORD_BYTE_LEN = 32
 
 
 def _inv(x: int) -> int:
-    return pow(x, _Q - 2, _Q)
+    return inverse_mod(x, _Q)
 
 
 _D = -121665 * _inv(121666)
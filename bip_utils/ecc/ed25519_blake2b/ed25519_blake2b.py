@@ -22,15 +22,28 @@
 
 # Imports
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_const import Ed25519Blake2bConst
 from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_keys import Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey
 from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_point import Ed25519Blake2bPoint
 
 
+# Register the Ed25519-Blake2b backend
+EllipticCurveBackends.Register(
+    EllipticCurveTypes.ED25519_BLAKE2B,
+    EllipticCurveBackend("ed25519_blake2b",
+                         lambda: (Ed25519Blake2bPoint,
+                                  Ed25519Blake2bPublicKey,
+                                  Ed25519Blake2bPrivateKey,
+                                  Ed25519Blake2bConst.GENERATOR))
+)
+
 # Ed25519-Blake2b curve definition
-Ed25519Blake2b: EllipticCurve = EllipticCurve(Ed25519Blake2bConst.NAME,
-                                              Ed25519Blake2bConst.CURVE_ORDER,
-                                              Ed25519Blake2bConst.GENERATOR,
-                                              Ed25519Blake2bPoint,
-                                              Ed25519Blake2bPublicKey,
-                                              Ed25519Blake2bPrivateKey)
+Ed25519Blake2b: EllipticCurve = EllipticCurveWithBackends(Ed25519Blake2bConst.NAME,
+                                                          Ed25519Blake2bConst.CURVE_ORDER,
+                                                          EllipticCurveTypes.ED25519_BLAKE2B)
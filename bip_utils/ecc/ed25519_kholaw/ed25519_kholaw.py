@@ -22,15 +22,28 @@
 
 # Imports
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_const import Ed25519KholawConst
 from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_keys import Ed25519KholawPrivateKey, Ed25519KholawPublicKey
 from bip_utils.ecc.ed25519_kholaw.ed25519_kholaw_point import Ed25519KholawPoint
 
 
+# Register the Ed25519-Kholaw backend
+EllipticCurveBackends.Register(
+    EllipticCurveTypes.ED25519_KHOLAW,
+    EllipticCurveBackend("nacl",
+                         lambda: (Ed25519KholawPoint,
+                                  Ed25519KholawPublicKey,
+                                  Ed25519KholawPrivateKey,
+                                  Ed25519KholawConst.GENERATOR))
+)
+
 # Ed25519-Kholaw curve definition
-Ed25519Kholaw: EllipticCurve = EllipticCurve(Ed25519KholawConst.NAME,
-                                             Ed25519KholawConst.CURVE_ORDER,
-                                             Ed25519KholawConst.GENERATOR,
-                                             Ed25519KholawPoint,
-                                             Ed25519KholawPublicKey,
-                                             Ed25519KholawPrivateKey)
+Ed25519Kholaw: EllipticCurve = EllipticCurveWithBackends(Ed25519KholawConst.NAME,
+                                                         Ed25519KholawConst.CURVE_ORDER,
+                                                         EllipticCurveTypes.ED25519_KHOLAW)
@@ -22,15 +22,28 @@
 
 # Imports
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ed25519_monero.ed25519_monero_const import Ed25519MoneroConst
 from bip_utils.ecc.ed25519_monero.ed25519_monero_keys import Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey
 from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
 
 
+# Register the Ed25519-Monero backend
+EllipticCurveBackends.Register(
+    EllipticCurveTypes.ED25519_MONERO,
+    EllipticCurveBackend("nacl",
+                         lambda: (Ed25519MoneroPoint,
+                                  Ed25519MoneroPublicKey,
+                                  Ed25519MoneroPrivateKey,
+                                  Ed25519MoneroConst.GENERATOR))
+)
+
 # Ed25519-Monero curve definition
-Ed25519Monero: EllipticCurve = EllipticCurve(Ed25519MoneroConst.NAME,
-                                             Ed25519MoneroConst.CURVE_ORDER,
-                                             Ed25519MoneroConst.GENERATOR,
-                                             Ed25519MoneroPoint,
-                                             Ed25519MoneroPublicKey,
-                                             Ed25519MoneroPrivateKey)
+Ed25519Monero: EllipticCurve = EllipticCurveWithBackends(Ed25519MoneroConst.NAME,
+                                                         Ed25519MoneroConst.CURVE_ORDER,
+                                                         EllipticCurveTypes.ED25519_MONERO)
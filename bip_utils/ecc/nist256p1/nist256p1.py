@@ -21,16 +21,80 @@
 """Module with nist256p1 curve."""
 
 # Imports
+from typing import Tuple, Type
+
+from ecdsa.ecdsa import generator_256
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.conf import EccConf
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
-from bip_utils.ecc.nist256p1.nist256p1_const import Nist256p1Const
-from bip_utils.ecc.nist256p1.nist256p1_keys import Nist256p1PrivateKey, Nist256p1PublicKey
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.nist256p1.nist256p1_const import (
+    Nist256p1Const,
+    Nist256p1Point,
+    Nist256p1PrivateKey,
+    Nist256p1PublicKey,
+)
+
+
+def _LoadCryptographyBackend() -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+    """
+    Load the backend based on cryptography library.
+
+    Returns:
+        tuple: Point class, public key class, private key class and generator point
+    """
+    from bip_utils.ecc.nist256p1.nist256p1_keys_cryptography import (  # noqa: PLC0415
+        Nist256p1PointCryptography,
+        Nist256p1PrivateKeyCryptography,
+        Nist256p1PublicKeyCryptography,
+    )
+
+    return (Nist256p1PointCryptography,
+            Nist256p1PublicKeyCryptography,
+            Nist256p1PrivateKeyCryptography,
+            Nist256p1PointCryptography.FromCoordinates(generator_256.x(), generator_256.y()))
+
+
+def _LoadEcdsaBackend() -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+    """
+    Load the backend based on ecdsa library.
+
+    Returns:
+        tuple: Point class, public key class, private key class and generator point
+    """
+    from bip_utils.ecc.nist256p1.nist256p1_keys_ecdsa import (  # noqa: PLC0415
+        Nist256p1PointEcdsa,
+        Nist256p1PrivateKeyEcdsa,
+        Nist256p1PublicKeyEcdsa,
+    )
+
+    return (Nist256p1PointEcdsa,
+            Nist256p1PublicKeyEcdsa,
+            Nist256p1PrivateKeyEcdsa,
+            Nist256p1PointEcdsa(generator_256))
+
+
+# Register backends, cryptography is preferred since it's much faster
+EllipticCurveBackends.Register(EllipticCurveTypes.NIST256P1,
+                               EllipticCurveBackend(Nist256p1Const.BACKEND_CRYPTOGRAPHY, _LoadCryptographyBackend, 1))
+EllipticCurveBackends.Register(EllipticCurveTypes.NIST256P1,
+                               EllipticCurveBackend(Nist256p1Const.BACKEND_ECDSA, _LoadEcdsaBackend, 0))
+# Initial backend from configuration
+EllipticCurveBackends.AutoSelect(EllipticCurveTypes.NIST256P1,
+                                 () if EccConf.USE_CRYPTOGRAPHY else (Nist256p1Const.BACKEND_CRYPTOGRAPHY,))
 
 
 # Nist256p1 curve definition
-Nist256p1: EllipticCurve = EllipticCurve(Nist256p1Const.NAME,
-                                         Nist256p1Const.CURVE_ORDER,
-                                         Nist256p1Const.GENERATOR,
-                                         Nist256p1Point,
-                                         Nist256p1PublicKey,
-                                         Nist256p1PrivateKey)
+Nist256p1: EllipticCurve = EllipticCurveWithBackends(Nist256p1Const.NAME,
+                                                     Nist256p1Const.CURVE_ORDER,
+                                                     EllipticCurveTypes.NIST256P1,
+                                                     point_cls=Nist256p1Point,
+                                                     pub_key_cls=Nist256p1PublicKey,
+                                                     priv_key_cls=Nist256p1PrivateKey)
@@ -21,10 +21,18 @@
 """Module with nist256p1 constants."""
 
 # Imports
+from typing import Type
+
 from ecdsa.ecdsa import generator_256
 
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackendGenerator,
+    EllipticCurveBackendProxy,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 
 
 class Nist256p1Const:
@@ -34,5 +42,20 @@ class Nist256p1Const:
     NAME: str = "Nist256p1"
     # Curve order
     CURVE_ORDER: int = generator_256.order()
-    # Curve generator point
-    GENERATOR: IPoint = Nist256p1Point(generator_256)
+    # Curve generator point of the active backend
+    GENERATOR = EllipticCurveBackendGenerator(EllipticCurveTypes.NIST256P1)
+    # Backend names
+    BACKEND_CRYPTOGRAPHY: str = "cryptography"
+    BACKEND_ECDSA: str = "ecdsa"
+
+
+# Classes of the active backend
+Nist256p1Point: Type[IPoint] = EllipticCurveBackendProxy.Create(
+    "Nist256p1Point", EllipticCurveTypes.NIST256P1, EllipticCurveBackend.PointClass, __name__
+)
+Nist256p1PublicKey: Type[IPublicKey] = EllipticCurveBackendProxy.Create(
+    "Nist256p1PublicKey", EllipticCurveTypes.NIST256P1, EllipticCurveBackend.PublicKeyClass, __name__
+)
+Nist256p1PrivateKey: Type[IPrivateKey] = EllipticCurveBackendProxy.Create(
+    "Nist256p1PrivateKey", EllipticCurveTypes.NIST256P1, EllipticCurveBackend.PrivateKeyClass, __name__
+)
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for nist256p1 keys based on cryptography library."""
+
+# Imports
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.nist256p1.nist256p1_point_cryptography import (
+    Nist256p1PointCryptography,
+    Nist256p1PointCryptographyConst,
+)
+from bip_utils.utils.misc import BytesUtils, DataBytes, IntegerUtils
+
+
+class Nist256p1PublicKeyCryptography(IPublicKey):
+    """Nist256p1 public key class."""
+
+    m_ver_key: ec.EllipticCurvePublicKey
+
+    @classmethod
+    def FromBytes(cls,
+                  key_bytes: bytes) -> IPublicKey:
+        """
+        Construct class from key bytes.
+
+        Args:
+            key_bytes (bytes): Key bytes
+
+        Returns:
+            IPublicKey: IPublicKey object
+
+        Raises:
+            ValueError: If key bytes are not valid
+        """
+        # Raw uncompressed key without prefix
+        if len(key_bytes) == EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN - 1:
+            key_bytes = EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_PREFIX + key_bytes
+        elif len(key_bytes) not in (EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN,
+                                    EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN):
+            raise ValueError("Invalid public key bytes")
+
+        try:
+            return cls(
+                ec.EllipticCurvePublicKey.from_encoded_point(Nist256p1PointCryptographyConst.CURVE,
+                                                             key_bytes)
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid public key bytes") from ex
+
+    @classmethod
+    def FromPoint(cls,
+                  key_point: IPoint) -> IPublicKey:
+        """
+        Construct class from key point.
+
+        Args:
+            key_point (IPoint object): Key point
+
+        Returns:
+            IPublicKey: IPublicKey object
+
+        Raises:
+            ValueError: If key point is not valid
+        """
+        # Points of the same library are already valid public keys
+        if isinstance(key_point, Nist256p1PointCryptography):
+            return cls(key_point.UnderlyingObject())
+
+        try:
+            return cls(
+                ec.EllipticCurvePublicNumbers(key_point.X(),
+                                              key_point.Y(),
+                                              Nist256p1PointCryptographyConst.CURVE).public_key()
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid public key point") from ex
+
+    def __init__(self,
+                 key_obj: ec.EllipticCurvePublicKey) -> None:
+        """
+        Construct class from key object.
+
+        Args:
+            key_obj (ec.EllipticCurvePublicKey): Key object
+        """
+        self.m_ver_key = key_obj
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.NIST256P1
+
+    @staticmethod
+    def CompressedLength() -> int:
+        """
+        Get the compressed key length.
+
+        Returns:
+           int: Compressed key length
+        """
+        return EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN
+
+    @staticmethod
+    def UncompressedLength() -> int:
+        """
+        Get the uncompressed key length.
+
+        Returns:
+           int: Uncompressed key length
+        """
+        return EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_ver_key
+
+    def RawCompressed(self) -> DataBytes:
+        """
+        Return raw compressed public key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(
+            self.m_ver_key.public_bytes(serialization.Encoding.X962,
+                                        serialization.PublicFormat.CompressedPoint)
+        )
+
+    def RawUncompressed(self) -> DataBytes:
+        """
+        Return raw uncompressed public key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(
+            self.m_ver_key.public_bytes(serialization.Encoding.X962,
+                                        serialization.PublicFormat.UncompressedPoint)
+        )
+
+    def Point(self) -> IPoint:
+        """
+        Get public key point.
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return Nist256p1PointCryptography(self.m_ver_key)
+
+
+class Nist256p1PrivateKeyCryptography(IPrivateKey):
+    """Nist256p1 private key class."""
+
+    m_sign_key: ec.EllipticCurvePrivateKey
+
+    @classmethod
+    def FromBytes(cls,
+                  key_bytes: bytes) -> IPrivateKey:
+        """
+        Construct class from key bytes.
+
+        Args:
+            key_bytes (bytes): Key bytes
+
+        Returns:
+            IPrivateKey: IPrivateKey object
+
+        Raises:
+            ValueError: If key bytes are not valid
+        """
+        if len(key_bytes) != cls.Length():
+            raise ValueError("Invalid private key bytes")
+
+        try:
+            return cls(
+                ec.derive_private_key(BytesUtils.ToInteger(key_bytes),
+                                      Nist256p1PointCryptographyConst.CURVE)
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid private key bytes") from ex
+
+    def __init__(self,
+                 key_obj: ec.EllipticCurvePrivateKey) -> None:
+        """
+        Construct class from key object.
+
+        Args:
+            key_obj (ec.EllipticCurvePrivateKey): Key object
+        """
+        self.m_sign_key = key_obj
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.NIST256P1
+
+    @staticmethod
+    def Length() -> int:
+        """
+        Get the key length.
+
+        Returns:
+           int: Key length
+        """
+        return EcdsaKeysConst.PRIV_KEY_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_sign_key
+
+    def Raw(self) -> DataBytes:
+        """
+        Return raw private key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(
+            IntegerUtils.ToBytes(self.m_sign_key.private_numbers().private_value,
+                                 bytes_num=self.Length())
+        )
+
+    def PublicKey(self) -> IPublicKey:
+        """
+        Get the public key correspondent to the private one.
+
+        Returns:
+            IPublicKey object: IPublicKey object
+        """
+        return Nist256p1PublicKeyCryptography(self.m_sign_key.public_key())
@@ -0,0 +1,299 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for nist256p1 point based on cryptography library."""
+
+# Imports
+from typing import Any, Optional, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from ecdsa import ellipticcurve, numbertheory
+from ecdsa.ecdsa import curve_256, generator_256
+
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.utils.misc import DataBytes
+
+
+class Nist256p1PointCryptographyConst:
+    """Class container for nist256p1 point constants based on cryptography library."""
+
+    # Curve object
+    CURVE: ec.EllipticCurve = ec.SECP256R1()
+    # Curve parameters
+    FIELD_PRIME: int = curve_256.p()
+    COEFF_A: int = curve_256.a()
+    ORDER: int = generator_256.order()
+    # Generator coordinates
+    GENERATOR_COORDS: Tuple[int, int] = (generator_256.x(), generator_256.y())
+
+
+class Nist256p1PointCryptography(IPoint):
+    """
+    Nist256p1 point class.
+    In cryptography library, there is no point object and points are only represented by
+    public keys. For this reason, a EllipticCurvePublicKey is used as underlying object.
+    Since the library doesn't expose point addition, it's computed in affine coordinates.
+    Multiplication of the generator is computed by the library, while multiplication of other
+    points relies on the ecdsa library.
+    """
+
+    m_pub_key: ec.EllipticCurvePublicKey
+    m_coords: Optional[Tuple[int, int]]
+
+    @classmethod
+    def FromBytes(cls,
+                  point_bytes: bytes) -> IPoint:
+        """
+        Construct class from point bytes.
+
+        Args:
+            point_bytes (bytes): Point bytes
+
+        Returns:
+            IPoint: IPoint object
+        """
+        if len(point_bytes) == EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN - 1:
+            point_bytes = EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_PREFIX + point_bytes
+        # Uncompressed points are passed through as they are
+        elif (len(point_bytes) != EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN
+              and not (len(point_bytes) == EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN
+                       and point_bytes[:1] == EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_PREFIX)):
+            raise ValueError("Invalid point bytes")
+
+        try:
+            return cls(
+                ec.EllipticCurvePublicKey.from_encoded_point(Nist256p1PointCryptographyConst.CURVE,
+                                                             point_bytes)
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid point bytes") from ex
+
+    @classmethod
+    def FromCoordinates(cls,
+                        x: int,
+                        y: int) -> IPoint:
+        """
+        Construct class from point coordinates.
+
+        Args:
+            x (int): X coordinate of the point
+            y (int): Y coordinate of the point
+
+        Returns:
+            IPoint: IPoint object
+        """
+        try:
+            pub_key = ec.EllipticCurvePublicNumbers(x, y, Nist256p1PointCryptographyConst.CURVE).public_key()
+        except ValueError as ex:
+            raise ValueError("Invalid point coordinates") from ex
+        return cls(pub_key, (x, y))
+
+    def __init__(self,
+                 point_obj: ec.EllipticCurvePublicKey,
+                 coords: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Construct class from point object.
+
+        Args:
+            point_obj (ec.EllipticCurvePublicKey): Point object
+            coords (tuple[int, int], optional)  : Point coordinates, if already known (default: None)
+        """
+        self.m_pub_key = point_obj
+        self.m_coords = coords
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.NIST256P1
+
+    @staticmethod
+    def CoordinateLength() -> int:
+        """
+        Get the coordinate length.
+
+        Returns:
+           int: Coordinate key length
+        """
+        return EcdsaKeysConst.POINT_COORD_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_pub_key
+
+    def X(self) -> int:
+        """
+        Get point X coordinate.
+
+        Returns:
+           int: Point X coordinate
+        """
+        return self.__Coordinates()[0]
+
+    def Y(self) -> int:
+        """
+        Get point Y coordinate.
+
+        Returns:
+           int: Point Y coordinate
+        """
+        return self.__Coordinates()[1]
+
+    def Raw(self) -> DataBytes:
+        """
+        Return the point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return self.RawDecoded()
+
+    def RawEncoded(self) -> DataBytes:
+        """
+        Return the encoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(
+            self.m_pub_key.public_bytes(serialization.Encoding.X962,
+                                        serialization.PublicFormat.CompressedPoint)
+        )
+
+    def RawDecoded(self) -> DataBytes:
+        """
+        Return the decoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(
+            self.m_pub_key.public_bytes(serialization.Encoding.X962,
+                                        serialization.PublicFormat.UncompressedPoint)[1:]
+        )
+
+    def __add__(self,
+                point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the result is the point at infinity
+        """
+        p = Nist256p1PointCryptographyConst.FIELD_PRIME
+        x1, y1 = self.__Coordinates()
+        x2, y2 = point.X(), point.Y()
+
+        if x1 == x2:
+            if (y1 + y2) % p == 0:
+                raise ValueError("Invalid point addition (point at infinity)")
+            lam = (3 * x1 * x1 + Nist256p1PointCryptographyConst.COEFF_A) * numbertheory.inverse_mod(2 * y1, p)
+        else:
+            lam = (y2 - y1) * numbertheory.inverse_mod(x2 - x1, p)
+        lam %= p
+
+        x3 = (lam * lam - x1 - x2) % p
+        y3 = (lam * (x1 - x3) - y1) % p
+        return self.__class__.FromCoordinates(x3, y3)
+
+    def __radd__(self,
+                 point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self + point
+
+    def __mul__(self,
+                scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the result is the point at infinity
+        """
+        if self.__Coordinates() == Nist256p1PointCryptographyConst.GENERATOR_COORDS:
+            scalar %= Nist256p1PointCryptographyConst.ORDER
+            if scalar == 0:
+                raise ValueError("Invalid point multiplication (point at infinity)")
+            return self.__class__(
+                ec.derive_private_key(scalar, Nist256p1PointCryptographyConst.CURVE).public_key()
+            )
+
+        point = ellipticcurve.PointJacobi.from_affine(
+            ellipticcurve.Point(curve_256, self.X(), self.Y())
+        ) * scalar
+        if point == ellipticcurve.INFINITY:
+            raise ValueError("Invalid point multiplication (point at infinity)")
+        return self.__class__.FromCoordinates(point.x(), point.y())
+
+    def __rmul__(self,
+                 scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self * scalar
+
+    def __Coordinates(self) -> Tuple[int, int]:
+        """
+        Get point coordinates, computing them only once.
+
+        Returns:
+            tuple[int, int]: X (index 0) and Y (index 1) coordinates
+        """
+        if self.m_coords is None:
+            pub_numbers = self.m_pub_key.public_numbers()
+            self.m_coords = (pub_numbers.x, pub_numbers.y)
+        return self.m_coords
@@ -0,0 +1,430 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Pure Python implementation of secp256k1 point operations, used when no native library is available.
+Points are internally represented in Jacobian coordinates (X, Y, Z), with x = X/Z^2 and y = Y/Z^3 (Z = 0 for the
+point at infinity), while inputs and outputs are in affine coordinates (x, y) (None for the point at infinity).
+Multiplications of the generator use a precomputed table, built the first time it's needed.
+Multiplications of other points use the GLV endomorphism with interleaved wNAF.
+"""
+
+# Imports
+from typing import List, Optional, Sequence, Tuple
+
+from ecdsa.numbertheory import inverse_mod
+
+
+# Affine and Jacobian point types
+AffinePoint = Tuple[int, int]
+JacobianPoint = Tuple[int, int, int]
+
+# Curve parameters (y^2 = x^3 + 7)
+_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_B = 7
+_G = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+      0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+_COORD_BYTE_LEN = 32
+
+# Endomorphism: lambda * (x, y) = (beta * x, y)
+_BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+_LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+# Basis for scalar decomposition
+_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+_B2 = _A1
+
+# Window size in bits of the generator table
+_G_TABLE_WIN_BITS = 8
+# Window size of wNAF for variable-base multiplication
+_WNAF_WIN_BITS = 5
+
+_JAC_INFINITY = (1, 1, 0)
+
+# Generator table, built the first time it's needed
+_g_table: Optional[List[List[AffinePoint]]] = None
+
+
+def _inv(x: int) -> int:
+    return inverse_mod(x, _P)
+
+
+def _jac_double(p: JacobianPoint) -> JacobianPoint:
+    x1, y1, z1 = p
+    if z1 == 0 or y1 == 0:
+        return _JAC_INFINITY
+
+    a = (x1 * x1) % _P
+    b = (y1 * y1) % _P
+    c = (b * b) % _P
+    d = (2 * ((x1 + b) ** 2 - a - c)) % _P
+    e = 3 * a
+    f = (e * e) % _P
+    x3 = (f - 2 * d) % _P
+    y3 = (e * (d - x3) - 8 * c) % _P
+    z3 = (2 * y1 * z1) % _P
+    return x3, y3, z3
+
+
+def _jac_add_affine(p: JacobianPoint,
+                    q: AffinePoint) -> JacobianPoint:
+    x1, y1, z1 = p
+    x2, y2 = q
+    if z1 == 0:
+        return x2, y2, 1
+
+    z1z1 = (z1 * z1) % _P
+    h = (x2 * z1z1 - x1) % _P
+    r = (y2 * z1 * z1z1 - y1) % _P
+    if h == 0:
+        return _jac_double(p) if r == 0 else _JAC_INFINITY
+
+    hh = (h * h) % _P
+    hhh = (h * hh) % _P
+    v = (x1 * hh) % _P
+    x3 = (r * r - hhh - 2 * v) % _P
+    y3 = (r * (v - x3) - y1 * hhh) % _P
+    z3 = (z1 * h) % _P
+    return x3, y3, z3
+
+
+def _jac_add(p: JacobianPoint,
+             q: JacobianPoint) -> JacobianPoint:
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    if z1 == 0:
+        return q
+    if z2 == 0:
+        return p
+
+    z1z1 = (z1 * z1) % _P
+    z2z2 = (z2 * z2) % _P
+    u1 = (x1 * z2z2) % _P
+    s1 = (y1 * z2 * z2z2) % _P
+    h = (x2 * z1z1 - u1) % _P
+    r = (y2 * z1 * z1z1 - s1) % _P
+    if h == 0:
+        return _jac_double(p) if r == 0 else _JAC_INFINITY
+
+    hh = (h * h) % _P
+    hhh = (h * hh) % _P
+    v = (u1 * hh) % _P
+    x3 = (r * r - hhh - 2 * v) % _P
+    y3 = (r * (v - x3) - s1 * hhh) % _P
+    z3 = (z1 * z2 * h) % _P
+    return x3, y3, z3
+
+
+def _jac_to_affine(p: JacobianPoint) -> Optional[AffinePoint]:
+    x, y, z = p
+    if z == 0:
+        return None
+    z_inv = _inv(z)
+    z_inv2 = (z_inv * z_inv) % _P
+    return (x * z_inv2) % _P, (y * z_inv2 * z_inv) % _P
+
+
+def _jac_to_affine_batch(points: Sequence[JacobianPoint]) -> List[AffinePoint]:
+    # Montgomery's trick: a single inversion for all points (none of them shall be the point at infinity)
+    z_prods = []
+    z_prod = 1
+    for point in points:
+        z_prod = (z_prod * point[2]) % _P
+        z_prods.append(z_prod)
+
+    prod_inv = _inv(z_prod)
+    points_aff: List[AffinePoint] = [(0, 0)] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        x, y, z = points[i]
+        z_inv = (prod_inv * z_prods[i - 1]) % _P if i > 0 else prod_inv
+        prod_inv = (prod_inv * z) % _P
+        z_inv2 = (z_inv * z_inv) % _P
+        points_aff[i] = ((x * z_inv2) % _P, (y * z_inv2 * z_inv) % _P)
+    return points_aff
+
+
+def _g_table_get() -> List[List[AffinePoint]]:
+    # Table of j * 2^(w*i) * G, for each window i and j in [1, 2^w - 1]
+    global _g_table     # noqa: PLW0603
+    if _g_table is None:
+        win_num = (_N.bit_length() + _G_TABLE_WIN_BITS - 1) // _G_TABLE_WIN_BITS
+        win_len = (1 << _G_TABLE_WIN_BITS) - 1
+
+        points = []
+        base = (_G[0], _G[1], 1)
+        for _ in range(win_num):
+            point = base
+            for _ in range(win_len):
+                points.append(point)
+                point = _jac_add(point, base)
+            # Next base is 2^w times the current one
+            base = point
+        points_aff = _jac_to_affine_batch(points)
+        _g_table = [points_aff[i:i + win_len] for i in range(0, len(points_aff), win_len)]
+    return _g_table
+
+
+def _scalar_split(k: int) -> Tuple[int, int]:
+    # Decompose k in k1 + k2 * lambda (mod n), with k1 and k2 of about 128-bit
+    c1 = (_B2 * k + _N // 2) // _N
+    c2 = (-_B1 * k + _N // 2) // _N
+    k1 = k - c1 * _A1 - c2 * _A2
+    k2 = -c1 * _B1 - c2 * _B2
+    return k1, k2
+
+
+def _wnaf(k: int) -> List[int]:
+    # Width-w non-adjacent form of k, least significant digit first
+    win_size = 1 << _WNAF_WIN_BITS
+    win_half = win_size >> 1
+    digits = []
+    while k > 0:
+        if k & 1:
+            d = k & (win_size - 1)
+            if d >= win_half:
+                d -= win_size
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+def int_decode(int_bytes: bytes) -> int:
+    """
+    Decode int from bytes.
+
+    Args:
+        int_bytes (bytes): Integer bytes
+
+    Returns:
+        int: Decoded integer
+    """
+    return int.from_bytes(int_bytes, "big")
+
+
+def int_encode(int_val: int) -> bytes:
+    """
+    Encode int to bytes.
+
+    Args:
+        int_val (int): Integer value
+
+    Returns:
+        bytes: Encoded integer
+    """
+    return int_val.to_bytes(_COORD_BYTE_LEN, "big")
+
+
+def curve_order() -> int:
+    """
+    Get the curve order.
+
+    Returns:
+        int: Curve order
+    """
+    return _N
+
+
+def generator() -> AffinePoint:
+    """
+    Get the generator point.
+
+    Returns:
+        tuple[int, int]: Generator coordinates
+    """
+    return _G
+
+
+def point_is_on_curve(point: AffinePoint) -> bool:
+    """
+    Get if the point lies on the secp256k1 curve.
+
+    Args:
+        point (tuple[int, int]): Point coordinates
+
+    Returns:
+        bool: True if it lies on the curve, false otherwise
+    """
+    x, y = point
+    return 0 <= x < _P and 0 <= y < _P and (y * y - x * x * x - _B) % _P == 0
+
+
+def point_decode(point_bytes: bytes) -> AffinePoint:
+    """
+    Decode point bytes to coordinates.
+    Compressed (33-byte), uncompressed (65-byte) and raw (64-byte, without prefix) formats are accepted.
+
+    Args:
+        point_bytes (bytes): Point bytes
+
+    Returns:
+        tuple[int, int]: Point coordinates
+
+    Raises:
+        ValueError: If the point bytes are not valid or the point doesn't lie on the curve
+    """
+    if len(point_bytes) == _COORD_BYTE_LEN + 1 and point_bytes[0] in (2, 3):
+        x = int_decode(point_bytes[1:])
+        if x >= _P:
+            raise ValueError("Invalid point bytes")
+        y_sq = (x * x * x + _B) % _P
+        y = pow(y_sq, (_P + 1) // 4, _P)
+        if (y * y) % _P != y_sq:
+            raise ValueError("Invalid point bytes")
+        if (y & 1) != (point_bytes[0] & 1):
+            y = _P - y
+        return x, y
+
+    if len(point_bytes) == _COORD_BYTE_LEN * 2 + 1 and point_bytes[0] == 4:
+        point_bytes = point_bytes[1:]
+    if len(point_bytes) == _COORD_BYTE_LEN * 2:
+        point = (int_decode(point_bytes[:_COORD_BYTE_LEN]), int_decode(point_bytes[_COORD_BYTE_LEN:]))
+        if not point_is_on_curve(point):
+            raise ValueError("Invalid point bytes")
+        return point
+
+    raise ValueError("Invalid point bytes")
+
+
+def point_encode(point: AffinePoint,
+                 compressed: bool) -> bytes:
+    """
+    Encode point coordinates to bytes.
+
+    Args:
+        point (tuple[int, int]): Point coordinates
+        compressed (bool)      : True for compressed format, false for uncompressed (with 0x04 prefix)
+
+    Returns:
+        bytes: Point bytes
+    """
+    x, y = point
+    if compressed:
+        return bytes([2 + (y & 1)]) + int_encode(x)
+    return b"\x04" + int_encode(x) + int_encode(y)
+
+
+def point_add(point_1: AffinePoint,
+              point_2: AffinePoint) -> Optional[AffinePoint]:
+    """
+    Add two points.
+
+    Args:
+        point_1 (tuple[int, int]): Point 1 coordinates
+        point_2 (tuple[int, int]): Point 2 coordinates
+
+    Returns:
+        tuple[int, int]: Coordinates of the resulting point (None for the point at infinity)
+    """
+    x1, y1 = point_1
+    x2, y2 = point_2
+    if x1 == x2:
+        if (y1 + y2) % _P == 0:
+            return None
+        # Doubling
+        slope = (3 * x1 * x1 * _inv(2 * y1)) % _P
+    else:
+        slope = ((y2 - y1) * _inv(x2 - x1)) % _P
+    x3 = (slope * slope - x1 - x2) % _P
+    return x3, (slope * (x1 - x3) - y1) % _P
+
+
+def point_scalar_mul_base(scalar: int) -> Optional[AffinePoint]:
+    """
+    Multiply the generator by a scalar, using a precomputed table.
+
+    Args:
+        scalar (int): Scalar
+
+    Returns:
+        tuple[int, int]: Coordinates of the resulting point (None for the point at infinity)
+    """
+    scalar %= _N
+    g_table = _g_table_get()
+    win_mask = (1 << _G_TABLE_WIN_BITS) - 1
+
+    acc = _JAC_INFINITY
+    win_idx = 0
+    while scalar > 0:
+        d = scalar & win_mask
+        if d:
+            acc = _jac_add_affine(acc, g_table[win_idx][d - 1])
+        scalar >>= _G_TABLE_WIN_BITS
+        win_idx += 1
+    return _jac_to_affine(acc)
+
+
+def point_scalar_mul(scalar: int,
+                     point: AffinePoint) -> Optional[AffinePoint]:
+    """
+    Multiply a point by a scalar, using the GLV endomorphism and interleaved wNAF.
+
+    Args:
+        scalar (int)           : Scalar
+        point (tuple[int, int]): Point coordinates
+
+    Returns:
+        tuple[int, int]: Coordinates of the resulting point (None for the point at infinity)
+    """
+    if point == _G:
+        return point_scalar_mul_base(scalar)
+
+    scalar %= _N
+    if scalar == 0:
+        return None
+
+    k1, k2 = _scalar_split(scalar)
+    x, y = point
+    y1 = y if k1 >= 0 else _P - y
+    y2 = y if k2 >= 0 else _P - y
+
+    # Odd multiples of the point (P, 3P, 5P, ...), normalized to affine coordinates for faster additions
+    table_len = 1 << (_WNAF_WIN_BITS - 2)
+    jac_point = (x, y1, 1)
+    jac_point_dbl = _jac_double(jac_point)
+    multiples = [jac_point]
+    for _ in range(table_len - 1):
+        multiples.append(_jac_add(multiples[-1], jac_point_dbl))
+    table_1 = _jac_to_affine_batch(multiples)
+    # Endomorphism of the multiples, with the sign of k2
+    table_2 = [((_BETA * px) % _P, py if y1 == y2 else _P - py) for px, py in table_1]
+
+    wnaf_1 = _wnaf(abs(k1))
+    wnaf_2 = _wnaf(abs(k2))
+    acc = _JAC_INFINITY
+    for i in range(max(len(wnaf_1), len(wnaf_2)) - 1, -1, -1):
+        acc = _jac_double(acc)
+        d1 = wnaf_1[i] if i < len(wnaf_1) else 0
+        d2 = wnaf_2[i] if i < len(wnaf_2) else 0
+        if d1 > 0:
+            acc = _jac_add_affine(acc, table_1[d1 >> 1])
+        elif d1 < 0:
+            px, py = table_1[(-d1) >> 1]
+            acc = _jac_add_affine(acc, (px, _P - py))
+        if d2 > 0:
+            acc = _jac_add_affine(acc, table_2[d2 >> 1])
+        elif d2 < 0:
+            px, py = table_2[(-d2) >> 1]
+            acc = _jac_add_affine(acc, (px, _P - py))
+    return _jac_to_affine(acc)
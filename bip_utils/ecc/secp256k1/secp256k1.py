@@ -21,19 +21,102 @@
 """Module with secp256k1 curve."""
 
 # Imports
+from typing import Tuple, Type
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.conf import EccConf
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.secp256k1.secp256k1_const import (
-                                         Secp256k1Const,
-                                         Secp256k1Point,
-                                         Secp256k1PrivateKey,
-                                         Secp256k1PublicKey,
+    Secp256k1Const,
+    Secp256k1Point,
+    Secp256k1PrivateKey,
+    Secp256k1PublicKey,
 )
 
 
+def _LoadCoincurveBackend() -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+    """
+    Load the backend based on coincurve library.
+
+    Returns:
+        tuple: Point class, public key class, private key class and generator point
+    """
+    from bip_utils.ecc.secp256k1.secp256k1_keys_coincurve import (  # noqa: PLC0415
+        Secp256k1PointCoincurve,
+        Secp256k1PrivateKeyCoincurve,
+        Secp256k1PublicKeyCoincurve,
+    )
+
+    return (Secp256k1PointCoincurve,
+            Secp256k1PublicKeyCoincurve,
+            Secp256k1PrivateKeyCoincurve,
+            Secp256k1PointCoincurve.FromCoordinates(Secp256k1Const.GENERATOR_X, Secp256k1Const.GENERATOR_Y))
+
+
+def _LoadEcdsaBackend() -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+    """
+    Load the backend based on ecdsa library.
+
+    Returns:
+        tuple: Point class, public key class, private key class and generator point
+    """
+    from ecdsa.ecdsa import generator_secp256k1  # noqa: PLC0415
+
+    from bip_utils.ecc.secp256k1.secp256k1_keys_ecdsa import (  # noqa: PLC0415
+        Secp256k1PointEcdsa,
+        Secp256k1PrivateKeyEcdsa,
+        Secp256k1PublicKeyEcdsa,
+    )
+
+    return (Secp256k1PointEcdsa,
+            Secp256k1PublicKeyEcdsa,
+            Secp256k1PrivateKeyEcdsa,
+            Secp256k1PointEcdsa(generator_secp256k1))
+
+
+def _LoadPythonBackend() -> Tuple[Type[IPoint], Type[IPublicKey], Type[IPrivateKey], IPoint]:
+    """
+    Load the backend based on the pure Python implementation.
+
+    Returns:
+        tuple: Point class, public key class, private key class and generator point
+    """
+    from bip_utils.ecc.secp256k1.secp256k1_keys_python import (  # noqa: PLC0415
+        Secp256k1PointPython,
+        Secp256k1PrivateKeyPython,
+        Secp256k1PublicKeyPython,
+    )
+
+    return (Secp256k1PointPython,
+            Secp256k1PublicKeyPython,
+            Secp256k1PrivateKeyPython,
+            Secp256k1PointPython.FromCoordinates(Secp256k1Const.GENERATOR_X, Secp256k1Const.GENERATOR_Y))
+
+
+# Register backends, coincurve is preferred since it's much faster.
+# The pure Python one comes next, since it's faster than ecdsa (precomputed generator table and GLV endomorphism).
+EllipticCurveBackends.Register(EllipticCurveTypes.SECP256K1,
+                               EllipticCurveBackend(Secp256k1Const.BACKEND_COINCURVE, _LoadCoincurveBackend, 2))
+EllipticCurveBackends.Register(EllipticCurveTypes.SECP256K1,
+                               EllipticCurveBackend(Secp256k1Const.BACKEND_PYTHON, _LoadPythonBackend, 1))
+EllipticCurveBackends.Register(EllipticCurveTypes.SECP256K1,
+                               EllipticCurveBackend(Secp256k1Const.BACKEND_ECDSA, _LoadEcdsaBackend, 0))
+# Initial backend from configuration
+EllipticCurveBackends.AutoSelect(EllipticCurveTypes.SECP256K1,
+                                 () if EccConf.USE_COINCURVE else (Secp256k1Const.BACKEND_COINCURVE,))
+
+
 # Secp256k1 curve definition
-Secp256k1: EllipticCurve = EllipticCurve(Secp256k1Const.NAME,
-                                         Secp256k1Const.CURVE_ORDER,
-                                         Secp256k1Const.GENERATOR,
-                                         Secp256k1Point,
-                                         Secp256k1PublicKey,
-                                         Secp256k1PrivateKey)
+Secp256k1: EllipticCurve = EllipticCurveWithBackends(Secp256k1Const.NAME,
+                                                     Secp256k1Const.CURVE_ORDER,
+                                                     EllipticCurveTypes.SECP256K1,
+                                                     point_cls=Secp256k1Point,
+                                                     pub_key_cls=Secp256k1PublicKey,
+                                                     priv_key_cls=Secp256k1PrivateKey)
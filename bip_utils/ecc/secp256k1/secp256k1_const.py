@@ -25,48 +25,12 @@ from typing import Type
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
-from bip_utils.ecc.conf import EccConf
-
-
-# Variables
-Secp256k1Point: Type[IPoint]
-Secp256k1PublicKey: Type[IPublicKey]
-Secp256k1PrivateKey: Type[IPrivateKey]
-_CURVE_ORDER: int
-_GENERATOR: IPoint
-
-# Use classes from coincurve version
-if EccConf.USE_COINCURVE:
-    from bip_utils.ecc.secp256k1.secp256k1_keys_coincurve import (
-        Secp256k1PointCoincurve,
-        Secp256k1PrivateKeyCoincurve,
-        Secp256k1PublicKeyCoincurve,
-    )
-
-    Secp256k1Point = Secp256k1PointCoincurve
-    Secp256k1PublicKey = Secp256k1PublicKeyCoincurve
-    Secp256k1PrivateKey = Secp256k1PrivateKeyCoincurve
-
-    _CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-    _GENERATOR = Secp256k1Point.FromCoordinates(0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
-                                                0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
-
-# Use classes from ecdsa version
-else:
-    from ecdsa.ecdsa import generator_secp256k1
-
-    from bip_utils.ecc.secp256k1.secp256k1_keys_ecdsa import (
-        Secp256k1PointEcdsa,
-        Secp256k1PrivateKeyEcdsa,
-        Secp256k1PublicKeyEcdsa,
-    )
-
-    Secp256k1Point = Secp256k1PointEcdsa
-    Secp256k1PublicKey = Secp256k1PublicKeyEcdsa
-    Secp256k1PrivateKey = Secp256k1PrivateKeyEcdsa
-
-    _CURVE_ORDER = generator_secp256k1.order()
-    _GENERATOR = Secp256k1Point(generator_secp256k1)
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackendGenerator,
+    EllipticCurveBackendProxy,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 
 
 class Secp256k1Const:
@@ -75,6 +39,25 @@ class Secp256k1Const:
     # Curve name
     NAME: str = "Secp256k1"
     # Curve order
-    CURVE_ORDER: int = _CURVE_ORDER
-    # Curve generator point
-    GENERATOR: IPoint = _GENERATOR
+    CURVE_ORDER: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    # Curve generator point coordinates
+    GENERATOR_X: int = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+    GENERATOR_Y: int = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+    # Curve generator point of the active backend
+    GENERATOR = EllipticCurveBackendGenerator(EllipticCurveTypes.SECP256K1)
+    # Backend names
+    BACKEND_COINCURVE: str = "coincurve"
+    BACKEND_ECDSA: str = "ecdsa"
+    BACKEND_PYTHON: str = "python"
+
+
+# Classes of the active backend
+Secp256k1Point: Type[IPoint] = EllipticCurveBackendProxy.Create(
+    "Secp256k1Point", EllipticCurveTypes.SECP256K1, EllipticCurveBackend.PointClass, __name__
+)
+Secp256k1PublicKey: Type[IPublicKey] = EllipticCurveBackendProxy.Create(
+    "Secp256k1PublicKey", EllipticCurveTypes.SECP256K1, EllipticCurveBackend.PublicKeyClass, __name__
+)
+Secp256k1PrivateKey: Type[IPrivateKey] = EllipticCurveBackendProxy.Create(
+    "Secp256k1PrivateKey", EllipticCurveTypes.SECP256K1, EllipticCurveBackend.PrivateKeyClass, __name__
+)
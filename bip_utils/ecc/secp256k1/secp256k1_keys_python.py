@@ -0,0 +1,242 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for secp256k1 keys based on the pure Python implementation."""
+
+# Imports
+from typing import Any, Tuple
+
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.secp256k1.lib import secp256k1_lib
+from bip_utils.ecc.secp256k1.secp256k1_point_python import Secp256k1PointPython
+from bip_utils.utils.misc import DataBytes
+
+
+class Secp256k1PublicKeyPython(IPublicKey):
+    """Secp256k1 public key class."""
+
+    m_point: Tuple[int, int]
+
+    @classmethod
+    def FromBytes(cls,
+                  key_bytes: bytes) -> IPublicKey:
+        """
+        Construct class from key bytes.
+
+        Args:
+            key_bytes (bytes): Key bytes
+
+        Returns:
+            IPublicKey: IPublicKey object
+
+        Raises:
+            ValueError: If key bytes are not valid
+        """
+        try:
+            return cls(secp256k1_lib.point_decode(key_bytes))
+        except ValueError as ex:
+            raise ValueError("Invalid public key bytes") from ex
+
+    @classmethod
+    def FromPoint(cls,
+                  key_point: IPoint) -> IPublicKey:
+        """
+        Construct class from key point.
+
+        Args:
+            key_point (IPoint object): Key point
+
+        Returns:
+            IPublicKey: IPublicKey object
+
+        Raises:
+            ValueError: If key point is not valid
+        """
+        point = (key_point.X(), key_point.Y())
+        if not secp256k1_lib.point_is_on_curve(point):
+            raise ValueError("Invalid public key point")
+        return cls(point)
+
+    def __init__(self,
+                 key_obj: Tuple[int, int]) -> None:
+        """
+        Construct class from key object.
+
+        Args:
+            key_obj (tuple[int, int]): Key point coordinates
+        """
+        self.m_point = key_obj
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.SECP256K1
+
+    @staticmethod
+    def CompressedLength() -> int:
+        """
+        Get the compressed key length.
+
+        Returns:
+           int: Compressed key length
+        """
+        return EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN
+
+    @staticmethod
+    def UncompressedLength() -> int:
+        """
+        Get the uncompressed key length.
+
+        Returns:
+           int: Uncompressed key length
+        """
+        return EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_point
+
+    def RawCompressed(self) -> DataBytes:
+        """
+        Return raw compressed public key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(secp256k1_lib.point_encode(self.m_point, True))
+
+    def RawUncompressed(self) -> DataBytes:
+        """
+        Return raw uncompressed public key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(secp256k1_lib.point_encode(self.m_point, False))
+
+    def Point(self) -> IPoint:
+        """
+        Get public key point.
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return Secp256k1PointPython(self.m_point)
+
+
+class Secp256k1PrivateKeyPython(IPrivateKey):
+    """Secp256k1 private key class."""
+
+    m_key: int
+
+    @classmethod
+    def FromBytes(cls,
+                  key_bytes: bytes) -> IPrivateKey:
+        """
+        Construct class from key bytes.
+
+        Args:
+            key_bytes (bytes): Key bytes
+
+        Returns:
+            IPrivateKey: IPrivateKey object
+
+        Raises:
+            ValueError: If key bytes are not valid
+        """
+        if len(key_bytes) != EcdsaKeysConst.PRIV_KEY_BYTE_LEN:
+            raise ValueError("Invalid private key bytes")
+        key_int = secp256k1_lib.int_decode(key_bytes)
+        if not 0 < key_int < secp256k1_lib.curve_order():
+            raise ValueError("Invalid private key bytes")
+        return cls(key_int)
+
+    def __init__(self,
+                 key_obj: int) -> None:
+        """
+        Construct class from key object.
+
+        Args:
+            key_obj (int): Key integer
+        """
+        self.m_key = key_obj
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.SECP256K1
+
+    @staticmethod
+    def Length() -> int:
+        """
+        Get the key length.
+
+        Returns:
+           int: Key length
+        """
+        return EcdsaKeysConst.PRIV_KEY_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_key
+
+    def Raw(self) -> DataBytes:
+        """
+        Return raw private key.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(secp256k1_lib.int_encode(self.m_key))
+
+    def PublicKey(self) -> IPublicKey:
+        """
+        Get the public key correspondent to the private one.
+
+        Returns:
+            IPublicKey object: IPublicKey object
+        """
+        point = secp256k1_lib.point_scalar_mul_base(self.m_key)
+        # Cannot be the point at infinity, since the key is in range [1, n - 1]
+        assert point is not None
+        return Secp256k1PublicKeyPython(point)
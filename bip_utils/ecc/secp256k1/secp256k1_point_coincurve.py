@@ -172,7 +172,7 @@ class Secp256k1PointCoincurve(IPoint):
         Returns:
             IPoint object: IPoint object
         """
-        return self.__class__(self.m_pub_key.combine([point.UnderlyingObject()]))
+        return self.__class__(self.m_pub_key.combine([self.FromPoint(point).UnderlyingObject()]))
 
     def __radd__(self,
                  point: IPoint) -> IPoint:
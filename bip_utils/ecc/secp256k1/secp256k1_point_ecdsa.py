@@ -177,7 +177,7 @@ class Secp256k1PointEcdsa(IPoint):
         Returns:
             IPoint object: IPoint object
         """
-        return self.__class__(self.m_point + point.UnderlyingObject())
+        return self.__class__(self.m_point + self.FromPoint(point).UnderlyingObject())
 
     def __radd__(self,
                  point: IPoint) -> IPoint:
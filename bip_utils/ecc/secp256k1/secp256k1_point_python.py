@@ -0,0 +1,215 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for secp256k1 point based on the pure Python implementation."""
+
+# Imports
+from typing import Any, Optional, Tuple
+
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.ecc.secp256k1.lib import secp256k1_lib
+from bip_utils.utils.misc import DataBytes
+
+
+class Secp256k1PointPython(IPoint):
+    """Secp256k1 point class."""
+
+    m_point: Tuple[int, int]
+
+    @classmethod
+    def FromBytes(cls,
+                  point_bytes: bytes) -> IPoint:
+        """
+        Construct class from point bytes.
+
+        Args:
+            point_bytes (bytes): Point bytes
+
+        Returns:
+            IPoint: IPoint object
+
+        Raises:
+            ValueError: If point bytes are not valid
+        """
+        return cls(secp256k1_lib.point_decode(point_bytes))
+
+    @classmethod
+    def FromCoordinates(cls,
+                        x: int,
+                        y: int) -> IPoint:
+        """
+        Construct class from point coordinates.
+
+        Args:
+            x (int): X coordinate of the point
+            y (int): Y coordinate of the point
+
+        Returns:
+            IPoint: IPoint object
+
+        Raises:
+            ValueError: If the point doesn't lie on the curve
+        """
+        if not secp256k1_lib.point_is_on_curve((x, y)):
+            raise ValueError("Invalid point coordinates")
+        return cls((x, y))
+
+    def __init__(self,
+                 point_obj: Optional[Tuple[int, int]]) -> None:
+        """
+        Construct class from point object.
+
+        Args:
+            point_obj (tuple[int, int]): Point coordinates
+
+        Raises:
+            ValueError: If the point is the point at infinity
+        """
+        if point_obj is None:
+            raise ValueError("Invalid point (point at infinity)")
+        self.m_point = point_obj
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.SECP256K1
+
+    @staticmethod
+    def CoordinateLength() -> int:
+        """
+        Get the coordinate length.
+
+        Returns:
+           int: Coordinate key length
+        """
+        return EcdsaKeysConst.POINT_COORD_BYTE_LEN
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_point
+
+    def X(self) -> int:
+        """
+        Get point X coordinate.
+
+        Returns:
+           int: Point X coordinate
+        """
+        return self.m_point[0]
+
+    def Y(self) -> int:
+        """
+        Get point Y coordinate.
+
+        Returns:
+           int: Point Y coordinate
+        """
+        return self.m_point[1]
+
+    def Raw(self) -> DataBytes:
+        """
+        Return the point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return self.RawDecoded()
+
+    def RawEncoded(self) -> DataBytes:
+        """
+        Return the encoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(secp256k1_lib.point_encode(self.m_point, True))
+
+    def RawDecoded(self) -> DataBytes:
+        """
+        Return the decoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(secp256k1_lib.point_encode(self.m_point, False)[1:])
+
+    def __add__(self,
+                point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self.__class__(secp256k1_lib.point_add(self.m_point, (point.X(), point.Y())))
+
+    def __radd__(self,
+                 point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self + point
+
+    def __mul__(self,
+                scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self.__class__(secp256k1_lib.point_scalar_mul(scalar, self.m_point))
+
+    def __rmul__(self,
+                 scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+        """
+        return self * scalar
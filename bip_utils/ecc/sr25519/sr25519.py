@@ -22,15 +22,28 @@
 
 # Imports
 from bip_utils.ecc.curve.elliptic_curve import EllipticCurve
+from bip_utils.ecc.curve.elliptic_curve_backends import (
+    EllipticCurveBackend,
+    EllipticCurveBackends,
+    EllipticCurveWithBackends,
+)
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.sr25519.sr25519_const import Sr25519Const
 from bip_utils.ecc.sr25519.sr25519_keys import Sr25519PrivateKey, Sr25519PublicKey
 from bip_utils.ecc.sr25519.sr25519_point import Sr25519Point
 
 
+# Register the Sr25519 backend
+EllipticCurveBackends.Register(
+    EllipticCurveTypes.SR25519,
+    EllipticCurveBackend("sr25519",
+                         lambda: (Sr25519Point,
+                                  Sr25519PublicKey,
+                                  Sr25519PrivateKey,
+                                  Sr25519Const.GENERATOR))
+)
+
 # Sr25519 curve definition
-Sr25519: EllipticCurve = EllipticCurve(Sr25519Const.NAME,
-                                       Sr25519Const.CURVE_ORDER,
-                                       Sr25519Const.GENERATOR,
-                                       Sr25519Point,
-                                       Sr25519PublicKey,
-                                       Sr25519PrivateKey)
+Sr25519: EllipticCurve = EllipticCurveWithBackends(Sr25519Const.NAME,
+                                                   Sr25519Const.CURVE_ORDER,
+                                                   EllipticCurveTypes.SR25519)
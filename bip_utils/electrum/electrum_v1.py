@@ -115,14 +115,15 @@ class ElectrumV1:
             if not isinstance(priv_key, Secp256k1PrivateKey):
                 raise TypeError("Private key shall be a secp256k1 key")
 
-            self.m_priv_key = priv_key
-            self.m_pub_key = priv_key.PublicKey()
+            # The key may have been created with a different backend of the curve
+            self.m_priv_key = Secp256k1PrivateKey.FromPrivateKey(priv_key)
+            self.m_pub_key = self.m_priv_key.PublicKey()
         else:
             if not isinstance(pub_key, Secp256k1PublicKey):
                 raise TypeError("Public key shall be a secp256k1 key")
 
             self.m_priv_key = None
-            self.m_pub_key = pub_key
+            self.m_pub_key = Secp256k1PublicKey.FromPublicKey(pub_key)
 
     def IsPublicOnly(self) -> bool:
         """
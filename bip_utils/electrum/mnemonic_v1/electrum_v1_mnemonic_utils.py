@@ -60,19 +60,19 @@ class ElectrumV1WordsListGetter(MnemonicWordsListGetterBase):
             raise TypeError("Language is not an enumerative of Bip39Languages")
 
         return self._LoadWordsList(lang,
-                                   self.__GetLanguageFile(lang),
+                                   self.GetLanguageFile(lang),
                                    ElectrumV1MnemonicConst.WORDS_LIST_NUM)
 
-    @staticmethod
-    def __GetLanguageFile(lang: MnemonicLanguages) -> str:
+    def GetLanguageFile(self,
+                        lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the words list file of the specified language.
 
         Args:
-            lang (Bip39Languages): Language
+            lang (MnemonicLanguages): Language
 
         Returns:
-            str: Language file name
+            str: File path
         """
         return os.path.join(os.path.dirname(__file__),
                             ElectrumV1MnemonicConst.LANGUAGE_FILES[lang])
@@ -8,6 +8,7 @@ from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
     ElectrumV2MnemonicTypes,
     ElectrumV2WordsNum,
 )
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_bulk_validator import ElectrumV2MnemonicBulkValidator
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_decoder import ElectrumV2MnemonicDecoder
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_encoder import ElectrumV2MnemonicEncoder
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_generator import ElectrumV2MnemonicGenerator
@@ -0,0 +1,124 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for Electrum v2 mnemonic bulk validation."""
+
+# Imports
+from typing import Optional
+
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
+    ElectrumV2Languages,
+    ElectrumV2Mnemonic,
+    ElectrumV2MnemonicTypes,
+)
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_decoder import ElectrumV2MnemonicDecoder
+from bip_utils.utils.mnemonic import (
+    Mnemonic,
+    MnemonicBulkValidator,
+    MnemonicBulkValidatorConst,
+    MnemonicDecoderBase,
+    MnemonicLanguages,
+)
+
+
+class ElectrumV2MnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Electrum v2 mnemonic bulk validator class.
+    It validates a stream of mnemonic phrases.
+    Mnemonics whose language is not one of ElectrumV2Languages are reported as not valid.
+    """
+
+    m_mnemonic_type: Optional[ElectrumV2MnemonicTypes]
+
+    def __init__(self,
+                 mnemonic_type: Optional[ElectrumV2MnemonicTypes] = None,
+                 lang: Optional[ElectrumV2Languages] = None,
+                 chunk_size: int = MnemonicBulkValidatorConst.DEFAULT_CHUNK_SIZE,
+                 worker_num: Optional[int] = 1) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic_type (ElectrumV2MnemonicTypes, optional): Mnemonic type, None for all types
+            lang (ElectrumV2Languages, optional)             : Language, None for automatic detection
+            chunk_size (int, optional)                       : Number of mnemonics validated by each task
+                                                               (default: 1000)
+            worker_num (int, optional)                       : Number of worker processes
+                                                               (default: 1, i.e. no processes,
+                                                               None: number of processors)
+
+        Raises:
+            TypeError: If the mnemonic type or the language is not of the correct enum
+            ValueError: If the chunk size or the number of workers is not valid
+        """
+        if mnemonic_type is not None and not isinstance(mnemonic_type, ElectrumV2MnemonicTypes):
+            raise TypeError("Mnemonic type is not an enumerative of ElectrumV2MnemonicTypes")
+        self.m_mnemonic_type = mnemonic_type
+        super().__init__(lang, chunk_size, worker_num)
+
+    def _ParseMnemonic(self,
+                       mnemonic: str) -> Mnemonic:
+        """
+        Parse a mnemonic string.
+
+        Args:
+            mnemonic (str): Mnemonic
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+        return ElectrumV2Mnemonic.FromString(mnemonic)
+
+    def _DetectLanguage(self,
+                        mnemonic: Mnemonic) -> MnemonicLanguages:
+        """
+        Detect the language of a mnemonic.
+
+        Args:
+            mnemonic (Mnemonic object): Mnemonic
+
+        Returns:
+            MnemonicLanguages: Mnemonic language
+
+        Raises:
+            ValueError: If the mnemonic language cannot be found
+        """
+        lang = Bip39WordsListFinder.FindLanguage(mnemonic)[1]
+        try:
+            return ElectrumV2Languages(lang)
+        except ValueError as ex:
+            raise ValueError(f"Language {lang} is not supported by Electrum v2") from ex
+
+    def _CreateDecoder(self,
+                       lang: MnemonicLanguages) -> MnemonicDecoderBase:
+        """
+        Create a decoder for the specified language.
+
+        Args:
+            lang (MnemonicLanguages): Language
+
+        Returns:
+            MnemonicDecoderBase object: Decoder
+
+        Raises:
+            TypeError: If the language is not a ElectrumV2Languages enum
+        """
+        return ElectrumV2MnemonicDecoder(self.m_mnemonic_type, lang)   # type: ignore [arg-type]
@@ -1,5 +1,6 @@
 from bip_utils.monero.mnemonic.monero_entropy_generator import MoneroEntropyBitLen, MoneroEntropyGenerator
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic, MoneroWordsNum
+from bip_utils.monero.mnemonic.monero_mnemonic_bulk_validator import MoneroMnemonicBulkValidator
 from bip_utils.monero.mnemonic.monero_mnemonic_decoder import MoneroMnemonicDecoder
 from bip_utils.monero.mnemonic.monero_mnemonic_encoder import (
     MoneroMnemonicEncoder,
@@ -0,0 +1,106 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for Monero mnemonic bulk validation."""
+
+# Imports
+from typing import Optional
+
+from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic
+from bip_utils.monero.mnemonic.monero_mnemonic_decoder import MoneroMnemonicDecoder
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroWordsListFinder
+from bip_utils.utils.mnemonic import (
+    Mnemonic,
+    MnemonicBulkValidator,
+    MnemonicBulkValidatorConst,
+    MnemonicDecoderBase,
+    MnemonicLanguages,
+)
+
+
+class MoneroMnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Monero mnemonic bulk validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 lang: Optional[MoneroLanguages] = None,
+                 chunk_size: int = MnemonicBulkValidatorConst.DEFAULT_CHUNK_SIZE,
+                 worker_num: Optional[int] = 1) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (MoneroLanguages, optional): Language, None for automatic detection
+            chunk_size (int, optional)      : Number of mnemonics validated by each task (default: 1000)
+            worker_num (int, optional)      : Number of worker processes (default: 1, i.e. no processes,
+                                              None: number of processors)
+
+        Raises:
+            TypeError: If the language is not a MoneroLanguages enum
+            ValueError: If the chunk size or the number of workers is not valid
+        """
+        super().__init__(lang, chunk_size, worker_num)
+
+    def _ParseMnemonic(self,
+                       mnemonic: str) -> Mnemonic:
+        """
+        Parse a mnemonic string.
+
+        Args:
+            mnemonic (str): Mnemonic
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+        return MoneroMnemonic.FromString(mnemonic)
+
+    def _DetectLanguage(self,
+                        mnemonic: Mnemonic) -> MnemonicLanguages:
+        """
+        Detect the language of a mnemonic.
+
+        Args:
+            mnemonic (Mnemonic object): Mnemonic
+
+        Returns:
+            MnemonicLanguages: Mnemonic language
+
+        Raises:
+            ValueError: If the mnemonic language cannot be found
+        """
+        return MoneroWordsListFinder.FindLanguage(mnemonic)[1]
+
+    def _CreateDecoder(self,
+                       lang: MnemonicLanguages) -> MnemonicDecoderBase:
+        """
+        Create a decoder for the specified language.
+
+        Args:
+            lang (MnemonicLanguages): Language
+
+        Returns:
+            MnemonicDecoderBase object: Decoder
+
+        Raises:
+            TypeError: If the language is not a MoneroLanguages enum
+        """
+        return MoneroMnemonicDecoder(lang)   # type: ignore [arg-type]
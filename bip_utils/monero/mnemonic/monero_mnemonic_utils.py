@@ -61,19 +61,19 @@ class MoneroWordsListGetter(MnemonicWordsListGetterBase):
             raise TypeError("Language is not an enumerative of MoneroLanguages")
 
         return self._LoadWordsList(lang,
-                                   self.__GetLanguageFile(lang),
+                                   self.GetLanguageFile(lang),
                                    MoneroMnemonicConst.WORDS_LIST_NUM)
 
-    @staticmethod
-    def __GetLanguageFile(lang: MnemonicLanguages) -> str:
+    def GetLanguageFile(self,
+                        lang: MnemonicLanguages) -> str:
         """
-        Get the specified language file name.
+        Get the words list file of the specified language.
 
         Args:
             lang (MnemonicLanguages): Language
 
         Returns:
-            str: Language file name
+            str: File path
         """
         return os.path.join(os.path.dirname(__file__),
                             MoneroMnemonicConst.LANGUAGE_FILES[lang])
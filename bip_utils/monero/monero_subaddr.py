@@ -21,10 +21,10 @@
 """Module for Monero subaddress computation."""
 
 # Imports
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from bip_utils.addr import XmrAddrEncoder
-from bip_utils.ecc import Ed25519Monero, Ed25519Utils
+from bip_utils.ecc import Ed25519Monero, Ed25519Utils, IPoint
 from bip_utils.monero.monero_keys import MoneroPrivateKey, MoneroPublicKey
 from bip_utils.utils.crypto import Kekkak256
 from bip_utils.utils.misc import IntegerUtils
@@ -80,29 +80,13 @@ class MoneroSubaddress:
         Raises:
             ValueError: If one of the indexes is not valid
         """
-        if minor_idx < 0 or minor_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
-            raise ValueError(f"Invalid minor index ({minor_idx})")
-        if major_idx < 0 or major_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
-            raise ValueError(f"Invalid major index ({major_idx})")
+        self.__ValidateIndexes(minor_idx, major_idx)
 
         # Subaddress 0,0 is the primary address
         if minor_idx == 0 and major_idx == 0:
             return self.m_pub_skey, self.m_pub_vkey
 
-        # Convert indexes to bytes
-        major_idx_bytes = IntegerUtils.ToBytes(major_idx,
-                                               bytes_num=MoneroSubaddressConst.SUBADDR_IDX_BYTE_LEN,
-                                               endianness="little")
-        minor_idx_bytes = IntegerUtils.ToBytes(minor_idx,
-                                               bytes_num=MoneroSubaddressConst.SUBADDR_IDX_BYTE_LEN,
-                                               endianness="little")
-
-        # m = Kekkak256("SubAddr" + master_priv_vkey + major_idx + minor_idx)
-        m = Kekkak256.QuickDigest(MoneroSubaddressConst.SUBADDR_PREFIX
-                                  + self.m_priv_vkey.Raw().ToBytes()
-                                  + major_idx_bytes
-                                  + minor_idx_bytes)
-        m_int = Ed25519Utils.IntDecode(Ed25519Utils.ScalarReduce(m))
+        m_int = self.__ComputeScalar(self.__ScalarPrefix(major_idx), minor_idx)
 
         # Compute subaddress public spend key
         # D = master_pub_skey + m * B
@@ -115,6 +99,101 @@ class MoneroSubaddress:
         return (MoneroPublicKey.FromPoint(subaddr_pub_skey_point),
                 MoneroPublicKey.FromPoint(subaddr_pub_vkey_point))
 
+    def ComputeKeysBatch(self,
+                         minor_idxs: Iterable[int],
+                         major_idx: int) -> List[Tuple[MoneroPublicKey, MoneroPublicKey]]:
+        """
+        Compute the public keys of multiple subaddresses of the same account.
+        The values depending only on the account are computed once and the variable-base multiplication
+        by the private view key is replaced by a base multiplication, so it's faster than calling ComputeKeys
+        for each index.
+
+        Args:
+            minor_idxs (Iterable[int]): Minor indexes (i.e. subaddress indexes)
+            major_idx (int)           : Major index (i.e. account index)
+
+        Returns:
+            list[tuple[MoneroPublicKey, MoneroPublicKey]]: Computed public spend and view keys,
+                                                           in the same order of the indexes
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        minor_idxs = list(minor_idxs)
+        for minor_idx in minor_idxs:
+            self.__ValidateIndexes(minor_idx, major_idx)
+
+        generator = Ed25519Monero.Generator()
+        order = Ed25519Monero.Order()
+        prefix_bytes = self.__ScalarPrefix(major_idx)
+        priv_vkey_int = self.m_priv_vkey.Raw().ToInt("little")
+        pub_skey_point = self.m_pub_skey.KeyObject().Point()
+        # master_priv_vkey * master_pub_skey, computed only if needed
+        pub_skey_vkey_point: Optional[IPoint] = None
+
+        keys = []
+        for minor_idx in minor_idxs:
+            # Subaddress 0,0 is the primary address
+            if minor_idx == 0 and major_idx == 0:
+                keys.append((self.m_pub_skey, self.m_pub_vkey))
+                continue
+
+            if pub_skey_vkey_point is None:
+                pub_skey_vkey_point = pub_skey_point * priv_vkey_int
+
+            m_int = self.__ComputeScalar(prefix_bytes, minor_idx)
+
+            # Compute subaddress public spend key
+            # D = master_pub_skey + m * B
+            subaddr_pub_skey_point = pub_skey_point + (generator * m_int)
+
+            # Compute subaddress public view key
+            # C = master_priv_vkey * D = (master_priv_vkey * master_pub_skey) + (master_priv_vkey * m) * B
+            subaddr_pub_vkey_point = pub_skey_vkey_point + (generator * ((priv_vkey_int * m_int) % order))
+
+            keys.append((MoneroPublicKey.FromPoint(subaddr_pub_skey_point),
+                         MoneroPublicKey.FromPoint(subaddr_pub_vkey_point)))
+
+        return keys
+
+    def ComputePublicSpendKeysBatch(self,
+                                    minor_idxs: Iterable[int],
+                                    major_idx: int) -> List[MoneroPublicKey]:
+        """
+        Compute only the public spend keys of multiple subaddresses of the same account.
+        It's useful for building lookup tables, since the public spend key is enough to identify a subaddress.
+
+        Args:
+            minor_idxs (Iterable[int]): Minor indexes (i.e. subaddress indexes)
+            major_idx (int)           : Major index (i.e. account index)
+
+        Returns:
+            list[MoneroPublicKey]: Computed public spend keys, in the same order of the indexes
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        minor_idxs = list(minor_idxs)
+        for minor_idx in minor_idxs:
+            self.__ValidateIndexes(minor_idx, major_idx)
+
+        generator = Ed25519Monero.Generator()
+        prefix_bytes = self.__ScalarPrefix(major_idx)
+        pub_skey_point = self.m_pub_skey.KeyObject().Point()
+
+        pub_skeys = []
+        for minor_idx in minor_idxs:
+            # Subaddress 0,0 is the primary address
+            if minor_idx == 0 and major_idx == 0:
+                pub_skeys.append(self.m_pub_skey)
+                continue
+
+            # D = master_pub_skey + m * B
+            m_int = self.__ComputeScalar(prefix_bytes, minor_idx)
+            pub_skeys.append(MoneroPublicKey.FromPoint(pub_skey_point + (generator * m_int)))
+
+        return pub_skeys
+
     def ComputeAndEncodeKeys(self,
                              minor_idx: int,
                              major_idx: int,
@@ -139,3 +218,84 @@ class MoneroSubaddress:
         return XmrAddrEncoder.EncodeKey(pub_skey.KeyObject(),
                                         pub_vkey=pub_vkey.KeyObject(),
                                         net_ver=net_ver)
+
+    def ComputeAndEncodeKeysBatch(self,
+                                  minor_idxs: Iterable[int],
+                                  major_idx: int,
+                                  net_ver: bytes) -> List[str]:
+        """
+        Compute the public keys of multiple subaddresses of the same account and encode them.
+
+        Args:
+            minor_idxs (Iterable[int]): Minor indexes (i.e. subaddress indexes)
+            major_idx (int)           : Major index (i.e. account index)
+            net_ver (bytes)           : Net version
+
+        Returns:
+            list[str]: Encoded subaddress strings, in the same order of the indexes
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        return [
+            XmrAddrEncoder.EncodeKey(pub_skey.KeyObject(),
+                                     pub_vkey=pub_vkey.KeyObject(),
+                                     net_ver=net_ver)
+            for pub_skey, pub_vkey in self.ComputeKeysBatch(minor_idxs, major_idx)
+        ]
+
+    def __ScalarPrefix(self,
+                       major_idx: int) -> bytes:
+        """
+        Get the prefix of the data to be hashed for computing the subaddress scalar, which is the same
+        for all the subaddresses of an account.
+
+        Args:
+            major_idx (int): Major index (i.e. account index)
+
+        Returns:
+            bytes: Prefix bytes
+        """
+        return (MoneroSubaddressConst.SUBADDR_PREFIX
+                + self.m_priv_vkey.Raw().ToBytes()
+                + IntegerUtils.ToBytes(major_idx,
+                                       bytes_num=MoneroSubaddressConst.SUBADDR_IDX_BYTE_LEN,
+                                       endianness="little"))
+
+    @staticmethod
+    def __ComputeScalar(prefix_bytes: bytes,
+                        minor_idx: int) -> int:
+        """
+        Compute the subaddress scalar.
+
+        Args:
+            prefix_bytes (bytes): Prefix bytes
+            minor_idx (int)     : Minor index (i.e. subaddress index)
+
+        Returns:
+            int: Subaddress scalar
+        """
+        # m = Kekkak256("SubAddr" + master_priv_vkey + major_idx + minor_idx)
+        m = Kekkak256.QuickDigest(prefix_bytes
+                                  + IntegerUtils.ToBytes(minor_idx,
+                                                         bytes_num=MoneroSubaddressConst.SUBADDR_IDX_BYTE_LEN,
+                                                         endianness="little"))
+        return Ed25519Utils.IntDecode(Ed25519Utils.ScalarReduce(m))
+
+    @staticmethod
+    def __ValidateIndexes(minor_idx: int,
+                          major_idx: int) -> None:
+        """
+        Validate the subaddress indexes.
+
+        Args:
+            minor_idx (int): Minor index (i.e. subaddress index)
+            major_idx (int): Major index (i.e. account index)
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        if minor_idx < 0 or minor_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError(f"Invalid minor index ({minor_idx})")
+        if major_idx < 0 or major_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError(f"Invalid major index ({major_idx})")
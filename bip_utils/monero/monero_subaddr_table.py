@@ -0,0 +1,527 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for Monero subaddress lookup tables, to get back the indexes of a subaddress public spend key."""
+
+# Imports
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from bip_utils.monero.monero_keys import MoneroPrivateKey, MoneroPublicKey
+from bip_utils.monero.monero_subaddr import MoneroSubaddress, MoneroSubaddressConst
+from bip_utils.utils.crypto import Kekkak256
+from bip_utils.utils.misc import ProcessPoolUtils
+
+
+class MoneroSubaddressTableConst:
+    """Class container for Monero subaddress table constants."""
+
+    # File magic
+    FILE_MAGIC: bytes = b"BUST"
+    # File version
+    FILE_VERSION: int = 2
+    # File header: magic, version, reserved bytes, master public spend key, public view key fingerprint
+    FILE_HEADER: struct.Struct = struct.Struct(">4sB3x32s32s")
+    # Table header: number of slots, number of records
+    TABLE_HEADER: struct.Struct = struct.Struct(">QQ")
+    # Offset of the first slot
+    SLOTS_OFFSET: int = FILE_HEADER.size + TABLE_HEADER.size
+    # Record: public spend key, major index, minor index
+    RECORD: struct.Struct = struct.Struct(">32sII")
+    # Public spend key length in bytes
+    KEY_BYTE_LEN: int = 32
+    # Empty slot key
+    EMPTY_KEY: bytes = b"\x00" * 32
+    # Maximum load factor of the table (i.e. the number of slots is at least twice the number of records)
+    SLOTS_PER_RECORD: int = 2
+    # Default number of subaddresses computed by each task
+    DEFAULT_CHUNK_SIZE: int = 1000
+
+
+class _MoneroSubaddressTableUtils:
+    """Class container for Monero subaddress table utility functions."""
+
+    @staticmethod
+    def SlotsNum(rec_num: int) -> int:
+        """
+        Get the number of slots for the specified number of records, which is a power of two.
+
+        Args:
+            rec_num (int): Number of records
+
+        Returns:
+            int: Number of slots
+        """
+        return 1 << max(rec_num * MoneroSubaddressTableConst.SLOTS_PER_RECORD - 1, 1).bit_length()
+
+    @staticmethod
+    def SlotIndex(key_bytes: bytes,
+                  slots_num: int) -> int:
+        """
+        Get the first slot index of a key.
+        Public keys are already uniformly distributed, so their first bytes are used directly as hash.
+
+        Args:
+            key_bytes (bytes): Key bytes
+            slots_num (int)  : Number of slots
+
+        Returns:
+            int: Slot index
+        """
+        return int.from_bytes(key_bytes[:8], "little") & (slots_num - 1)
+
+    @staticmethod
+    def ViewKeyFingerPrint(priv_vkey: MoneroPrivateKey) -> bytes:
+        """
+        Get the fingerprint of a view key, i.e. the hash of the public view key.
+
+        Args:
+            priv_vkey (MoneroPrivateKey object): Private view key
+
+        Returns:
+            bytes: View key fingerprint
+        """
+        return Kekkak256.QuickDigest(priv_vkey.PublicKey().RawCompressed().ToBytes())
+
+    @staticmethod
+    def Insert(buff: mmap.mmap,
+               slots_num: int,
+               rec: Tuple[bytes, int, int],
+               overwrite: bool) -> bool:
+        """
+        Insert a record in the table using linear probing.
+
+        Args:
+            buff (mmap object)          : Memory-mapped file
+            slots_num (int)             : Number of slots
+            rec (tuple[bytes, int, int]): Public spend key bytes, major index and minor index
+            overwrite (bool)            : True for overwriting an existing record with the same key,
+                                          false for keeping it
+
+        Returns:
+            bool: True if a new record was added, false if the key was already present
+        """
+        rec_len = MoneroSubaddressTableConst.RECORD.size
+        key_bytes = rec[0]
+        slot_idx = _MoneroSubaddressTableUtils.SlotIndex(key_bytes, slots_num)
+        while True:
+            rec_offset = MoneroSubaddressTableConst.SLOTS_OFFSET + slot_idx * rec_len
+            rec_key_bytes = buff[rec_offset:rec_offset + MoneroSubaddressTableConst.KEY_BYTE_LEN]
+            if rec_key_bytes in (MoneroSubaddressTableConst.EMPTY_KEY, key_bytes):
+                is_new = rec_key_bytes != key_bytes
+                if is_new or overwrite:
+                    MoneroSubaddressTableConst.RECORD.pack_into(buff, rec_offset, *rec)
+                return is_new
+            slot_idx = (slot_idx + 1) & (slots_num - 1)
+
+    @staticmethod
+    def Find(buff: mmap.mmap,
+             slots_num: int,
+             key_bytes: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Find a record in the table using linear probing.
+
+        Args:
+            buff (mmap object): Memory-mapped file
+            slots_num (int)   : Number of slots
+            key_bytes (bytes) : Public spend key bytes
+
+        Returns:
+            tuple[int, int]: Major index (index 0) and minor index (index 1), None if not found
+        """
+        rec_len = MoneroSubaddressTableConst.RECORD.size
+        slot_idx = _MoneroSubaddressTableUtils.SlotIndex(key_bytes, slots_num)
+        while True:
+            rec_offset = MoneroSubaddressTableConst.SLOTS_OFFSET + slot_idx * rec_len
+            rec_key_bytes = buff[rec_offset:rec_offset + MoneroSubaddressTableConst.KEY_BYTE_LEN]
+            if rec_key_bytes == key_bytes:
+                _, major_idx, minor_idx = MoneroSubaddressTableConst.RECORD.unpack_from(buff, rec_offset)
+                return major_idx, minor_idx
+            if rec_key_bytes == MoneroSubaddressTableConst.EMPTY_KEY:
+                return None
+            slot_idx = (slot_idx + 1) & (slots_num - 1)
+
+    @staticmethod
+    def ReadHeader(header_bytes: bytes) -> Tuple[bytes, bytes]:
+        """
+        Read the file header.
+
+        Args:
+            header_bytes (bytes): Header bytes
+
+        Returns:
+            tuple[bytes, bytes]: Master public spend key bytes (index 0) and view key fingerprint (index 1)
+
+        Raises:
+            ValueError: If the header is not valid
+        """
+        if len(header_bytes) < MoneroSubaddressTableConst.FILE_HEADER.size:
+            raise ValueError("Invalid subaddress table file (header too short)")
+
+        magic, version, pub_skey_bytes, vkey_fprint = MoneroSubaddressTableConst.FILE_HEADER.unpack_from(
+            header_bytes
+        )
+        if magic != MoneroSubaddressTableConst.FILE_MAGIC:
+            raise ValueError("Invalid subaddress table file (wrong magic)")
+        if version != MoneroSubaddressTableConst.FILE_VERSION:
+            raise ValueError(f"Invalid subaddress table file (unsupported version: {version})")
+        return pub_skey_bytes, vkey_fprint
+
+    @staticmethod
+    def ReadTable(buff: mmap.mmap) -> Tuple[int, int]:
+        """
+        Read the table header, without reading the records.
+
+        Args:
+            buff (mmap object): Memory-mapped file
+
+        Returns:
+            tuple[int, int]: Number of slots (index 0) and number of records (index 1)
+
+        Raises:
+            ValueError: If the table is not valid
+        """
+        if len(buff) < MoneroSubaddressTableConst.SLOTS_OFFSET:
+            raise ValueError("Invalid subaddress table file (truncated table header)")
+
+        slots_num, rec_num = MoneroSubaddressTableConst.TABLE_HEADER.unpack_from(
+            buff, MoneroSubaddressTableConst.FILE_HEADER.size
+        )
+        if slots_num == 0 or slots_num & (slots_num - 1) != 0 or rec_num > slots_num:
+            raise ValueError("Invalid subaddress table file (wrong table header)")
+        if len(buff) != MoneroSubaddressTableConst.SLOTS_OFFSET + slots_num * MoneroSubaddressTableConst.RECORD.size:
+            raise ValueError("Invalid subaddress table file (truncated table)")
+        return slots_num, rec_num
+
+    @staticmethod
+    def IterRecords(buff: mmap.mmap,
+                    slots_num: int) -> Iterator[Tuple[bytes, int, int]]:
+        """
+        Iterate over the records of the table.
+
+        Args:
+            buff (mmap object): Memory-mapped file
+            slots_num (int)   : Number of slots
+
+        Returns:
+            Iterator[tuple[bytes, int, int]]: Iterator over public spend key, major index and minor index
+        """
+        slots_offset = MoneroSubaddressTableConst.SLOTS_OFFSET
+        for rec in MoneroSubaddressTableConst.RECORD.iter_unpack(
+            buff[slots_offset:slots_offset + slots_num * MoneroSubaddressTableConst.RECORD.size]
+        ):
+            if rec[0] != MoneroSubaddressTableConst.EMPTY_KEY:
+                yield rec
+
+    @staticmethod
+    def CreateTable(fout: BinaryIO,
+                    header_bytes: bytes,
+                    rec_num: int) -> int:
+        """
+        Write the file header and an empty table to the file.
+
+        Args:
+            fout (file object)  : File object opened for writing
+            header_bytes (bytes): File header bytes
+            rec_num (int)       : Maximum number of records
+
+        Returns:
+            int: Number of slots
+        """
+        slots_num = _MoneroSubaddressTableUtils.SlotsNum(rec_num)
+        fout.seek(0)
+        fout.write(header_bytes)
+        # The number of records is written when the table is complete
+        fout.write(MoneroSubaddressTableConst.TABLE_HEADER.pack(slots_num, 0))
+        fout.truncate(MoneroSubaddressTableConst.SLOTS_OFFSET + slots_num * MoneroSubaddressTableConst.RECORD.size)
+        fout.flush()
+        return slots_num
+
+
+class MoneroSubaddressTable:
+    """
+    Monero subaddress table class.
+    It allows to get back the major and minor indexes of a subaddress from its public spend key, using a table file
+    written by MoneroSubaddressTableWriter (e.g. for checking the outputs of transactions).
+    The file is memory-mapped and contains a single hash table, so lookups don't depend on the number of records.
+    """
+
+    m_file: BinaryIO
+    m_buff: mmap.mmap
+    m_pub_skey_bytes: bytes
+    m_slots_num: int
+    m_rec_num: int
+
+    def __init__(self,
+                 file_path: str) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str): Table file path
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        self.m_file = open(file_path, "rb")     # pylint: disable=consider-using-with
+        try:
+            self.m_buff = mmap.mmap(self.m_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.m_pub_skey_bytes, _ = _MoneroSubaddressTableUtils.ReadHeader(
+                self.m_buff[:MoneroSubaddressTableConst.FILE_HEADER.size]
+            )
+            self.m_slots_num, self.m_rec_num = _MoneroSubaddressTableUtils.ReadTable(self.m_buff)
+        except ValueError:
+            self.Close()
+            raise
+
+    def Close(self) -> None:
+        """Close the table file."""
+        if hasattr(self, "m_buff"):
+            self.m_buff.close()
+        self.m_file.close()
+
+    def PublicSpendKey(self) -> MoneroPublicKey:
+        """
+        Get the master public spend key of the table.
+
+        Returns:
+            MoneroPublicKey object: MoneroPublicKey object
+        """
+        return MoneroPublicKey.FromBytes(self.m_pub_skey_bytes)
+
+    def RecordsNum(self) -> int:
+        """
+        Get the number of records.
+
+        Returns:
+            int: Number of records
+        """
+        return self.m_rec_num
+
+    def Lookup(self,
+               pub_skey: Union[bytes, MoneroPublicKey]) -> Optional[Tuple[int, int]]:
+        """
+        Get the indexes of the specified subaddress public spend key.
+
+        Args:
+            pub_skey (bytes or MoneroPublicKey object): Public spend key bytes or object
+
+        Returns:
+            tuple[int, int]: Major index (index 0) and minor index (index 1), None if not in the table
+        """
+        key_bytes = pub_skey.RawCompressed().ToBytes() if isinstance(pub_skey, MoneroPublicKey) else pub_skey
+        if (len(key_bytes) != MoneroSubaddressTableConst.KEY_BYTE_LEN
+                or key_bytes == MoneroSubaddressTableConst.EMPTY_KEY):
+            return None
+        return _MoneroSubaddressTableUtils.Find(self.m_buff, self.m_slots_num, key_bytes)
+
+
+class MoneroSubaddressTableWriter:
+    """
+    Monero subaddress table writer class.
+    It computes subaddress public spend keys and writes them to a table file, that can be read by MoneroSubaddressTable.
+    The file contains a single hash table, that can be extended incrementally (e.g. with new accounts or a bigger
+    lookahead): subaddresses are inserted in place if the table has enough free slots, otherwise the table is
+    rehashed into a bigger one (at least twice as big), so extending it takes amortized constant time for each
+    subaddress.
+    Public spend keys are computed by a pool of processes and written directly to the memory-mapped table,
+    so the memory usage doesn't depend on the number of subaddresses.
+    """
+
+    m_file_path: str
+    m_priv_vkey: MoneroPrivateKey
+    m_pub_skey: MoneroPublicKey
+    m_chunk_size: int
+    m_worker_num: Optional[int]
+
+    def __init__(self,
+                 file_path: str,
+                 priv_vkey: MoneroPrivateKey,
+                 pub_skey: MoneroPublicKey,
+                 chunk_size: int = MoneroSubaddressTableConst.DEFAULT_CHUNK_SIZE,
+                 worker_num: Optional[int] = None) -> None:
+        """
+        Construct class.
+        If the file already exists, new subaddresses will be added to it.
+
+        Args:
+            file_path (str)                    : Table file path
+            priv_vkey (MoneroPrivateKey object): Private view key
+            pub_skey (MoneroPublicKey object) : Public spend key
+            chunk_size (int, optional)         : Number of subaddresses computed by each task (default: 1000)
+            worker_num (int, optional)         : Number of worker processes (default: number of processors)
+
+        Raises:
+            ValueError: If the chunk size or the number of workers is not valid,
+                        or the public spend key or the view key is not matching the existing file
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        ProcessPoolUtils.CheckWorkersNum(worker_num)
+
+        self.m_file_path = file_path
+        self.m_priv_vkey = priv_vkey
+        self.m_pub_skey = pub_skey
+        self.m_chunk_size = chunk_size
+        self.m_worker_num = worker_num
+
+        pub_skey_bytes = pub_skey.RawCompressed().ToBytes()
+        vkey_fprint = _MoneroSubaddressTableUtils.ViewKeyFingerPrint(priv_vkey)
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            with open(file_path, "rb") as fin:
+                file_pub_skey_bytes, file_vkey_fprint = _MoneroSubaddressTableUtils.ReadHeader(
+                    fin.read(MoneroSubaddressTableConst.FILE_HEADER.size)
+                )
+            if file_pub_skey_bytes != pub_skey_bytes:
+                raise ValueError("Public spend key not matching the existing file")
+            if file_vkey_fprint != vkey_fprint:
+                raise ValueError("View key not matching the existing file")
+        else:
+            with open(file_path, "wb") as fout:
+                _MoneroSubaddressTableUtils.CreateTable(
+                    fout,
+                    MoneroSubaddressTableConst.FILE_HEADER.pack(MoneroSubaddressTableConst.FILE_MAGIC,
+                                                                MoneroSubaddressTableConst.FILE_VERSION,
+                                                                pub_skey_bytes,
+                                                                vkey_fprint),
+                    0
+                )
+
+    def AddSubaddresses(self,
+                        major_idx: int,
+                        minor_start: int,
+                        minor_stop: int) -> None:
+        """
+        Add the subaddresses of the specified account with minor indexes from start to stop (excluded).
+        Subaddresses already present in the table are overwritten.
+
+        Args:
+            major_idx (int)  : Major index (i.e. account index)
+            minor_start (int): Start minor index
+            minor_stop (int) : Stop minor index (excluded)
+
+        Raises:
+            ValueError: If one of the indexes is not valid or the file is not valid
+        """
+        if major_idx < 0 or major_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError(f"Invalid major index ({major_idx})")
+        if minor_start < 0 or minor_stop < minor_start or minor_stop > MoneroSubaddressConst.SUBADDR_MAX_IDX + 1:
+            raise ValueError(f"Invalid minor index range ({minor_start}, {minor_stop})")
+        if minor_stop == minor_start:
+            return
+
+        with open(self.m_file_path, "rb") as fin, \
+                mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buff_in:
+            slots_num, rec_num = _MoneroSubaddressTableUtils.ReadTable(buff_in)
+        # Rehash the table if the new subaddresses may not fit
+        if _MoneroSubaddressTableUtils.SlotsNum(rec_num + minor_stop - minor_start) > slots_num:
+            self.__Rehash(rec_num + minor_stop - minor_start)
+
+        with open(self.m_file_path, "r+b") as fout, \
+                mmap.mmap(fout.fileno(), 0) as buff:
+            slots_num, rec_num = _MoneroSubaddressTableUtils.ReadTable(buff)
+            for minor_idx, key_bytes in self.__ComputeKeys(major_idx, minor_start, minor_stop):
+                rec_num += _MoneroSubaddressTableUtils.Insert(buff, slots_num, (key_bytes, major_idx, minor_idx), True)
+            MoneroSubaddressTableConst.TABLE_HEADER.pack_into(buff,
+                                                              MoneroSubaddressTableConst.FILE_HEADER.size,
+                                                              slots_num,
+                                                              rec_num)
+            buff.flush()
+
+    def __Rehash(self,
+                 rec_num: int) -> None:
+        """
+        Rehash the table into a bigger one.
+
+        Args:
+            rec_num (int): Maximum number of records of the new table
+        """
+        tmp_file_path = self.m_file_path + ".tmp"
+        with open(self.m_file_path, "rb") as fin, \
+                mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buff_in:
+            slots_num_in, _ = _MoneroSubaddressTableUtils.ReadTable(buff_in)
+
+            with open(tmp_file_path, "wb+") as fout:
+                slots_num = _MoneroSubaddressTableUtils.CreateTable(
+                    fout,
+                    buff_in[:MoneroSubaddressTableConst.FILE_HEADER.size],
+                    rec_num
+                )
+                with mmap.mmap(fout.fileno(), 0) as buff_out:
+                    rec_num_out = 0
+                    for rec in _MoneroSubaddressTableUtils.IterRecords(buff_in, slots_num_in):
+                        rec_num_out += _MoneroSubaddressTableUtils.Insert(buff_out, slots_num, rec, False)
+                    MoneroSubaddressTableConst.TABLE_HEADER.pack_into(buff_out,
+                                                                      MoneroSubaddressTableConst.FILE_HEADER.size,
+                                                                      slots_num,
+                                                                      rec_num_out)
+                    buff_out.flush()
+        os.replace(tmp_file_path, self.m_file_path)
+
+    def __ComputeKeys(self,
+                      major_idx: int,
+                      minor_start: int,
+                      minor_stop: int) -> Iterator[Tuple[int, bytes]]:
+        """
+        Compute the public spend keys of the subaddresses with minor indexes from start to stop (excluded).
+
+        Args:
+            major_idx (int)  : Major index (i.e. account index)
+            minor_start (int): Start minor index
+            minor_stop (int) : Stop minor index (excluded)
+
+        Returns:
+            Iterator[tuple[int, bytes]]: Iterator over minor index and public spend key bytes
+        """
+        priv_vkey_bytes = self.m_priv_vkey.Raw().ToBytes()
+        pub_skey_bytes = self.m_pub_skey.RawCompressed().ToBytes()
+        chunks_args = ((priv_vkey_bytes, pub_skey_bytes, major_idx,
+                        chunk_start, min(chunk_start + self.m_chunk_size, minor_stop))
+                       for chunk_start in range(minor_start, minor_stop, self.m_chunk_size))
+
+        yield from ProcessPoolUtils.MapChunks(self._ComputeChunk, chunks_args, self.m_worker_num)
+
+    @staticmethod
+    def _ComputeChunk(priv_vkey_bytes: bytes,
+                      pub_skey_bytes: bytes,
+                      major_idx: int,
+                      minor_start: int,
+                      minor_stop: int) -> List[Tuple[int, bytes]]:
+        """
+        Compute the public spend keys of the subaddresses with minor indexes from start to stop (excluded).
+        It's executed by the worker processes, so it only depends on its arguments.
+
+        Args:
+            priv_vkey_bytes (bytes): Private view key bytes
+            pub_skey_bytes (bytes) : Public spend key bytes
+            major_idx (int)        : Major index (i.e. account index)
+            minor_start (int)      : Start minor index
+            minor_stop (int)       : Stop minor index (excluded)
+
+        Returns:
+            list[tuple[int, bytes]]: Minor index and public spend key bytes for each index
+        """
+        subaddr = MoneroSubaddress(MoneroPrivateKey.FromBytes(priv_vkey_bytes),
+                                   MoneroPublicKey.FromBytes(pub_skey_bytes))
+        pub_skeys = subaddr.ComputePublicSpendKeysBatch(range(minor_start, minor_stop), major_idx)
+        return [(minor_idx, pub_skey.RawCompressed().ToBytes())
+                for minor_idx, pub_skey in enumerate(pub_skeys, minor_start)]
@@ -21,9 +21,11 @@
 """Module for SHA-2 algorithms."""
 
 # Imports
+from __future__ import annotations
+
 import hashlib
 import hmac
-from typing import Tuple, Union
+from typing import Any, Tuple, Union
 
 from bip_utils.utils.misc import AlgoUtils
 
@@ -70,8 +72,61 @@ class HmacSha512:
     """
     HMAC-SHA512 class.
     It computes digests using HMAC-SHA512 algorithm.
+    A keyed object can be copied to compute several digests with the same key, without processing the key again.
     """
 
+    handle: Any
+
+    def __init__(self,
+                 key: Union[bytes, str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            key (str or bytes): Key
+        """
+        self.handle = hmac.new(AlgoUtils.Encode(key), digestmod=hashlib.sha512)
+
+    def Copy(self) -> HmacSha512:
+        """
+        Get a copy of the object, including its current state.
+
+        Returns:
+            HmacSha512 object: HmacSha512 object
+        """
+        hmac_obj = HmacSha512.__new__(HmacSha512)
+        hmac_obj.handle = self.handle.copy()
+        return hmac_obj
+
+    def Update(self,
+               data: Union[bytes, str]) -> None:
+        """
+        Update digest.
+
+        Args:
+            data (str or bytes): Data
+        """
+        self.handle.update(AlgoUtils.Encode(data))
+
+    def Digest(self) -> bytes:
+        """
+        Get the computed digest.
+
+        Returns:
+            bytes: Computed digest
+        """
+        return self.handle.digest()
+
+    def DigestHalves(self) -> Tuple[bytes, bytes]:
+        """
+        Get the computed digest split into two halves.
+
+        Returns:
+            tuple[bytes, bytes]: Computed digest left part (index 0) and right part (index 1)
+        """
+        digest_bytes = self.Digest()
+        return digest_bytes[:HmacSha512.DigestSize() // 2], digest_bytes[HmacSha512.DigestSize() // 2:]
+
     @staticmethod
     def QuickDigest(key: Union[bytes, str],
                     data: Union[bytes, str]) -> bytes:
@@ -5,4 +5,6 @@ from bip_utils.utils.misc.bytes import BytesUtils
 from bip_utils.utils.misc.cbor_indefinite_len_array import CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
 from bip_utils.utils.misc.data_bytes import DataBytes
 from bip_utils.utils.misc.integer import IntegerUtils
+from bip_utils.utils.misc.lru_cache import LruCache, LruCacheStats
+from bip_utils.utils.misc.process_pool import ProcessPoolUtils, ProcessPoolUtilsConst
 from bip_utils.utils.misc.string import StringUtils
@@ -0,0 +1,311 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for a generic bounded LRU cache."""
+
+# Imports
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+
+class LruCacheStats:
+    """LRU cache statistics class."""
+
+    m_hits: int
+    m_misses: int
+    m_size: int
+    m_max_size: int
+
+    def __init__(self,
+                 hits: int,
+                 misses: int,
+                 size: int,
+                 max_size: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            hits (int)    : Number of hits
+            misses (int)  : Number of misses
+            size (int)    : Current number of objects
+            max_size (int): Maximum number of objects
+        """
+        self.m_hits = hits
+        self.m_misses = misses
+        self.m_size = size
+        self.m_max_size = max_size
+
+    def Hits(self) -> int:
+        """
+        Get the number of hits.
+
+        Returns:
+            int: Number of hits
+        """
+        return self.m_hits
+
+    def Misses(self) -> int:
+        """
+        Get the number of misses.
+
+        Returns:
+            int: Number of misses
+        """
+        return self.m_misses
+
+    def Size(self) -> int:
+        """
+        Get the current number of objects.
+
+        Returns:
+            int: Current number of objects
+        """
+        return self.m_size
+
+    def MaxSize(self) -> int:
+        """
+        Get the maximum number of objects.
+
+        Returns:
+            int: Maximum number of objects
+        """
+        return self.m_max_size
+
+    def HitRate(self) -> float:
+        """
+        Get the hit rate.
+
+        Returns:
+            float: Hit rate, between 0 and 1 (0 if no lookup was done)
+        """
+        lookups = self.m_hits + self.m_misses
+        return self.m_hits / lookups if lookups > 0 else 0.0
+
+
+class LruCache:
+    """
+    Bounded LRU cache class.
+    It keeps at most a maximum number of objects, evicting the least recently used ones, and counts hits and misses.
+    It's thread-safe and it's meant to be used as base class by the specific caches, which define how objects
+    are looked up and stored by using the protected methods.
+    """
+
+    m_max_size: int
+    m_objs: OrderedDict
+    m_hits: int
+    m_misses: int
+    m_lock: threading.Lock
+
+    def __init__(self,
+                 max_size: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int): Maximum number of objects
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        self.__CheckMaxSize(max_size)
+
+        self.m_max_size = max_size
+        self.m_objs = OrderedDict()
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_lock = threading.Lock()
+
+    def MaxSize(self) -> int:
+        """
+        Get the maximum number of objects.
+
+        Returns:
+            int: Maximum number of objects
+        """
+        return self.m_max_size
+
+    def Size(self) -> int:
+        """
+        Get the current number of objects.
+
+        Returns:
+            int: Current number of objects
+        """
+        return len(self.m_objs)
+
+    def Hits(self) -> int:
+        """
+        Get the number of hits.
+
+        Returns:
+            int: Number of hits
+        """
+        return self.m_hits
+
+    def Misses(self) -> int:
+        """
+        Get the number of misses.
+
+        Returns:
+            int: Number of misses
+        """
+        return self.m_misses
+
+    def HitRate(self) -> float:
+        """
+        Get the hit rate.
+
+        Returns:
+            float: Hit rate, between 0 and 1 (0 if no lookup was done)
+        """
+        return self.Stats().HitRate()
+
+    def Stats(self) -> LruCacheStats:
+        """
+        Get a consistent snapshot of the statistics.
+
+        Returns:
+            LruCacheStats object: LruCacheStats object
+        """
+        with self.m_lock:
+            return LruCacheStats(self.m_hits, self.m_misses, len(self.m_objs), self.m_max_size)
+
+    def Resize(self,
+               max_size: int) -> None:
+        """
+        Set a new maximum number of objects, evicting the least recently used ones if needed.
+
+        Args:
+            max_size (int): Maximum number of objects
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        self.__CheckMaxSize(max_size)
+
+        with self.m_lock:
+            self.m_max_size = max_size
+            self.__EvictExceeding()
+
+    def Evict(self,
+              count: int = 1) -> int:
+        """
+        Evict the least recently used objects.
+
+        Args:
+            count (int, optional): Number of objects to evict (default: 1)
+
+        Returns:
+            int: Number of evicted objects
+        """
+        with self.m_lock:
+            count = min(max(count, 0), len(self.m_objs))
+            for _ in range(count):
+                self.m_objs.popitem(last=False)
+        return count
+
+    def Clear(self) -> None:
+        """Clear the objects and reset the statistics."""
+        with self.m_lock:
+            self.m_objs.clear()
+            self.m_hits = 0
+            self.m_misses = 0
+
+    #
+    # Protected methods
+    #
+
+    def _Get(self,
+             key: Hashable) -> Optional[Any]:
+        """
+        Get the object with the specified key, counting a hit or a miss.
+
+        Args:
+            key (hashable): Key
+
+        Returns:
+            Any: Object (None if not present)
+        """
+        return self._GetFirst((key,))[1]
+
+    def _GetFirst(self,
+                  keys: Sequence[Hashable]) -> Tuple[int, Optional[Any]]:
+        """
+        Get the object of the first present key among the specified ones, counting a single hit or miss.
+
+        Args:
+            keys (Sequence[hashable]): Keys, in lookup order
+
+        Returns:
+            tuple[int, Any]: Index of the found key (index 0) and its object (index 1), -1 and None if not found
+        """
+        with self.m_lock:
+            for i, key in enumerate(keys):
+                obj = self.m_objs.get(key)
+                if obj is not None:
+                    self.m_objs.move_to_end(key)
+                    self.m_hits += 1
+                    return i, obj
+            self.m_misses += 1
+        return -1, None
+
+    def _Put(self,
+             key: Hashable,
+             obj: Any) -> Any:
+        """
+        Put an object, evicting the least recently used ones if full.
+        If an object with the same key is already present (e.g. put by another thread in the meantime), it's kept.
+
+        Args:
+            key (hashable): Key
+            obj (Any)     : Object
+
+        Returns:
+            Any: Cached object
+        """
+        with self.m_lock:
+            cached_obj = self.m_objs.setdefault(key, obj)
+            self.m_objs.move_to_end(key)
+            self.__EvictExceeding()
+            return cached_obj
+
+    #
+    # Private methods
+    #
+
+    def __EvictExceeding(self) -> None:
+        """Evict the least recently used objects exceeding the maximum size (the lock shall be already acquired)."""
+        while len(self.m_objs) > self.m_max_size:
+            self.m_objs.popitem(last=False)
+
+    @staticmethod
+    def __CheckMaxSize(max_size: int) -> None:
+        """
+        Check the maximum size.
+
+        Args:
+            max_size (int): Maximum number of objects
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if max_size <= 0:
+            raise ValueError(f"Invalid maximum size ({max_size})")
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for executing tasks on chunks of data with a pool of processes."""
+
+# Imports
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ProcessPoolUtilsConst:
+    """Class container for process pool utility constants."""
+
+    # Maximum number of pending tasks for each worker
+    MAX_PENDING_TASKS_PER_WORKER: int = 2
+
+
+class ProcessPoolUtils:
+    """
+    Class container for process pool utility functions.
+    Chunks are processed in order by a pool of processes, keeping a bounded number of pending tasks, so that
+    memory doesn't grow if results are consumed slowly.
+    """
+
+    @staticmethod
+    def CheckWorkersNum(worker_num: Optional[int]) -> None:
+        """
+        Check the number of workers.
+
+        Args:
+            worker_num (int, optional): Number of worker processes (1: no processes, None: number of processors)
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        if worker_num is not None and worker_num <= 0:
+            raise ValueError(f"Invalid number of workers ({worker_num})")
+
+    @staticmethod
+    def MapChunks(fct: Callable[..., Iterable[T]],
+                  chunks_args: Iterable[Sequence[Any]],
+                  worker_num: Optional[int]) -> Iterator[T]:
+        """
+        Call the function for each chunk and yield the results of all chunks, in order.
+        The chunks iterable is consumed lazily. If more than one worker is used, the function and its arguments
+        shall be picklable.
+
+        Args:
+            fct (function)                    : Function called for each chunk, returning its results
+            chunks_args (Iterable[Sequence])  : Function arguments for each chunk
+            worker_num (int, optional)        : Number of worker processes (1: no processes, None: number of processors)
+
+        Returns:
+            Iterator: Iterator over the results of all chunks
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        ProcessPoolUtils.CheckWorkersNum(worker_num)
+
+        # No need to spawn processes for a single worker
+        if worker_num == 1:
+            for chunk_args in chunks_args:
+                yield from fct(*chunk_args)
+            return
+
+        worker_num = worker_num or os.cpu_count() or 1
+        with ProcessPoolExecutor(worker_num) as executor:
+            max_pending = worker_num * ProcessPoolUtilsConst.MAX_PENDING_TASKS_PER_WORKER
+            pending: Deque[Future] = deque()
+            for chunk_args in chunks_args:
+                pending.append(executor.submit(fct, *chunk_args))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
@@ -1,10 +1,17 @@
 from bip_utils.utils.mnemonic.entropy_generator import EntropyGenerator
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_bulk_validator import (
+    MnemonicBulkValidator,
+    MnemonicBulkValidatorConst,
+    MnemonicBulkValidatorResult,
+)
 from bip_utils.utils.mnemonic.mnemonic_decoder_base import MnemonicDecoderBase
 from bip_utils.utils.mnemonic.mnemonic_encoder_base import MnemonicEncoderBase
 from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
 from bip_utils.utils.mnemonic.mnemonic_utils import (
+    MnemonicPackedWordsList,
     MnemonicUtils,
+    MnemonicWordsIndex,
     MnemonicWordsList,
     MnemonicWordsListFileReader,
     MnemonicWordsListFinderBase,
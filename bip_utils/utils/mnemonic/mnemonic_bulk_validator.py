@@ -0,0 +1,235 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for validating large amounts of mnemonics."""
+
+# Imports
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from bip_utils.utils.misc import ProcessPoolUtils
+from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_decoder_base import MnemonicDecoderBase
+from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
+
+
+class MnemonicBulkValidatorConst:
+    """Class container for mnemonic bulk validator constants."""
+
+    # Default number of mnemonics validated by each task
+    DEFAULT_CHUNK_SIZE: int = 1000
+
+
+class MnemonicBulkValidatorResult(NamedTuple):
+    """Mnemonic bulk validator result class."""
+
+    line: str
+    valid: bool
+    language: Optional[MnemonicLanguages]
+    error: Optional[str]
+
+
+class MnemonicBulkValidator(ABC):
+    """
+    Mnemonic bulk validator base class.
+    It validates a stream of mnemonics, reusing the same decoder for all the mnemonics of the same language.
+    Optionally, mnemonics can be split in chunks that are validated by a pool of processes. In any case,
+    results are returned in order.
+    """
+
+    m_lang: Optional[MnemonicLanguages]
+    m_chunk_size: int
+    m_worker_num: Optional[int]
+    m_decoders: Dict[MnemonicLanguages, MnemonicDecoderBase]
+
+    def __init__(self,
+                 lang: Optional[MnemonicLanguages],
+                 chunk_size: int,
+                 worker_num: Optional[int]) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (MnemonicLanguages, optional): Language, None for automatic detection
+            chunk_size (int)                  : Number of mnemonics validated by each task
+            worker_num (int, optional)        : Number of worker processes (1: no processes, None: number of processors)
+
+        Raises:
+            TypeError: If the language is not of the correct enum
+            ValueError: If the chunk size or the number of workers is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        ProcessPoolUtils.CheckWorkersNum(worker_num)
+
+        self.m_lang = lang
+        self.m_chunk_size = chunk_size
+        self.m_worker_num = worker_num
+        self.m_decoders = {}
+        # Create the decoder immediately if the language is specified, so that it's also checked
+        if lang is not None:
+            self.__GetDecoder(lang)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the object state for pickling.
+        Decoders are not pickled, since they are created again by the worker processes.
+
+        Returns:
+            dict: Object state
+        """
+        state = self.__dict__.copy()
+        state["m_decoders"] = {}
+        return state
+
+    def Validate(self,
+                 mnemonics: Iterable[str]) -> Iterator[MnemonicBulkValidatorResult]:
+        """
+        Validate the specified mnemonics.
+        The iterable is consumed lazily, so it can be a generator over a very large input.
+
+        Args:
+            mnemonics (Iterable[str]): Mnemonics
+
+        Returns:
+            Iterator[MnemonicBulkValidatorResult]: Iterator over the validation result of each mnemonic
+        """
+        mnemonics_it = iter(mnemonics)
+        chunks = iter(lambda: list(islice(mnemonics_it, self.m_chunk_size)), [])
+
+        yield from ProcessPoolUtils.MapChunks(self._ValidateChunk, ((chunk,) for chunk in chunks), self.m_worker_num)
+
+    def ValidateFile(self,
+                     file_path: str,
+                     encoding: str = "utf-8") -> Iterator[MnemonicBulkValidatorResult]:
+        """
+        Validate the mnemonics contained in the specified file, one for each line.
+        Lines are stripped and empty lines are skipped.
+
+        Args:
+            file_path (str)         : File path
+            encoding (str, optional): File encoding (default: utf-8)
+
+        Returns:
+            Iterator[MnemonicBulkValidatorResult]: Iterator over the validation result of each mnemonic
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(file_path, encoding=encoding) as fin:
+            yield from self.Validate(line for line in map(str.strip, fin) if line)
+
+    def _ValidateChunk(self,
+                       mnemonics: List[str]) -> List[MnemonicBulkValidatorResult]:
+        """
+        Validate a chunk of mnemonics.
+        It's also executed by the worker processes.
+
+        Args:
+            mnemonics (list[str]): Mnemonics
+
+        Returns:
+            list[MnemonicBulkValidatorResult]: Validation result of each mnemonic
+        """
+        return [self.__ValidateMnemonic(mnemonic) for mnemonic in mnemonics]
+
+    def __ValidateMnemonic(self,
+                           mnemonic: str) -> MnemonicBulkValidatorResult:
+        """
+        Validate a single mnemonic.
+
+        Args:
+            mnemonic (str): Mnemonic
+
+        Returns:
+            MnemonicBulkValidatorResult object: Validation result
+        """
+        lang = self.m_lang
+        try:
+            mnemonic_obj = self._ParseMnemonic(mnemonic)
+            if lang is None:
+                lang = self._DetectLanguage(mnemonic_obj)
+            self.__GetDecoder(lang).Decode(mnemonic_obj)
+        except (ValueError, MnemonicChecksumError) as ex:
+            return MnemonicBulkValidatorResult(mnemonic, False, lang, str(ex))
+        return MnemonicBulkValidatorResult(mnemonic, True, lang, None)
+
+    def __GetDecoder(self,
+                     lang: MnemonicLanguages) -> MnemonicDecoderBase:
+        """
+        Get the decoder for the specified language, creating it the first time.
+
+        Args:
+            lang (MnemonicLanguages): Language
+
+        Returns:
+            MnemonicDecoderBase object: Decoder
+        """
+        decoder = self.m_decoders.get(lang)
+        if decoder is None:
+            decoder = self._CreateDecoder(lang)
+            self.m_decoders[lang] = decoder
+        return decoder
+
+    @abstractmethod
+    def _ParseMnemonic(self,
+                       mnemonic: str) -> Mnemonic:
+        """
+        Parse a mnemonic string.
+
+        Args:
+            mnemonic (str): Mnemonic
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+
+    @abstractmethod
+    def _DetectLanguage(self,
+                        mnemonic: Mnemonic) -> MnemonicLanguages:
+        """
+        Detect the language of a mnemonic.
+
+        Args:
+            mnemonic (Mnemonic object): Mnemonic
+
+        Returns:
+            MnemonicLanguages: Mnemonic language
+
+        Raises:
+            ValueError: If the mnemonic language cannot be found
+        """
+
+    @abstractmethod
+    def _CreateDecoder(self,
+                       lang: MnemonicLanguages) -> MnemonicDecoderBase:
+        """
+        Create a decoder for the specified language.
+
+        Args:
+            lang (MnemonicLanguages): Language
+
+        Returns:
+            MnemonicDecoderBase object: Decoder
+
+        Raises:
+            TypeError: If the language is not of the correct enum
+        """
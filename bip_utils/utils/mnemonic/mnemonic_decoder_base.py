@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Type, Union
+from typing import Iterable, List, Optional, Tuple, Type, Union
 
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
 from bip_utils.utils.mnemonic.mnemonic_utils import (
@@ -81,6 +81,25 @@ class MnemonicDecoderBase(ABC):
             ValueError: If mnemonic is not valid
         """
 
+    def DecodeMany(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]]) -> List[bytes]:
+        """
+        Decode multiple mnemonic phrases to bytes (no checksum).
+        The words list is loaded (or detected) for each mnemonic as in the Decode method, so mnemonics
+        of different languages can be mixed if no language was specified at construction.
+
+        Args:
+            mnemonics (Iterable[str or Mnemonic object]): Mnemonics
+
+        Returns:
+            list[bytes]: Decoded bytes (no checksum), in the same order of the mnemonics
+
+        Raises:
+            MnemonicChecksumError: If the checksum of any mnemonic is not valid
+            ValueError: If any mnemonic is not valid
+        """
+        return [self.Decode(mnemonic) for mnemonic in mnemonics]
+
     def _FindLanguage(self,
                       mnemonic: Mnemonic) -> Tuple[MnemonicWordsList, MnemonicLanguages]:
         """
@@ -23,8 +23,14 @@
 # Imports
 from __future__ import annotations
 
+import mmap
+import os
+import struct
+import sys
+import zlib
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Type
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
@@ -93,6 +99,42 @@ class MnemonicUtils:
         # The chunk shall be at least 4-byte long
         return IntegerUtils.ToBytes(int_chunk, bytes_num=4, endianness=endianness)
 
+    @staticmethod
+    def WordIndexesToInteger(word_idxs: Iterable[int],
+                             word_bit_len: int) -> int:
+        """
+        Pack word indexes into an integer, the first index in the most significant bits.
+
+        Args:
+            word_idxs (iterable[int]): Word indexes
+            word_bit_len (int)       : Bit length of each word index
+
+        Returns:
+            int: Packed integer
+        """
+        int_val = 0
+        for word_idx in word_idxs:
+            int_val = (int_val << word_bit_len) | word_idx
+        return int_val
+
+    @staticmethod
+    def IntegerToWordIndexes(int_val: int,
+                             words_num: int,
+                             word_bit_len: int) -> List[int]:
+        """
+        Unpack word indexes from an integer, the first index in the most significant bits.
+
+        Args:
+            int_val (int)     : Packed integer
+            words_num (int)   : Number of words
+            word_bit_len (int): Bit length of each word index
+
+        Returns:
+            list[int]: Word indexes
+        """
+        word_mask = (1 << word_bit_len) - 1
+        return [(int_val >> (word_bit_len * i)) & word_mask for i in range(words_num - 1, -1, -1)]
+
 
 class MnemonicWordsList:
     """Mnemonic words list class."""
@@ -154,6 +196,361 @@ class MnemonicWordsList:
         return self.m_idx_to_words[word_idx]
 
 
+class MnemonicPackedWordsListConst:
+    """Class container for mnemonic packed words list constants."""
+
+    # File extension, the file is placed beside the correspondent words list text file
+    FILE_EXT: str = ".bin"
+
+    # File magic and version
+    FILE_MAGIC: bytes = b"MWPL"
+    FILE_VER: int = 1
+    # File header: magic, version, number of bits of the slot index, number of bits of the bucket index,
+    # number of words, words blob length
+    FILE_HEADER: str = "<4sBBBxHxxI"
+    # Word offset format (in the words blob)
+    OFFSET: str = "I"
+    # Bucket displacement format
+    DISPLACEMENT: str = "H"
+    # Slot format (word index)
+    SLOT: str = "H"
+    # Value of empty slots
+    SLOT_EMPTY: int = 0xFFFF
+
+    # Difference between the number of bits of the slot index and the bucket index (i.e. 4 words for each bucket)
+    BUCKET_BITS_DIFF: int = 2
+
+
+class MnemonicPackedWordsList(MnemonicWordsList):
+    """
+    Mnemonic packed words list class.
+    It's a words list stored in a compact binary format, made of:
+    - header
+    - offsets table: the offset of each word in the words blob (plus the blob length)
+    - perfect hash index: the displacement of each bucket and the word index of each slot
+    - words blob: all the words encoded in UTF-8
+    A word is looked up by its bucket (computed from the CRC32), whose displacement gives the slot containing the word
+    index without collisions.
+    The file is memory-mapped, so it's shared by processes and loaded only when accessed. Words are decoded and cached
+    only when they are requested, instead of creating all of them at construction.
+    If a words list changes, the file shall be built again with:
+    MnemonicPackedWordsList.FromWords(MnemonicWordsListFileReader.ReadWords(txt_file)).SaveToFile(bin_file)
+    The packed words lists of the package are loaded by MnemonicWordsListFileReader, in place of the text ones.
+    """
+
+    m_packed_data: Union[bytes, mmap.mmap]
+    m_words_num: int
+    m_slot_bits: int
+    m_bucket_bits: int
+    m_offsets: Sequence[int]
+    m_displacements: Sequence[int]
+    m_slots: Sequence[int]
+    m_words_blob: memoryview
+    m_words_cache: List[Optional[str]]
+
+    @classmethod
+    def FromWords(cls,
+                  words_list: List[str]) -> MnemonicPackedWordsList:
+        """
+        Construct class from a words list.
+
+        Args:
+            words_list (list[str]): Words list
+
+        Returns:
+            MnemonicPackedWordsList object: MnemonicPackedWordsList object
+
+        Raises:
+            ValueError: If the words list cannot be packed
+        """
+        return cls(cls.__Pack(words_list))
+
+    @classmethod
+    def FromFile(cls,
+                 file_path: str) -> MnemonicPackedWordsList:
+        """
+        Construct class from file, which is memory-mapped.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            MnemonicPackedWordsList object: MnemonicPackedWordsList object
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as fin:
+            return cls(mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __init__(self,     # pylint: disable=super-init-not-called
+                 packed_data: Union[bytes, mmap.mmap]) -> None:
+        """
+        Construct class.
+
+        Args:
+            packed_data (bytes or mmap object): Packed words list data
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        try:
+            magic, ver, slot_bits, bucket_bits, words_num, blob_len = struct.unpack_from(
+                MnemonicPackedWordsListConst.FILE_HEADER, packed_data
+            )
+        except struct.error as ex:
+            raise ValueError("Invalid packed words list data") from ex
+        if (magic != MnemonicPackedWordsListConst.FILE_MAGIC
+                or ver != MnemonicPackedWordsListConst.FILE_VER
+                or bucket_bits > slot_bits
+                or words_num > min(1 << slot_bits, MnemonicPackedWordsListConst.SLOT_EMPTY)):
+            raise ValueError("Invalid packed words list header")
+
+        data_view = memoryview(packed_data)
+        offset = struct.calcsize(MnemonicPackedWordsListConst.FILE_HEADER)
+        self.m_offsets, offset = self.__GetTable(data_view, offset, MnemonicPackedWordsListConst.OFFSET,
+                                                 words_num + 1)
+        self.m_displacements, offset = self.__GetTable(data_view, offset, MnemonicPackedWordsListConst.DISPLACEMENT,
+                                                       1 << bucket_bits)
+        self.m_slots, offset = self.__GetTable(data_view, offset, MnemonicPackedWordsListConst.SLOT,
+                                               1 << slot_bits)
+        if len(data_view) - offset != blob_len or self.m_offsets[-1] != blob_len:
+            raise ValueError("Invalid packed words list length")
+
+        self.m_packed_data = packed_data
+        self.m_words_num = words_num
+        self.m_slot_bits = slot_bits
+        self.m_bucket_bits = bucket_bits
+        self.m_words_blob = data_view[offset:]
+        self.m_words_cache = [None] * words_num
+        self.m_words_to_idx = {}
+
+    def ToBytes(self) -> bytes:
+        """
+        Get the packed words list bytes.
+
+        Returns:
+            bytes: Packed words list bytes
+        """
+        return bytes(self.m_packed_data)
+
+    def SaveToFile(self,
+                   file_path: str) -> None:
+        """
+        Save the packed words list to file.
+
+        Args:
+            file_path (str): File path
+        """
+        with open(file_path, "wb") as fout:
+            fout.write(self.ToBytes())
+
+    def Length(self) -> int:
+        """
+        Get the length of the words list.
+
+        Returns:
+            int: Words list length
+        """
+        return self.m_words_num
+
+    def GetWordIdx(self,
+                   word: str) -> int:
+        """
+        Get the index of the specified word.
+
+        Args:
+            word (str): Word to be searched
+
+        Returns:
+            int: Word index
+
+        Raises:
+            ValueError: If the word is not found
+        """
+        try:
+            return self.m_words_to_idx[word]
+        except KeyError:
+            pass
+
+        word_bytes = word.encode("utf-8")
+        word_hash, word_mul = self.__WordHashes(word_bytes)
+        bucket_idx = (word_hash >> 16) & ((1 << self.m_bucket_bits) - 1)
+        word_idx = self.m_slots[
+            self.__WordSlot(word_hash, word_mul, self.m_displacements[bucket_idx], self.m_slot_bits)
+        ]
+        # The slot of a word not in the list can be empty or contain another word
+        if word_idx == MnemonicPackedWordsListConst.SLOT_EMPTY or self.__GetWordBytes(word_idx) != word_bytes:
+            raise ValueError(f"Unable to find word {word}")
+
+        self.m_words_to_idx[word] = word_idx
+        return word_idx
+
+    def GetWordAtIdx(self,
+                     word_idx: int) -> str:
+        """
+        Get the word at the specified index.
+
+        Args:
+            word_idx (int): Word index
+
+        Returns:
+            str: Word at the specified index
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        word = self.m_words_cache[word_idx]
+        if word is None:
+            word = str(self.__GetWordBytes(word_idx % self.m_words_num), "utf-8")
+            self.m_words_cache[word_idx] = word
+        return word
+
+    def __GetWordBytes(self,
+                       word_idx: int) -> memoryview:
+        """
+        Get the bytes of the word at the specified index.
+
+        Args:
+            word_idx (int): Word index
+
+        Returns:
+            memoryview: Word bytes
+        """
+        return self.m_words_blob[self.m_offsets[word_idx]:self.m_offsets[word_idx + 1]]
+
+    @staticmethod
+    def __GetTable(data_view: memoryview,
+                   offset: int,
+                   elem_fmt: str,
+                   elem_num: int) -> Tuple[Sequence[int], int]:
+        """
+        Get a table of integers from the packed data.
+        On little-endian platforms, the table is a view of the data so no copy is performed.
+
+        Args:
+            data_view (memoryview): Packed data
+            offset (int)          : Table offset
+            elem_fmt (str)        : Format of table elements
+            elem_num (int)        : Number of table elements
+
+        Returns:
+            tuple[Sequence[int], int]: Table (index 0), offset after the table (index 1)
+
+        Raises:
+            ValueError: If the data is too short
+        """
+        table_len = struct.calcsize(f"<{elem_num}{elem_fmt}")
+        table_view = data_view[offset:offset + table_len]
+        if len(table_view) != table_len:
+            raise ValueError("Invalid packed words list length")
+
+        if sys.byteorder == "little" and struct.calcsize(elem_fmt) == struct.calcsize(f"<{elem_fmt}"):
+            return table_view.cast(elem_fmt), offset + table_len   # type: ignore [call-overload]
+        return struct.unpack(f"<{elem_num}{elem_fmt}", table_view), offset + table_len
+
+    @classmethod
+    def __Pack(cls,
+               words_list: List[str]) -> bytes:
+        """
+        Pack a words list.
+
+        Args:
+            words_list (list[str]): Words list
+
+        Returns:
+            bytes: Packed words list bytes
+
+        Raises:
+            ValueError: If the words list cannot be packed
+        """
+        words_bytes = [word.encode("utf-8") for word in words_list]
+        words_num = len(words_bytes)
+        if words_num >= MnemonicPackedWordsListConst.SLOT_EMPTY:
+            raise ValueError(f"Too many words ({words_num})")
+        if len(set(words_bytes)) != words_num:
+            raise ValueError("Words list contains duplicated words")
+
+        slot_bits = max(1, (words_num - 1).bit_length())
+        bucket_bits = max(0, slot_bits - MnemonicPackedWordsListConst.BUCKET_BITS_DIFF)
+
+        # Group words by bucket
+        buckets: List[List[Tuple[int, int, int]]] = [[] for _ in range(1 << bucket_bits)]
+        for word_idx, word in enumerate(words_bytes):
+            word_hash, word_mul = cls.__WordHashes(word)
+            buckets[(word_hash >> 16) & ((1 << bucket_bits) - 1)].append((word_hash, word_mul, word_idx))
+
+        # Find the displacement of each bucket so that its words fall in empty slots, starting from the biggest buckets
+        max_displacement = 1 << (struct.calcsize(MnemonicPackedWordsListConst.DISPLACEMENT) * 8)
+        displacements = [0] * len(buckets)
+        slots = [MnemonicPackedWordsListConst.SLOT_EMPTY] * (1 << slot_bits)
+        for bucket_idx in sorted(range(len(buckets)), key=lambda idx: len(buckets[idx]), reverse=True):
+            bucket = buckets[bucket_idx]
+            if not bucket:
+                break
+            for displacement in range(max_displacement):
+                slot_idxs = {cls.__WordSlot(word_hash, word_mul, displacement, slot_bits)
+                             for word_hash, word_mul, _ in bucket}
+                if (len(slot_idxs) == len(bucket)
+                        and all(slots[slot_idx] == MnemonicPackedWordsListConst.SLOT_EMPTY for slot_idx in slot_idxs)):
+                    break
+            else:
+                raise ValueError("Unable to build the words list perfect hash index")
+
+            displacements[bucket_idx] = displacement
+            for word_hash, word_mul, word_idx in bucket:
+                slots[cls.__WordSlot(word_hash, word_mul, displacement, slot_bits)] = word_idx
+
+        words_blob = b"".join(words_bytes)
+        return (
+            struct.pack(MnemonicPackedWordsListConst.FILE_HEADER,
+                        MnemonicPackedWordsListConst.FILE_MAGIC,
+                        MnemonicPackedWordsListConst.FILE_VER,
+                        slot_bits,
+                        bucket_bits,
+                        words_num,
+                        len(words_blob))
+            + struct.pack(f"<{words_num + 1}{MnemonicPackedWordsListConst.OFFSET}",
+                          *accumulate([0] + [len(word) for word in words_bytes]))
+            + struct.pack(f"<{len(displacements)}{MnemonicPackedWordsListConst.DISPLACEMENT}", *displacements)
+            + struct.pack(f"<{len(slots)}{MnemonicPackedWordsListConst.SLOT}", *slots)
+            + words_blob
+        )
+
+    @staticmethod
+    def __WordHashes(word_bytes: bytes) -> Tuple[int, int]:
+        """
+        Get the hashes of the specified word.
+
+        Args:
+            word_bytes (bytes): Word bytes
+
+        Returns:
+            tuple[int, int]: Word hash (index 0), odd word multiplier (index 1)
+        """
+        return zlib.crc32(word_bytes), zlib.adler32(word_bytes) | 1
+
+    @staticmethod
+    def __WordSlot(word_hash: int,
+                   word_mul: int,
+                   displacement: int,
+                   slot_bits: int) -> int:
+        """
+        Get the slot index of the specified word.
+
+        Args:
+            word_hash (int)   : Word hash
+            word_mul (int)    : Word multiplier
+            displacement (int): Bucket displacement
+            slot_bits (int)   : Number of bits of the slot index
+
+        Returns:
+            int: Slot index
+        """
+        return (((word_hash + displacement) * word_mul) & 0xFFFFFFFF) >> (32 - slot_bits)
+
+
 class MnemonicWordsListFileReader:
     """
     Mnemonic words list file reader class.
@@ -165,6 +562,7 @@ class MnemonicWordsListFileReader:
                  words_num: int) -> MnemonicWordsList:
         """
         Load words list file correspondent to the specified language.
+        If a packed words list file is present beside it, the packed one is loaded.
 
         Args:
             file_path (str): File name
@@ -177,17 +575,285 @@ class MnemonicWordsListFileReader:
             ValueError: If loaded words list is not valid
         """
 
-        # Read file
-        with open(file_path, encoding="utf-8") as fin:
-            words_list = [word.strip()
-                          for word in fin.readlines()
-                          if word.strip() != "" and not word.startswith("#")]
+        words_list: Optional[MnemonicWordsList] = MnemonicWordsListFileReader.LoadPackedFile(file_path)
+        if words_list is None:
+            words_list = MnemonicWordsList(MnemonicWordsListFileReader.ReadWords(file_path))
 
         # Check words list count
-        if len(words_list) != words_num:
-            raise ValueError(f"Number of loaded words list ({len(words_list)}) is not valid")
+        if words_list.Length() != words_num:
+            raise ValueError(f"Number of loaded words list ({words_list.Length()}) is not valid")
+
+        return words_list
+
+    @staticmethod
+    def LoadPackedFile(file_path: str) -> Optional[MnemonicPackedWordsList]:
+        """
+        Load the packed words list file beside the specified words list file.
+
+        Args:
+            file_path (str): Words list file name
+
+        Returns:
+            MnemonicPackedWordsList object: MnemonicPackedWordsList object (None if not present or not valid)
+        """
+        try:
+            return MnemonicPackedWordsList.FromFile(
+                os.path.splitext(file_path)[0] + MnemonicPackedWordsListConst.FILE_EXT
+            )
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def ReadWords(file_path: str) -> List[str]:
+        """
+        Read the words from a words list file, skipping empty lines and comments.
+
+        Args:
+            file_path (str): File name
+
+        Returns:
+            list[str]: Words
+        """
+        with open(file_path, encoding="utf-8") as fin:
+            return [word.strip()
+                    for word in fin.readlines()
+                    if word.strip() != "" and not word.startswith("#")]
+
+
+class MnemonicWordsIndexConst:
+    """Class container for mnemonic words index constants."""
+
+    # Root path of the indexed files (i.e. package path)
+    ROOT_PATH: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Index file path
+    FILE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words_index.bin")
+    # Name of the folders containing the words list files
+    WORDS_LIST_DIR_NAME: str = "wordlist"
+
+    # File magic and version
+    FILE_MAGIC: bytes = b"MWIX"
+    FILE_VER: int = 1
+    # File header: magic, version, number of bits of the bucket index, number of files
+    FILE_HEADER: str = "<4sBBH"
+    # Header of each file name: name length
+    FILE_NAME_HEADER: str = "<H"
+    # Bucket format (bitset of files)
+    BUCKET: str = "I"
+
+    # Number of bits of the bucket index
+    BUCKET_BITS: int = 13
+
+
+class MnemonicWordsIndex:
+    """
+    Mnemonic words index class.
+    It's an inverted index of all the words list files of the package, mapping words to the bitset of the files
+    containing them (one bit for each file).
+    To keep it small and fast to load, words are grouped in buckets by their CRC32, so the bitset of a word is the one
+    of its bucket: it can contain files that don't actually include the word (never the opposite).
+    Therefore, it's only used to skip words lists, while the remaining ones are checked as usual.
+    The index is precomputed in a file, so that words lists are not loaded to build it. If a words list changes, the
+    file shall be built again with: MnemonicWordsIndex.Build().SaveToFile(MnemonicWordsIndexConst.FILE_PATH)
+    """
+
+    m_files: Dict[str, int]
+    m_buckets: Sequence[int]
+
+    # Global instance
+    __instance: Optional[MnemonicWordsIndex] = None
+
+    @classmethod
+    def Instance(cls) -> MnemonicWordsIndex:
+        """
+        Get the global class instance, loaded from the package file the first time.
+        If the file cannot be loaded, an empty index (i.e. not skipping any words list) is used.
+
+        Returns:
+            MnemonicWordsIndex object: MnemonicWordsIndex object
+        """
+        if cls.__instance is None:
+            try:
+                cls.__instance = cls.FromFile(MnemonicWordsIndexConst.FILE_PATH)
+            except (OSError, ValueError):
+                cls.__instance = cls([], [])
+        return cls.__instance
+
+    @classmethod
+    def Build(cls,
+              root_path: str = MnemonicWordsIndexConst.ROOT_PATH) -> MnemonicWordsIndex:
+        """
+        Build the index from all the words list files found in the specified path.
+
+        Args:
+            root_path (str, optional): Root path (default: package path)
+
+        Returns:
+            MnemonicWordsIndex object: MnemonicWordsIndex object
+
+        Raises:
+            ValueError: If there are too many files
+        """
+        files = sorted(
+            os.path.relpath(os.path.join(dir_path, file_name), root_path).replace(os.sep, "/")
+            for dir_path, _, file_names in os.walk(root_path)
+            if os.path.basename(dir_path) == MnemonicWordsIndexConst.WORDS_LIST_DIR_NAME
+            for file_name in file_names
+            if file_name.endswith(".txt")
+        )
+        if len(files) > struct.calcsize(MnemonicWordsIndexConst.BUCKET) * 8:
+            raise ValueError(f"Too many words list files ({len(files)})")
+
+        buckets = [0] * (1 << MnemonicWordsIndexConst.BUCKET_BITS)
+        for i, file_name in enumerate(files):
+            for word in MnemonicWordsListFileReader.ReadWords(os.path.join(root_path, file_name)):
+                buckets[cls.__WordBucket(word)] |= 1 << i
+        return cls(files, buckets)
+
+    @classmethod
+    def FromBytes(cls,
+                  index_bytes: bytes) -> MnemonicWordsIndex:
+        """
+        Construct class from bytes.
+
+        Args:
+            index_bytes (bytes): Index bytes
+
+        Returns:
+            MnemonicWordsIndex object: MnemonicWordsIndex object
+
+        Raises:
+            ValueError: If the bytes are not valid
+        """
+        try:
+            magic, ver, bucket_bits, files_num = struct.unpack_from(MnemonicWordsIndexConst.FILE_HEADER, index_bytes)
+            if (magic != MnemonicWordsIndexConst.FILE_MAGIC
+                    or ver != MnemonicWordsIndexConst.FILE_VER
+                    or bucket_bits != MnemonicWordsIndexConst.BUCKET_BITS):
+                raise ValueError("Invalid words index header")
+
+            offset = struct.calcsize(MnemonicWordsIndexConst.FILE_HEADER)
+            files = []
+            for _ in range(files_num):
+                name_len = struct.unpack_from(MnemonicWordsIndexConst.FILE_NAME_HEADER, index_bytes, offset)[0]
+                offset += struct.calcsize(MnemonicWordsIndexConst.FILE_NAME_HEADER)
+                files.append(index_bytes[offset:offset + name_len].decode("utf-8"))
+                offset += name_len
+
+            buckets = struct.unpack_from(
+                f"<{1 << bucket_bits}{MnemonicWordsIndexConst.BUCKET}", index_bytes, offset
+            )
+        except (struct.error, UnicodeDecodeError) as ex:
+            raise ValueError("Invalid words index bytes") from ex
+
+        return cls(files, buckets)
+
+    @classmethod
+    def FromFile(cls,
+                 file_path: str) -> MnemonicWordsIndex:
+        """
+        Construct class from file.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            MnemonicWordsIndex object: MnemonicWordsIndex object
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as fin:
+            return cls.FromBytes(fin.read())
+
+    def __init__(self,
+                 files: List[str],
+                 buckets: Sequence[int]) -> None:
+        """
+        Construct class.
+
+        Args:
+            files (list[str])       : Indexed files, relative to the root path
+            buckets (sequence[int]) : Bitset of files for each bucket (empty for an empty index)
+        """
+        self.m_files = {file_name: 1 << i for i, file_name in enumerate(files)}
+        self.m_buckets = buckets
+
+    def ToBytes(self) -> bytes:
+        """
+        Get the index bytes.
+
+        Returns:
+            bytes: Index bytes
+        """
+        index_bytes = struct.pack(MnemonicWordsIndexConst.FILE_HEADER,
+                                  MnemonicWordsIndexConst.FILE_MAGIC,
+                                  MnemonicWordsIndexConst.FILE_VER,
+                                  MnemonicWordsIndexConst.BUCKET_BITS,
+                                  len(self.m_files))
+        for file_name in self.m_files:
+            name_bytes = file_name.encode("utf-8")
+            index_bytes += struct.pack(MnemonicWordsIndexConst.FILE_NAME_HEADER, len(name_bytes)) + name_bytes
+        return index_bytes + struct.pack(f"<{len(self.m_buckets)}{MnemonicWordsIndexConst.BUCKET}", *self.m_buckets)
+
+    def SaveToFile(self,
+                   file_path: str) -> None:
+        """
+        Save the index to file.
+
+        Args:
+            file_path (str): File path
+        """
+        with open(file_path, "wb") as fout:
+            fout.write(self.ToBytes())
+
+    def FileBitset(self,
+                   file_path: str) -> int:
+        """
+        Get the bitset of the specified words list file.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            int: File bitset (0 if the file is not indexed)
+        """
+        try:
+            file_name = os.path.relpath(os.path.abspath(file_path), MnemonicWordsIndexConst.ROOT_PATH)
+        # On Windows, if the path is on a different drive
+        except ValueError:
+            return 0
+        return self.m_files.get(file_name.replace(os.sep, "/"), 0)
+
+    def WordsBitset(self,
+                    words: List[str]) -> int:
+        """
+        Get the bitset of the files that may contain all the specified words.
+
+        Args:
+            words (list[str]): Words
+
+        Returns:
+            int: Files bitset
+        """
+        bitset = (1 << len(self.m_files)) - 1
+        if self.m_buckets:
+            for word in words:
+                bitset &= self.m_buckets[self.__WordBucket(word)]
+        return bitset
+
+    @staticmethod
+    def __WordBucket(word: str) -> int:
+        """
+        Get the bucket index of the specified word.
 
-        return MnemonicWordsList(words_list)
+        Args:
+            word (str): Word
+
+        Returns:
+            int: Bucket index
+        """
+        return zlib.crc32(word.encode("utf-8")) & ((1 << MnemonicWordsIndexConst.BUCKET_BITS) - 1)
 
 
 class MnemonicWordsListGetterBase(ABC):
@@ -220,6 +886,19 @@ class MnemonicWordsListGetterBase(ABC):
             ValueError: If loaded words list is not valid
         """
 
+    def GetLanguageFile(self,
+                        lang: MnemonicLanguages) -> Optional[str]:
+        """
+        Get the words list file of the specified language, used for finding the language quickly.
+
+        Args:
+            lang (MnemonicLanguages): Language
+
+        Returns:
+            str: File path (None if words list is not loaded from a file)
+        """
+        return None
+
     def _LoadWordsList(self,
                        lang: MnemonicLanguages,
                        file_name: str,
@@ -305,12 +984,22 @@ class MnemonicWordsListFinderBase(ABC):
         Raises:
             ValueError: If the mnemonic language cannot be found
         """
+        words_list_getter = words_list_getter_cls.Instance()
+        words_index = MnemonicWordsIndex.Instance()
+        # Files that may contain all the words, so that only the words lists of these files are loaded
+        words_bitset = words_index.WordsBitset(mnemonic.ToList())
+
         for lang in langs_enum:
+            lang_file = words_list_getter.GetLanguageFile(lang)
+            file_bitset = words_index.FileBitset(lang_file) if lang_file is not None else 0
+            if file_bitset != 0 and (words_bitset & file_bitset) == 0:
+                continue
+
             # Search all the words because some languages have words in common
             # (e.g. 'fatigue' both in English and French)
             # It's more time consuming, but considering only the first word can detect the wrong language sometimes
             try:
-                words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
+                words_list = words_list_getter.GetByLanguage(lang)
                 for word in mnemonic.ToList():
                     words_list.GetWordIdx(word)
                 return words_list, lang
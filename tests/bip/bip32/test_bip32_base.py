@@ -20,14 +20,19 @@
 
 # Imports
 import binascii
+import pickle
 import unittest
+from unittest import mock
 
 from bip_utils import (
-    Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyError, Bip32KeyIndex, Bip32KeyNetVersions,
-    Bip32PrivateKey, Bip32PublicKey, EllipticCurveGetter
+    Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyBinaryDeserializer, Bip32KeyData, Bip32KeyError,
+    Bip32KeyIndex, Bip32KeyNetVersions, Bip32PrivateKey, Bip32PublicKey, EllipticCurveGetter
 )
+from bip_utils.bip.bip32.base.bip32_base import Bip32BaseConst
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
+from bip_utils.bip.bip32.bip32_key_ser import Bip32KeySerConst
 from bip_utils.bip.bip32.slip10.bip32_slip10_mst_key_generator import Bip32Slip10MstKeyGeneratorConst
+from bip_utils.ecc.curve.elliptic_curve_backends import EllipticCurveBackendProxy
 
 
 # Generic seed for testing
@@ -152,6 +157,184 @@ class Bip32BaseTests(unittest.TestCase):
         bip32_ctx = bip32_class.FromPublicKey(binascii.unhexlify(test_vector["pub_key"]))
         self.__test_public_derivation_pub_key(bip32_ctx, test_vector)
 
+    # Test batch derivation of child keys
+    def _test_child_keys(self, bip32_class, test_vector):
+        for test in test_vector:
+            bip32_ctx = bip32_class.FromSeed(binascii.unhexlify(test["seed"]))
+
+            # Indexes of the test vector
+            indexes = [der_path["index"] for der_path in test["der_paths"]]
+            self.__test_child_keys(bip32_ctx, bip32_ctx.ChildKeys(indexes), indexes)
+            # Range of hardened indexes
+            start = Bip32KeyIndex.HardenIndex(0)
+            self.__test_child_keys(bip32_ctx, bip32_ctx.ChildKeysRange(start, 3), range(start, start + 3))
+
+        # Empty range
+        self.assertEqual([], bip32_ctx.ChildKeysRange(0, 0))
+        # Invalid ranges
+        self.assertRaises(ValueError, bip32_ctx.ChildKeysRange, 0, -1)
+        self.assertRaises(ValueError, bip32_ctx.ChildKeysRange, Bip32KeyIndex.HardenIndex(0) - 1, 2)
+        self.assertRaises(ValueError, bip32_ctx.ChildKeysRange, Bip32KeyDataConst.KEY_INDEX_MAX_VAL, 2)
+
+    # Test batch public derivation of child keys
+    def _test_public_child_keys(self, bip32_class, test_vector):
+        bip32_ctx = bip32_class.FromExtendedKey(test_vector["ex_pub"])
+        self.__test_child_keys(bip32_ctx, bip32_ctx.ChildKeysRange(0, 3), range(3))
+        # Public derivation does not support hardened indexes
+        self.assertRaises(Bip32KeyError, bip32_ctx.ChildKeysRange, Bip32KeyIndex.HardenIndex(0), 3)
+        self.assertRaises(Bip32KeyError, bip32_ctx.ChildKeys, [0, Bip32KeyIndex.HardenIndex(0)])
+
+    # Test iteration over child keys
+    def _test_iter_children(self, bip32_class):
+        bip32_ctx = bip32_class.FromSeed(TEST_SEED)
+        start = Bip32KeyIndex.HardenIndex(5)
+
+        # Use a small chunk size to test more chunks
+        with mock.patch.object(Bip32BaseConst, "ITER_CHILDREN_CHUNK_SIZE", 3):
+            self.__test_child_keys(bip32_ctx, list(bip32_ctx.IterChildKeys(start, start + 8)), range(start, start + 8))
+            for public_only in (True, False):
+                children = list(bip32_ctx.IterChildren(start, start + 8, public_only))
+                self.assertEqual([index for index, _, _ in children], list(range(start, start + 8)))
+                for index, pub_key_bytes, priv_key_bytes in children:
+                    bip32_exp = bip32_ctx.ChildKey(index)
+                    self.assertEqual(bip32_exp.PublicKey().RawCompressed().ToBytes(), pub_key_bytes)
+                    self.assertEqual(None if public_only else bip32_exp.PrivateKey().Raw().ToBytes(), priv_key_bytes)
+
+            # Public derivation
+            if bip32_class.IsPublicDerivationSupported():
+                bip32_ctx.ConvertToPublic()
+                children = list(bip32_ctx.IterChildren(0, 7))
+                self.assertEqual([index for index, _, _ in children], list(range(7)))
+                for index, pub_key_bytes, priv_key_bytes in children:
+                    self.assertEqual(bip32_ctx.ChildKey(index).PublicKey().RawCompressed().ToBytes(), pub_key_bytes)
+                    self.assertIsNone(priv_key_bytes)
+                self.assertRaises(Bip32KeyError, list, bip32_ctx.IterChildren(0, 7, False))
+
+        bip32_ctx = bip32_class.FromSeed(TEST_SEED)
+        # Empty range
+        self.assertEqual([], list(bip32_ctx.IterChildren(start, start)))
+        # Invalid ranges
+        self.assertRaises(ValueError, list, bip32_ctx.IterChildKeys(start, start - 1))
+        self.assertRaises(ValueError, list, bip32_ctx.IterChildKeys(start, Bip32KeyDataConst.KEY_INDEX_MAX_VAL + 2))
+        with mock.patch.object(Bip32BaseConst, "ITER_CHILDREN_CHUNK_SIZE", 1):
+            self.assertRaises(ValueError, list, bip32_ctx.IterChildKeys(Bip32KeyIndex.HardenIndex(0) - 1,
+                                                                        Bip32KeyIndex.HardenIndex(0) + 1))
+
+    # Test that public keys and parent fingerprints are computed only when needed
+    def _test_lazy_public_key(self, bip32_class):
+        bip32_mst_ctx = bip32_class.FromSeed(TEST_SEED)
+        bip32_path = "0'/1'/2'/3'/4'"
+        # Reference derivation, forcing the computation of all the public keys
+        bip32_ref_ctx = bip32_mst_ctx
+        for elem in bip32_path.split("/"):
+            bip32_ref_ctx.PublicKey().KeyObject()
+            bip32_ref_ctx = bip32_ref_ctx.DerivePath(elem)
+        bip32_ref_ctx.PublicKey().KeyObject()
+
+        priv_key_cls = bip32_class.Curve().PrivateKeyClass()
+        # Patch the class of the active backend
+        if isinstance(priv_key_cls, EllipticCurveBackendProxy):
+            priv_key_cls = priv_key_cls.ActiveClass()
+        with mock.patch.object(priv_key_cls, "PublicKey", autospec=True,
+                               side_effect=priv_key_cls.PublicKey) as pub_key_mock:
+            bip32_ctx = bip32_class.FromSeed(TEST_SEED).DerivePath(bip32_path)
+            # No public key computed for a hardened path
+            self.assertEqual(pub_key_mock.call_count, 0)
+            self.assertEqual(bip32_ctx.Depth(), 5)
+            self.assertEqual(bip32_ctx.ChainCode(), bip32_ref_ctx.ChainCode())
+            self.assertEqual(bip32_ctx.PrivateKey().Raw(), bip32_ref_ctx.PrivateKey().Raw())
+            self.assertEqual(pub_key_mock.call_count, 0)
+            # Public key computed only when needed, and only once
+            self.assertEqual(bip32_ctx.PublicKey().RawCompressed(), bip32_ref_ctx.PublicKey().RawCompressed())
+            self.assertEqual(bip32_ctx.PublicKey().RawUncompressed(), bip32_ref_ctx.PublicKey().RawUncompressed())
+            self.assertEqual(pub_key_mock.call_count, 1)
+            # The parent fingerprint requires the parent public key
+            self.assertEqual(bip32_ctx.ParentFingerPrint(), bip32_ref_ctx.ParentFingerPrint())
+            self.assertEqual(pub_key_mock.call_count, 2)
+            # Children of a key whose public key is already computed get the fingerprint directly
+            bip32_child_ctx = bip32_ctx.ChildKey(Bip32KeyIndex.HardenIndex(0))
+            self.assertEqual(bip32_child_ctx.ParentFingerPrint(), bip32_ctx.FingerPrint())
+            self.assertEqual(pub_key_mock.call_count, 2)
+            # Children do not keep a reference to the parent public key object
+            bip32_child_ctx = bip32_child_ctx.ChildKey(Bip32KeyIndex.HardenIndex(0))
+            parent_fprint = bip32_child_ctx.PublicKey().Data().m_parent_fprint
+            self.assertTrue(callable(parent_fprint))
+            self.assertFalse(hasattr(parent_fprint, "__self__"))
+            self.assertEqual(pub_key_mock.call_count, 2)
+            # The parent fingerprint and the parent public key are computed only once
+            bip32_grandchild_ctx = bip32_child_ctx.ChildKey(Bip32KeyIndex.HardenIndex(0))
+            self.assertEqual(bip32_grandchild_ctx.ParentFingerPrint(), bip32_child_ctx.FingerPrint())
+            self.assertEqual(pub_key_mock.call_count, 3)
+            self.assertEqual(bip32_grandchild_ctx.ParentFingerPrint(), bip32_child_ctx.FingerPrint())
+            self.assertEqual(pub_key_mock.call_count, 3)
+
+        self.assertEqual(bip32_ctx.PrivateKey().ToExtended(), bip32_ref_ctx.PrivateKey().ToExtended())
+        self.assertEqual(bip32_ctx.PublicKey().ToExtended(), bip32_ref_ctx.PublicKey().ToExtended())
+
+        # Converting to public resolves everything before discarding the private key
+        bip32_ctx = bip32_mst_ctx.DerivePath(bip32_path)
+        bip32_ctx.ConvertToPublic()
+        self.assertTrue(bip32_ctx.IsPublicOnly())
+        self.assertEqual(bip32_ctx.PublicKey().ToExtended(), bip32_ref_ctx.PublicKey().ToExtended())
+
+    # Test binary serialization and pickling
+    def _test_binary(self, bip32_class):
+        curve = bip32_class.Curve()
+        bip32_ctx = bip32_class.FromSeed(TEST_SEED).DerivePath("0'/1'")
+
+        for public_only in (False, True):
+            if public_only:
+                bip32_ctx.ConvertToPublic()
+            ser_key_bytes = bip32_ctx.ToBinary()
+            key_len = curve.PublicKeyClass().CompressedLength() if public_only else curve.PrivateKeyClass().Length()
+            self.assertEqual(len(ser_key_bytes), Bip32KeySerConst.BINARY_HEADER_BYTE_LEN + key_len)
+
+            loaded_ctxs = [bip32_class.FromBinary(ser_key_bytes), bip32_class.FromBinary(ser_key_bytes, True),
+                           pickle.loads(pickle.dumps(bip32_ctx))]
+            for loaded_ctx in loaded_ctxs:
+                self.assertTrue(type(loaded_ctx) is bip32_class)
+                self.assertEqual(loaded_ctx.IsPublicOnly(), public_only)
+                self.assertEqual(loaded_ctx.KeyNetVersions().Public(), bip32_ctx.KeyNetVersions().Public())
+                self.assertEqual(loaded_ctx.KeyNetVersions().Private(), bip32_ctx.KeyNetVersions().Private())
+                self.assertEqual(loaded_ctx.ToBinary(), ser_key_bytes)
+                self.assertEqual(loaded_ctx.PublicKey().ToExtended(), bip32_ctx.PublicKey().ToExtended())
+                if not public_only:
+                    self.assertEqual(loaded_ctx.PrivateKey().ToExtended(), bip32_ctx.PrivateKey().ToExtended())
+
+            # Conversion to extended key
+            ex_key_str = (bip32_ctx.PublicKey().ToExtended()
+                          if public_only
+                          else bip32_ctx.PrivateKey().ToExtended())
+            self.assertEqual(Bip32KeyBinaryDeserializer.ToExtendedKey(ser_key_bytes), ex_key_str)
+
+        # Trusted public keys are decoded only when needed
+        ser_key_bytes = ser_key_bytes[:Bip32KeySerConst.BINARY_HEADER_BYTE_LEN] + b"\x05" * len(
+            bip32_ctx.PublicKey().RawCompressed()
+        )
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes)
+        bip32_ctx = bip32_class.FromBinary(ser_key_bytes, True)
+        self.assertEqual(bip32_ctx.Depth(), 2)
+        self.assertRaises(Bip32KeyError, bip32_ctx.PublicKey().KeyObject)
+
+    # Test invalid binary keys
+    def _test_invalid_binary(self, bip32_class):
+        ser_key_bytes = bip32_class.FromSeed(TEST_SEED).ToBinary()
+
+        # Wrong curve tag
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, bytes([0xFF]) + ser_key_bytes[1:])
+        # Wrong flags
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes[:1] + b"\x02" + ser_key_bytes[2:])
+        # Wrong lengths
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes[:-1])
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes + b"\x00")
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes[:10])
+        self.assertRaises(Bip32KeyError, Bip32KeyBinaryDeserializer.ToExtendedKey, bytes([0xFF]) + ser_key_bytes[1:])
+        self.assertRaises(Bip32KeyError, Bip32KeyBinaryDeserializer.ToExtendedKey, ser_key_bytes[:10])
+        # Master key with wrong fingerprint, only checked if not trusted
+        ser_key_bytes = ser_key_bytes[:11] + b"\x01\x02\x03\x04" + ser_key_bytes[15:]
+        self.assertRaises(Bip32KeyError, bip32_class.FromBinary, ser_key_bytes)
+        self.assertEqual(bytes(bip32_class.FromBinary(ser_key_bytes, True).ParentFingerPrint()), b"\x01\x02\x03\x04")
+
     # Test elliptic curve
     def _test_elliptic_curve(self, bip32_class, curve_type):
         self.assertEqual(bip32_class.Curve(), EllipticCurveGetter.FromType(curve_type))
@@ -244,6 +427,21 @@ class Bip32BaseTests(unittest.TestCase):
             # Test object
             self.__test_bip32_obj(bip32_ctx, der_path, depth, True)
 
+    # Test child keys derived in batch
+    def __test_child_keys(self, bip32_ctx, child_keys, indexes):
+        indexes = list(indexes)
+        self.assertEqual(len(indexes), len(child_keys))
+
+        for index, child_key in zip(indexes, child_keys):
+            bip32_exp = bip32_ctx.ChildKey(index)
+
+            self.assertEqual(bip32_exp.IsPublicOnly(), child_key.IsPublicOnly())
+            self.assertEqual(index, child_key.Index())
+            self.assertEqual(bip32_exp.Depth(), child_key.Depth())
+            self.assertEqual(bip32_exp.PublicKey().ToExtended(), child_key.PublicKey().ToExtended())
+            if not bip32_exp.IsPublicOnly():
+                self.assertEqual(bip32_exp.PrivateKey().ToExtended(), child_key.PrivateKey().ToExtended())
+
     # Test public derivation from extended key
     def __test_public_derivation_ex_key(self, bip32_ctx, test_vector):
         # Shall be public and the public key shall be correct
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import Bip32DerivationCache, Bip32KholawEd25519, Bip32Slip10Ed25519, Bip32Slip10Secp256k1
+
+
+# Seed for testing
+TEST_SEED = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
+# Other seed for testing
+TEST_SEED_2 = binascii.unhexlify(b"fffcf9f6f3f0edeae7e4e1dedbd8d5d2cfccc9c6c3c0bdbab7b4b1aeaba8a5a29f9c999693908d8a8784817e7b7875726f6c696663605d5a5754514e4b484542")
+
+# Tests for derivation
+TEST_VECT = [
+    {
+        "class": Bip32Slip10Secp256k1,
+        "paths": ["m/84'/0'/0'/0/0", "m/84'/0'/0'/0/1", "m/84'/0'/0'/1/0", "m/84'/0'/1'/0/0", "m/44'/0'/0'/0/0"],
+    },
+    {
+        "class": Bip32Slip10Ed25519,
+        "paths": ["m/44'/501'/0'/0'", "m/44'/501'/0'/1'", "m/44'/501'/1'/0'"],
+    },
+    {
+        "class": Bip32KholawEd25519,
+        "paths": ["m/1852'/1815'/0'/0/0", "m/1852'/1815'/0'/0/1", "m/1852'/1815'/0'/2/0"],
+    },
+]
+
+
+#
+# Tests
+#
+class Bip32DerivationCacheTests(unittest.TestCase):
+    # Test derivation
+    def test_derivation(self):
+        for test in TEST_VECT:
+            cache = Bip32DerivationCache()
+
+            # Derive two times, the second time shall always hit the cache
+            misses = []
+            for _ in range(2):
+                for path in test["paths"]:
+                    for seed in (TEST_SEED, TEST_SEED_2):
+                        bip32_ctx = test["class"].FromSeedAndPath(seed, path, cache=cache)
+                        bip32_exp = test["class"].FromSeedAndPath(seed, path)
+                        self.assertEqual(bip32_exp.PrivateKey().ToExtended(), bip32_ctx.PrivateKey().ToExtended())
+                        self.assertEqual(bip32_exp.PublicKey().ToExtended(), bip32_ctx.PublicKey().ToExtended())
+                misses.append(cache.Misses())
+
+            self.assertEqual(len(test["paths"]) * 4, cache.Hits() + cache.Misses())
+            self.assertEqual(misses[0], misses[1])
+
+    # Test public derivation
+    def test_public_derivation(self):
+        cache = Bip32DerivationCache()
+
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/84'/0'/0'")
+        bip32_ctx.ConvertToPublic()
+        for i in range(3):
+            self.assertEqual(bip32_ctx.DerivePath(f"0/{i}").PublicKey().ToExtended(),
+                             bip32_ctx.DerivePath(f"0/{i}", cache).PublicKey().ToExtended())
+        self.assertEqual(2, cache.Hits())
+        self.assertEqual(1, cache.Misses())
+
+        # Private and public nodes shall not share the cached nodes
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/84'/0'/0'")
+        self.assertFalse(bip32_ctx.DerivePath("0/0", cache).IsPublicOnly())
+        self.assertEqual(2, cache.Misses())
+
+    # Test that looking up private nodes doesn't compute public keys
+    def test_lazy_public_key(self):
+        cache = Bip32DerivationCache()
+
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/84'/0'/0'")
+        for i in range(3):
+            bip32_ctx.DerivePath(f"0'/{i}'", cache)
+        self.assertEqual(2, cache.Hits())
+        # The parent fingerprint is not resolved
+        self.assertTrue(callable(bip32_ctx.PrivateKey().Data().m_parent_fprint))
+
+    # Test eviction
+    def test_eviction(self):
+        cache = Bip32DerivationCache(3)
+        self.assertEqual(3, cache.MaxSize())
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0.0, cache.HitRate())
+
+        # Path of length 5, 4 intermediate nodes but only 3 kept
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(TEST_SEED)
+        bip32_ctx.DerivePath("m/84'/0'/0'/0/0", cache)
+        self.assertEqual(3, cache.Size())
+        # Same account, shall hit the cache
+        bip32_ctx.DerivePath("m/84'/0'/0'/0/1", cache)
+        self.assertEqual(1, cache.Hits())
+        self.assertEqual(0.5, cache.HitRate())
+        stats = cache.Stats()
+        self.assertEqual((1, 1, 3, 3, 0.5), (stats.Hits(), stats.Misses(), stats.Size(), stats.MaxSize(), stats.HitRate()))
+        # Empty path shall return the same object without using the cache
+        self.assertTrue(bip32_ctx.DerivePath("m", cache) is bip32_ctx)
+        self.assertEqual(2, cache.Hits() + cache.Misses())
+
+        # Explicit eviction
+        self.assertEqual(1, cache.Evict())
+        self.assertEqual(2, cache.Size())
+        self.assertEqual(2, cache.Evict(10))
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0, cache.Evict())
+
+        # Resize
+        bip32_ctx.DerivePath("m/84'/0'/0'/0/0", cache)
+        cache.Resize(1)
+        self.assertEqual(1, cache.MaxSize())
+        self.assertEqual(1, cache.Size())
+        # The most recent node (i.e. the longest prefix) is kept
+        bip32_ctx.DerivePath("m/84'/0'/0'/0/2", cache)
+        self.assertEqual(2, cache.Hits())
+
+        # Clear
+        cache.Clear()
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0, cache.Hits())
+        self.assertEqual(0, cache.Misses())
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, Bip32DerivationCache, 0)
+        self.assertRaises(ValueError, Bip32DerivationCache(1).Resize, 0)
+        # Absolute path from a child key
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/0'")
+        self.assertRaises(ValueError, bip32_ctx.DerivePath, "m/0", Bip32DerivationCache())
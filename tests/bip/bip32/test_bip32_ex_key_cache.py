@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import (
+    Bip32ExKeyCache, Bip32KeyError, Bip32KeyNetVersions, Bip32Slip10Secp256k1, Bip44PublicKey, Bip84, Bip84Coins
+)
+
+
+# Seed for testing
+TEST_SEED = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
+# Testnet key net versions
+TEST_NET_KEY_NET_VER = Bip32KeyNetVersions(b"\x04\x35\x87\xcf", b"\x04\x35\x83\x94")
+
+
+#
+# Tests
+#
+class Bip32ExKeyCacheTests(unittest.TestCase):
+    # Test public extended keys
+    def test_public_keys(self):
+        cache = Bip32ExKeyCache()
+        self.assertFalse(cache.IsPrivateCached())
+
+        ex_keys = [Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, f"m/84'/0'/{i}'").PublicKey().ToExtended()
+                   for i in range(3)]
+        # Decode two times, the second time shall always hit the cache
+        for _ in range(2):
+            bip32_ctxs = [Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache) for ex_key in ex_keys]
+            for ex_key, bip32_ctx in zip(ex_keys, bip32_ctxs):
+                self.assertTrue(bip32_ctx.IsPublicOnly())
+                self.assertEqual(ex_key, bip32_ctx.PublicKey().ToExtended())
+        self.assertEqual(3, cache.Size())
+        self.assertEqual(3, cache.Hits())
+        self.assertEqual(3, cache.Misses())
+        self.assertEqual(0.5, cache.HitRate())
+
+        # Public objects are shared
+        self.assertTrue(Bip32Slip10Secp256k1.FromExtendedKey(ex_keys[0], cache=cache) is
+                        Bip32Slip10Secp256k1.FromExtendedKey(ex_keys[0], cache=cache))
+
+        # Key net versions are part of the key, invalid keys are not cached
+        self.assertRaises(Bip32KeyError, Bip32Slip10Secp256k1.FromExtendedKey,
+                          ex_keys[0], TEST_NET_KEY_NET_VER, cache)
+        self.assertEqual(3, cache.Size())
+
+    # Test private extended keys
+    def test_private_keys(self):
+        ex_key = Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, "m/84'/0'/0'").PrivateKey().ToExtended()
+
+        # Not cached by default
+        cache = Bip32ExKeyCache()
+        for _ in range(2):
+            bip32_ctx = Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache)
+            self.assertEqual(ex_key, bip32_ctx.PrivateKey().ToExtended())
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0, cache.Hits())
+
+        # Cached if enabled, but objects are never shared
+        cache = Bip32ExKeyCache(cache_priv=True)
+        self.assertTrue(cache.IsPrivateCached())
+        bip32_ctx = Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache)
+        bip32_ctx.ConvertToPublic()
+        for _ in range(2):
+            bip32_ctx = Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache)
+            self.assertFalse(bip32_ctx.IsPublicOnly())
+            self.assertEqual(ex_key, bip32_ctx.PrivateKey().ToExtended())
+        self.assertEqual(1, cache.Size())
+        self.assertEqual(2, cache.Hits())
+
+    # Test BIP44 construction
+    def test_bip44(self):
+        cache = Bip32ExKeyCache()
+        ex_key = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0).PublicKey().ToExtended()
+
+        bip84_ctxs = [Bip84.FromExtendedKey(ex_key, Bip84Coins.BITCOIN, cache) for _ in range(2)]
+        self.assertTrue(bip84_ctxs[0].Bip32Object() is bip84_ctxs[1].Bip32Object())
+        self.assertTrue(isinstance(bip84_ctxs[1].PublicKey(), Bip44PublicKey))
+        self.assertEqual(ex_key, bip84_ctxs[1].PublicKey().ToExtended())
+        self.assertEqual(1, cache.Hits())
+
+    # Test eviction
+    def test_eviction(self):
+        cache = Bip32ExKeyCache(2)
+        self.assertEqual(2, cache.MaxSize())
+        self.assertEqual(0.0, cache.HitRate())
+
+        ex_keys = [Bip32Slip10Secp256k1.FromSeedAndPath(TEST_SEED, f"m/84'/0'/{i}'").PublicKey().ToExtended()
+                   for i in range(3)]
+        for ex_key in ex_keys:
+            Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache)
+        self.assertEqual(2, cache.Size())
+        # The least recently used key was evicted
+        Bip32Slip10Secp256k1.FromExtendedKey(ex_keys[0], cache=cache)
+        self.assertEqual(0, cache.Hits())
+        Bip32Slip10Secp256k1.FromExtendedKey(ex_keys[2], cache=cache)
+        self.assertEqual(1, cache.Hits())
+
+        # Explicit eviction
+        self.assertEqual(1, cache.Evict())
+        self.assertEqual(1, cache.Size())
+        self.assertEqual(1, cache.Evict(10))
+        self.assertEqual(0, cache.Evict())
+
+        # Resize
+        for ex_key in ex_keys:
+            Bip32Slip10Secp256k1.FromExtendedKey(ex_key, cache=cache)
+        cache.Resize(1)
+        self.assertEqual(1, cache.MaxSize())
+        self.assertEqual(1, cache.Size())
+
+        # Clear
+        cache.Clear()
+        self.assertEqual(0, cache.Size())
+        self.assertEqual(0, cache.Hits())
+        self.assertEqual(0, cache.Misses())
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, Bip32ExKeyCache, 0)
+        self.assertRaises(ValueError, Bip32ExKeyCache(1).Resize, 0)
@@ -19,12 +19,13 @@
 # THE SOFTWARE.
 
 import os
+import pickle
 
 # Imports
 import random
 import unittest
 
-from bip_utils import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex
+from bip_utils import Bip32ChainCode, Bip32Depth, Bip32FingerPrint, Bip32KeyData, Bip32KeyIndex, HmacSha512
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 
 
@@ -91,6 +92,24 @@ class Bip32KeyDataTests(unittest.TestCase):
         self.assertEqual(key_data.ParentFingerPrint(), fprint)
         self.assertFalse(key_data.ParentFingerPrint().IsMasterKey())
 
+    # Test that the value types do not allocate an instance dictionary
+    def test_slots(self):
+        for obj in (Bip32Depth(0), Bip32KeyIndex(0), Bip32ChainCode(), Bip32FingerPrint(), Bip32KeyData()):
+            self.assertFalse(hasattr(obj, "__dict__"))
+            self.assertRaises(AttributeError, setattr, obj, "m_test", 0)
+
+    # Test chaincode HMAC
+    def test_chaincode_hmac(self):
+        chaincode = Bip32ChainCode(os.urandom(Bip32KeyDataConst.CHAINCODE_BYTE_LEN))
+        self.assertIs(chaincode.Hmac(), chaincode.Hmac())
+        for data_bytes in (b"", os.urandom(37), os.urandom(65)):
+            hmac = chaincode.Hmac().Copy()
+            hmac.Update(data_bytes)
+            self.assertEqual(hmac.Digest(), HmacSha512.QuickDigest(chaincode.ToBytes(), data_bytes))
+            self.assertEqual(hmac.DigestHalves(), HmacSha512.QuickDigestHalves(chaincode.ToBytes(), data_bytes))
+        # The HMAC object is not pickled
+        self.assertEqual(pickle.loads(pickle.dumps(chaincode)), chaincode)
+
     # Test for operators
     def test_operators(self):
         self.assertTrue(Bip32Depth(1) < Bip32Depth(2))
@@ -23,8 +23,8 @@ import binascii
 import unittest
 
 from bip_utils import (
-    Bip32KeyIndex, Bip32Path, Bip32PathError, Bip32PathParser, Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b,
-    Bip32Slip10Nist256p1, Bip32Slip10Secp256k1
+    Bip32DerivationCache, Bip32KeyIndex, Bip32Path, Bip32PathError, Bip32PathParser, Bip32PathTemplate,
+    Bip32Slip10Ed25519, Bip32Slip10Ed25519Blake2b, Bip32Slip10Nist256p1, Bip32Slip10Secp256k1
 )
 
 
@@ -170,6 +170,66 @@ TEST_VECT_PATH_INVALID = [
     "0/1/-1",
 ]
 
+# Tests for path templates
+TEST_VECT_PATH_TEMPLATE = [
+    {
+        "template": "m/44'/60'/{account}'/0/{index}",
+        "values": {"account": 1, "index": 17},
+        "path": "m/44'/60'/1'/0/17",
+        "prefix": "m/44'/60'",
+        "slot_names": ["account", "index"],
+        "to_str": "m/44'/60'/{account}'/0/{index}",
+    },
+    {
+        "template": "0h/{change}/{index}p/",
+        "values": {"index": 5, "change": 1},
+        "path": "0'/1/5'",
+        "prefix": "0'",
+        "slot_names": ["change", "index"],
+        "to_str": "0'/{change}/{index}'",
+    },
+    {
+        "template": "{index}",
+        "values": {"index": 2147483648},
+        "path": "2147483648",
+        "prefix": "",
+        "slot_names": ["index"],
+        "to_str": "{index}",
+    },
+    {
+        "template": "m/0'/1",
+        "values": {},
+        "path": "m/0'/1",
+        "prefix": "m/0'/1",
+        "slot_names": [],
+        "to_str": "m/0'/1",
+    },
+]
+
+# Tests for invalid path templates
+TEST_VECT_PATH_TEMPLATE_INVALID = [
+    "m/m",
+    "m/{index",
+    "m/index}",
+    "m/{}",
+    "m/{1index}",
+    "m/{index}''",
+    "m/{index}/{index}",
+    "m/a/{index}",
+    "m/0/1/4294967296/{index}",
+]
+
+# Tests for invalid path template values
+TEST_VECT_PATH_TEMPLATE_VALUES_INVALID = [
+    {},
+    {"account": 0},
+    {"account": 0, "index": 0, "change": 0},
+    {"account": 0, "change": 0},
+    {"account": -1, "index": 0},
+    {"account": 2147483648, "index": 0},
+    {"account": 0, "index": 4294967296},
+]
+
 
 #
 # Tests
@@ -213,6 +273,46 @@ class Bip32PathTests(unittest.TestCase):
             self.assertRaises(Bip32PathError, Bip32Slip10Secp256k1.FromSeed(seed).DerivePath, test)
             self.assertRaises(Bip32PathError, Bip32Slip10Secp256k1.FromSeedAndPath, seed, test)
 
+    # Test path templates
+    def test_template(self):
+        for test in TEST_VECT_PATH_TEMPLATE:
+            template = Bip32PathTemplate(test["template"])
+            path = template.Path(**test["values"])
+            exp_path = Bip32PathParser.Parse(test["path"])
+
+            self.assertEqual(exp_path.IsAbsolute(), template.IsAbsolute())
+            self.assertEqual(exp_path.IsAbsolute(), path.IsAbsolute())
+            self.assertEqual(exp_path.ToList(), path.ToList())
+            self.assertEqual(test["prefix"], template.Prefix().ToStr())
+            self.assertEqual(test["slot_names"], template.SlotNames())
+            self.assertEqual(test["to_str"], template.ToStr())
+            self.assertEqual(test["to_str"], str(template))
+
+    # Test derivation of paths built from templates
+    def test_template_derivation(self):
+        seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
+        bip32_ctx = Bip32Slip10Secp256k1.FromSeed(seed)
+        template = Bip32PathTemplate("m/44'/0'/{account}'/0/{index}")
+        cache = Bip32DerivationCache()
+
+        for account in range(2):
+            for index in range(3):
+                path_str = f"m/44'/0'/{account}'/0/{index}"
+                self.assertEqual(bip32_ctx.DerivePath(path_str).PublicKey().ToExtended(),
+                                 bip32_ctx.DerivePath(template.Path(account=account, index=index), cache)
+                                 .PublicKey().ToExtended())
+        # The constant prefix is derived only once
+        self.assertEqual(cache.Misses(), 1)
+
+    # Test invalid path templates
+    def test_invalid_templates(self):
+        for test in TEST_VECT_PATH_TEMPLATE_INVALID:
+            self.assertRaises(Bip32PathError, Bip32PathTemplate, test)
+
+        template = Bip32PathTemplate("m/44'/60'/{account}'/0/{index}")
+        for test in TEST_VECT_PATH_TEMPLATE_VALUES_INVALID:
+            self.assertRaises(Bip32PathError, template.Path, **test)
+
     # Test a path object
     def __test_path(self, test, path):
         # Check length
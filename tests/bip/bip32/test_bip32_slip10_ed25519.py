@@ -219,6 +219,26 @@ class Bip32Slip10Ed25519Tests(Bip32BaseTests):
     def test_from_pub_key(self):
         self._test_from_pub_key(Bip32Slip10Ed25519, TEST_VECT)
 
+    # Test batch derivation of child keys
+    def test_child_keys(self):
+        self._test_child_keys(Bip32Slip10Ed25519, TEST_VECT)
+
+    # Test lazy computation of public keys
+    def test_lazy_public_key(self):
+        self._test_lazy_public_key(Bip32Slip10Ed25519)
+
+    # Test iteration over child keys
+    def test_iter_children(self):
+        self._test_iter_children(Bip32Slip10Ed25519)
+
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Bip32Slip10Ed25519)
+
+    # Test invalid binary keys
+    def test_invalid_binary(self):
+        self._test_invalid_binary(Bip32Slip10Ed25519)
+
     # Test elliptic curve
     def test_elliptic_curve(self):
         self._test_elliptic_curve(Bip32Slip10Ed25519, EllipticCurveTypes.ED25519)
@@ -239,10 +259,12 @@ class Bip32Slip10Ed25519Tests(Bip32BaseTests):
         self.assertRaises(Bip32KeyError, Bip32Slip10Ed25519.FromSeedAndPath, TEST_SEED, "m/0'/1")
         self.assertRaises(Bip32KeyError, bip32_ctx.ChildKey, 0)
         self.assertRaises(Bip32KeyError, bip32_ctx.DerivePath, "0'/1")
+        self.assertRaises(Bip32KeyError, bip32_ctx.ChildKeysRange, 0, 2)
 
         # Public derivation
         bip32_ctx.ConvertToPublic()
         self.assertRaises(Bip32KeyError, bip32_ctx.ChildKey, 0)
+        self.assertRaises(Bip32KeyError, bip32_ctx.ChildKeysRange, 0, 2)
 
     # Test old class
     def test_old_cls(self):
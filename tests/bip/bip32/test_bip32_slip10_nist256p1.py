@@ -265,6 +265,30 @@ class Bip32Slip10Nist256p1Tests(Bip32BaseTests):
     def test_public_derivation_pub_key(self):
         self._test_public_derivation_pub_key(Bip32Slip10Nist256p1, TEST_VECT_PUBLIC_DER_PUB_KEY)
 
+    # Test batch derivation of child keys
+    def test_child_keys(self):
+        self._test_child_keys(Bip32Slip10Nist256p1, TEST_VECT)
+
+    # Test lazy computation of public keys
+    def test_lazy_public_key(self):
+        self._test_lazy_public_key(Bip32Slip10Nist256p1)
+
+    # Test iteration over child keys
+    def test_iter_children(self):
+        self._test_iter_children(Bip32Slip10Nist256p1)
+
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Bip32Slip10Nist256p1)
+
+    # Test invalid binary keys
+    def test_invalid_binary(self):
+        self._test_invalid_binary(Bip32Slip10Nist256p1)
+
+    # Test batch public derivation of child keys
+    def test_public_child_keys(self):
+        self._test_public_child_keys(Bip32Slip10Nist256p1, TEST_VECT_PUBLIC_DER_EX_KEY)
+
     # Test elliptic curve
     def test_elliptic_curve(self):
         self._test_elliptic_curve(Bip32Slip10Nist256p1, EllipticCurveTypes.NIST256P1)
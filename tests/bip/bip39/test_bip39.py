@@ -19,12 +19,15 @@
 # THE SOFTWARE.
 
 # Imports
+import asyncio
 import binascii
+import threading
 import unittest
+from unittest import mock
 
 from bip_utils import (
-    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39MnemonicDecoder, Bip39MnemonicGenerator,
-    Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
+    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39MnemonicBulkValidator, Bip39MnemonicDecoder,
+    Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
 )
 
 
@@ -426,8 +429,120 @@ class Bip39Tests(unittest.TestCase):
             self.assertRaises(test["exception"], Bip39MnemonicValidator(lang).Validate, test["mnemonic"])
             self.assertRaises(test["exception"], Bip39SeedGenerator, test["mnemonic"], lang)
 
+    # Test decoding multiple mnemonics at once
+    def test_decode_many(self):
+        mnemonics = [test["mnemonic"] for test in TEST_VECT]
+        entropies = [binascii.unhexlify(test["entropy"]) for test in TEST_VECT]
+
+        self.assertEqual(entropies, Bip39MnemonicDecoder().DecodeMany(mnemonics))
+        self.assertEqual([], Bip39MnemonicDecoder().DecodeMany([]))
+
+        for test in TEST_VECT_MNEMONIC_INVALID:
+            lang = test["lang"] if "lang" in test else Bip39Languages.ENGLISH
+            self.assertRaises(test["exception"], Bip39MnemonicDecoder(lang).DecodeMany, [mnemonics[0], test["mnemonic"]])
+
+    # Test validating multiple mnemonics at once
+    def test_validate_many(self):
+        # Skip mnemonics that are invalid only for a specific language, since the language is automatically detected
+        invalid_mnemonics = [test["mnemonic"] for test in TEST_VECT_MNEMONIC_INVALID if test.get("lang") is None]
+        mnemonics = [test["mnemonic"] for test in TEST_VECT] + invalid_mnemonics
+
+        self.assertEqual(
+            [True] * len(TEST_VECT) + [False] * len(invalid_mnemonics),
+            [result.valid for result in Bip39MnemonicBulkValidator().Validate(mnemonics)]
+        )
+        self.assertEqual([], list(Bip39MnemonicBulkValidator().Validate([])))
+
+    # Test generating multiple seeds at once
+    def test_generate_many(self):
+        test_vect = [test for test in TEST_VECT if "lang" not in test]
+        mnemonics = [test["mnemonic"] for test in test_vect]
+        seeds = [binascii.unhexlify(test["seed"]) for test in test_vect]
+
+        for worker_num in (None, 1, 4):
+            self.assertEqual(seeds, Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, worker_num=worker_num))
+            self.assertEqual(
+                seeds,
+                Bip39SeedGenerator.GenerateMany(mnemonics, [TEST_PASSPHRASE] * len(mnemonics), worker_num=worker_num)
+            )
+            self.assertEqual(
+                seeds,
+                asyncio.run(Bip39SeedGenerator.GenerateManyAsync(mnemonics, TEST_PASSPHRASE, worker_num=worker_num))
+            )
+        self.assertEqual([], Bip39SeedGenerator.GenerateMany([]))
+
+        # Different passphrases
+        self.assertEqual(
+            [Bip39SeedGenerator(mnemonics[0]).Generate(), Bip39SeedGenerator(mnemonics[1]).Generate("test")],
+            Bip39SeedGenerator.GenerateMany(mnemonics[:2], ["", "test"])
+        )
+
+        # Invalid mnemonics
+        for test in TEST_VECT_MNEMONIC_INVALID:
+            lang = test["lang"] if "lang" in test else Bip39Languages.ENGLISH
+            self.assertRaises(test["exception"], Bip39SeedGenerator.GenerateMany, mnemonics + [test["mnemonic"]], "", lang)
+            self.assertRaises(test["exception"], asyncio.run,
+                              Bip39SeedGenerator.GenerateManyAsync([test["mnemonic"]], "", lang))
+
+        # Validation does not block the event loop
+        self.__test_generate_many_async_validation(mnemonics)
+        # Cancellation does not wait for the running seeds
+        self.__test_generate_many_async_cancel(mnemonics)
+
+        # Invalid parameters
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics, [TEST_PASSPHRASE])
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics, "", None, 0)
+
     # Tests invalid parameters
     def test_invalid_params(self):
         self.assertRaises(TypeError, Bip39MnemonicGenerator, 0)
         self.assertRaises(TypeError, Bip39MnemonicValidator, 0)
         self.assertRaises(TypeError, Bip39SeedGenerator, "", 0)
+
+    # Test that the asynchronous seeds generation validates the mnemonics outside the event loop thread
+    def __test_generate_many_async_validation(self, mnemonics):
+        validate_threads = []
+        validate = Bip39MnemonicValidator.Validate
+
+        def validate_mnemonic(validator, mnemonic):
+            validate_threads.append(threading.get_ident())
+            return validate(validator, mnemonic)
+
+        async def generate():
+            return threading.get_ident(), await Bip39SeedGenerator.GenerateManyAsync(mnemonics, worker_num=1)
+
+        with mock.patch.object(Bip39MnemonicValidator, "Validate", autospec=True, side_effect=validate_mnemonic):
+            loop_thread, seeds = asyncio.run(generate())
+        self.assertEqual(len(seeds), len(mnemonics))
+        self.assertEqual(len(validate_threads), len(mnemonics))
+        self.assertNotIn(loop_thread, validate_threads)
+
+    # Test that cancelling the asynchronous seeds generation does not wait for the running seeds
+    def __test_generate_many_async_cancel(self, mnemonics):
+        started = threading.Event()
+        release = threading.Event()
+        finished = []
+
+        def generate_seed(mnemonic_str, passphrase):
+            started.set()
+            release.wait(10)
+            finished.append(mnemonic_str)
+            return b""
+
+        async def generate_and_cancel():
+            task = asyncio.ensure_future(Bip39SeedGenerator.GenerateManyAsync(mnemonics, worker_num=1))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with mock.patch.object(Bip39SeedGenerator, "_Bip39SeedGenerator__GenerateSeed",
+                               side_effect=generate_seed) as generate_seed_mock:
+            try:
+                asyncio.run(generate_and_cancel())
+                # The running seed is still blocked, the other ones are never started
+                self.assertEqual(finished, [])
+            finally:
+                release.set()
+            self.assertEqual(generate_seed_mock.call_count, 1)
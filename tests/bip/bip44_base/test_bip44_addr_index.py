@@ -0,0 +1,236 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bip_utils import (
+    Bip32Secp256k1, Bip44AddrIndex, Bip44AddrIndexWriter, Bip44Changes, Bip84, Bip84Coins, P2PKHAddrDecoder,
+    P2WPKHAddrDecoder
+)
+from bip_utils.bip.bip44_base.bip44_addr_index import _Bip44AddrIndexUtils
+from bip_utils.bip.conf.bip44 import Bip44Conf
+
+
+# Seed for testing
+TEST_SEED = b"\x00" * 64
+
+
+#
+# Tests
+#
+class Bip44AddrIndexTests(unittest.TestCase):
+    # Set up test
+    def setUp(self):
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+        self.m_file_path = os.path.join(self.m_tmp_dir.name, "addr.idx")
+        self.m_acc_ctx = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0)
+
+    # Tear down test
+    def tearDown(self):
+        self.m_tmp_dir.cleanup()
+
+    # Test BIP44 addresses
+    def test_bip44(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 50)
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_INT, 0, 10)
+        self.assertEqual(writer.PendingNum(), 60)
+        writer.Flush()
+        self.assertEqual(writer.PendingNum(), 0)
+
+        index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        try:
+            self.assertEqual(index.KeyLength(), 20)
+            self.assertEqual(index.PathLength(), 3)
+            self.assertEqual(index.SegmentsNum(), 1)
+            self.assertEqual(index.RecordsNum(), 60)
+            for change_type, stop in ((Bip44Changes.CHAIN_EXT, 50), (Bip44Changes.CHAIN_INT, 10)):
+                for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(change_type, 0, stop):
+                    self.assertEqual(index.Lookup(addr), (0, int(change_type), addr_idx))
+            # Not indexed address
+            addr = self.m_acc_ctx.Change(Bip44Changes.CHAIN_EXT).AddressIndex(50).PublicKey().ToAddress()
+            self.assertIsNone(index.Lookup(addr))
+            # Invalid address
+            self.assertRaises(ValueError, index.Lookup, "invalid")
+        finally:
+            index.Close()
+
+    # Test incremental writing and compaction
+    def test_incremental(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 20)
+        writer.Flush()
+        # Flushing without pending addresses shall not add segments
+        writer.Flush()
+
+        # Reopen the file and extend it, also overwriting an address
+        addr_0 = self.m_acc_ctx.Change(Bip44Changes.CHAIN_EXT).AddressIndex(0).PublicKey().ToAddress()
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 20, 40)
+        writer.AddAddress(addr_0, (5, 6, 7))
+        writer.Flush()
+
+        index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        try:
+            self.assertEqual(index.SegmentsNum(), 2)
+            self.assertEqual(index.RecordsNum(), 41)
+            self.assertEqual(index.Lookup(addr_0), (5, 6, 7))
+            for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 1, 40):
+                self.assertEqual(index.Lookup(addr), (0, 0, addr_idx))
+        finally:
+            index.Close()
+
+        writer.Compact()
+
+        index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        try:
+            self.assertEqual(index.SegmentsNum(), 1)
+            self.assertEqual(index.RecordsNum(), 40)
+            self.assertEqual(index.Lookup(addr_0), (5, 6, 7))
+            for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 1, 40):
+                self.assertEqual(index.Lookup(addr), (0, 0, addr_idx))
+        finally:
+            index.Close()
+
+    # Test automatic flushing
+    def test_auto_flush(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, max_pending=8, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 20)
+        self.assertEqual(writer.PendingNum(), 4)
+        writer.Flush()
+
+        index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        try:
+            self.assertEqual(index.SegmentsNum(), 3)
+            self.assertEqual(index.RecordsNum(), 20)
+            for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, 20):
+                self.assertEqual(index.Lookup(addr), (0, 0, addr_idx))
+        finally:
+            index.Close()
+
+        # No limit
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, max_pending=None, max_segments=None,
+                                      hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_INT, 0, 20)
+        self.assertEqual(writer.PendingNum(), 20)
+
+    # Test automatic compaction
+    def test_auto_compact(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, max_pending=4, max_segments=3, hrp="bc")
+        for start, exp_seg_num in ((0, 1), (4, 2), (8, 3), (12, 1), (16, 2)):
+            writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, start, start + 4)
+
+            index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+            try:
+                self.assertEqual(index.SegmentsNum(), exp_seg_num)
+                self.assertEqual(index.RecordsNum(), start + 4)
+                for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, start + 4):
+                    self.assertEqual(index.Lookup(addr), (0, 0, addr_idx))
+            finally:
+                index.Close()
+
+    # Test interrupted flushing
+    def test_flush_error(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 10)
+        writer.Flush()
+        with open(self.m_file_path, "rb") as fin:
+            file_bytes = fin.read()
+
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 10, 20)
+        with mock.patch.object(_Bip44AddrIndexUtils, "WriteSegments", side_effect=OSError("Disk full")):
+            self.assertRaises(OSError, writer.Flush)
+        # The file is left as it was and the addresses are still pending
+        with open(self.m_file_path, "rb") as fin:
+            self.assertEqual(fin.read(), file_bytes)
+        self.assertEqual(writer.PendingNum(), 10)
+
+        writer.Flush()
+        index = Bip44AddrIndex(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        try:
+            self.assertEqual(index.SegmentsNum(), 2)
+            for addr_idx, _, addr in self.m_acc_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, 20):
+                self.assertEqual(index.Lookup(addr), (0, 0, addr_idx))
+        finally:
+            index.Close()
+
+    # Test BIP32 addresses
+    def test_bip32(self):
+        bip32_ctx = Bip32Secp256k1.FromSeed(TEST_SEED).DerivePath("m/0'/1/2")
+        coin_conf = Bip44Conf.BitcoinMainNet
+
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2PKHAddrDecoder, path_len=4,
+                                      net_ver=coin_conf.AddrParams()["net_ver"])
+        writer.AddBip32Addresses(bip32_ctx, coin_conf, 0, 10, (0x80000000, 1, 2))
+        writer.AddBip32Addresses(bip32_ctx, coin_conf, 10, 20, (0x80000000, 1, 2))
+        writer.Flush()
+        # BIP44 addresses require a path length of 3
+        self.assertRaises(ValueError, writer.AddBip44Addresses, self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 1)
+
+        index = Bip44AddrIndex(self.m_file_path, P2PKHAddrDecoder, net_ver=coin_conf.AddrParams()["net_ver"])
+        try:
+            self.assertEqual(index.PathLength(), 4)
+            for i in range(20):
+                addr = Bip44Conf.BitcoinMainNet.AddrClass().EncodeKey(
+                    bip32_ctx.ChildKey(i).PublicKey().KeyObject(), **coin_conf.AddrParams()
+                )
+                self.assertEqual(index.Lookup(addr), (0x80000000, 1, 2, i))
+        finally:
+            index.Close()
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, Bip44AddrIndexWriter, self.m_file_path, P2WPKHAddrDecoder, 0)
+        self.assertRaises(ValueError, Bip44AddrIndexWriter, self.m_file_path, P2WPKHAddrDecoder, 256)
+
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        addr = self.m_acc_ctx.Change(Bip44Changes.CHAIN_EXT).AddressIndex(0).PublicKey().ToAddress()
+        self.assertRaises(ValueError, writer.AddAddress, addr, (0, 0))
+        self.assertRaises(ValueError, writer.AddAddress, addr, (0, 0, -1))
+        self.assertRaises(ValueError, writer.AddAddress, addr, (0, 0, 2**32))
+        self.assertRaises(ValueError, writer.AddAddress, "invalid", (0, 0, 0))
+        writer.AddAddress(addr, (0, 0, 0))
+        writer.Flush()
+
+        # Path length not matching the existing file
+        self.assertRaises(ValueError, Bip44AddrIndexWriter, self.m_file_path, P2WPKHAddrDecoder, 4, hrp="bc")
+        # Invalid maximum number of pending addresses
+        self.assertRaises(ValueError, Bip44AddrIndexWriter, self.m_file_path, P2WPKHAddrDecoder, 3, 0, hrp="bc")
+        # Invalid maximum number of segments
+        self.assertRaises(ValueError, Bip44AddrIndexWriter, self.m_file_path, P2WPKHAddrDecoder, 3, 10, 0, hrp="bc")
+
+    # Test invalid files
+    def test_invalid_file(self):
+        writer = Bip44AddrIndexWriter(self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
+        writer.AddBip44Addresses(self.m_acc_ctx, Bip44Changes.CHAIN_EXT, 0, 5)
+        writer.Flush()
+        with open(self.m_file_path, "rb") as fin:
+            file_bytes = fin.read()
+
+        for invalid_bytes in (b"BUA", b"XXXX" + file_bytes[4:], file_bytes[:4] + b"\x01" + file_bytes[5:],
+                              file_bytes[:-1], file_bytes[:12], file_bytes[:8] + file_bytes[-16:],
+                              file_bytes[:-16] + b"\x00" * 16):
+            with open(self.m_file_path, "wb") as fout:
+                fout.write(invalid_bytes)
+            self.assertRaises(ValueError, Bip44AddrIndex, self.m_file_path, P2WPKHAddrDecoder, hrp="bc")
@@ -20,6 +20,8 @@
 
 # Imports
 import binascii
+import copy
+import pickle
 import unittest
 
 from bip_utils import (
@@ -263,6 +265,63 @@ class Bip44BaseTests(unittest.TestCase):
         # Invalid parameter
         self.assertRaises(TypeError, bip_ctx.IsLevel, 0)
 
+    # Test iteration over addresses
+    def _test_iter_addresses(self, bip_class, bip_coin, test_seed_bytes):
+        bip_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin).Purpose().Coin().Account(0)
+        for change_type in Bip44Changes:
+            addrs = list(bip_ctx.IterAddresses(change_type, 2, 6))
+            self.assertEqual([addr_idx for addr_idx, _, _ in addrs], list(range(2, 6)))
+            for addr_idx, pub_key_bytes, addr in addrs:
+                bip_addr_ctx = bip_ctx.Change(change_type).AddressIndex(addr_idx)
+                self.assertEqual(bip_addr_ctx.PublicKey().RawCompressed().ToBytes(), pub_key_bytes)
+                self.assertEqual(bip_addr_ctx.PublicKey().ToAddress(), addr)
+        # From public account key
+        bip_pub_ctx = bip_class.FromExtendedKey(bip_ctx.PublicKey().ToExtended(), bip_coin)
+        self.assertEqual(list(bip_pub_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, 3)),
+                         list(bip_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, 3)))
+        # From change level
+        self.assertEqual(list(bip_ctx.Change(Bip44Changes.CHAIN_INT).IterChangeAddresses(2, 6)),
+                         list(bip_ctx.IterAddresses(Bip44Changes.CHAIN_INT, 2, 6)))
+
+        # Invalid parameters
+        self.assertRaises(TypeError, list, bip_ctx.IterAddresses(0, 0, 1))
+        bip_chg_ctx = bip_ctx.Change(Bip44Changes.CHAIN_EXT)
+        self.assertRaises(Bip44DepthError, list, bip_chg_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 0, 1))
+        self.assertRaises(ValueError, list, bip_ctx.IterAddresses(Bip44Changes.CHAIN_EXT, 1, 0))
+        self.assertRaises(Bip44DepthError, list, bip_ctx.IterChangeAddresses(0, 1))
+        self.assertRaises(ValueError, list, bip_chg_ctx.IterChangeAddresses(1, 0))
+
+    # Test binary serialization and pickling
+    def _test_binary(self, bip_class, bip_coin, test_seed_bytes):
+        bip_ctx = bip_class.FromSeed(test_seed_bytes, bip_coin).Purpose().Coin().Account(0)
+        bip_pub_ctx = bip_class.FromExtendedKey(bip_ctx.PublicKey().ToExtended(), bip_coin)
+
+        for ctx in (bip_ctx, bip_pub_ctx):
+            loaded_ctxs = [bip_class.FromBinary(ctx.ToBinary(), bip_coin),
+                           bip_class.FromBinary(ctx.ToBinary(), bip_coin, True),
+                           # Default implementation of the base class
+                           super(bip_class, bip_class).FromBinary(ctx.ToBinary(), bip_coin),
+                           pickle.loads(pickle.dumps(ctx))]
+            for loaded_ctx in loaded_ctxs:
+                self.assertTrue(type(loaded_ctx) is bip_class)
+                self.assertEqual(loaded_ctx.IsPublicOnly(), ctx.IsPublicOnly())
+                self.assertEqual(loaded_ctx.Level(), Bip44Levels.ACCOUNT)
+                self.assertEqual(loaded_ctx.CoinConf().CoinNames().Name(), ctx.CoinConf().CoinNames().Name())
+                self.assertEqual(loaded_ctx.PublicKey().ToExtended(), ctx.PublicKey().ToExtended())
+
+            # The coin type is pickled instead of the coin configuration
+            self.assertTrue(pickle.loads(pickle.dumps(ctx)).CoinConf() is ctx.CoinConf())
+            self.assertTrue(len(pickle.dumps(ctx)) < len(pickle.dumps(ctx.CoinConf())))
+            # Custom coin configurations are pickled entirely
+            custom_ctx = bip_class(ctx.Bip32Object(), copy.copy(ctx.CoinConf()))
+            loaded_ctx = pickle.loads(pickle.dumps(custom_ctx))
+            self.assertEqual(loaded_ctx.CoinConf().CoinNames().Name(), ctx.CoinConf().CoinNames().Name())
+            self.assertEqual(loaded_ctx.PublicKey().ToExtended(), ctx.PublicKey().ToExtended())
+
+        # Depth is checked also for binary keys
+        self.assertRaises(Bip44DepthError, bip_class.FromBinary,
+                          bip_ctx.Bip32Object().DerivePath("0/0/0").ToBinary(), bip_coin)
+
     # Test different key formats
     def _test_key_formats(self, bip_class, test_data):
         # Create from seed
@@ -295,11 +354,13 @@ class Bip44BaseTests(unittest.TestCase):
         # Exception: construct from invalid type
         self.assertRaises(TypeError, bip_class.FromSeed, b"", 0)
         self.assertRaises(TypeError, bip_class.FromExtendedKey, "", 0)
+        self.assertRaises(TypeError, bip_class.FromBinary, b"", 0)
         self.assertRaises(TypeError, bip_class.FromPrivateKey, b"", 0)
 
         for coin in test_coins:
             self.assertRaises(TypeError, bip_class.FromSeed, b"", coin)
             self.assertRaises(TypeError, bip_class.FromExtendedKey, "", coin)
+            self.assertRaises(TypeError, bip_class.FromBinary, b"", coin)
             self.assertRaises(TypeError, bip_class.FromPrivateKey, b"", coin)
 
     # Test invalid path derivations
@@ -0,0 +1,131 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+from unittest import mock
+
+from bip_utils import Bip44Changes, Bip44DepthError, Bip44GapScanner, Bip84, Bip84Coins
+
+
+# Seed for testing
+TEST_SEED = b"\x00" * 64
+
+# Tests for scanning (used indexes for each change type and expected results)
+TEST_VECT = [
+    {
+        "gap_limit": 20,
+        "used": {
+            Bip44Changes.CHAIN_EXT: [0, 3, 22, 45],
+            Bip44Changes.CHAIN_INT: [],
+        },
+        "used_indexes": {
+            Bip44Changes.CHAIN_EXT: [0, 3, 22],
+            Bip44Changes.CHAIN_INT: [],
+        },
+        "next_free_index": {
+            Bip44Changes.CHAIN_EXT: 23,
+            Bip44Changes.CHAIN_INT: 0,
+        },
+        "scanned_num": {
+            Bip44Changes.CHAIN_EXT: 43,
+            Bip44Changes.CHAIN_INT: 20,
+        },
+    },
+    {
+        "gap_limit": 1,
+        "used": {
+            Bip44Changes.CHAIN_EXT: [0, 1, 3],
+            Bip44Changes.CHAIN_INT: [1],
+        },
+        "used_indexes": {
+            Bip44Changes.CHAIN_EXT: [0, 1],
+            Bip44Changes.CHAIN_INT: [],
+        },
+        "next_free_index": {
+            Bip44Changes.CHAIN_EXT: 2,
+            Bip44Changes.CHAIN_INT: 0,
+        },
+        "scanned_num": {
+            Bip44Changes.CHAIN_EXT: 3,
+            Bip44Changes.CHAIN_INT: 1,
+        },
+    },
+]
+
+
+#
+# Tests
+#
+class Bip44GapScannerTests(unittest.TestCase):
+    # Test scanning
+    def test_scan(self):
+        bip44_acc_ctx = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).Purpose().Coin().Account(0)
+        bip44_pub_acc_ctx = Bip84.FromExtendedKey(bip44_acc_ctx.PublicKey().ToExtended(), Bip84Coins.BITCOIN)
+
+        for test in TEST_VECT:
+            used_addrs = {
+                bip44_acc_ctx.Change(change_type).AddressIndex(addr_idx).PublicKey().ToAddress()
+                for change_type, addr_indexes in test["used"].items()
+                for addr_idx in addr_indexes
+            }
+
+            # Set of used addresses
+            for bip_obj in (bip44_acc_ctx, bip44_pub_acc_ctx):
+                results = Bip44GapScanner(bip_obj, used_addrs, test["gap_limit"]).ScanAll()
+                self.__test_results(test, results)
+
+            # Function
+            checked_addrs = []
+
+            def is_used(addr):
+                checked_addrs.append(addr)
+                return addr in used_addrs
+
+            scanner = Bip44GapScanner(bip44_acc_ctx, is_used, test["gap_limit"])
+            self.assertEqual(scanner.GapLimit(), test["gap_limit"])
+            results = {change_type: scanner.Scan(change_type) for change_type in Bip44Changes}
+            self.__test_results(test, results)
+            # Each address shall be checked only once
+            self.assertEqual(len(checked_addrs), len(set(checked_addrs)))
+            self.assertEqual(len(checked_addrs), sum(test["scanned_num"].values()))
+
+            # The change key shall be derived only once for each scan, regardless of the number of windows
+            with mock.patch.object(bip44_acc_ctx, "Change", wraps=bip44_acc_ctx.Change) as change_mock:
+                Bip44GapScanner(bip44_acc_ctx, used_addrs, test["gap_limit"]).ScanAll()
+            self.assertEqual(change_mock.call_count, len(Bip44Changes))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip44_mst_ctx = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN)
+        bip44_acc_ctx = bip44_mst_ctx.Purpose().Coin().Account(0)
+
+        self.assertRaises(Bip44DepthError, Bip44GapScanner, bip44_mst_ctx, set())
+        self.assertRaises(Bip44DepthError, Bip44GapScanner, bip44_acc_ctx.Change(Bip44Changes.CHAIN_EXT), set())
+        self.assertRaises(ValueError, Bip44GapScanner, bip44_acc_ctx, set(), 0)
+        self.assertRaises(TypeError, Bip44GapScanner(bip44_acc_ctx, set()).Scan, 0)
+
+    # Test results
+    def __test_results(self, test, results):
+        self.assertEqual(set(results.keys()), set(Bip44Changes))
+        for change_type, result in results.items():
+            self.assertEqual(result.UsedIndexes(), test["used_indexes"][change_type])
+            self.assertEqual(result.NextFreeIndex(), test["next_free_index"][change_type])
+            self.assertEqual(result.ScannedNum(), test["scanned_num"][change_type])
@@ -0,0 +1,119 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils import (
+    Bip32KeyError, Bip32KeyIndex, Bip32PathError, Bip32PathTemplate, Bip44, Bip44Coins, Bip44Conf, Bip44ParallelDeriver,
+    Bip44PublicKey
+)
+
+
+# Seed for testing
+TEST_SEED = b"\x00" * 64
+
+# Tests for parallel derivation
+TEST_VECT = [
+    # Public derivation from account key
+    {
+        "coin": Bip44Coins.BITCOIN,
+        "conf": Bip44Conf.BitcoinMainNet,
+        "public": True,
+        "path_template": "0/{index}",
+        "is_hardened": False,
+    },
+    # Hardened derivation from account key (ed25519 only supports hardened derivation)
+    {
+        "coin": Bip44Coins.ALGORAND,
+        "conf": Bip44Conf.Algorand,
+        "public": False,
+        "path_template": "0'/{index}'",
+        "is_hardened": True,
+    },
+    # Non-hardened derivation from account private key
+    {
+        "coin": Bip44Coins.CARDANO_BYRON_ICARUS,
+        "conf": Bip44Conf.CardanoByronIcarus,
+        "public": False,
+        "path_template": "0/{index}",
+        "is_hardened": False,
+    },
+]
+
+
+#
+# Tests
+#
+class Bip44ParallelDeriverTests(unittest.TestCase):
+    # Test derivation
+    def test_derive(self):
+        for test in TEST_VECT:
+            bip44_acc_ctx = Bip44.FromSeed(TEST_SEED, test["coin"]).Purpose().Coin().Account(0)
+            ex_key = (bip44_acc_ctx.PublicKey().ToExtended()
+                      if test["public"]
+                      else bip44_acc_ctx.PrivateKey().ToExtended())
+
+            # Expected results
+            bip32_chg_ctx = bip44_acc_ctx.Bip32Object().DerivePath(test["path_template"].split("/")[0])
+            expected = []
+            for i in range(5, 12):
+                index = Bip32KeyIndex.HardenIndex(i) if test["is_hardened"] else i
+                pub_key = Bip44PublicKey(bip32_chg_ctx.ChildKey(index).PublicKey(), test["conf"])
+                expected.append((i, pub_key.RawCompressed().ToBytes(), pub_key.ToAddress()))
+
+            # Same results regardless of chunk size and number of workers
+            for chunk_size, worker_num in ((1, 1), (3, 1), (100, 1), (2, 2)):
+                deriver = Bip44ParallelDeriver(ex_key,
+                                               test["conf"],
+                                               test["path_template"],
+                                               chunk_size=chunk_size,
+                                               worker_num=worker_num)
+                self.assertEqual(list(deriver.Derive(5, 12)), expected)
+                self.assertEqual(list(deriver.Derive(5, 5)), [])
+
+            # Same results with a path template object
+            deriver = Bip44ParallelDeriver(ex_key,
+                                           test["conf"],
+                                           Bip32PathTemplate(test["path_template"]),
+                                           worker_num=1)
+            self.assertEqual(list(deriver.Derive(5, 12)), expected)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip44_acc_ctx = Bip44.FromSeed(TEST_SEED, Bip44Coins.BITCOIN).Purpose().Coin().Account(0)
+        ex_pub = bip44_acc_ctx.PublicKey().ToExtended()
+
+        for path_template in ("", "0", "0/1", "{index}/0", "0/{a}/{b}", "0/{index}x", "0/a/{index}", "0/*"):
+            self.assertRaises(Bip32PathError, Bip44ParallelDeriver, ex_pub, Bip44Conf.BitcoinMainNet, path_template)
+        self.assertRaises(ValueError, Bip44ParallelDeriver, ex_pub, Bip44Conf.BitcoinMainNet, "0/{index}", 0)
+        self.assertRaises(ValueError, Bip44ParallelDeriver, ex_pub, Bip44Conf.BitcoinMainNet, "0/{index}", 1, 0)
+        # Absolute path from a child key
+        self.assertRaises(ValueError, Bip44ParallelDeriver, ex_pub, Bip44Conf.BitcoinMainNet, "m/0/{index}")
+        # Hardened derivation from a public key
+        self.assertRaises(Bip32KeyError, Bip44ParallelDeriver, ex_pub, Bip44Conf.BitcoinMainNet, "0'/{index}")
+
+        deriver = Bip44ParallelDeriver(ex_pub, Bip44Conf.BitcoinMainNet, "0/{index}", worker_num=1)
+        self.assertRaises(ValueError, list, deriver.Derive(-1, 0))
+        self.assertRaises(ValueError, list, deriver.Derive(1, 0))
+        self.assertRaises(ValueError, list, deriver.Derive(0, 2**31 + 1))
+        # Hardened derivation from a public key
+        deriver = Bip44ParallelDeriver(ex_pub, Bip44Conf.BitcoinMainNet, "0/{index}'", worker_num=1)
+        self.assertRaises(Bip32KeyError, list, deriver.Derive(0, 1))
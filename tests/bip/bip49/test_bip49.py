@@ -754,6 +754,14 @@ class Bip49Tests(Bip44BaseTests):
     def test_is_level(self):
         self._test_is_level(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
 
+    # Test iteration over addresses
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Bip49, Bip49Coins.BITCOIN, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         self._test_key_formats(Bip49, TEST_VECT_KEY_FORMATS)
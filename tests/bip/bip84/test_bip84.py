@@ -246,6 +246,14 @@ class Bip84Tests(Bip44BaseTests):
     def test_is_level(self):
         self._test_is_level(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
 
+    # Test iteration over addresses
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Bip84, Bip84Coins.BITCOIN, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         self._test_key_formats(Bip84, TEST_VECT_KEY_FORMATS)
@@ -183,6 +183,14 @@ class Bip86Tests(Bip44BaseTests):
     def test_is_level(self):
         self._test_is_level(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
 
+    # Test iteration over addresses
+    def test_iter_addresses(self):
+        self._test_iter_addresses(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Bip86, Bip86Coins.BITCOIN, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         self._test_key_formats(Bip86, TEST_VECT_KEY_FORMATS)
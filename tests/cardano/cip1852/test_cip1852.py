@@ -192,6 +192,10 @@ class Cip1852Tests(Bip44BaseTests):
     def test_is_level(self):
         self._test_is_level(Cip1852, Cip1852Coins.CARDANO_ICARUS, TEST_SEED)
 
+    # Test binary serialization
+    def test_binary(self):
+        self._test_binary(Cip1852, Cip1852Coins.CARDANO_ICARUS, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         self._test_key_formats(Cip1852, TEST_VECT_KEY_FORMATS)
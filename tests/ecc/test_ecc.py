@@ -33,12 +33,28 @@ from bip_utils import (
     DataBytes, Ed25519, Ed25519Blake2b, Ed25519Blake2bPoint, Ed25519Blake2bPrivateKey, Ed25519Blake2bPublicKey,
     Ed25519Kholaw, Ed25519KholawPoint, Ed25519KholawPrivateKey, Ed25519KholawPublicKey, Ed25519Monero,
     Ed25519MoneroPoint, Ed25519MoneroPrivateKey, Ed25519MoneroPublicKey, Ed25519Point, Ed25519PrivateKey,
-    Ed25519PublicKey, EllipticCurveGetter, EllipticCurveTypes, Nist256p1, Nist256p1Point, Nist256p1PrivateKey,
+    Ed25519PublicKey, EllipticCurveBackends, EllipticCurveGetter, EllipticCurveTypes, Nist256p1, Nist256p1Point, Nist256p1PrivateKey,
     Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey, Sr25519, Sr25519Point,
     Sr25519PrivateKey, Sr25519PublicKey
 )
-from bip_utils.ecc.conf import EccConf
-from bip_utils.utils.misc import IntegerUtils
+from bip_utils.ecc.nist256p1.nist256p1_const import Nist256p1Const
+from bip_utils.ecc.secp256k1.lib import secp256k1_lib
+from bip_utils.ecc.secp256k1.secp256k1_keys_python import Secp256k1PointPython
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
+
+
+# Underlying object classes of the secp256k1 backends (public key, private key, point)
+SECP256K1_UNDERLYING_CLASSES = {
+    "coincurve": (coincurve.PublicKey, coincurve.PrivateKey, coincurve.PublicKey),
+    "python": (tuple, int, tuple),
+    "ecdsa": (ecdsa.VerifyingKey, ecdsa.SigningKey, ellipticcurve.PointJacobi),
+}[EllipticCurveBackends.ActiveName(EllipticCurveTypes.SECP256K1)]
+
+# cryptography is optional
+NIST256P1_USE_CRYPTOGRAPHY = (EllipticCurveBackends.ActiveName(EllipticCurveTypes.NIST256P1)
+                              == Nist256p1Const.BACKEND_CRYPTOGRAPHY)
+if NIST256P1_USE_CRYPTOGRAPHY:
+    from cryptography.hazmat.primitives.asymmetric import ec
 
 
 # ed25519 order and generator
@@ -306,6 +322,15 @@ class EccTests(unittest.TestCase):
         self.assertEqual(point.Y(), TEST_ED25519_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_ED25519_POINT_DEC_BYTES)
 
+        # Points known to lie on the curve
+        point_enc = Ed25519Point(TEST_ED25519_POINT_ENC_BYTES) + point + Ed25519.Generator()
+        self.assertTrue(point.IsOnCurve())
+        self.assertTrue(point_enc.IsOnCurve())
+        self.assertTrue(Ed25519Point(TEST_ED25519_POINT_ENC_BYTES).IsOnCurve())
+        point_invalid = Ed25519Point(binascii.unhexlify(TEST_VECT_ED25519_PUB_KEY_INVALID[0]))
+        self.assertFalse(point_invalid.IsOnCurve())
+        self.assertRaises(ValueError, Ed25519PublicKey.FromPoint, point_invalid)
+
     # Test Ed25519-Blake2b class
     def test_ed25519_blake2b(self):
         # Curve
@@ -446,7 +471,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(pub_key.RawCompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.RawUncompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.Point(), Nist256p1Point))
-        self.assertTrue(isinstance(pub_key.UnderlyingObject(), ecdsa.VerifyingKey))
+        self.assertTrue(isinstance(pub_key.UnderlyingObject(), ec.EllipticCurvePublicKey if NIST256P1_USE_CRYPTOGRAPHY else ecdsa.VerifyingKey))
         self.assertEqual(pub_key.RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
         self.assertEqual(pub_key.RawUncompressed().ToBytes(), TEST_NIST256P1_UNCOMPR_PUB_KEY_BYTES)
         # From uncompressed
@@ -469,7 +494,7 @@ class EccTests(unittest.TestCase):
         priv_key = Nist256p1PrivateKey.FromBytes(TEST_NIST256P1_PRIV_KEY_BYTES)
         self.assertTrue(isinstance(priv_key.Raw(), DataBytes))
         self.assertTrue(isinstance(priv_key.PublicKey(), Nist256p1PublicKey))
-        self.assertTrue(isinstance(priv_key.UnderlyingObject(), ecdsa.SigningKey))
+        self.assertTrue(isinstance(priv_key.UnderlyingObject(), ec.EllipticCurvePrivateKey if NIST256P1_USE_CRYPTOGRAPHY else ecdsa.SigningKey))
         self.assertEqual(priv_key.Raw().ToBytes(), TEST_NIST256P1_PRIV_KEY_BYTES)
         self.assertEqual(priv_key.PublicKey().RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
 
@@ -483,7 +508,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(point.Raw(), DataBytes))
         self.assertTrue(isinstance(point.RawDecoded(), DataBytes))
         self.assertTrue(isinstance(point.RawEncoded(), DataBytes))
-        self.assertTrue(isinstance(point.UnderlyingObject(), ellipticcurve.PointJacobi))
+        self.assertTrue(isinstance(point.UnderlyingObject(), ec.EllipticCurvePublicKey if NIST256P1_USE_CRYPTOGRAPHY else ellipticcurve.PointJacobi))
         self.assertEqual(point.X(), TEST_NIST256P1_POINT_COORD["x"])
         self.assertEqual(point.Y(), TEST_NIST256P1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_NIST256P1_POINT_DEC_BYTES)
@@ -505,6 +530,10 @@ class EccTests(unittest.TestCase):
         self.assertEqual(point_mul.X(), TEST_NIST256P1_POINT_COORD_MUL["x"])
         self.assertEqual(point_mul.Y(), TEST_NIST256P1_POINT_COORD_MUL["y"])
 
+        # Generator multiplication
+        point_mul = Nist256p1.Generator() * BytesUtils.ToInteger(TEST_NIST256P1_PRIV_KEY_BYTES)
+        self.assertEqual(point_mul.RawEncoded().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
+
         # From bytes
         point = Nist256p1Point.FromBytes(TEST_NIST256P1_POINT_DEC_BYTES)
         self.assertEqual(point.X(), TEST_NIST256P1_POINT_COORD["x"])
@@ -539,7 +568,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(pub_key.RawCompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.RawUncompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.Point(), Secp256k1Point))
-        self.assertTrue(isinstance(pub_key.UnderlyingObject(), coincurve.PublicKey if EccConf.USE_COINCURVE else ecdsa.VerifyingKey))
+        self.assertTrue(isinstance(pub_key.UnderlyingObject(), SECP256K1_UNDERLYING_CLASSES[0]))
         self.assertEqual(pub_key.RawCompressed().ToBytes(), TEST_SECP256K1_COMPR_PUB_KEY_BYTES)
         self.assertEqual(pub_key.RawUncompressed().ToBytes(), TEST_SECP256K1_UNCOMPR_PUB_KEY_BYTES)
         # From uncompressed
@@ -562,7 +591,7 @@ class EccTests(unittest.TestCase):
         priv_key = Secp256k1PrivateKey.FromBytes(TEST_SECP256K1_PRIV_KEY_BYTES)
         self.assertTrue(isinstance(priv_key.Raw(), DataBytes))
         self.assertTrue(isinstance(priv_key.PublicKey(), Secp256k1PublicKey))
-        self.assertTrue(isinstance(priv_key.UnderlyingObject(), coincurve.PrivateKey if EccConf.USE_COINCURVE else ecdsa.SigningKey))
+        self.assertTrue(isinstance(priv_key.UnderlyingObject(), SECP256K1_UNDERLYING_CLASSES[1]))
         self.assertEqual(priv_key.Raw().ToBytes(), TEST_SECP256K1_PRIV_KEY_BYTES)
         self.assertEqual(priv_key.PublicKey().RawCompressed().ToBytes(), TEST_SECP256K1_COMPR_PUB_KEY_BYTES)
 
@@ -576,7 +605,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(point.Raw(), DataBytes))
         self.assertTrue(isinstance(point.RawDecoded(), DataBytes))
         self.assertTrue(isinstance(point.RawEncoded(), DataBytes))
-        self.assertTrue(isinstance(point.UnderlyingObject(), coincurve.PublicKey if EccConf.USE_COINCURVE else ellipticcurve.PointJacobi))
+        self.assertTrue(isinstance(point.UnderlyingObject(), SECP256K1_UNDERLYING_CLASSES[2]))
         self.assertEqual(point.X(), TEST_SECP256K1_POINT_COORD["x"])
         self.assertEqual(point.Y(), TEST_SECP256K1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_SECP256K1_POINT_DEC_BYTES)
@@ -609,6 +638,31 @@ class EccTests(unittest.TestCase):
         self.assertEqual(point.Y(), TEST_SECP256K1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_SECP256K1_POINT_DEC_BYTES)
 
+        # Pure Python implementation, compared with ecdsa
+        n = generator_secp256k1.order()
+        priv_key_int = BytesUtils.ToInteger(TEST_SECP256K1_PRIV_KEY_BYTES)
+        point_ecdsa = generator_secp256k1 * priv_key_int
+        point_py = (point_ecdsa.x(), point_ecdsa.y())
+        for scalar in (1, 2, 3, 0xFF, 2**128 + 1, n // 2, n - 2, n - 1, n + 5, priv_key_int):
+            res_ecdsa = generator_secp256k1 * scalar
+            self.assertEqual(secp256k1_lib.point_scalar_mul_base(scalar), (res_ecdsa.x(), res_ecdsa.y()))
+            res_ecdsa = point_ecdsa * scalar
+            self.assertEqual(secp256k1_lib.point_scalar_mul(scalar, point_py), (res_ecdsa.x(), res_ecdsa.y()))
+        self.assertIsNone(secp256k1_lib.point_scalar_mul_base(n))
+        self.assertIsNone(secp256k1_lib.point_scalar_mul(0, point_py))
+
+        res_ecdsa = point_ecdsa + generator_secp256k1
+        self.assertEqual(secp256k1_lib.point_add(point_py, secp256k1_lib.generator()), (res_ecdsa.x(), res_ecdsa.y()))
+        res_ecdsa = point_ecdsa.double()
+        self.assertEqual(secp256k1_lib.point_add(point_py, point_py), (res_ecdsa.x(), res_ecdsa.y()))
+        self.assertIsNone(secp256k1_lib.point_add(point_py, (point_py[0], generator_secp256k1.curve().p() - point_py[1])))
+
+        self.assertEqual(secp256k1_lib.point_decode(TEST_SECP256K1_POINT_ENC_BYTES), point_py)
+        self.assertEqual(secp256k1_lib.point_decode(TEST_SECP256K1_POINT_DEC_BYTES), point_py)
+        self.assertEqual(secp256k1_lib.point_encode(point_py, True), TEST_SECP256K1_POINT_ENC_BYTES)
+        self.assertRaises(ValueError, Secp256k1PointPython, None)
+        self.assertRaises(ValueError, Secp256k1PointPython.FromCoordinates, point_py[0], point_py[1] + 1)
+
     # Test Sr25519 class
     def test_sr25519(self):
         # Curve
@@ -0,0 +1,349 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+import coincurve
+import ecdsa
+
+from bip_utils import (
+    Bip32ExKeyCache, Bip32KeyIndex, Bip32Nist256p1, Bip32Secp256k1, EccInterningCache, EllipticCurveBackend,
+    EllipticCurveBackends, EllipticCurveGetter, EllipticCurveTypes, EthAddrEncoder, Nist256p1Point, Nist256p1PublicKey,
+    P2PKHAddrEncoder, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
+)
+from bip_utils.ecc.conf import EccConf
+from bip_utils.ecc.nist256p1.nist256p1_const import Nist256p1Const
+from bip_utils.ecc.secp256k1.secp256k1_const import Secp256k1Const
+
+
+# cryptography is optional
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+
+# Seed for testing
+TEST_SEED = b"\x00" * 64
+# Path for testing
+TEST_PATH = "m/0'/1/2'/3"
+
+# Expected backends for each curve
+TEST_VECT_BACKENDS = {
+    EllipticCurveTypes.ED25519: ["nacl"],
+    EllipticCurveTypes.ED25519_BLAKE2B: ["ed25519_blake2b"],
+    EllipticCurveTypes.ED25519_KHOLAW: ["nacl"],
+    EllipticCurveTypes.ED25519_MONERO: ["nacl"],
+    EllipticCurveTypes.NIST256P1: ["cryptography", "ecdsa"],
+    EllipticCurveTypes.SECP256K1: ["coincurve", "python", "ecdsa"],
+    EllipticCurveTypes.SR25519: ["sr25519"],
+}
+
+
+# Classes of a custom backend
+class _CustomPoint:
+    pass
+
+
+class _CustomPublicKey:
+    pass
+
+
+class _CustomPrivateKey:
+    pass
+
+
+# Backend loader of a library that is not installed
+def _missing_backend_loader():
+    raise ImportError("Library not installed")
+
+
+#
+# Tests
+#
+class EllipticCurveBackendsTests(unittest.TestCase):
+    # Test registered backends
+    def test_backends(self):
+        for curve_type, names in TEST_VECT_BACKENDS.items():
+            self.assertEqual(EllipticCurveBackends.Names(curve_type), names)
+            self.assertEqual(EllipticCurveBackends.AvailableNames(curve_type),
+                             [name for name in names if name != "cryptography" or CRYPTOGRAPHY_AVAILABLE])
+            self.assertTrue(EllipticCurveBackends.ActiveName(curve_type) in names)
+
+            # Curve classes are the ones of the active backend
+            curve = EllipticCurveGetter.FromType(curve_type)
+            backend = EllipticCurveBackends.ActiveBackend(curve_type)
+            self.assertTrue(curve.Generator() is backend.Generator())
+            self.assertTrue(issubclass(backend.PointClass(), curve.PointClass()))
+            self.assertTrue(issubclass(backend.PublicKeyClass(), curve.PublicKeyClass()))
+            self.assertTrue(issubclass(backend.PrivateKeyClass(), curve.PrivateKeyClass()))
+
+        self.assertEqual(EllipticCurveBackends.ActiveName(EllipticCurveTypes.SECP256K1),
+                         "coincurve" if EccConf.USE_COINCURVE else "python")
+        self.assertEqual(EllipticCurveBackends.ActiveName(EllipticCurveTypes.NIST256P1),
+                         "cryptography" if EccConf.USE_CRYPTOGRAPHY and CRYPTOGRAPHY_AVAILABLE else "ecdsa")
+
+    # Test backend switching
+    def test_set_backend(self):
+        for curve_type, bip32_cls, pub_key_cls, key_obj_classes in (
+            (EllipticCurveTypes.SECP256K1, Bip32Secp256k1, Secp256k1PublicKey,
+             {"coincurve": coincurve.PublicKey, "python": tuple, "ecdsa": ecdsa.VerifyingKey}),
+            (EllipticCurveTypes.NIST256P1, Bip32Nist256p1, Nist256p1PublicKey,
+             {"cryptography": ec.EllipticCurvePublicKey, "ecdsa": ecdsa.VerifyingKey}
+             if CRYPTOGRAPHY_AVAILABLE
+             else {"ecdsa": ecdsa.VerifyingKey}),
+        ):
+            active_name = EllipticCurveBackends.ActiveName(curve_type)
+            try:
+                results = {}
+                for name, key_obj_cls in key_obj_classes.items():
+                    EllipticCurveBackends.SetBackend(curve_type, name)
+                    self.assertEqual(EllipticCurveBackends.ActiveName(curve_type), name)
+
+                    bip32_ctx = bip32_cls.FromSeed(TEST_SEED).DerivePath(TEST_PATH)
+                    pub_key = bip32_ctx.PublicKey().KeyObject()
+                    self.assertTrue(isinstance(pub_key, pub_key_cls))
+                    self.assertTrue(isinstance(pub_key.UnderlyingObject(), key_obj_cls))
+                    self.assertTrue(isinstance(pub_key_cls.FromBytes(pub_key.RawCompressed().ToBytes()),
+                                               EllipticCurveBackends.ActiveBackend(curve_type).PublicKeyClass()))
+                    # Public derivation
+                    bip32_pub_ctx = bip32_cls.FromExtendedKey(
+                        bip32_cls.FromSeed(TEST_SEED).DerivePath(TEST_PATH[:-2]).PublicKey().ToExtended()
+                    ).ChildKey(3)
+                    results[name] = (bip32_ctx.PrivateKey().ToExtended(),
+                                     bip32_ctx.PublicKey().ToExtended(),
+                                     bip32_pub_ctx.PublicKey().ToExtended())
+
+                # Same results with all backends
+                for name, result in results.items():
+                    self.assertEqual(result, results["ecdsa"])
+                    self.assertEqual(result[1], result[2])
+            finally:
+                EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+    # Test objects created before switching backend
+    def test_objects_before_switch(self):
+        curve_type = EllipticCurveTypes.SECP256K1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+
+        bip32_ctx = Bip32Secp256k1.FromSeed(TEST_SEED).DerivePath(TEST_PATH[:-2])
+        bip32_pub_ctx = Bip32Secp256k1.FromExtendedKey(bip32_ctx.PublicKey().ToExtended())
+        priv_key = bip32_ctx.PrivateKey().KeyObject()
+        pub_key = bip32_ctx.PublicKey().KeyObject()
+        point = bip32_ctx.PublicKey().Point()
+
+        exp_child_ex_key = bip32_ctx.ChildKey(3).PublicKey().ToExtended()
+        exp_hardened_ex_key = bip32_ctx.ChildKey(Bip32KeyIndex.HardenIndex(3)).PublicKey().ToExtended()
+        exp_sum = (point + Secp256k1.Generator()).RawEncoded().ToBytes()
+        exp_p2pkh = P2PKHAddrEncoder.EncodeKey(pub_key, net_ver=b"\x00")
+        exp_eth = EthAddrEncoder.EncodeKey(pub_key)
+
+        try:
+            for name in EllipticCurveBackends.AvailableNames(curve_type):
+                EllipticCurveBackends.SetBackend(curve_type, name)
+
+                # Objects are still recognized
+                self.assertTrue(isinstance(priv_key, Secp256k1PrivateKey))
+                self.assertTrue(isinstance(pub_key, Secp256k1PublicKey))
+                self.assertTrue(isinstance(point, Secp256k1Point))
+                self.assertTrue(issubclass(type(pub_key), Secp256k1PublicKey))
+                # Objects are converted to the active backend
+                active_backend = EllipticCurveBackends.ActiveBackend(curve_type)
+                self.assertTrue(isinstance(Secp256k1PublicKey.FromPublicKey(pub_key), active_backend.PublicKeyClass()))
+                self.assertTrue(isinstance(Secp256k1PrivateKey.FromPrivateKey(priv_key),
+                                           active_backend.PrivateKeyClass()))
+                self.assertTrue(isinstance(Secp256k1Point.FromPoint(point), active_backend.PointClass()))
+
+                # Derivation from nodes created before switching
+                self.assertEqual(bip32_pub_ctx.ChildKey(3).PublicKey().ToExtended(), exp_child_ex_key)
+                self.assertEqual(bip32_ctx.ChildKey(3).PublicKey().ToExtended(), exp_child_ex_key)
+                self.assertEqual(bip32_ctx.ChildKey(Bip32KeyIndex.HardenIndex(3)).PublicKey().ToExtended(),
+                                 exp_hardened_ex_key)
+                self.assertEqual(Bip32Secp256k1(priv_key=None,
+                                                pub_key=pub_key,
+                                                key_data=bip32_ctx.PublicKey().Data(),
+                                                key_net_ver=bip32_ctx.KeyNetVersions()).PublicKey().ToExtended(),
+                                 bip32_ctx.PublicKey().ToExtended())
+                # Point operations
+                self.assertEqual((point + Secp256k1.Generator()).RawEncoded().ToBytes(), exp_sum)
+                self.assertEqual((Secp256k1.Generator() + point).RawEncoded().ToBytes(), exp_sum)
+                # Address encoding
+                self.assertEqual(P2PKHAddrEncoder.EncodeKey(pub_key, net_ver=b"\x00"), exp_p2pkh)
+                self.assertEqual(EthAddrEncoder.EncodeKey(pub_key), exp_eth)
+        finally:
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+    # Test caches clearing when switching backend
+    def test_switch_listeners(self):
+        curve_type = EllipticCurveTypes.SECP256K1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+        switched_curves = []
+
+        ex_key_cache = Bip32ExKeyCache()
+        Bip32Secp256k1.FromExtendedKey(Bip32Secp256k1.FromSeed(TEST_SEED).PublicKey().ToExtended(),
+                                       cache=ex_key_cache)
+        EllipticCurveBackends.AddSwitchListener(switched_curves.append)
+        EccInterningCache.Enable(curve_type)
+        try:
+            Secp256k1PublicKey.FromBytes(Secp256k1.Generator().RawEncoded().ToBytes())
+            self.assertEqual(EccInterningCache.Stats(curve_type).Size(), 1)
+            self.assertEqual(ex_key_cache.Size(), 1)
+
+            # Setting the same backend doesn't notify
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+            self.assertEqual(switched_curves, [])
+            self.assertEqual(EccInterningCache.Stats(curve_type).Size(), 1)
+            self.assertEqual(ex_key_cache.Size(), 1)
+
+            EllipticCurveBackends.SetBackend(curve_type, "ecdsa" if active_name != "ecdsa" else "python")
+            self.assertEqual(switched_curves, [curve_type])
+            self.assertEqual(EccInterningCache.Stats(curve_type).Size(), 0)
+            self.assertEqual(ex_key_cache.Size(), 0)
+        finally:
+            EccInterningCache.Disable(curve_type)
+            EllipticCurveBackends.RemoveSwitchListener(switched_curves.append)
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+        self.assertEqual(switched_curves, [curve_type])
+        self.assertRaises(ValueError, EllipticCurveBackends.RemoveSwitchListener, switched_curves.append)
+
+    # Test point construction from bytes
+    def test_point_from_bytes(self):
+        curve_type = EllipticCurveTypes.NIST256P1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+        try:
+            for name in EllipticCurveBackends.AvailableNames(curve_type):
+                EllipticCurveBackends.SetBackend(curve_type, name)
+
+                pub_key = Bip32Nist256p1.FromSeed(TEST_SEED).PublicKey().KeyObject()
+                point = pub_key.Point()
+                for point_bytes in (pub_key.RawCompressed().ToBytes(),
+                                    pub_key.RawUncompressed().ToBytes(),
+                                    pub_key.RawUncompressed().ToBytes()[1:]):
+                    self.assertEqual(Nist256p1Point.FromBytes(point_bytes).X(), point.X())
+                    self.assertEqual(Nist256p1Point.FromBytes(point_bytes).Y(), point.Y())
+
+                # Uncompressed point with invalid prefix
+                self.assertRaises(ValueError, Nist256p1Point.FromBytes,
+                                  b"\x05" + pub_key.RawUncompressed().ToBytes()[1:])
+        finally:
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+    # Test proxy classes
+    def test_proxy_classes(self):
+        for proxy_cls, module in ((Secp256k1PublicKey, "bip_utils.ecc.secp256k1.secp256k1_const"),
+                                  (Nist256p1PublicKey, "bip_utils.ecc.nist256p1.nist256p1_const")):
+            self.assertEqual(proxy_cls.__module__, module)
+            self.assertEqual(proxy_cls.__qualname__, proxy_cls.__name__)
+
+    # Test generator constants
+    def test_generator_const(self):
+        curve_type = EllipticCurveTypes.SECP256K1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+        try:
+            for name in EllipticCurveBackends.AvailableNames(curve_type):
+                EllipticCurveBackends.SetBackend(curve_type, name)
+                self.assertTrue(Secp256k1Const.GENERATOR is Secp256k1.Generator())
+                self.assertEqual((Secp256k1Const.GENERATOR.X(), Secp256k1Const.GENERATOR.Y()),
+                                 (Secp256k1Const.GENERATOR_X, Secp256k1Const.GENERATOR_Y))
+        finally:
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+        self.assertTrue(Nist256p1Const.GENERATOR is EllipticCurveGetter.FromType(EllipticCurveTypes.NIST256P1).Generator())
+
+    # Test type checks of objects of backends loaded after the first check
+    def test_proxy_loaded_backend(self):
+        curve_type = EllipticCurveTypes.SECP256K1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+        try:
+            EllipticCurveBackends.Register(
+                curve_type,
+                EllipticCurveBackend("custom",
+                                     lambda: (_CustomPoint, _CustomPublicKey, _CustomPrivateKey, Secp256k1.Generator()),
+                                     -1)
+            )
+            self.assertFalse(isinstance(object(), Secp256k1PublicKey))
+            self.assertFalse(issubclass(_CustomPublicKey, Secp256k1PublicKey))
+            # Loading the backend makes its classes accepted
+            EllipticCurveBackends.Backend(curve_type, "custom").PublicKeyClass()
+            self.assertTrue(issubclass(_CustomPublicKey, Secp256k1PublicKey))
+            # Unregistering the backend makes its classes rejected
+            EllipticCurveBackends.Unregister(curve_type, "custom")
+            self.assertFalse(issubclass(_CustomPublicKey, Secp256k1PublicKey))
+        finally:
+            if "custom" in EllipticCurveBackends.Names(curve_type):
+                EllipticCurveBackends.Unregister(curve_type, "custom")
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+    # Test registering backends
+    def test_register(self):
+        curve_type = EllipticCurveTypes.SECP256K1
+        active_name = EllipticCurveBackends.ActiveName(curve_type)
+        ecdsa_backend = EllipticCurveBackends.Backend(curve_type, "ecdsa")
+
+        try:
+            # Backend whose library is not installed
+            EllipticCurveBackends.Register(curve_type, EllipticCurveBackend("missing", _missing_backend_loader, 10))
+            self.assertEqual(EllipticCurveBackends.Names(curve_type), ["missing", "coincurve", "python", "ecdsa"])
+            self.assertEqual(EllipticCurveBackends.AvailableNames(curve_type), ["coincurve", "python", "ecdsa"])
+            self.assertFalse(EllipticCurveBackends.Backend(curve_type, "missing").IsAvailable())
+            self.assertRaises(ValueError, EllipticCurveBackends.SetBackend, curve_type, "missing")
+            # Registering doesn't change the active backend
+            self.assertEqual(EllipticCurveBackends.ActiveName(curve_type), active_name)
+            self.assertEqual(EllipticCurveBackends.AutoSelect(curve_type), "coincurve")
+            # Excluded backends are skipped
+            self.assertEqual(EllipticCurveBackends.AutoSelect(curve_type, ("coincurve",)), "python")
+            self.assertEqual(EllipticCurveBackends.AutoSelect(curve_type, ("coincurve", "python")), "ecdsa")
+            self.assertRaises(ValueError, EllipticCurveBackends.AutoSelect, curve_type, ("coincurve", "python", "ecdsa"))
+            self.assertEqual(EllipticCurveBackends.AutoSelect(curve_type), "coincurve")
+
+            # Backend with a higher priority
+            EllipticCurveBackends.Register(
+                curve_type,
+                EllipticCurveBackend("custom",
+                                     lambda: (ecdsa_backend.PointClass(),
+                                              ecdsa_backend.PublicKeyClass(),
+                                              ecdsa_backend.PrivateKeyClass(),
+                                              ecdsa_backend.Generator()),
+                                     20)
+            )
+            self.assertEqual(EllipticCurveBackends.AutoSelect(curve_type), "custom")
+            self.assertTrue(Secp256k1.Generator() is ecdsa_backend.Generator())
+
+            # Unregistering the active backend selects a new one when used
+            EllipticCurveBackends.Unregister(curve_type, "custom")
+            self.assertEqual(EllipticCurveBackends.ActiveName(curve_type), "coincurve")
+        finally:
+            for name in ("missing", "custom"):
+                if name in EllipticCurveBackends.Names(curve_type):
+                    EllipticCurveBackends.Unregister(curve_type, name)
+            EllipticCurveBackends.SetBackend(curve_type, active_name)
+
+        self.assertEqual(EllipticCurveBackends.Names(curve_type), ["coincurve", "python", "ecdsa"])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(TypeError, EllipticCurveBackends.Names, 0)
+        self.assertRaises(TypeError, EllipticCurveBackends.SetBackend, 0, "ecdsa")
+        self.assertRaises(TypeError, EllipticCurveBackends.Register, 0, EllipticCurveBackend("ecdsa", lambda: None))
+        self.assertRaises(ValueError, EllipticCurveBackends.SetBackend, EllipticCurveTypes.SECP256K1, "invalid")
+        self.assertRaises(ValueError, EllipticCurveBackends.Backend, EllipticCurveTypes.SECP256K1, "invalid")
+        self.assertRaises(ValueError, EllipticCurveBackends.Unregister, EllipticCurveTypes.SECP256K1, "invalid")
@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import threading
+import unittest
+
+from bip_utils import (
+    Bip32Secp256k1, EccInterningCache, EllipticCurveTypes, Ed25519MoneroPublicKey, Ed25519Point, Ed25519PublicKey,
+    Secp256k1PrivateKey, Secp256k1PublicKey
+)
+
+
+# Public keys for testing
+TEST_SECP256K1_PUB_KEYS = [
+    Secp256k1PrivateKey.FromBytes(bytes([i + 1]) * 32).PublicKey().RawCompressed().ToBytes()
+    for i in range(4)
+]
+TEST_ED25519_PUB_KEY = binascii.unhexlify(b"00e9b6062841bb977ad21de71ec961900633c26f21384e015b014a637a61499547")
+TEST_ED25519_POINT = binascii.unhexlify(b"e9b6062841bb977ad21de71ec961900633c26f21384e015b014a637a61499547")
+# Invalid public key for testing
+TEST_SECP256K1_PUB_KEY_INVALID = b"\x02" + b"\xff" * 32
+
+
+#
+# Tests
+#
+class EccInterningCacheTests(unittest.TestCase):
+    def tearDown(self):
+        for curve_type in EllipticCurveTypes:
+            EccInterningCache.Disable(curve_type)
+
+    # Test disabled cache
+    def test_disabled(self):
+        self.assertFalse(EccInterningCache.IsEnabled(EllipticCurveTypes.SECP256K1))
+        self.assertFalse(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0])
+                         is Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0]))
+        self.assertRaises(ValueError, EccInterningCache.Stats, EllipticCurveTypes.SECP256K1)
+
+    # Test interning
+    def test_interning(self):
+        EccInterningCache.Enable(EllipticCurveTypes.SECP256K1)
+        self.assertTrue(EccInterningCache.IsEnabled(EllipticCurveTypes.SECP256K1))
+        self.assertFalse(EccInterningCache.IsEnabled(EllipticCurveTypes.ED25519))
+
+        pub_key = Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0])
+        self.assertTrue(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0]) is pub_key)
+        self.assertTrue(Secp256k1PublicKey.FromBytes(bytearray(TEST_SECP256K1_PUB_KEYS[0])) is pub_key)
+        self.assertTrue(Bip32Secp256k1.FromPublicKey(TEST_SECP256K1_PUB_KEYS[0]).PublicKey().KeyObject() is pub_key)
+        self.assertTrue(Secp256k1PublicKey.IsValidBytes(TEST_SECP256K1_PUB_KEYS[0]))
+        # Uncompressed bytes are a different entry
+        pub_key_uncompr = Secp256k1PublicKey.FromBytes(pub_key.RawUncompressed().ToBytes())
+        self.assertFalse(pub_key_uncompr is pub_key)
+        self.assertEqual(pub_key_uncompr.RawCompressed().ToBytes(), TEST_SECP256K1_PUB_KEYS[0])
+
+        stats = EccInterningCache.Stats(EllipticCurveTypes.SECP256K1)
+        self.assertEqual(stats.Hits(), 4)
+        self.assertEqual(stats.Misses(), 2)
+        self.assertEqual(stats.Size(), 2)
+        self.assertEqual(stats.MaxSize(), 4096)
+        self.assertEqual(stats.HitRate(), 4 / 6)
+
+        # Invalid keys are not cached
+        for _ in range(2):
+            self.assertRaises(ValueError, Secp256k1PublicKey.FromBytes, TEST_SECP256K1_PUB_KEY_INVALID)
+        self.assertEqual(EccInterningCache.Stats(EllipticCurveTypes.SECP256K1).Misses(), 4)
+        self.assertEqual(EccInterningCache.Stats(EllipticCurveTypes.SECP256K1).Size(), 2)
+
+        # Clear
+        EccInterningCache.Clear(EllipticCurveTypes.SECP256K1)
+        stats = EccInterningCache.Stats(EllipticCurveTypes.SECP256K1)
+        self.assertEqual((stats.Hits(), stats.Misses(), stats.Size(), stats.HitRate()), (0, 0, 0, 0.0))
+        self.assertFalse(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0]) is pub_key)
+        EccInterningCache.Clear()
+        self.assertEqual(EccInterningCache.Stats(EllipticCurveTypes.SECP256K1).Size(), 0)
+
+    # Test curves sharing the implementation and points
+    def test_classes(self):
+        EccInterningCache.Enable(EllipticCurveTypes.ED25519)
+
+        pub_key = Ed25519PublicKey.FromBytes(TEST_ED25519_PUB_KEY)
+        self.assertTrue(Ed25519PublicKey.FromBytes(TEST_ED25519_PUB_KEY) is pub_key)
+        point = Ed25519Point.FromBytes(TEST_ED25519_POINT)
+        self.assertTrue(Ed25519Point.FromBytes(TEST_ED25519_POINT) is point)
+        self.assertEqual(EccInterningCache.Stats(EllipticCurveTypes.ED25519).Size(), 2)
+        # Subclasses belong to their own curve
+        self.assertFalse(Ed25519MoneroPublicKey.FromBytes(TEST_ED25519_POINT)
+                         is Ed25519MoneroPublicKey.FromBytes(TEST_ED25519_POINT))
+
+    # Test subclasses redefining FromBytes
+    def test_subclasses(self):
+        class _SuperPublicKey(Ed25519PublicKey):
+            @classmethod
+            def FromBytes(cls, key_bytes):
+                return super().FromBytes(key_bytes)
+
+        class _StaticPublicKey(Ed25519PublicKey):
+            @staticmethod
+            def FromBytes(key_bytes):
+                return Ed25519PublicKey.FromBytes(key_bytes)
+
+        class _SameFromBytesPublicKey(Ed25519PublicKey):
+            FromBytes = Ed25519PublicKey.__dict__["FromBytes"]
+
+        # Static methods are not wrapped, already wrapped methods are not wrapped again
+        self.assertTrue(isinstance(_StaticPublicKey.__dict__["FromBytes"], staticmethod))
+        self.assertTrue(_SameFromBytesPublicKey.__dict__["FromBytes"] is Ed25519PublicKey.__dict__["FromBytes"])
+
+        EccInterningCache.Enable(EllipticCurveTypes.ED25519)
+        # Calling the parent FromBytes is cached once
+        pub_key = _SuperPublicKey.FromBytes(TEST_ED25519_PUB_KEY)
+        self.assertTrue(type(pub_key) is _SuperPublicKey)
+        self.assertTrue(_SuperPublicKey.FromBytes(TEST_ED25519_PUB_KEY) is pub_key)
+        stats = EccInterningCache.Stats(EllipticCurveTypes.ED25519)
+        self.assertEqual((stats.Hits(), stats.Misses(), stats.Size()), (1, 1, 1))
+
+        self.assertTrue(_StaticPublicKey.FromBytes(TEST_ED25519_PUB_KEY)
+                        is Ed25519PublicKey.FromBytes(TEST_ED25519_PUB_KEY))
+
+    # Test eviction of least recently used objects
+    def test_eviction(self):
+        EccInterningCache.Enable(EllipticCurveTypes.SECP256K1, 2)
+
+        pub_key_0 = Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0])
+        pub_key_1 = Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[1])
+        self.assertTrue(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0]) is pub_key_0)
+        # The second key is the least recently used one
+        Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[2])
+        self.assertEqual(EccInterningCache.Stats(EllipticCurveTypes.SECP256K1).Size(), 2)
+        self.assertTrue(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[0]) is pub_key_0)
+        self.assertFalse(Secp256k1PublicKey.FromBytes(TEST_SECP256K1_PUB_KEYS[1]) is pub_key_1)
+
+    # Test concurrent access
+    def test_threads(self):
+        EccInterningCache.Enable(EllipticCurveTypes.SECP256K1, 3)
+        results = []
+
+        def _worker():
+            for i in range(50):
+                key_bytes = TEST_SECP256K1_PUB_KEYS[i % len(TEST_SECP256K1_PUB_KEYS)]
+                results.append(Secp256k1PublicKey.FromBytes(key_bytes).RawCompressed().ToBytes() == key_bytes)
+
+        threads = [threading.Thread(target=_worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = EccInterningCache.Stats(EllipticCurveTypes.SECP256K1)
+        self.assertTrue(all(results))
+        self.assertEqual(len(results), 200)
+        self.assertEqual(stats.Hits() + stats.Misses(), 200)
+        self.assertEqual(stats.Size(), 3)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(TypeError, EccInterningCache.Enable, 0)
+        self.assertRaises(TypeError, EccInterningCache.Disable, 0)
+        self.assertRaises(TypeError, EccInterningCache.IsEnabled, 0)
+        self.assertRaises(TypeError, EccInterningCache.Clear, 0)
+        self.assertRaises(TypeError, EccInterningCache.Stats, 0)
+        self.assertRaises(ValueError, EccInterningCache.Enable, EllipticCurveTypes.SECP256K1, 0)
@@ -438,6 +438,11 @@ class MoneroTests(unittest.TestCase):
         self.assertRaises(ValueError, monero.Subaddress, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0)
         self.assertRaises(ValueError, monero.Subaddress, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
 
+        self.assertRaises(ValueError, monero.Subaddresses, [0, -1], 0)
+        self.assertRaises(ValueError, monero.Subaddresses, [0], -1)
+        self.assertRaises(ValueError, monero.Subaddresses, [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1], 0)
+        self.assertRaises(ValueError, monero.Subaddresses, [0], MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
+
     # Test Monero object
     def __test_monero_obj(self, monero_obj, test, is_watch_only):
         # Test watch-only flag
@@ -475,3 +480,9 @@ class MoneroTests(unittest.TestCase):
         for test_subaddr in test["subaddresses"]:
             subaddr = monero_obj.Subaddress(test_subaddr["minor_idx"], test_subaddr["major_idx"])
             self.assertEqual(test_subaddr["address"], subaddr)
+            subaddrs = monero_obj.Subaddresses([test_subaddr["minor_idx"]], test_subaddr["major_idx"])
+            self.assertEqual([test_subaddr["address"]], subaddrs)
+
+        # Test multiple subaddresses, including the primary address
+        self.assertEqual(monero_obj.Subaddresses(range(3)), [monero_obj.Subaddress(i) for i in range(3)])
+        self.assertEqual(monero_obj.Subaddresses(range(3), 1), [monero_obj.Subaddress(i, 1) for i in range(3)])
@@ -134,6 +134,40 @@ class MoneroSubaddrTests(unittest.TestCase):
                 subaddr = monero_subaddr.ComputeAndEncodeKeys(test_subaddr["minor_idx"], test_subaddr["major_idx"], net_ver)
                 self.assertEqual(test_subaddr["subaddress"], subaddr)
 
+                # ComputeKeysBatch
+                keys = monero_subaddr.ComputeKeysBatch([test_subaddr["minor_idx"]] * 2, test_subaddr["major_idx"])
+                self.assertEqual(len(keys), 2)
+                for pub_skey, pub_vkey in keys:
+                    self.assertEqual(test_subaddr["pub_skey"], pub_skey.RawCompressed().ToHex())
+                    self.assertEqual(test_subaddr["pub_vkey"], pub_vkey.RawCompressed().ToHex())
+
+                # ComputeAndEncodeKeysBatch
+                subaddrs = monero_subaddr.ComputeAndEncodeKeysBatch([test_subaddr["minor_idx"]],
+                                                                    test_subaddr["major_idx"],
+                                                                    net_ver)
+                self.assertEqual([test_subaddr["subaddress"]], subaddrs)
+
+    # Test batch compute
+    def test_compute_batch(self):
+        priv_vkey = MoneroPrivateKey.FromBytes(binascii.unhexlify(TEST_PRIV_VIEW_KEY))
+        pub_skey = MoneroPublicKey.FromBytes(binascii.unhexlify(TEST_PUB_SPEND_KEY))
+
+        monero_subaddr = MoneroSubaddress(priv_vkey, pub_skey)
+
+        for major_idx in (0, 1):
+            keys = monero_subaddr.ComputeKeysBatch(range(10), major_idx)
+            self.assertEqual(len(keys), 10)
+            for minor_idx, (pub_skey, pub_vkey) in enumerate(keys):
+                exp_pub_skey, exp_pub_vkey = monero_subaddr.ComputeKeys(minor_idx, major_idx)
+                self.assertEqual(exp_pub_skey.RawCompressed().ToBytes(), pub_skey.RawCompressed().ToBytes())
+                self.assertEqual(exp_pub_vkey.RawCompressed().ToBytes(), pub_vkey.RawCompressed().ToBytes())
+
+            pub_skeys = monero_subaddr.ComputePublicSpendKeysBatch(range(10), major_idx)
+            self.assertEqual([pub_skey.RawCompressed().ToBytes() for pub_skey, _ in keys],
+                             [pub_skey.RawCompressed().ToBytes() for pub_skey in pub_skeys])
+
+        self.assertEqual(monero_subaddr.ComputeKeysBatch([], 0), [])
+
     # Test invalid parameters
     def test_invalid_params(self):
         priv_vkey = MoneroPrivateKey.FromBytes(binascii.unhexlify(TEST_PRIV_VIEW_KEY))
@@ -150,3 +184,10 @@ class MoneroSubaddrTests(unittest.TestCase):
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, 0, -1, b"")
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0, b"")
         self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeys, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, b"")
+
+        self.assertRaises(ValueError, monero_subaddr.ComputeKeysBatch, [0, -1], 0)
+        self.assertRaises(ValueError, monero_subaddr.ComputeKeysBatch, [0], -1)
+        self.assertRaises(ValueError, monero_subaddr.ComputeKeysBatch, [MoneroSubaddressConst.SUBADDR_MAX_IDX + 1], 0)
+        self.assertRaises(ValueError, monero_subaddr.ComputeKeysBatch, [0], MoneroSubaddressConst.SUBADDR_MAX_IDX + 1)
+        self.assertRaises(ValueError, monero_subaddr.ComputeAndEncodeKeysBatch, [-1], 0, b"")
+        self.assertRaises(ValueError, monero_subaddr.ComputePublicSpendKeysBatch, [-1], 0)
@@ -0,0 +1,155 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import Monero, MoneroSubaddress, MoneroSubaddressTable, MoneroSubaddressTableWriter
+from bip_utils.monero.monero_subaddr import MoneroSubaddressConst
+
+
+# Seed for testing
+TEST_SEED = b"\x01" * 32
+
+
+#
+# Tests
+#
+class MoneroSubaddressTableTests(unittest.TestCase):
+    # Set up test
+    def setUp(self):
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+        self.m_file_path = os.path.join(self.m_tmp_dir.name, "subaddr.tbl")
+        self.m_monero = Monero.FromSeed(TEST_SEED)
+        self.m_subaddr = MoneroSubaddress(self.m_monero.PrivateViewKey(), self.m_monero.PublicSpendKey())
+
+    # Tear down test
+    def tearDown(self):
+        self.m_tmp_dir.cleanup()
+
+    # Test build and lookup
+    def test_lookup(self):
+        writer = self.__writer(worker_num=1)
+        writer.AddSubaddresses(0, 0, 20)
+        writer.AddSubaddresses(1, 0, 10)
+        writer.AddSubaddresses(2, 5, 5)
+
+        table = MoneroSubaddressTable(self.m_file_path)
+        try:
+            self.assertEqual(table.RecordsNum(), 30)
+            self.assertEqual(table.PublicSpendKey().RawCompressed().ToBytes(),
+                             self.m_monero.PublicSpendKey().RawCompressed().ToBytes())
+            self.__test_lookup(table, 0, range(20))
+            self.__test_lookup(table, 1, range(10))
+
+            # Not in the table
+            pub_skey = self.m_subaddr.ComputeKeys(20, 0)[0]
+            self.assertIsNone(table.Lookup(pub_skey))
+            self.assertIsNone(table.Lookup(pub_skey.RawCompressed().ToBytes()))
+            self.assertIsNone(table.Lookup(b"\x00" * 32))
+            self.assertIsNone(table.Lookup(b"\x01" * 31))
+        finally:
+            table.Close()
+
+    # Test extending
+    def test_extend(self):
+        self.__writer(worker_num=1).AddSubaddresses(0, 0, 20)
+        # 64 slots, enough for extending the lookahead in place, overlapping the existing subaddresses
+        file_size = os.path.getsize(self.m_file_path)
+        writer = self.__writer(worker_num=1)
+        writer.AddSubaddresses(0, 10, 22)
+        self.assertEqual(os.path.getsize(self.m_file_path), file_size)
+
+        table = MoneroSubaddressTable(self.m_file_path)
+        try:
+            self.assertEqual(table.RecordsNum(), 22)
+            self.__test_lookup(table, 0, range(22))
+        finally:
+            table.Close()
+
+        # Not enough slots, the table is rehashed
+        writer.AddSubaddresses(1, 0, 11)
+        self.assertGreater(os.path.getsize(self.m_file_path), file_size)
+
+        table = MoneroSubaddressTable(self.m_file_path)
+        try:
+            self.assertEqual(table.RecordsNum(), 33)
+            self.__test_lookup(table, 0, range(22))
+            self.__test_lookup(table, 1, range(11))
+        finally:
+            table.Close()
+
+    # Test build using multiple processes
+    def test_multiple_workers(self):
+        self.__writer(chunk_size=7, worker_num=2).AddSubaddresses(3, 0, 30)
+
+        table = MoneroSubaddressTable(self.m_file_path)
+        try:
+            self.assertEqual(table.RecordsNum(), 30)
+            self.__test_lookup(table, 3, range(30))
+        finally:
+            table.Close()
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, self.__writer, chunk_size=0)
+        self.assertRaises(ValueError, self.__writer, worker_num=0)
+
+        writer = self.__writer(worker_num=1)
+        self.assertRaises(ValueError, writer.AddSubaddresses, -1, 0, 1)
+        self.assertRaises(ValueError, writer.AddSubaddresses, MoneroSubaddressConst.SUBADDR_MAX_IDX + 1, 0, 1)
+        self.assertRaises(ValueError, writer.AddSubaddresses, 0, -1, 1)
+        self.assertRaises(ValueError, writer.AddSubaddresses, 0, 2, 1)
+        self.assertRaises(ValueError, writer.AddSubaddresses, 0, 0, MoneroSubaddressConst.SUBADDR_MAX_IDX + 2)
+
+        # Different public spend key
+        other_monero = Monero.FromSeed(b"\x02" * 32)
+        self.assertRaises(ValueError, MoneroSubaddressTableWriter, self.m_file_path,
+                          other_monero.PrivateViewKey(), other_monero.PublicSpendKey())
+        # Different view key
+        self.assertRaises(ValueError, MoneroSubaddressTableWriter, self.m_file_path,
+                          other_monero.PrivateViewKey(), self.m_monero.PublicSpendKey())
+
+        # Invalid files
+        with open(self.m_file_path, "rb") as fin:
+            valid_bytes = fin.read()
+        for file_bytes in (b"", b"BUSX" + b"\x01" * 68, b"BUST" + b"\x01" + b"\x00" * 67, valid_bytes[:72],
+                           valid_bytes[:-1], valid_bytes[:72] + b"\x00" * 16,
+                           # Number of slots not a power of two
+                           valid_bytes[:72] + (3).to_bytes(8, "big") + b"\x00" * (8 + 40 * 3)):
+            with open(self.m_file_path, "wb") as fout:
+                fout.write(file_bytes)
+            self.assertRaises(ValueError, MoneroSubaddressTable, self.m_file_path)
+
+    # Test lookup of subaddresses
+    def __test_lookup(self, table, major_idx, minor_idxs):
+        for minor_idx in minor_idxs:
+            pub_skey = self.m_subaddr.ComputeKeys(minor_idx, major_idx)[0]
+            self.assertEqual(table.Lookup(pub_skey), (major_idx, minor_idx))
+            self.assertEqual(table.Lookup(pub_skey.RawCompressed().ToBytes()), (major_idx, minor_idx))
+
+    # Create writer
+    def __writer(self, **kwargs):
+        return MoneroSubaddressTableWriter(self.m_file_path,
+                                           self.m_monero.PrivateViewKey(),
+                                           self.m_monero.PublicSpendKey(),
+                                           **kwargs)
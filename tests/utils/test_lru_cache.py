@@ -0,0 +1,119 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import threading
+import unittest
+
+from bip_utils import LruCache
+
+
+#
+# Helper class
+#
+class _TestLruCache(LruCache):
+    def Get(self, key):
+        return self._Get(key)
+
+    def GetFirst(self, keys):
+        return self._GetFirst(keys)
+
+    def Put(self, key, obj):
+        return self._Put(key, obj)
+
+
+#
+# Tests
+#
+class LruCacheTests(unittest.TestCase):
+    # Test get and put
+    def test_get_put(self):
+        cache = _TestLruCache(3)
+        self.assertEqual((3, 0, 0, 0, 0.0), (cache.MaxSize(), cache.Size(), cache.Hits(), cache.Misses(), cache.HitRate()))
+
+        self.assertTrue(cache.Get("a") is None)
+        self.assertEqual(cache.Put("a", 1), 1)
+        # An already present object is kept
+        self.assertEqual(cache.Put("a", 2), 1)
+        self.assertEqual(cache.Get("a"), 1)
+        # A single hit or miss for multiple keys
+        self.assertEqual(cache.GetFirst(["b", "a"]), (1, 1))
+        self.assertEqual(cache.GetFirst(["b", "c"]), (-1, None))
+        self.assertEqual(cache.GetFirst([]), (-1, None))
+
+        stats = cache.Stats()
+        self.assertEqual((2, 3, 1, 3), (stats.Hits(), stats.Misses(), stats.Size(), stats.MaxSize()))
+        self.assertEqual(stats.HitRate(), 2 / 5)
+        self.assertEqual(cache.HitRate(), 2 / 5)
+
+        # Clear
+        cache.Clear()
+        stats = cache.Stats()
+        self.assertEqual((0, 0, 0, 0.0), (stats.Hits(), stats.Misses(), stats.Size(), stats.HitRate()))
+
+    # Test eviction of least recently used objects
+    def test_eviction(self):
+        cache = _TestLruCache(3)
+        for i in range(3):
+            cache.Put(i, str(i))
+        # 1 becomes the least recently used one
+        cache.Get(0)
+        cache.Put(3, "3")
+        self.assertEqual(cache.Size(), 3)
+        self.assertTrue(cache.Get(1) is None)
+        self.assertEqual(cache.Get(0), "0")
+
+        # Explicit eviction, the least recently used is 2
+        self.assertEqual(cache.Evict(), 1)
+        self.assertTrue(cache.Get(2) is None)
+        self.assertEqual(cache.Evict(10), 2)
+        self.assertEqual(cache.Evict(), 0)
+        self.assertEqual(cache.Size(), 0)
+
+        # Resize
+        for i in range(3):
+            cache.Put(i, str(i))
+        cache.Resize(1)
+        self.assertEqual((1, 1), (cache.MaxSize(), cache.Size()))
+        self.assertEqual(cache.Get(2), "2")
+
+    # Test concurrent access
+    def test_threads(self):
+        cache = _TestLruCache(5)
+
+        def _worker():
+            for i in range(100):
+                if cache.Get(i % 10) is None:
+                    cache.Put(i % 10, i % 10)
+
+        threads = [threading.Thread(target=_worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.Stats()
+        self.assertEqual(stats.Hits() + stats.Misses(), 400)
+        self.assertEqual(stats.Size(), 5)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, _TestLruCache, 0)
+        self.assertRaises(ValueError, _TestLruCache(1).Resize, 0)
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicBulkValidator, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39WordsNum,
+    ElectrumV2Languages, ElectrumV2MnemonicBulkValidator, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicTypes,
+    ElectrumV2WordsNum, MnemonicBulkValidatorResult, MoneroLanguages, MoneroMnemonicBulkValidator,
+    MoneroMnemonicGenerator, MoneroWordsNum
+)
+
+
+# Mnemonics used for testing
+TEST_BIP39_MNEMONICS = [
+    # Valid
+    "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+    # Wrong checksum
+    "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon any",
+    # Wrong length
+    "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon",
+    # Not existent word
+    "abandon abandon abandon notexistent abandon abandon abandon abandon abandon abandon abandon about",
+    # Valid (other language)
+    Bip39MnemonicGenerator(Bip39Languages.ITALIAN).FromWordsNumber(Bip39WordsNum.WORDS_NUM_24).ToStr(),
+]
+
+
+#
+# Tests
+#
+class MnemonicBulkValidatorTests(unittest.TestCase):
+    # Test BIP39 bulk validator
+    def test_bip39(self):
+        results = list(Bip39MnemonicBulkValidator(chunk_size=2).Validate(iter(TEST_BIP39_MNEMONICS)))
+
+        self.assertEqual(
+            [Bip39MnemonicValidator().IsValid(mnemonic) for mnemonic in TEST_BIP39_MNEMONICS],
+            [result.valid for result in results]
+        )
+        self.assertEqual(TEST_BIP39_MNEMONICS, [result.line for result in results])
+        self.assertEqual(
+            [Bip39Languages.ENGLISH, Bip39Languages.ENGLISH, Bip39Languages.ENGLISH, None, Bip39Languages.ITALIAN],
+            [result.language for result in results]
+        )
+        self.assertTrue(all((result.error is None) == result.valid for result in results))
+
+        # Language specified
+        results = list(Bip39MnemonicBulkValidator(Bip39Languages.ENGLISH).Validate(TEST_BIP39_MNEMONICS))
+        self.assertEqual([True, False, False, False, False], [result.valid for result in results])
+        self.assertTrue(all(result.language == Bip39Languages.ENGLISH for result in results))
+
+        self.assertEqual([], list(Bip39MnemonicBulkValidator().Validate([])))
+
+    # Test Electrum v2 bulk validator
+    def test_electrum_v2(self):
+        mnemonics = [
+            ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.SEGWIT,
+                                        ElectrumV2Languages.SPANISH).FromWordsNumber(ElectrumV2WordsNum.WORDS_NUM_12),
+            ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).FromWordsNumber(ElectrumV2WordsNum.WORDS_NUM_12),
+            TEST_BIP39_MNEMONICS[0],
+        ]
+        results = list(ElectrumV2MnemonicBulkValidator().Validate(map(str, mnemonics)))
+
+        self.assertEqual([True, True, False], [result.valid for result in results])
+        self.assertEqual(ElectrumV2Languages.SPANISH, results[0].language)
+        self.assertEqual(ElectrumV2Languages.ENGLISH, results[1].language)
+
+        # Mnemonic type specified
+        results = list(ElectrumV2MnemonicBulkValidator(ElectrumV2MnemonicTypes.STANDARD).Validate(map(str, mnemonics)))
+        self.assertEqual([False, True, False], [result.valid for result in results])
+
+        # Language not supported by Electrum v2
+        results = list(ElectrumV2MnemonicBulkValidator().Validate(TEST_BIP39_MNEMONICS[-1:]))
+        self.assertFalse(results[0].valid)
+        self.assertIsNone(results[0].language)
+
+    # Test Monero bulk validator
+    def test_monero(self):
+        mnemonic = MoneroMnemonicGenerator(MoneroLanguages.GERMAN).FromWordsNumber(MoneroWordsNum.WORDS_NUM_25)
+        mnemonic_no_chksum = MoneroMnemonicGenerator().FromWordsNumber(MoneroWordsNum.WORDS_NUM_12)
+        mnemonic_wrong_chksum = "abbey abbey abbey abbey abbey abbey abbey abbey abbey abbey abbey abbey abducts"
+
+        results = list(MoneroMnemonicBulkValidator().Validate(
+            [mnemonic.ToStr(), mnemonic_no_chksum.ToStr(), mnemonic_wrong_chksum]
+        ))
+        self.assertEqual([True, True, False], [result.valid for result in results])
+        self.assertEqual([MoneroLanguages.GERMAN, MoneroLanguages.ENGLISH, MoneroLanguages.ENGLISH],
+                         [result.language for result in results])
+
+    # Test validation from file
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "mnemonics.txt")
+            with open(file_path, "w", encoding="utf-8") as fout:
+                fout.write("\n".join(f"  {mnemonic}  \n" for mnemonic in TEST_BIP39_MNEMONICS))
+
+            results = list(Bip39MnemonicBulkValidator().ValidateFile(file_path))
+            self.assertEqual(list(Bip39MnemonicBulkValidator().Validate(TEST_BIP39_MNEMONICS)), results)
+
+    # Test validation with multiple processes
+    def test_processes(self):
+        mnemonics = TEST_BIP39_MNEMONICS * 5
+
+        results = list(Bip39MnemonicBulkValidator(chunk_size=3, worker_num=2).Validate(mnemonics))
+        self.assertEqual(list(Bip39MnemonicBulkValidator().Validate(mnemonics)), results)
+        self.assertTrue(all(isinstance(result, MnemonicBulkValidatorResult) for result in results))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(TypeError, Bip39MnemonicBulkValidator, MoneroLanguages.ENGLISH)
+        self.assertRaises(TypeError, MoneroMnemonicBulkValidator, Bip39Languages.ENGLISH)
+        self.assertRaises(TypeError, ElectrumV2MnemonicBulkValidator, 0)
+        self.assertRaises(ValueError, Bip39MnemonicBulkValidator, None, 0)
+        self.assertRaises(ValueError, Bip39MnemonicBulkValidator, None, 1, 0)
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import glob
+import os
+import tempfile
+import unittest
+
+from bip_utils import Bip39Languages, MoneroLanguages
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroWordsListGetter
+from bip_utils.utils.mnemonic import MnemonicPackedWordsList, MnemonicWordsList, MnemonicWordsListFileReader
+from bip_utils.utils.mnemonic.mnemonic_utils import MnemonicPackedWordsListConst, MnemonicWordsIndexConst
+
+
+# Tests words list
+TEST_WORDS_LIST = ["abandon", "ability", "able", "about", "above", "àbside", "абзац", "的"]
+
+
+#
+# Tests
+#
+class MnemonicPackedWordsListTests(unittest.TestCase):
+    # Test that the package files are up to date with the words lists
+    def test_package_files(self):
+        words_list_files = glob.glob(
+            os.path.join(MnemonicWordsIndexConst.ROOT_PATH, "**", "wordlist", "*.txt"), recursive=True
+        )
+        self.assertNotEqual(len(words_list_files), 0)
+
+        for words_list_file in words_list_files:
+            words = MnemonicWordsListFileReader.ReadWords(words_list_file)
+            packed_words_list = MnemonicWordsListFileReader.LoadPackedFile(words_list_file)
+
+            self.assertIsNotNone(packed_words_list)
+            self.assertEqual(MnemonicPackedWordsList.FromWords(words).ToBytes(), packed_words_list.ToBytes())
+
+    # Test that words lists are loaded from the packed files
+    def test_loaded_words_lists(self):
+        for getter, langs in ((Bip39WordsListGetter, Bip39Languages), (MoneroWordsListGetter, MoneroLanguages)):
+            for lang in langs:
+                words_list = getter.Instance().GetByLanguage(lang)
+                words = MnemonicWordsListFileReader.ReadWords(getter.Instance().GetLanguageFile(lang))
+
+                self.assertTrue(isinstance(words_list, MnemonicPackedWordsList))
+                self.__TestWordsList(words_list, words)
+
+    # Test words list
+    def test_words_list(self):
+        for words in (TEST_WORDS_LIST, TEST_WORDS_LIST[:1], []):
+            self.__TestWordsList(MnemonicPackedWordsList.FromWords(words), words)
+
+        # Packed words list shall behave like the normal one
+        words_list = MnemonicPackedWordsList.FromWords(TEST_WORDS_LIST)
+        words_list_exp = MnemonicWordsList(TEST_WORDS_LIST)
+        self.assertEqual(words_list_exp.GetWordAtIdx(-1), words_list.GetWordAtIdx(-1))
+        self.assertRaises(IndexError, words_list.GetWordAtIdx, len(TEST_WORDS_LIST))
+        for word in ("", "abandonx", "abando", "ABANDON", "abzac"):
+            self.assertRaises(ValueError, words_list_exp.GetWordIdx, word)
+            self.assertRaises(ValueError, words_list.GetWordIdx, word)
+
+    # Test file
+    def test_file(self):
+        words_list = MnemonicPackedWordsList.FromWords(TEST_WORDS_LIST)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            words_list_file = os.path.join(tmp_dir, "test.txt")
+            with open(words_list_file, "w", encoding="utf-8") as fout:
+                fout.write("\n".join(TEST_WORDS_LIST))
+
+            # Text file is loaded if the packed one is not present
+            self.assertIsNone(MnemonicWordsListFileReader.LoadPackedFile(words_list_file))
+            self.assertFalse(isinstance(MnemonicWordsListFileReader.LoadFile(words_list_file, len(TEST_WORDS_LIST)),
+                                        MnemonicPackedWordsList))
+
+            words_list.SaveToFile(os.path.join(tmp_dir, "test" + MnemonicPackedWordsListConst.FILE_EXT))
+            words_list_loaded = MnemonicWordsListFileReader.LoadFile(words_list_file, len(TEST_WORDS_LIST))
+            self.assertTrue(isinstance(words_list_loaded, MnemonicPackedWordsList))
+            self.assertEqual(words_list.ToBytes(), words_list_loaded.ToBytes())
+            self.__TestWordsList(words_list_loaded, TEST_WORDS_LIST)
+
+            self.assertRaises(ValueError, MnemonicWordsListFileReader.LoadFile, words_list_file, len(TEST_WORDS_LIST) + 1)
+            # Release the memory-mapped file, so that the directory can be removed on all platforms
+            del words_list_loaded
+
+    # Test invalid data
+    def test_invalid_data(self):
+        packed_bytes = MnemonicPackedWordsList.FromWords(TEST_WORDS_LIST).ToBytes()
+
+        for invalid_bytes in (
+            b"",
+            packed_bytes[:10],
+            b"XXXX" + packed_bytes[4:],
+            packed_bytes[:4] + b"\x00" + packed_bytes[5:],
+            packed_bytes[:-1],
+            packed_bytes + b"\x00",
+        ):
+            self.assertRaises(ValueError, MnemonicPackedWordsList, invalid_bytes)
+
+        self.assertRaises(ValueError, MnemonicPackedWordsList.FromWords, TEST_WORDS_LIST + TEST_WORDS_LIST[:1])
+
+    # Test a words list
+    def __TestWordsList(self, words_list, words):
+        self.assertEqual(len(words), words_list.Length())
+        for i, word in enumerate(words):
+            self.assertEqual(word, words_list.GetWordAtIdx(i))
+            self.assertEqual(i, words_list.GetWordIdx(word))
+            # Cached
+            self.assertEqual(i, words_list.GetWordIdx(word))
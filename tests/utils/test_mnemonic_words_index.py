@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicGenerator, Bip39WordsNum, MoneroLanguages, MoneroMnemonicGenerator, MoneroWordsNum
+)
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroWordsListFinder, MoneroWordsListGetter
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicWordsIndex, MnemonicWordsListFileReader
+from bip_utils.utils.mnemonic.mnemonic_utils import MnemonicWordsIndexConst
+
+
+#
+# Tests
+#
+class MnemonicWordsIndexTests(unittest.TestCase):
+    # Test that the package file is up to date with the words lists
+    def test_package_file(self):
+        index = MnemonicWordsIndex.Build()
+        with open(MnemonicWordsIndexConst.FILE_PATH, "rb") as fin:
+            self.assertEqual(index.ToBytes(), fin.read())
+        self.assertEqual(MnemonicWordsIndex.FromBytes(index.ToBytes()).ToBytes(), index.ToBytes())
+
+    # Test that all the words of a words list are found in its file
+    def test_words_bitset(self):
+        index = MnemonicWordsIndex.Instance()
+
+        for getter, langs in ((Bip39WordsListGetter, Bip39Languages), (MoneroWordsListGetter, MoneroLanguages)):
+            for lang in langs:
+                lang_file = getter.Instance().GetLanguageFile(lang)
+                file_bitset = index.FileBitset(lang_file)
+                self.assertNotEqual(file_bitset, 0)
+                words = MnemonicWordsListFileReader.ReadWords(lang_file)
+                self.assertNotEqual(index.WordsBitset(words) & file_bitset, 0)
+
+        self.assertEqual(index.FileBitset("not_indexed.txt"), 0)
+
+    # Test language detection
+    def test_find_language(self):
+        for lang in Bip39Languages:
+            mnemonic = Bip39MnemonicGenerator(lang).FromWordsNumber(Bip39WordsNum.WORDS_NUM_12)
+            self.assertEqual(Bip39WordsListFinder.FindLanguage(mnemonic)[1], lang)
+        for lang in MoneroLanguages:
+            mnemonic = MoneroMnemonicGenerator(lang).FromWordsNumber(MoneroWordsNum.WORDS_NUM_25)
+            self.assertEqual(MoneroWordsListFinder.FindLanguage(mnemonic)[1], lang)
+
+        # Words in common between languages, the first language in order is returned like for the full search
+        self.assertEqual(Bip39WordsListFinder.FindLanguage(Mnemonic.FromString("fatigue"))[1],
+                         Bip39Languages.ENGLISH)
+        self.assertRaises(ValueError, Bip39WordsListFinder.FindLanguage, Mnemonic.FromString("abandon abaco"))
+
+    # Test empty and invalid indexes
+    def test_invalid(self):
+        index = MnemonicWordsIndex([], [])
+        self.assertEqual(index.WordsBitset(["abandon"]), 0)
+        self.assertEqual(index.FileBitset(Bip39WordsListGetter.Instance().GetLanguageFile(Bip39Languages.ENGLISH)), 0)
+
+        index_bytes = MnemonicWordsIndex.Instance().ToBytes()
+        self.assertRaises(ValueError, MnemonicWordsIndex.FromBytes, b"XXXX" + index_bytes[4:])
+        self.assertRaises(ValueError, MnemonicWordsIndex.FromBytes, index_bytes[:-1])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "words_index.bin")
+            MnemonicWordsIndex.Instance().SaveToFile(file_path)
+            self.assertEqual(MnemonicWordsIndex.FromFile(file_path).ToBytes(), index_bytes)
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils.utils.misc import ProcessPoolUtils
+
+
+#
+# Helper functions
+#
+def _SquareRange(start, stop):
+    return [i * i for i in range(start, stop)]
+
+
+#
+# Tests
+#
+class ProcessPoolUtilsTests(unittest.TestCase):
+    # Test map chunks
+    def test_map_chunks(self):
+        exp_res = [i * i for i in range(105)]
+
+        for worker_num in (None, 1, 2):
+            # More chunks than pending tasks, to test the bounded queue
+            chunks_args = ((i, min(i + 10, 105)) for i in range(0, 105, 10))
+            self.assertEqual(exp_res, list(ProcessPoolUtils.MapChunks(_SquareRange, chunks_args, worker_num)))
+            self.assertEqual([], list(ProcessPoolUtils.MapChunks(_SquareRange, [], worker_num)))
+
+    # Test chunks are consumed lazily
+    def test_lazy(self):
+        consumed = []
+
+        def chunks_args():
+            for i in range(3):
+                consumed.append(i)
+                yield i, i + 1
+
+        res_it = ProcessPoolUtils.MapChunks(_SquareRange, chunks_args(), 1)
+        self.assertEqual([], consumed)
+        self.assertEqual(0, next(res_it))
+        self.assertEqual([0], consumed)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        for worker_num in (0, -1):
+            self.assertRaises(ValueError, ProcessPoolUtils.CheckWorkersNum, worker_num)
+            self.assertRaises(ValueError, next, ProcessPoolUtils.MapChunks(_SquareRange, [(0, 1)], worker_num))